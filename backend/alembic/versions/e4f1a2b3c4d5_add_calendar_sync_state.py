@@ -0,0 +1,26 @@
+"""add calendar sync_state for adaptive feed scheduling
+
+Revision ID: e4f1a2b3c4d5
+Revises: 0bda720ee4ad
+Create Date: 2026-10-18 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f1a2b3c4d5'
+down_revision: Union[str, None] = '0bda720ee4ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('calendars', sa.Column('sync_state', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('calendars', 'sync_state')
@@ -269,11 +269,15 @@ async def get_verified_domain(domain: str, db=Depends(_lazy_get_db)):
     Raises:
         HTTPException 404: Domain not found
     """
+    return load_verified_domain(db, domain)
+
+
+def load_verified_domain(db, domain: str):
+    """Load a domain by key or raise 404 (sync session; see get_verified_domain)."""
     from sqlalchemy import select
     from ..models.domain import Domain
 
-    stmt = select(Domain).where(Domain.domain_key == domain)
-    domain_obj = db.scalar(stmt)
+    domain_obj = db.scalar(select(Domain).where(Domain.domain_key == domain))
 
     if not domain_obj:
         raise HTTPException(
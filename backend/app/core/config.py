@@ -29,6 +29,16 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./data/icalviewer.db"
     test_database_url: str = "sqlite:///./data/test_icalviewer.db"
 
+    # Connection pooling ("auto": lambda inside Lambda, server otherwise;
+    # "external": an external pooler such as PgBouncer in transaction mode pools for us)
+    db_pool_strategy: str = "auto"  # auto, lambda, server, external
+    db_pool_size: int = 5  # server strategy
+    db_max_overflow: int = 10  # server strategy
+    db_pool_timeout_seconds: float = 10.0
+    db_pool_recycle_seconds: int = 1800  # server strategy
+    db_lambda_pool_recycle_seconds: int = 240  # Recycle before proxy/NAT idle timeouts drop frozen connections
+    bulk_insert_batch_size: int = 1000  # Rows per executemany in bulk_insert()
+
     # DynamoDB settings (for serverless deployment)
     use_dynamodb: bool = False  # Set via USE_DYNAMODB env var
     dynamodb_table_name: str = "filter-ical-table"  # Set via DYNAMODB_TABLE_NAME env var
@@ -41,12 +51,41 @@ class Settings(BaseSettings):
     _allowed_origins: List[str] = ["http://localhost:8000", "http://127.0.0.1:8000"]
     
     # Background job settings
-    sync_interval_minutes: int = 30  # Lambda EventBridge schedule (was 5 for ECS)
+    sync_interval_minutes: int = 30  # Initial interval of a newly seen feed (was 5 for ECS)
     enable_background_tasks: bool = True
     dev_sync_interval_minutes: int = 2  # Faster feedback in development
 
+    # Adaptive per-feed scheduling: ticks (EventBridge / APScheduler) sync only due feeds
+    feed_sync_min_interval_minutes: int = 10  # Also the tick interval (matches the EventBridge rate)
+    feed_sync_max_interval_minutes: int = 24 * 60
+
+    # Background refresh of personal calendars (bounded batch per tick, most stale/exported first)
+    user_calendar_refresh_enabled: bool = True
+    user_calendar_refresh_batch_size: int = 50
+    user_calendar_refresh_concurrency: int = 4
+    user_calendar_refresh_min_age_minutes: int = 60  # Not refreshed again sooner
+    user_calendar_refresh_budget_seconds: float = 60.0
+
+    # Upstream politeness: per-host fetch cap, backoff of failing feeds/hosts, circuit breaker
+    feed_fetch_timeout_seconds: int = 30
+    feed_fetch_host_concurrency: int = 4  # Concurrent fetches per upstream host (per event loop)
+    feed_backoff_base_seconds: float = 60.0  # Doubled per consecutive failure, with jitter
+    feed_backoff_max_seconds: float = 6 * 60 * 60
+    feed_circuit_failure_threshold: int = 3  # Then only single probe fetches until one succeeds
+    feed_host_circuit_min_feeds: int = 3  # Distinct failing feeds before a whole host is backed off
+
     # Lambda execution context
     is_lambda: bool = False  # Set to True via IS_LAMBDA env var
+
+    # Sharded scheduled sync (coordinator invokes one worker per shard)
+    sync_shard_count: int = 1
+    sync_shard_budget_seconds: float = 240.0  # Coordinator waits budget + in-flight domain (timeout: 10 minutes)
+
+    # Per-calendar/domain sync leases (one sync at a time across workers)
+    sync_lock_backend: str = "auto"  # auto (advisory on PostgreSQL, redis if available, else local), redis, advisory, local
+    sync_lock_lease_seconds: float = 120.0  # Renewed while the sync runs
+    sync_lock_wait_seconds: float = 300.0  # How long a request attached to another worker's sync waits
+    sync_lock_poll_seconds: float = 1.0
     
     # Demo data settings
     auto_seed_demo_data: bool = True  # Auto-seed in development
@@ -56,6 +95,21 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379"
     cache_ttl_seconds: int = 300  # 5 minutes
 
+    # Filter export precomputation (after each domain sync)
+    export_cache_ttl_seconds: int = 300  # Matches export Cache-Control max-age
+    export_precompute_max_workers: int = 4  # Concurrent render/cache writes per domain
+    export_precompute_budget_seconds: float = 20.0  # Per-domain budget; remaining filters render on demand
+
+    # Executors keeping CPU-heavy parsing and blocking DB writes off the event loop
+    parse_executor_kind: str = "auto"  # auto (process; thread in Lambda/tests), process, thread
+    parse_executor_workers: int = 2
+    blocking_db_executor_workers: int = 4
+    parallel_parse_min_bytes: int = 1_000_000  # Larger feeds are parsed in VEVENT chunks across the process pool
+
+    # Versioned DynamoDB response cache (keys change with the data, TTL only bounds memory)
+    versioned_cache_ttl_seconds: int = 3600
+    versioned_cache_max_local_entries: int = 64  # Per-container (in-process) tier
+
     # Development settings
     verbose_logging: bool = False  # Extra logging in development
 
@@ -166,6 +220,13 @@ class Settings(BaseSettings):
         if self.is_development:
             return self.dev_sync_interval_minutes
         return self.sync_interval_minutes
+
+    @property
+    def sync_tick_minutes(self) -> int:
+        """Get the scheduler tick (and shortest feed interval) based on environment."""
+        if self.is_development:
+            return self.dev_sync_interval_minutes
+        return self.feed_sync_min_interval_minutes
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -199,4 +260,20 @@ def get_database_url() -> str:
     """Get appropriate database URL based on environment."""
     if settings.is_testing:
         return settings.test_database_url
-    return settings.database_url
\ No newline at end of file
+    return settings.database_url
+
+
+# Async drivers for the sync URL schemes (asyncpg for Postgres, aiosqlite locally)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """Get the database URL with an async driver (same database as get_database_url)."""
+    database_url = get_database_url()
+    scheme, separator, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}"
\ No newline at end of file
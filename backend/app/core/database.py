@@ -1,25 +1,39 @@
 """Database configuration and session management for rapid development."""
 
-from sqlalchemy import create_engine
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine, insert
 from sqlalchemy.ext.declarative import declarative_base  
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
 
-from .config import get_database_url
+from .config import settings, get_database_url, get_async_database_url
+from .db_pool import pool_options, instrument_engine
+
+
+# Pool metrics per engine ("sync", "async"), see get_pool_metrics()
+_pool_metrics = {}
 
 
 # Create engine with proper SQLite settings
 def create_db_engine(database_url: str):
-    """Create database engine with appropriate settings."""
+    """Create database engine with the configured pool strategy and metrics."""
     connect_args = {}
     if database_url.startswith("sqlite"):
         connect_args = {"check_same_thread": False}
-    
-    return create_engine(
+
+    options = pool_options(database_url)
+    connect_args.update(options.pop("connect_args", {}))
+
+    engine = create_engine(
         database_url,
         connect_args=connect_args,
-        echo=False  # Set to True for SQL logging in development
+        echo=False,  # Set to True for SQL logging in development
+        **options
     )
+    _pool_metrics["sync"] = instrument_engine(engine, database_url, options)
+    return engine
 
 
 # Database engine and session
@@ -39,6 +53,45 @@ def get_db():
         db.close()
 
 
+def create_async_db_engine(database_url: str):
+    """Create async database engine (asyncpg / aiosqlite) with the configured pool strategy."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    options = pool_options(database_url)
+    engine = create_async_engine(database_url, echo=False, **options)
+    _pool_metrics["async"] = instrument_engine(engine.sync_engine, database_url, options)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker():
+    """
+    Async session factory, created on first use.
+
+    Lazy so processes that never serve the async read paths (sync tasks,
+    DynamoDB mode) don't need the async drivers.
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(
+        create_async_db_engine(get_async_database_url()),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db():
+    """
+    FastAPI dependency to get an async database session.
+
+    Used by the hot read paths. Existing service functions run unchanged via
+    `await db.run_sync(service_fn, *args)`: their queries are awaited on the
+    async connection, so the event loop serves other requests during I/O.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
 def create_tables():
     """Create all database tables (rapid development approach)."""
     Base.metadata.create_all(bind=engine)
@@ -51,4 +104,59 @@ def drop_tables():
 
 def get_session_sync():
     """Get synchronous database session for background tasks and seeding."""
-    return SessionLocal()
\ No newline at end of file
+    return SessionLocal()
+
+
+def bulk_insert(db, table, rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+    """
+    Insert many rows in the session's transaction without ORM objects.
+
+    Each batch is one executemany of a Core INSERT, which SQLAlchemy sends
+    as multi-row INSERT ... VALUES statements (insertmanyvalues) on SQLite
+    and PostgreSQL instead of one statement per row. Column defaults still
+    apply; the session's identity map is bypassed.
+
+    Args:
+        db: Database session
+        table: Model class or Table to insert into
+        rows: Column values per row (all rows with the same keys)
+        batch_size: Rows per executemany (default: settings.bulk_insert_batch_size)
+
+    Returns:
+        Number of rows inserted
+    """
+    table = getattr(table, "__table__", table)
+    batch_size = batch_size or settings.bulk_insert_batch_size
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(table), rows[start:start + batch_size])
+    return len(rows)
+
+
+def bulk_insert_returning_ids(db, table, rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> List[Any]:
+    """
+    Insert many rows like bulk_insert and return their new primary keys.
+
+    Uses INSERT ... RETURNING, which insertmanyvalues keeps batched and in
+    parameter order on SQLite (3.35+) and PostgreSQL.
+
+    Args:
+        db: Database session
+        table: Model class or Table to insert into (single-column primary key)
+        rows: Column values per row (all rows with the same keys)
+        batch_size: Rows per executemany (default: settings.bulk_insert_batch_size)
+
+    Returns:
+        Primary keys in the order of rows
+    """
+    table = getattr(table, "__table__", table)
+    batch_size = batch_size or settings.bulk_insert_batch_size
+    statement = insert(table).returning(*table.primary_key.columns, sort_by_parameter_order=True)
+    ids = []
+    for start in range(0, len(rows), batch_size):
+        ids.extend(db.execute(statement, rows[start:start + batch_size]).scalars().all())
+    return ids
+
+
+def get_pool_metrics() -> dict:
+    """Checkout latency and saturation of the engines created so far."""
+    return {name: metrics.snapshot() for name, metrics in _pool_metrics.items()}
@@ -0,0 +1,174 @@
+"""
+Connection pool strategy and metrics for the SQL engines.
+
+Strategies (settings.db_pool_strategy):
+- lambda: one connection per container (plus one overflow), pre-ping and
+  recycle before idle timeouts - frozen containers must not hold on to
+  dead connections or exhaust max_connections during bursts
+- server: sized pool for long-running processes
+- external: no application-side pooling; an external pooler (PgBouncer in
+  transaction mode) multiplexes connections, so prepared statement caches
+  are disabled
+- auto: lambda inside Lambda, server otherwise
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+
+from .config import settings
+
+POOL_STRATEGIES = ("lambda", "server", "external")
+LATENCY_SAMPLES = 1000
+
+
+def resolve_pool_strategy(strategy: Optional[str] = None) -> str:
+    """Resolve "auto" (or None) to a concrete pool strategy."""
+    strategy = (strategy or settings.db_pool_strategy).lower()
+    if strategy == "auto":
+        return "lambda" if settings.is_lambda else "server"
+    if strategy not in POOL_STRATEGIES:
+        raise ValueError(f"Unknown database pool strategy: {strategy}")
+    return strategy
+
+
+def pool_options(database_url: str, strategy: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for a pool strategy.
+
+    SQLite keeps SQLAlchemy's defaults (file/memory pools are driver specific).
+
+    Args:
+        database_url: Database URL the engine is created for
+        strategy: Pool strategy (default: settings.db_pool_strategy)
+
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+
+    strategy = resolve_pool_strategy(strategy)
+
+    if strategy == "external":
+        options = {"poolclass": NullPool}
+        if "+asyncpg" in database_url:
+            # Transaction pooling hands each transaction a different server connection
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+
+    if strategy == "lambda":
+        return {
+            "pool_size": 1,
+            "max_overflow": 1,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+            "pool_recycle": settings.db_lambda_pool_recycle_seconds,
+            "pool_pre_ping": True,
+        }
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": True,
+    }
+
+
+class PoolMetrics:
+    """
+    Checkout latency and saturation of one engine's connection pool.
+
+    Latency covers the whole checkout (waiting for a free connection,
+    connecting, pre-ping). Counters survive engine.dispose().
+    """
+
+    def __init__(self, engine, strategy: str, capacity: Optional[int]):
+        self.strategy = strategy
+        self.capacity = capacity  # None: unbounded (NullPool / SQLite defaults)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._in_use = 0
+        self._peak_in_use = 0
+
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+        raw_connection = engine.raw_connection
+
+        def timed_raw_connection(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return raw_connection(*args, **kwargs)
+            except PoolTimeoutError:
+                with self._lock:
+                    self._timeouts += 1
+                raise
+            finally:
+                with self._lock:
+                    self._latencies.append(time.perf_counter() - started)
+
+        engine.raw_connection = timed_raw_connection
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._in_use = max(self._in_use - 1, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics (latencies in milliseconds over the recent checkouts)."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            in_use = self._in_use
+            result = {
+                "strategy": self.strategy,
+                "capacity": self.capacity,
+                "in_use": in_use,
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+            }
+
+        result["saturation"] = round(in_use / self.capacity, 3) if self.capacity else None
+        if latencies:
+            result["checkout_ms"] = {
+                "p50": round(latencies[len(latencies) // 2] * 1000, 3),
+                "p95": round(latencies[int(len(latencies) * 0.95)] * 1000, 3),
+                "max": round(latencies[-1] * 1000, 3),
+            }
+        else:
+            result["checkout_ms"] = None
+        return result
+
+
+def instrument_engine(engine, database_url: str, options: Dict[str, Any],
+                      strategy: Optional[str] = None) -> PoolMetrics:
+    """
+    Attach pool metrics to a sync engine (or an AsyncEngine's sync_engine).
+
+    Args:
+        engine: Engine to instrument
+        database_url: URL the engine was created for
+        options: pool_options() the engine was created with
+        strategy: Pool strategy the options were resolved from
+
+    Returns:
+        PoolMetrics for the engine
+    """
+    capacity = None
+    if "pool_size" in options:
+        capacity = options["pool_size"] + options.get("max_overflow", 0)
+    label = "sqlite" if database_url.startswith("sqlite") else resolve_pool_strategy(strategy)
+    return PoolMetrics(engine, label, capacity)
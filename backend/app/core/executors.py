@@ -0,0 +1,156 @@
+"""
+Bounded executors for work that must not run on the event loop.
+
+- parse_executor: CPU-bound iCal parsing. Process pool by default so
+  parsing multi-megabyte feeds doesn't hold the GIL of the serving process;
+  thread pool in Lambda (no /dev/shm for multiprocessing) and tests.
+- blocking_db_executor: thread pool for blocking ORM writes.
+
+Each executor records queue depth and wait/run durations, see
+get_executor_metrics().
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import settings
+
+DURATION_SAMPLES = 1000
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict):
+    """Run fn in the worker and report when it started (CLOCK_MONOTONIC is system-wide)."""
+    started = time.monotonic()
+    return started, fn(*args, **kwargs)
+
+
+def _percentiles_ms(samples: List[float]) -> Optional[Dict[str, float]]:
+    if not samples:
+        return None
+    samples = sorted(samples)
+    return {
+        "p50": round(samples[len(samples) // 2] * 1000, 3),
+        "p95": round(samples[int(len(samples) * 0.95)] * 1000, 3),
+        "max": round(samples[-1] * 1000, 3),
+    }
+
+
+class InstrumentedExecutor:
+    """
+    Size-limited executor with queue depth and duration metrics.
+
+    The pool is created on first use, so importing this module never
+    starts worker processes.
+    """
+
+    def __init__(self, name: str, kind: str, max_workers: int):
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_times = deque(maxlen=DURATION_SAMPLES)
+        self._run_times = deque(maxlen=DURATION_SAMPLES)
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix=self.name
+                    )
+            return self._pool
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) in the pool and await its result.
+
+        For process pools fn, its arguments and result must be picklable.
+        """
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        with self._lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        try:
+            started, result = await loop.run_in_executor(self._get_pool(), _timed_call, fn, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        finished = time.monotonic()
+        with self._lock:
+            self._completed += 1
+            self._wait_times.append(max(started - submitted, 0.0))
+            self._run_times.append(finished - started)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics; queue_depth counts tasks waiting for a free worker."""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(self._in_flight - self.max_workers, 0),
+                "peak_in_flight": self._peak_in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "wait_ms": _percentiles_ms(list(self._wait_times)),
+                "run_ms": _percentiles_ms(list(self._run_times)),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool (a later run() starts a new one)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+def resolve_parse_executor_kind(kind: Optional[str] = None) -> str:
+    """Resolve "auto": process pools only where multiprocessing works and pays off."""
+    kind = (kind or settings.parse_executor_kind).lower()
+    if kind == "auto":
+        return "thread" if settings.is_lambda or settings.is_testing else "process"
+    if kind not in ("process", "thread"):
+        raise ValueError(f"Unknown parse executor kind: {kind}")
+    return kind
+
+
+parse_executor = InstrumentedExecutor(
+    "parse", resolve_parse_executor_kind(), settings.parse_executor_workers
+)
+blocking_db_executor = InstrumentedExecutor(
+    "blocking-db", "thread", settings.blocking_db_executor_workers
+)
+
+
+def get_executor_metrics() -> Dict[str, Dict[str, Any]]:
+    """Queue depth and durations of all executors."""
+    return {executor.name: executor.snapshot() for executor in (parse_executor, blocking_db_executor)}
+
+
+def shutdown_executors() -> None:
+    """Stop all executor pools (application shutdown)."""
+    for executor in (parse_executor, blocking_db_executor):
+        executor.shutdown()
@@ -41,6 +41,7 @@ class ErrorMessages:
     RECURRING_EVENT_TITLE_REQUIRED = "recurring_event_title is required"
     RECURRING_EVENT_TITLES_REQUIRED = "recurring_event_titles is required"
     GROUP_ID_AND_EVENTS_REQUIRED = "group_id and recurring_event_titles are required"
+    EVENT_SELECTION_REQUIRED = "title or group_id is required"
     EMAIL_REQUIRED_FOR_PASSWORD = "Email address is required when setting a password (needed for password reset)"
     EMAIL_REQUIRED_FOR_DOMAIN_REQUEST = "Email address is required to request a domain. Please add an email to your profile first."
 
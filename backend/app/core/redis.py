@@ -171,4 +171,26 @@ def get_cache_ttl(key: str) -> int:
         return client.ttl(key)
     except Exception as e:
         # Silently fail when Redis is unavailable (graceful degradation)
-        return -2
\ No newline at end of file
+        return -2
+
+
+def is_redis_reachable() -> bool:
+    """
+    Check whether the Redis server answers.
+    
+    Returns:
+        True if a PING succeeds, False otherwise
+        
+    I/O Operation - Redis ping.
+    """
+    if not REDIS_AVAILABLE:
+        return False
+    
+    try:
+        client = get_redis_client()
+        if client is None:
+            return False
+        return bool(client.ping())
+    except Exception:
+        # Silently fail when Redis is unavailable (graceful degradation)
+        return False
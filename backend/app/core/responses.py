@@ -0,0 +1,31 @@
+"""
+Fast JSON response rendering for large payloads.
+
+IMPERATIVE SHELL - HTTP response serialization.
+
+Endpoints returning large event payloads hand their dictionaries directly to
+FastJSONResponse, skipping FastAPI's jsonable_encoder pass. orjson serializes
+datetimes natively; the stdlib fallback keeps things working without it.
+"""
+
+import json
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # Set to None when not available
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (stdlib json fallback)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -13,8 +13,11 @@ from sqlalchemy.orm import Session
 
 from .config import settings
 from .database import get_db
-from ..services.cache_service import warm_domain_cache
-from ..services.domain_service import ensure_domain_calendar_exists, load_domains_config, auto_assign_events_with_rules
+from .sync_lock import run_unless_leased
+from ..services.domain_service import load_domains_config
+from ..services.domain_sync_service import sync_domain
+from ..services.sync_schedule_service import get_due_domains
+from ..services.user_calendar_refresh_service import refresh_user_calendars
 
 
 # Global scheduler instance
@@ -64,9 +67,10 @@ def get_domain_keys() -> List[str]:
 
 def sync_domain_calendars_task():
     """
-    Background task to sync all domain calendars and warm cache.
+    Background task to sync due domain calendars and warm cache.
     
-    This runs every 5 minutes to keep data fresh.
+    Runs every tick (settings.sync_tick_minutes); each feed is synced when
+    due by its adaptive schedule.
     
     I/O Operation - Database and cache operations.
     """
@@ -90,43 +94,28 @@ def sync_domain_calendars_task():
                 print(f"❌ Failed to load domains config: {error}")
                 return
             
-            # Process each domain
+            # Process only feeds due by their adaptive schedule, most subscribed first
+            due_keys = get_due_domains(db, domain_keys)
+            print(f"📅 {len(due_keys)} of {len(domain_keys)} domain feeds due")
             synced_count = 0
             cached_count = 0
             
-            for domain_key in domain_keys:
+            for domain_key in due_keys:
                 try:
-                    # Ensure domain calendar exists and is synced
-                    success, calendar, sync_error = asyncio.run(
-                        ensure_domain_calendar_exists(db, domain_key)
+                    # Sync, rules, cache and exports on one in-memory event set
+                    ran, result = asyncio.run(
+                        run_unless_leased(f"domain:{domain_key}", lambda: sync_domain(db, domain_key))
                     )
-
-                    if success:
-                        print(f"✅ Synced domain calendar: {domain_key}")
-                        synced_count += 1
-
-                        # Apply assignment rules to newly synced events
-                        rule_success, assignment_count, rule_error = asyncio.run(
-                            auto_assign_events_with_rules(db, domain_key)
-                        )
-                        if rule_success and assignment_count > 0:
-                            print(f"📋 Applied {assignment_count} assignment rules for domain: {domain_key}")
-                        elif not rule_success:
-                            print(f"⚠️ Rule application failed for domain {domain_key}: {rule_error}")
-
-                        # Warm cache for this domain
-                        cache_success = warm_domain_cache(db, domain_key)
-                        if cache_success:
-                            print(f"🔥 Warmed cache for domain: {domain_key}")
-                            cached_count += 1
-                        else:
-                            print(f"⚠️ Cache warming failed for domain: {domain_key}")
-                    else:
-                        print(f"❌ Failed to sync domain {domain_key}: {sync_error}")
-
                 except Exception as domain_error:
                     print(f"❌ Error processing domain {domain_key}: {domain_error}")
                     continue
+
+                if not ran:
+                    # Another worker's scheduler is already processing this domain
+                    print(f"⏭️ Domain {domain_key} is being synced by another worker")
+                    continue
+                synced_count += result["synced"]
+                cached_count += result["cached"]
             
             print(f"📊 Sync completed: {synced_count} calendars synced, {cached_count} caches warmed")
             
@@ -138,6 +127,28 @@ def sync_domain_calendars_task():
         print(f"❌ Background sync task error: {e}")
 
 
+def refresh_user_calendars_task():
+    """
+    Background task to refresh a batch of personal calendars.
+
+    One worker per tick does the refresh (the other workers skip it).
+
+    I/O Operation - Calendar syncs.
+    """
+    try:
+        ran, result = asyncio.run(run_unless_leased(
+            "user_calendar_refresh",
+            lambda: refresh_user_calendars(settings.user_calendar_refresh_budget_seconds)
+        ))
+        if ran:
+            print(
+                f"👤 User calendar refresh: {result['refreshed']}/{result['selected']} refreshed, "
+                f"{result['failed']} failed, {result['deferred']} deferred"
+            )
+    except Exception as e:
+        print(f"❌ User calendar refresh error: {e}")
+
+
 def start_scheduler():
     """
     Start the background scheduler with domain sync task.
@@ -150,15 +161,25 @@ def start_scheduler():
         # Add the domain sync task
         scheduler.add_job(
             sync_domain_calendars_task,
-            trigger=IntervalTrigger(minutes=settings.actual_sync_interval_minutes),
+            trigger=IntervalTrigger(minutes=settings.sync_tick_minutes),
             id="domain_calendar_sync",
             name="Domain Calendar Sync and Cache Warming",
             replace_existing=True
         )
         
+        # Add the personal calendar refresh task
+        if settings.user_calendar_refresh_enabled:
+            scheduler.add_job(
+                refresh_user_calendars_task,
+                trigger=IntervalTrigger(minutes=settings.sync_tick_minutes),
+                id="user_calendar_refresh",
+                name="User Calendar Background Refresh",
+                replace_existing=True
+            )
+        
         # Start the scheduler
         scheduler.start()
-        print(f"🕒 Scheduler started: syncing every {settings.actual_sync_interval_minutes} minutes")
+        print(f"🕒 Scheduler started: checking for due feeds every {settings.sync_tick_minutes} minutes")
         
     except Exception as e:
         print(f"❌ Failed to start scheduler: {e}")
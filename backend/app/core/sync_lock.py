@@ -0,0 +1,359 @@
+"""
+Lease-based locks so a calendar/domain is synced by one worker at a time.
+
+Every uvicorn worker runs the scheduled sync, and manual/admin endpoints
+trigger syncs too. Overlapping delete-and-reinsert cycles on one calendar
+waste upstream and database capacity and can leave duplicated events.
+
+Backends (settings.sync_lock_backend):
+- redis: SET NX PX lease, renewed while the sync runs and released with a
+  token check (an expired lease is never released by its old holder)
+- advisory: PostgreSQL session advisory lock on a dedicated connection;
+  released by the server if the holder's connection dies. Lease
+  connections come from their own unpooled engine, so held leases never
+  compete with request/sync sessions for the (small) main pool
+- local: in-process only (development/tests)
+- auto: advisory on PostgreSQL, redis when available, local otherwise
+
+run_exclusive() attaches concurrent requests to the in-flight sync: in the
+same process they await its result, across processes they wait for the
+lease to be released and read the published result.
+
+IMPERATIVE SHELL - I/O operations for distributed locking.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from .config import settings, get_database_url
+from .redis import REDIS_AVAILABLE, get_redis_client, get_cache, set_cache
+
+logger = logging.getLogger(__name__)
+
+SyncResult = Tuple[bool, int, str]
+T = TypeVar("T")
+
+LOCK_BACKENDS = ("redis", "advisory", "local")
+
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then return redis.call("del", KEYS[1]) end
+return 0
+"""
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then return redis.call("pexpire", KEYS[1], ARGV[2]) end
+return 0
+"""
+
+
+class RedisLeaseLock:
+    """Lease in Redis; the token proves ownership for renew/release."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def acquire(self, key: str, lease_seconds: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        if self.client.set(f"sync_lock:{key}", token, nx=True, px=int(lease_seconds * 1000)):
+            return token
+        return None
+
+    def renew(self, key: str, token: str, lease_seconds: float) -> bool:
+        return bool(self.client.eval(_RENEW_SCRIPT, 1, f"sync_lock:{key}", token, int(lease_seconds * 1000)))
+
+    def release(self, key: str, token: str) -> None:
+        self.client.eval(_RELEASE_SCRIPT, 1, f"sync_lock:{key}", token)
+
+    def is_held(self, key: str) -> bool:
+        return bool(self.client.exists(f"sync_lock:{key}"))
+
+
+def advisory_lock_id(key: str) -> int:
+    """Stable signed 64-bit lock id for a key (pg_advisory_lock takes a bigint)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+class AdvisoryLeaseLock:
+    """
+    PostgreSQL session advisory lock held on a dedicated connection.
+
+    The lease lasts as long as the connection: no renewal is needed, and a
+    crashed holder's lock is dropped with its connection.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._connections: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _try_lock(self, connection, key: str) -> bool:
+        from sqlalchemy import text
+
+        return bool(connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": advisory_lock_id(key)}
+        ).scalar())
+
+    def acquire(self, key: str, lease_seconds: float) -> Optional[str]:
+        connection = self.engine.connect()
+        try:
+            acquired = self._try_lock(connection, key)
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return None
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._connections[token] = connection
+        return token
+
+    def renew(self, key: str, token: str, lease_seconds: float) -> bool:
+        return token in self._connections
+
+    def release(self, key: str, token: str) -> None:
+        from sqlalchemy import text
+
+        with self._lock:
+            connection = self._connections.pop(token, None)
+        if connection is None:
+            return
+        try:
+            connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": advisory_lock_id(key)})
+            connection.commit()
+        finally:
+            connection.close()
+
+    def is_held(self, key: str) -> bool:
+        from sqlalchemy import text
+
+        with self.engine.connect() as connection:
+            if not self._try_lock(connection, key):
+                return True
+            connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": advisory_lock_id(key)})
+            connection.commit()
+            return False
+
+
+class LocalLeaseLock:
+    """In-process lease (single worker); expired leases can be taken over."""
+
+    def __init__(self):
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, lease_seconds: float) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease and lease[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._leases[key] = (token, now + lease_seconds)
+            return token
+
+    def renew(self, key: str, token: str, lease_seconds: float) -> bool:
+        with self._lock:
+            lease = self._leases.get(key)
+            if not lease or lease[0] != token:
+                return False
+            self._leases[key] = (token, time.monotonic() + lease_seconds)
+            return True
+
+    def release(self, key: str, token: str) -> None:
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease and lease[0] == token:
+                del self._leases[key]
+
+    def is_held(self, key: str) -> bool:
+        with self._lock:
+            lease = self._leases.get(key)
+            return bool(lease and lease[1] > time.monotonic())
+
+
+def resolve_lock_backend(backend: Optional[str] = None) -> str:
+    """Resolve "auto" to a concrete lock backend."""
+    backend = (backend or settings.sync_lock_backend).lower()
+    if backend == "auto":
+        if get_database_url().startswith(("postgresql", "postgres")):
+            return "advisory"
+        if REDIS_AVAILABLE:
+            return "redis"
+        return "local"
+    if backend not in LOCK_BACKENDS:
+        raise ValueError(f"Unknown sync lock backend: {backend}")
+    return backend
+
+
+_sync_lock = None
+
+
+def create_lock_engine(database_url: str):
+    """
+    Engine for advisory lock connections.
+
+    NullPool: each held lease opens its own connection and closes it on
+    release, independent of the main engine's pool size and timeout.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import NullPool
+
+    return create_engine(database_url, poolclass=NullPool)
+
+
+def get_sync_lock():
+    """
+    Get or create the configured lock backend.
+
+    I/O Operation - Lock backend management.
+    """
+    global _sync_lock
+
+    if _sync_lock is None:
+        backend = resolve_lock_backend()
+        if backend == "redis":
+            _sync_lock = RedisLeaseLock(get_redis_client())
+        elif backend == "advisory":
+            _sync_lock = AdvisoryLeaseLock(create_lock_engine(get_database_url()))
+        else:
+            _sync_lock = LocalLeaseLock()
+
+    return _sync_lock
+
+
+# In-flight syncs of this process (any thread / event loop) by lock key
+_inflight: Dict[str, concurrent.futures.Future] = {}
+_inflight_lock = threading.Lock()
+
+
+async def _keep_renewed(lock, key: str, token: str) -> None:
+    while True:
+        await asyncio.sleep(settings.sync_lock_lease_seconds / 3)
+        try:
+            if not lock.renew(key, token, settings.sync_lock_lease_seconds):
+                logger.warning(f"Sync lease for {key} was lost before the sync finished")
+                return
+        except Exception as e:
+            logger.warning(f"Could not renew sync lease for {key}: {e}")
+
+
+async def _await_remote_result(lock, key: str, attached_result: Callable[[], SyncResult]) -> SyncResult:
+    """Wait for another worker's sync of key and return its outcome."""
+    wait_started = time.time()
+    deadline = time.monotonic() + settings.sync_lock_wait_seconds
+    while lock.is_held(key):
+        if time.monotonic() >= deadline:
+            return False, 0, "Sync already in progress"
+        await asyncio.sleep(settings.sync_lock_poll_seconds)
+
+    published = get_cache(f"sync_result:{key}")
+    if published and published.get("finished_at", 0) >= wait_started:
+        return published["success"], published["event_count"], published["error"]
+    # No published outcome (no Redis, or the holder died): report the stored state
+    return attached_result()
+
+
+async def _hold_lease(lock, key: str, token: str, fn: Callable[[], Awaitable[T]]) -> T:
+    """Run fn while renewing the held lease, then release it."""
+    renewer = asyncio.create_task(_keep_renewed(lock, key, token))
+    try:
+        return await fn()
+    finally:
+        renewer.cancel()
+        try:
+            lock.release(key, token)
+        except Exception as e:
+            logger.warning(f"Could not release sync lease for {key}: {e}")
+
+
+async def _run_with_lease(key: str, sync_fn: Callable[[], Awaitable[SyncResult]],
+                          attached_result: Callable[[], SyncResult]) -> SyncResult:
+    lock = get_sync_lock()
+    try:
+        token = lock.acquire(key, settings.sync_lock_lease_seconds)
+    except Exception as e:
+        # Lock backend unavailable: sync unlocked rather than not at all
+        logger.warning(f"Sync lock unavailable for {key}, syncing without lock: {e}")
+        return await sync_fn()
+
+    if token is None:
+        return await _await_remote_result(lock, key, attached_result)
+
+    result = await _hold_lease(lock, key, token, sync_fn)
+    set_cache(
+        f"sync_result:{key}",
+        {"success": result[0], "event_count": result[1], "error": result[2], "finished_at": time.time()},
+        int(settings.sync_lock_wait_seconds),
+    )
+    return result
+
+
+async def run_exclusive(key: str, sync_fn: Callable[[], Awaitable[SyncResult]],
+                        attached_result: Callable[[], SyncResult]) -> SyncResult:
+    """
+    Run sync_fn unless a sync of key is already running; then attach to it.
+
+    Args:
+        key: Lock key (e.g. "calendar:42")
+        sync_fn: Starts the sync, returns (success, event_count, error)
+        attached_result: Outcome to report when another worker's sync finished
+            without publishing one (reads the stored state)
+
+    Returns:
+        Tuple of (success, event_count, error_message) of the sync that ran
+
+    I/O Operation - Distributed lock around the sync.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = concurrent.futures.Future()
+
+    if not owner:
+        # Same process: the owner may run on another thread's event loop
+        return await asyncio.wrap_future(future)
+
+    try:
+        result = await _run_with_lease(key, sync_fn, attached_result)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+async def run_unless_leased(key: str, job: Callable[[], Awaitable[T]]) -> Tuple[bool, Optional[T]]:
+    """
+    Run job under the lease for key, or skip it if the lease is held elsewhere.
+
+    Used by background jobs that skip work another worker is already doing.
+    The lease is renewed while the job runs, so long jobs keep it. Lock
+    backend errors are logged and the job runs unlocked.
+
+    Returns:
+        Tuple of (ran, job result)
+
+    I/O Operation - Distributed lock around a background job.
+    """
+    try:
+        lock = get_sync_lock()
+        token = lock.acquire(key, settings.sync_lock_lease_seconds)
+    except Exception as e:
+        logger.warning(f"Sync lock unavailable for {key}: {e}")
+        return True, await job()
+
+    if token is None:
+        return False, None
+    return True, await _hold_lease(lock, key, token, job)
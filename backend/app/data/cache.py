@@ -190,6 +190,85 @@ def validate_cached_domain_events(cached_data: Dict[str, Any]) -> bool:
         return False
 
 
+def generate_filter_export_cache_key(link_uuid: str) -> str:
+    """
+    Generate cache key for a rendered filter export.
+    
+    Args:
+        link_uuid: Filter export UUID (/ical/{uuid}.ics)
+        
+    Returns:
+        Cache key string
+        
+    Pure function - deterministic key generation.
+    """
+    return f"filter_export:{link_uuid}"
+
+
+def create_filter_export_cache_entry(ical_content: str, etag: str,
+                                     last_modified: datetime) -> Dict[str, Any]:
+    """
+    Create cache entry for a rendered filter export.
+    
+    Args:
+        ical_content: Rendered iCal body
+        etag: ETag header value for the body
+        last_modified: Last-Modified timestamp for the export
+        
+    Returns:
+        Cache-ready data structure
+        
+    Pure function - data transformation.
+    """
+    return {
+        "content": ical_content,
+        "etag": etag,
+        "last_modified": last_modified.isoformat(),
+        "cached_at": datetime.now(timezone.utc).isoformat()
+    }
+
+
+def validate_cached_filter_export(cached_data: Any) -> bool:
+    """
+    Validate cached filter export structure.
+    
+    Args:
+        cached_data: Data retrieved from cache
+        
+    Returns:
+        True if entry can be served, False otherwise
+        
+    Pure function - structure validation.
+    """
+    if not isinstance(cached_data, dict):
+        return False
+    
+    return all(isinstance(cached_data.get(key), str) for key in ("content", "etag", "last_modified"))
+
+
+def generate_versioned_domain_cache_key(kind: str, domain_key: str, generation: Dict[str, int],
+                                        counters: List[str]) -> str:
+    """
+    Generate cache key for domain data derived from versioned inputs.
+    
+    The key embeds the domain's change counters, so entries never need
+    invalidation: any change to an input yields a new key.
+    
+    Args:
+        kind: Cached data kind (e.g. "events", "title_counts")
+        domain_key: Domain identifier
+        generation: Domain change counters (version, sync_generation, assignment_version)
+        counters: Names of the counters the cached data depends on
+        
+    Returns:
+        Cache key string
+        
+    Pure function - deterministic key generation.
+    """
+    suffix = ":".join(f"{name}={generation.get(name, 0)}" for name in counters)
+    return f"ddb_{kind}:{domain_key}:{suffix}"
+
+
 def get_cache_keys_for_domain(domain_key: str) -> List[str]:
     """
     Get all cache keys associated with a domain.
@@ -6,6 +6,7 @@ All calendar business logic without I/O operations.
 """
 
 import uuid
+import hashlib
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
 from app.core.result import Result, ok, fail
@@ -116,6 +117,57 @@ def create_event_data(calendar_id: Any, event_data: Dict[str, Any]) -> Dict[str,
     }
 
 
+def create_domain_event_data(event_row: Dict[str, Any], domain_key: str) -> Dict[str, Any]:
+    """
+    Create the domain event structure (grouping, rules, exports) from a stored event row.
+
+    Datetimes are normalized as a round trip through the naive DateTime
+    columns returns them (wall time kept, tzinfo dropped), so rows carried
+    in memory from a sync build the same data as rows read back.
+
+    Args:
+        event_row: Event column values (ORM __dict__ or inserted row with "id")
+        domain_key: Domain identifier
+
+    Returns:
+        Domain event dictionary
+
+    Pure function - transforms data structure.
+    """
+    # Extract raw_ical for category matching
+    raw_ical = ""
+    other_ical_fields = event_row.get("other_ical_fields")
+    if other_ical_fields and isinstance(other_ical_fields, dict):
+        # Prefer original raw_ical if available (contains full iCal data)
+        raw_ical = other_ical_fields.get('raw_ical', '')
+
+        # If no raw_ical but we have parsed categories, reconstruct minimal format
+        if not raw_ical:
+            categories = other_ical_fields.get('categories', [])
+            if categories:
+                raw_ical = "\n".join([f"CATEGORIES:{cat}" for cat in categories])
+
+    start_time, end_time = (
+        value.replace(tzinfo=None) if isinstance(value, datetime) else value
+        for value in (event_row.get("start_time"), event_row.get("end_time"))
+    )
+    return {
+        "id": f"evt_{event_row['id']}",
+        "calendar_id": f"domain_{domain_key}",
+        "title": event_row.get("title"),
+        "start_time": start_time,  # Fixed: use start_time for export compatibility
+        "end_time": end_time,      # Fixed: use end_time for export compatibility
+        "description": event_row.get("description") or "",
+        "location": event_row.get("location"),
+        "uid": event_row.get("uid"),
+        "raw_ical": raw_ical,  # For category matching in rules (reconstructed with CATEGORIES)
+        # Keep legacy format for domain UI compatibility
+        "start": start_time.isoformat() if start_time else None,
+        "end": end_time.isoformat() if end_time else None,
+        "is_recurring": False  # Will be determined by grouping
+    }
+
+
 def filter_events_by_date_range(events: List[Dict[str, Any]], 
                                start_date: Optional[datetime] = None,
                                end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
@@ -332,6 +384,7 @@ def apply_filter_to_events(events: List[Dict[str, Any]], filter_data: Dict[str,
     if not subscribed_event_ids:
         return []
 
+    subscribed_titles = set(subscribed_event_ids)
     filter_created_at = filter_data.get("created_at")
     filtered = []
 
@@ -339,7 +392,7 @@ def apply_filter_to_events(events: List[Dict[str, Any]], filter_data: Dict[str,
         event_title = event.get("title")
 
         # Check if event title matches subscribed titles
-        if event_title not in subscribed_event_ids:
+        if event_title not in subscribed_titles:
             continue
 
         # If NOT including future events, filter by creation date
@@ -354,6 +407,23 @@ def apply_filter_to_events(events: List[Dict[str, Any]], filter_data: Dict[str,
     return filtered
 
 
+def _export_header_lines(filter_name: str) -> List[str]:
+    """VCALENDAR header lines for a filtered export."""
+    return [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//Filter iCal//{filter_name}//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        # RFC 7986: Suggested refresh interval (5 minutes for dynamic calendars)
+        "REFRESH-INTERVAL;VALUE=DURATION:PT5M",
+        # Legacy property for Apple Calendar and Outlook compatibility
+        "X-PUBLISHED-TTL:PT5M",
+        f"X-WR-CALNAME:{filter_name}",
+        "X-WR-CALDESC:Filtered calendar from Filter iCal"
+    ]
+
+
 def transform_events_for_export(events: List[Dict[str, Any]], filter_name: str) -> str:
     """
     Transform events into iCal format for export.
@@ -367,19 +437,7 @@ def transform_events_for_export(events: List[Dict[str, Any]], filter_name: str)
 
     Pure function - deterministic text transformation.
     """
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        f"PRODID:-//Filter iCal//{filter_name}//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        # RFC 7986: Suggested refresh interval (5 minutes for dynamic calendars)
-        "REFRESH-INTERVAL;VALUE=DURATION:PT5M",
-        # Legacy property for Apple Calendar and Outlook compatibility
-        "X-PUBLISHED-TTL:PT5M",
-        f"X-WR-CALNAME:{filter_name}",
-        "X-WR-CALDESC:Filtered calendar from Filter iCal"
-    ]
+    lines = _export_header_lines(filter_name)
 
     for event in events:
         # Always regenerate VEVENT blocks to ensure fresh metadata (DTSTAMP, SEQUENCE)
@@ -392,12 +450,66 @@ def transform_events_for_export(events: List[Dict[str, Any]], filter_name: str)
     return "\n".join(lines)
 
 
-def _generate_vevent_from_data(event: Dict[str, Any]) -> List[str]:
+def render_vevent_fragments(events: List[Dict[str, Any]], dtstamp: datetime) -> List[str]:
+    """
+    Render each event into a VEVENT text fragment once.
+
+    Fragments are shared by every filter export of the same event set, so a
+    domain with many filters renders each event a single time. A fixed
+    dtstamp keeps the fragments (and export ETags) stable between syncs.
+
+    Args:
+        events: List of events to render
+        dtstamp: Timestamp used for DTSTAMP (and LAST-MODIFIED fallback)
+
+    Returns:
+        List of VEVENT fragments, aligned with events
+
+    Pure function - deterministic text transformation.
+    """
+    return ["\n".join(_generate_vevent_from_data(event, dtstamp)) for event in events]
+
+
+def assemble_export_from_fragments(fragments: List[str], filter_name: str) -> str:
+    """
+    Assemble a filtered export from pre-rendered VEVENT fragments.
+
+    Produces the same layout as transform_events_for_export.
+
+    Args:
+        fragments: VEVENT fragments of the filtered events (in order)
+        filter_name: Name of the filter for iCal metadata
+
+    Returns:
+        iCal formatted string
+
+    Pure function - string assembly.
+    """
+    return "\n".join(_export_header_lines(filter_name) + fragments + ["END:VCALENDAR"])
+
+
+def generate_export_etag(ical_content: str) -> str:
+    """
+    Generate HTTP ETag for export content.
+
+    Args:
+        ical_content: iCal formatted string
+
+    Returns:
+        Quoted content hash
+
+    Pure function - deterministic hash.
+    """
+    return f'"{hashlib.md5(ical_content.encode()).hexdigest()}"'
+
+
+def _generate_vevent_from_data(event: Dict[str, Any], dtstamp: Optional[datetime] = None) -> List[str]:
     """
     Generate VEVENT lines from event data.
 
     Args:
         event: Event data dictionary
+        dtstamp: Export timestamp (defaults to current time)
 
     Returns:
         List of iCal VEVENT lines
@@ -412,7 +524,7 @@ def _generate_vevent_from_data(event: Dict[str, Any]) -> List[str]:
 
     # DTSTAMP: RFC 5545 REQUIRED - timestamp when this iCalendar object was created
     # Use current time to indicate when this export was generated
-    now = datetime.now(timezone.utc)
+    now = dtstamp or datetime.now(timezone.utc)
     lines.append(f"DTSTAMP:{now.strftime('%Y%m%dT%H%M%SZ')}")
 
     # SEQUENCE: Version number for this event (0 for filtered exports, we don't track modifications)
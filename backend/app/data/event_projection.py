@@ -0,0 +1,156 @@
+"""
+Pure functions for shaping event data into lean API responses.
+
+FUNCTIONAL CORE - No side effects, fully testable.
+Internal event dictionaries carry everything the services need (raw_ical for
+category rules, datetimes for export). API responses only ship the fields
+clients actually render, selectable per request.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from app.core.result import Result, ok, fail
+
+
+# Lean event response model - shipped by default
+DEFAULT_EVENT_FIELDS: Tuple[str, ...] = (
+    "id", "uid", "title", "start", "end", "description", "location"
+)
+
+# Heavy or duplicate fields - only shipped when requested via fields=
+OPTIONAL_EVENT_FIELDS: Tuple[str, ...] = (
+    "start_time", "end_time", "raw_ical", "calendar_id"
+)
+
+ALLOWED_EVENT_FIELDS: Tuple[str, ...] = DEFAULT_EVENT_FIELDS + OPTIONAL_EVENT_FIELDS
+
+
+def parse_event_fields(fields: Optional[str]) -> Result[Tuple[str, ...]]:
+    """
+    Parse a comma-separated fields= query value into an event field selection.
+
+    Args:
+        fields: Raw query value (e.g. "title,start,raw_ical") or None
+
+    Returns:
+        Result containing the selected field names (default set when empty)
+        or error listing the allowed fields
+
+    Pure function - deterministic parsing and validation.
+    """
+    if not fields or not fields.strip():
+        return ok(DEFAULT_EVENT_FIELDS)
+
+    selected = []
+    for field in fields.split(','):
+        field = field.strip()
+        if not field or field in selected:
+            continue
+        if field not in ALLOWED_EVENT_FIELDS:
+            return fail(f"Unknown event field '{field}'. Allowed fields: {', '.join(ALLOWED_EVENT_FIELDS)}")
+        selected.append(field)
+
+    if not selected:
+        return ok(DEFAULT_EVENT_FIELDS)
+
+    return ok(tuple(selected))
+
+
+def requires_full_events(fields: Tuple[str, ...]) -> bool:
+    """
+    Check whether a field selection needs data beyond the lean default set.
+
+    Lean payloads are what gets cached, so selections outside the default
+    set must be built from the full internal event data.
+
+    Args:
+        fields: Selected event fields
+
+    Returns:
+        True if any selected field is not part of the default set
+
+    Pure function - set comparison.
+    """
+    return not set(fields).issubset(DEFAULT_EVENT_FIELDS)
+
+
+def _iso(value: Any) -> Any:
+    """Convert datetime values to ISO strings, pass other values through."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def project_event(event: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Project one event dictionary onto the selected response fields.
+
+    `start`/`end` are derived from `start_time`/`end_time` when the source
+    only has the latter (DynamoDB events), so both backends produce the same
+    lean shape. Fields missing from the source are omitted.
+
+    Args:
+        event: Internal event dictionary
+        fields: Selected event fields
+
+    Returns:
+        New dictionary containing only the selected fields
+
+    Pure function - returns new dictionary, input unchanged.
+    """
+    projected = {}
+    for field in fields:
+        if field in event:
+            projected[field] = _iso(event[field])
+        elif field == "start" and "start_time" in event:
+            projected[field] = _iso(event["start_time"])
+        elif field == "end" and "end_time" in event:
+            projected[field] = _iso(event["end_time"])
+    return projected
+
+
+def project_events(events: List[Dict[str, Any]], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """
+    Project a list of events onto the selected response fields.
+
+    Args:
+        events: Internal event dictionaries
+        fields: Selected event fields
+
+    Returns:
+        New list of projected event dictionaries
+
+    Pure function - list transformation.
+    """
+    return [project_event(event, fields) for event in events]
+
+
+def project_domain_events_response(domain_events_response: Dict[str, Any],
+                                   fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Project every event instance of a grouped domain events response.
+
+    Group and recurring event structure is preserved; only the event
+    instances are slimmed. Other top-level keys (cache metadata) pass through.
+
+    Args:
+        domain_events_response: Grouped response {groups: [{..., recurring_events: [...]}]}
+        fields: Selected event fields
+
+    Returns:
+        New response with projected event instances
+
+    Pure function - data structure transformation.
+    """
+    groups = []
+    for group in domain_events_response.get('groups', []):
+        recurring_events = [
+            {
+                **recurring_event,
+                "events": project_events(recurring_event.get('events', []), fields)
+            }
+            for recurring_event in group.get('recurring_events', [])
+        ]
+        groups.append({**group, "recurring_events": recurring_events})
+
+    return {**domain_events_response, "groups": groups}
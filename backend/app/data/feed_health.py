@@ -0,0 +1,166 @@
+"""
+Pure functions for upstream feed health, backoff and circuit breaking.
+
+FUNCTIONAL CORE - No side effects, fully testable.
+
+Health state per feed URL and per upstream host (plain dict, JSON serializable):
+    failures: Consecutive failed fetches (0: healthy)
+    retry_at: Epoch seconds before which fetches are skipped
+    last_error: Error of the last failed fetch
+    last_failure_at / last_success_at: Epoch seconds
+    last_duration_ms: Duration of the last successful fetch
+
+A failing feed is retried after an exponential backoff with jitter. After
+circuit_threshold consecutive failures the circuit is open: once retry_at
+passes, a single probe fetch is let through; success closes the circuit,
+failure reopens it with a longer backoff.
+
+Host state additionally has failed_feeds: the distinct feeds (keys) with
+host failures since the host last answered. One broken feed never backs
+off its host; the host circuit opens only once several feeds on it fail.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def backoff_seconds(failures: int, base_seconds: float, max_seconds: float, jitter: float) -> float:
+    """
+    Exponential backoff with equal jitter.
+
+    Half of the delay is fixed and half random, so feeds on one host that
+    failed together don't all retry at the same moment.
+
+    Args:
+        failures: Consecutive failures (>= 1)
+        base_seconds: Delay after the first failure
+        max_seconds: Upper bound of the delay
+        jitter: Random value in [0, 1)
+
+    Returns:
+        Delay in seconds
+
+    Pure function - arithmetic only.
+    """
+    delay = min(base_seconds * 2 ** (failures - 1), max_seconds)
+    return delay / 2 + delay / 2 * jitter
+
+
+def fetch_admission(health: Optional[Dict[str, Any]], now: float, circuit_threshold: int) -> str:
+    """
+    Decide whether a feed may be fetched now.
+
+    Returns:
+        "allow", "probe" (circuit half-open: one trial fetch) or "skip"
+
+    Pure function - state inspection.
+    """
+    health = health or {}
+    failures = health.get("failures", 0)
+    if failures and now < health.get("retry_at", 0):
+        return "skip"
+    return "probe" if failures >= circuit_threshold else "allow"
+
+
+def claim_probe(health: Dict[str, Any], now: float, probe_seconds: float) -> Dict[str, Any]:
+    """
+    Hold other fetches back while a probe runs.
+
+    Pure function - creates new state.
+    """
+    return {**health, "retry_at": now + probe_seconds}
+
+
+def record_fetch_success(health: Optional[Dict[str, Any]], now: float, duration_ms: float) -> Dict[str, Any]:
+    """
+    Record a successful fetch (closes the circuit).
+
+    Pure function - creates new state.
+    """
+    return {
+        **(health or {}),
+        "failures": 0,
+        "retry_at": 0,
+        "last_success_at": now,
+        "last_duration_ms": round(duration_ms, 1),
+    }
+
+
+def record_fetch_failure(health: Optional[Dict[str, Any]], error: str, now: float,
+                         base_seconds: float, max_seconds: float, jitter: float) -> Dict[str, Any]:
+    """
+    Record a failed fetch and schedule the next attempt.
+
+    Pure function - creates new state.
+    """
+    failures = (health or {}).get("failures", 0) + 1
+    return {
+        **(health or {}),
+        "failures": failures,
+        "retry_at": now + backoff_seconds(failures, base_seconds, max_seconds, jitter),
+        "last_error": error,
+        "last_failure_at": now,
+    }
+
+
+def host_admission(health: Optional[Dict[str, Any]], now: float, min_failed_feeds: int) -> str:
+    """
+    Decide whether feeds on a host may be fetched now.
+
+    The host circuit is open only while min_failed_feeds distinct feeds
+    have failed on it since its last success.
+
+    Returns:
+        "allow", "probe" (circuit half-open: one trial fetch) or "skip"
+
+    Pure function - state inspection.
+    """
+    health = health or {}
+    if len(health.get("failed_feeds", [])) < min_failed_feeds:
+        return "allow"
+    return "skip" if now < health.get("retry_at", 0) else "probe"
+
+
+def record_host_failure(health: Optional[Dict[str, Any]], feed_key: str, error: str, now: float,
+                        base_seconds: float, max_seconds: float, jitter: float,
+                        max_tracked_feeds: int = 16) -> Dict[str, Any]:
+    """
+    Record a host failure of one feed on the host.
+
+    Pure function - creates new state.
+    """
+    failed_feeds = [key for key in (health or {}).get("failed_feeds", []) if key != feed_key]
+    return {
+        **record_fetch_failure(health, error, now, base_seconds, max_seconds, jitter),
+        "failed_feeds": (failed_feeds + [feed_key])[-max_tracked_feeds:],
+    }
+
+
+def record_host_success(health: Optional[Dict[str, Any]], now: float, duration_ms: float) -> Dict[str, Any]:
+    """
+    Record that the host answered (closes the host circuit).
+
+    Pure function - creates new state.
+    """
+    return {**record_fetch_success(health, now, duration_ms), "failed_feeds": []}
+
+
+_HOST_ERROR_PREFIXES = ("Timeout fetching calendar", "Connection error fetching calendar")
+
+
+def is_host_failure(error: str) -> bool:
+    """
+    Check whether a fetch error points at the upstream host, not the feed.
+
+    Timeouts, connection errors, 5xx and 429 responses may affect every
+    feed on the host; other HTTP errors (404, 403, ...) and other errors
+    (invalid URL, too many redirects, decoding) only the feed itself.
+    Expects the error messages of calendar_service.fetch_ical_content.
+
+    Pure function - string classification.
+    """
+    if error.startswith(_HOST_ERROR_PREFIXES):
+        return True
+    if not error.startswith("HTTP "):
+        return False
+    status = error.split(" ", 2)[1]
+    return status.startswith("5") or status == "429"
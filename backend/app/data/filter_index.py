@@ -0,0 +1,244 @@
+"""
+Pure functions for batch filter evaluation over a title index.
+
+FUNCTIONAL CORE - No side effects, fully testable.
+
+A domain has one event set and many filters over it. Instead of scanning the
+event list once per filter, the events are indexed once:
+
+    titles:    title_id -> title
+    title_ids: title -> title_id
+    positions: title_id -> event row positions
+
+Each filter becomes a bitset over title IDs (a Python int, bit i = title i).
+The three-list formula then reduces to integer bit operations:
+
+    included = (group_bits | subscribed_bits) & ~unselected_bits
+
+and materializing a filter only touches the rows of the included titles.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable
+
+
+def build_title_index(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a title index over an event list.
+
+    Title IDs are assigned in order of first appearance, so the index is
+    deterministic for a given event list.
+
+    Args:
+        events: List of event dictionaries (must have 'title')
+
+    Returns:
+        Index dictionary with titles, title_ids and positions
+
+    Pure function - builds new data structure from input.
+    """
+    titles = []
+    title_ids = {}
+    positions = []
+
+    for position, event in enumerate(events):
+        title = event.get("title")
+        title_id = title_ids.get(title)
+        if title_id is None:
+            title_id = len(titles)
+            title_ids[title] = title_id
+            titles.append(title)
+            positions.append([])
+        positions[title_id].append(position)
+
+    return {
+        "titles": titles,
+        "title_ids": title_ids,
+        "positions": positions
+    }
+
+
+def titles_to_bitset(index: Dict[str, Any], titles: Optional[Iterable[str]]) -> int:
+    """
+    Convert event titles to a bitset over the index's title IDs.
+
+    Titles that do not occur in the indexed events are ignored.
+
+    Args:
+        index: Title index from build_title_index
+        titles: Event titles (any iterable, None treated as empty)
+
+    Returns:
+        Bitset as integer (bit i set = title i included)
+
+    Pure function - deterministic conversion.
+    """
+    title_ids = index["title_ids"]
+    bits = 0
+    for title in titles or ():
+        title_id = title_ids.get(title)
+        if title_id is not None:
+            bits |= 1 << title_id
+    return bits
+
+
+def build_group_bitsets(index: Dict[str, Any],
+                        group_titles: Dict[int, Iterable[str]]) -> Dict[int, int]:
+    """
+    Convert group title sets to bitsets once per domain.
+
+    Args:
+        index: Title index from build_title_index
+        group_titles: Mapping group_id -> event titles assigned to the group
+
+    Returns:
+        Mapping group_id -> bitset
+
+    Pure function - dictionary transformation.
+    """
+    return {
+        group_id: titles_to_bitset(index, titles)
+        for group_id, titles in group_titles.items()
+    }
+
+
+def compute_filter_bitset(index: Dict[str, Any], filter_data: Dict[str, Any],
+                          group_bitsets: Optional[Dict[int, int]] = None) -> int:
+    """
+    Compute the bitset of titles included by a filter.
+
+    Domain filters use the three-list model
+    (group_titles ∪ subscribed_event_ids) - unselected_event_ids,
+    personal filters include their subscribed titles.
+
+    Args:
+        index: Title index from build_title_index
+        filter_data: Filter configuration dict
+        group_bitsets: Mapping group_id -> bitset (domain filters)
+
+    Returns:
+        Bitset of included titles
+
+    Pure function - bit operations only.
+    """
+    subscribed_bits = titles_to_bitset(index, filter_data.get("subscribed_event_ids"))
+
+    if filter_data.get("domain_key") is None:
+        return subscribed_bits
+
+    group_bitsets = group_bitsets or {}
+    group_bits = 0
+    for group_id in filter_data.get("subscribed_group_ids") or ():
+        group_bits |= group_bitsets.get(group_id, 0)
+
+    unselected_bits = titles_to_bitset(index, filter_data.get("unselected_event_ids"))
+
+    return (group_bits | subscribed_bits) & ~unselected_bits
+
+
+def bitset_to_positions(index: Dict[str, Any], bits: int) -> List[int]:
+    """
+    Resolve a title bitset to sorted event row positions.
+
+    Args:
+        index: Title index from build_title_index
+        bits: Bitset of included titles
+
+    Returns:
+        Event positions in original event order
+
+    Pure function - deterministic resolution.
+    """
+    positions = index["positions"]
+    selected = []
+    while bits:
+        lowest = bits & -bits
+        selected.extend(positions[lowest.bit_length() - 1])
+        bits ^= lowest
+    selected.sort()
+    return selected
+
+
+def compute_filter_positions(events: List[Dict[str, Any]], index: Dict[str, Any],
+                             filter_data: Dict[str, Any],
+                             group_bitsets: Optional[Dict[int, int]] = None) -> List[int]:
+    """
+    Evaluate one filter against indexed events, returning row positions.
+
+    Produces the same selection as app.data.calendar.apply_filter_to_events,
+    including the frozen-snapshot rule for personal filters with
+    include_future_events=False.
+
+    Args:
+        events: Event list the index was built from
+        index: Title index from build_title_index
+        filter_data: Filter configuration dict
+        group_bitsets: Mapping group_id -> bitset (domain filters)
+
+    Returns:
+        Positions of included events in original event order
+
+    Pure function - same inputs always produce same outputs.
+    """
+    bits = compute_filter_bitset(index, filter_data, group_bitsets)
+    if not bits:
+        return []
+
+    positions = bitset_to_positions(index, bits)
+
+    # Personal filters in frozen mode skip events created after the filter
+    is_personal = filter_data.get("domain_key") is None
+    filter_created_at = filter_data.get("created_at")
+    if is_personal and filter_data.get("include_future_events") is False and filter_created_at:
+        positions = [
+            position for position in positions
+            if not (events[position].get("created_at") and events[position]["created_at"] > filter_created_at)
+        ]
+
+    return positions
+
+
+def select_filtered_events(events: List[Dict[str, Any]], index: Dict[str, Any],
+                           filter_data: Dict[str, Any],
+                           group_bitsets: Optional[Dict[int, int]] = None) -> List[Dict[str, Any]]:
+    """
+    Evaluate one filter against indexed events.
+
+    Args:
+        events: Event list the index was built from
+        index: Title index from build_title_index
+        filter_data: Filter configuration dict
+        group_bitsets: Mapping group_id -> bitset (domain filters)
+
+    Returns:
+        Filtered list of events (new list, original unchanged)
+
+    Pure function - same inputs always produce same outputs.
+    """
+    return [
+        events[position]
+        for position in compute_filter_positions(events, index, filter_data, group_bitsets)
+    ]
+
+
+def evaluate_filters(events: List[Dict[str, Any]], filters: List[Dict[str, Any]],
+                     group_titles: Optional[Dict[int, Iterable[str]]] = None) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Evaluate many filters over the same event set with a shared index.
+
+    Args:
+        events: List of all events (one domain or calendar)
+        filters: Filter configuration dicts (must have 'id')
+        group_titles: Mapping group_id -> event titles assigned to the group
+
+    Returns:
+        Mapping filter id -> filtered events
+
+    Pure function - index built once, each filter is bit operations.
+    """
+    index = build_title_index(events)
+    group_bitsets = build_group_bitsets(index, group_titles or {})
+
+    return {
+        filter_data["id"]: select_filtered_events(events, index, filter_data, group_bitsets)
+        for filter_data in filters
+    }
@@ -6,6 +6,7 @@ All grouping business logic without I/O operations.
 """
 
 import yaml
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
 from app.core.result import Result, ok, fail
 
@@ -328,6 +329,11 @@ def _event_matches_single_condition(event: Dict[str, Any], condition: Dict[str,
     return False
 
 
+# IDs of the auto-groups of ungrouped events (shared by both backends; the frontend lists ids >= 9998 last)
+AUTO_RECURRING_GROUP_ID = 9998
+AUTO_UNIQUE_GROUP_ID = 9999
+
+
 def create_auto_group_data(domain_key: str, group_type: str) -> Dict[str, Any]:
     """
     Create auto-group data structure for ungrouped events.
@@ -414,8 +420,8 @@ def assign_ungrouped_to_auto_groups(ungrouped_events: List[Dict[str, Any]],
     unique_group = create_auto_group_data(domain_key, 'unique')
     
     # Assign high numeric IDs for auto-groups to ensure they appear last
-    recurring_group['id'] = 9998  # Auto-recurring (second-to-last)
-    unique_group['id'] = 9999     # Auto-unique (last)
+    recurring_group['id'] = AUTO_RECURRING_GROUP_ID  # Auto-recurring (second-to-last)
+    unique_group['id'] = AUTO_UNIQUE_GROUP_ID        # Auto-unique (last)
     
     # Categorize events
     recurring_events = []
@@ -590,6 +596,176 @@ def build_domain_events_response(grouped_events: Dict[str, List[Dict[str, Any]]]
     }
 
 
+def _event_start_datetime(event: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Read an event's start time as a timezone-aware datetime.
+
+    Events arrive as datetimes (fresh from the database) or ISO strings
+    (from the cache or the DynamoDB routers). Naive values are treated as UTC.
+
+    Args:
+        event: Event data
+
+    Returns:
+        Start datetime in UTC or None if missing/unparseable
+
+    Pure function - deterministic parsing.
+    """
+    start_time = event.get('start_time') or event.get('start')
+    if not start_time:
+        return None
+
+    if isinstance(start_time, str):
+        try:
+            start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if not isinstance(start_time, datetime):
+        return None
+
+    if start_time.tzinfo is None:
+        return start_time.replace(tzinfo=timezone.utc)
+    return start_time.astimezone(timezone.utc)
+
+
+def get_next_occurrence(events: List[Dict[str, Any]], now: datetime) -> Optional[str]:
+    """
+    Find the earliest event start at or after a reference time.
+
+    Args:
+        events: Event instances of one recurring event
+        now: Reference time (timezone-aware)
+
+    Returns:
+        ISO timestamp of the next occurrence or None if all are in the past
+
+    Pure function - deterministic selection.
+    """
+    upcoming = [
+        start for start in (_event_start_datetime(event) for event in events)
+        if start is not None and start >= now
+    ]
+    if not upcoming:
+        return None
+    return min(upcoming).isoformat()
+
+
+def build_domain_events_summary(domain_events_response: Dict[str, Any],
+                                now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Reduce a grouped domain events response to a lightweight summary.
+
+    Keeps the group -> recurring event hierarchy but replaces every event
+    instance list with its count and next occurrence. Clients fetch the
+    instances of a single title or group on demand instead.
+
+    Example:
+    --------
+    >>> response = {"groups": [{"id": 1, "name": "Sport", "recurring_events": [
+    ...     {"title": "Training", "event_count": 2, "events": [...]}]}]}
+    >>> build_domain_events_summary(response)
+    >>> # {"groups": [{"id": 1, "name": "Sport", "event_count": 2,
+    >>> #   "recurring_events": [{"title": "Training", "event_count": 2,
+    >>> #                         "next_occurrence": "2025-01-06T18:00:00+00:00"}]}]}
+
+    Args:
+        domain_events_response: Response from build_domain_events_with_auto_groups
+        now: Reference time for next occurrence (defaults to current UTC time)
+
+    Returns:
+        Summary response with groups, titles, counts and next occurrences
+
+    Pure function - data structure transformation.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    summary_groups = []
+    for group in domain_events_response.get('groups', []):
+        recurring_events = [
+            {
+                "title": recurring_event.get('title'),
+                "event_count": recurring_event.get('event_count', 0),
+                "next_occurrence": get_next_occurrence(recurring_event.get('events', []), now)
+            }
+            for recurring_event in group.get('recurring_events', [])
+        ]
+        summary_groups.append({
+            "id": group.get('id'),
+            "name": group.get('name'),
+            "event_count": sum(event['event_count'] for event in recurring_events),
+            "recurring_events": recurring_events
+        })
+
+    return {"groups": summary_groups}
+
+
+def select_domain_event_instances(domain_events_response: Dict[str, Any],
+                                  title: Optional[str] = None,
+                                  group_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Select event instances of one recurring title and/or one group.
+
+    Titles assigned to several groups appear once per group in the grouped
+    response, so instances are de-duplicated by title. Results are sorted by
+    start time for stable pagination.
+
+    Args:
+        domain_events_response: Response from build_domain_events_with_auto_groups
+        title: Recurring event title to select (optional)
+        group_id: Group ID to select (optional)
+
+    Returns:
+        Event instances matching the selection, ordered by start time
+
+    Pure function - data selection.
+    """
+    selected = []
+    seen_titles = set()
+
+    for group in domain_events_response.get('groups', []):
+        if group_id is not None and group.get('id') != group_id:
+            continue
+        for recurring_event in group.get('recurring_events', []):
+            event_title = recurring_event.get('title')
+            if title is not None and event_title != title:
+                continue
+            if event_title in seen_titles:
+                continue
+            seen_titles.add(event_title)
+            selected.extend(recurring_event.get('events', []))
+
+    fallback = datetime.max.replace(tzinfo=timezone.utc)
+    return sorted(selected, key=lambda event: _event_start_datetime(event) or fallback)
+
+
+def paginate_events(events: List[Dict[str, Any]], page: int, limit: int) -> Dict[str, Any]:
+    """
+    Slice an event list into one page with pagination metadata.
+
+    Args:
+        events: Full list of events
+        page: 1-based page number
+        limit: Events per page
+
+    Returns:
+        Dictionary with events, total, page, limit and total_pages
+
+    Pure function - list slicing.
+    """
+    total = len(events)
+    offset = (page - 1) * limit
+
+    return {
+        "events": events[offset:offset + limit],
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "total_pages": (total + limit - 1) // limit
+    }
+
+
 def validate_group_data(name: str, domain_key: str) -> Result[None]:
     """
     Validate group creation data.
@@ -31,11 +31,12 @@ def parse_ical_content(ical_content: str) -> Result[List[Dict[str, Any]]]:
     """
     try:
         calendar = ICalCalendar.from_ical(ical_content)
+        raw_index = _index_raw_events(ical_content)
         events = []
 
         for component in calendar.walk():
             if component.name == "VEVENT":
-                event_data = _extract_event_data(component, ical_content)
+                event_data = _extract_event_data(component, ical_content, raw_index)
                 if event_data:
                     events.append(event_data)
 
@@ -46,13 +47,15 @@ def parse_ical_content(ical_content: str) -> Result[List[Dict[str, Any]]]:
         return fail(f"Failed to parse iCal content: {str(e)}")
 
 
-def _extract_event_data(ical_event: ICalEvent, raw_ical: str) -> Optional[Dict[str, Any]]:
+def _extract_event_data(ical_event: ICalEvent, raw_ical: str,
+                        raw_index: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
     """
     Extract event data from iCal event component (simple approach like old backend).
 
     Args:
         ical_event: Parsed iCal event component
         raw_ical: Original raw iCal content for reference
+        raw_index: UID -> raw VEVENT block index of raw_ical (see _index_raw_events)
 
     Returns:
         Event data dictionary or None if invalid
@@ -82,7 +85,10 @@ def _extract_event_data(ical_event: ICalEvent, raw_ical: str) -> Optional[Dict[s
 
 
         # Extract raw event for debugging/export
-        raw_event = _extract_raw_event(raw_ical, uid)
+        if raw_index is not None and uid in raw_index:
+            raw_event = raw_index[uid]
+        else:
+            raw_event = _extract_raw_event(raw_ical, uid)
 
         return {
             "id": event_id,
@@ -202,6 +208,129 @@ def _extract_raw_event(raw_ical: str, uid: str) -> str:
         return ""
 
 
+def _index_raw_events(raw_ical: str) -> Dict[str, str]:
+    """
+    Index raw VEVENT blocks by UID in one pass.
+
+    Replaces a _extract_raw_event scan per event (quadratic in feed size).
+    Maps each UID to the first block with that UID line, which is the
+    block _extract_raw_event finds; UIDs missing from the index (e.g.
+    folded UID lines) fall back to the scan.
+
+    Args:
+        raw_ical: Complete raw iCal content
+
+    Returns:
+        Dictionary mapping UID -> raw VEVENT block
+
+    Pure function - deterministic text indexing.
+    """
+    index = {}
+    for block_lines, uids in _iter_raw_event_blocks(raw_ical.split('\n')):
+        block = '\n'.join(block_lines)
+        for uid in uids:
+            index.setdefault(uid, block)
+    return index
+
+
+def _iter_raw_event_blocks(lines: List[str]):
+    """Yield (block_lines, uids) of each VEVENT block, line splitting as in _extract_raw_event."""
+    event_lines = None
+    uids = []
+    for line in lines:
+        if line.startswith('BEGIN:VEVENT'):
+            event_lines = [line]
+            uids = []
+        elif event_lines is not None:
+            event_lines.append(line)
+            if line.startswith('END:VEVENT'):
+                yield event_lines, uids
+                event_lines = None
+            elif line.startswith('UID:'):
+                uids.append(line[4:].rstrip('\r'))
+
+
+def split_ical_chunks(ical_content: str, chunk_count: int) -> Tuple[List[str], Dict[str, Tuple[int, str]]]:
+    """
+    Split a feed into VEVENT-aligned chunks that parse independently.
+
+    Every chunk is a complete VCALENDAR: the calendar properties and all
+    non-event components (VTIMEZONE definitions) are shared, followed by a
+    contiguous run of the feed's VEVENT blocks, so chunk results
+    concatenated in order match the serial parse.
+
+    Args:
+        ical_content: Raw iCal content
+        chunk_count: Maximum number of chunks
+
+    Returns:
+        Tuple of (chunks, first_blocks) where first_blocks maps each UID to
+        (chunk index, raw block) of its first occurrence, for merge_parsed_chunks
+
+    Pure function - deterministic text splitting.
+    """
+    lines = ical_content.split('\n')
+
+    # Shared lines: everything outside VEVENT blocks except the closing END:VCALENDAR
+    shared = []
+    depth = 0
+    for line in lines:
+        if line.startswith('BEGIN:VEVENT'):
+            depth += 1
+        elif line.startswith('END:VEVENT'):
+            depth = max(depth - 1, 0)
+        elif depth == 0 and line.strip() and not line.startswith('END:VCALENDAR'):
+            shared.append(line)
+
+    blocks = list(_iter_raw_event_blocks(lines))
+    chunk_count = max(1, min(chunk_count, len(blocks)))
+    if chunk_count == 1:
+        return [ical_content], {}
+
+    chunks = []
+    first_blocks = {}
+    per_chunk = -(-len(blocks) // chunk_count)  # Ceiling division
+    for chunk_index, start in enumerate(range(0, len(blocks), per_chunk)):
+        chunk_lines = list(shared)
+        for block_lines, uids in blocks[start:start + per_chunk]:
+            chunk_lines.extend(block_lines)
+            for uid in uids:
+                if uid not in first_blocks:
+                    first_blocks[uid] = (chunk_index, '\n'.join(block_lines))
+        chunk_lines.append('END:VCALENDAR')
+        chunks.append('\n'.join(chunk_lines))
+
+    return chunks, first_blocks
+
+
+def merge_parsed_chunks(results: List[Result], first_blocks: Dict[str, Tuple[int, str]]) -> Result[List[Dict[str, Any]]]:
+    """
+    Merge per-chunk parse results in chunk order.
+
+    Events whose UID first occurs in an earlier chunk (recurrence overrides
+    of an earlier master) get that block as raw_ical, like the serial parse.
+
+    Args:
+        results: parse_ical_content results, one per chunk from split_ical_chunks
+        first_blocks: UID first occurrences from split_ical_chunks
+
+    Returns:
+        Result containing all events, or the first chunk failure
+
+    Pure function - creates new list.
+    """
+    events = []
+    for chunk_index, result in enumerate(results):
+        if not result.is_success:
+            return result
+        for event in result.value:
+            first = first_blocks.get(event["uid"])
+            if first and first[0] < chunk_index:
+                event = {**event, "raw_ical": first[1]}
+            events.append(event)
+    return ok(events)
+
+
 def normalize_event_title(title: str) -> str:
     """
     Normalize event title for consistent grouping.
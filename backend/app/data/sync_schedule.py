@@ -0,0 +1,253 @@
+"""
+Pure functions for adaptive per-feed sync scheduling.
+
+FUNCTIONAL CORE - No side effects, fully testable.
+Change detection, interval estimation from change history and upstream
+cache headers, due-feed selection and the user calendar refresh queue
+without I/O.
+
+Schedule state per feed (plain dict, JSON serializable):
+    content_hash: Hash of the last fetched content
+    changed: Whether the last fetch changed the content
+    change_times: Epoch seconds of the most recent observed changes
+    interval_seconds: Current sync interval
+    next_due: Epoch seconds when the feed is due again
+    written_at: Epoch seconds of the last event write
+"""
+
+import hashlib
+import heapq
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from statistics import median
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+CHANGE_HISTORY_SIZE = 8
+UNCHANGED_BACKOFF = 1.5
+
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*(s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def feed_content_hash(ical_content: str) -> str:
+    """
+    Hash feed content for change detection.
+
+    DTSTAMP lines are ignored: many servers set them to the time of the
+    request, so they differ on every fetch of an unchanged calendar.
+
+    Args:
+        ical_content: Raw iCal content
+
+    Returns:
+        Hex digest
+
+    Pure function - deterministic hashing.
+    """
+    digest = hashlib.sha256()
+    for line in ical_content.splitlines():
+        if line.upper().startswith("DTSTAMP"):
+            continue
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def upstream_max_age(headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Get how long upstream declares the feed fresh.
+
+    Args:
+        headers: Response headers (case-insensitive mapping or lower-case keys)
+
+    Returns:
+        Seconds from Cache-Control s-maxage/max-age or Expires - Date,
+        0 for no-cache/no-store, None without caching headers
+
+    Pure function - header parsing.
+    """
+    lowered = {key.lower(): value for key, value in headers.items()}
+    cache_control = lowered.get("cache-control", "")
+
+    if re.search(r"no-(cache|store)", cache_control, re.IGNORECASE):
+        return 0
+    directives = dict((name.lower(), int(value)) for name, value in _MAX_AGE_PATTERN.findall(cache_control))
+    if directives:
+        return directives.get("s-maxage", directives.get("max-age"))
+
+    if "expires" in lowered:
+        try:
+            expires = parsedate_to_datetime(lowered["expires"])
+            date = parsedate_to_datetime(lowered["date"]) if "date" in lowered else None
+        except (TypeError, ValueError):
+            return 0  # Invalid Expires means already expired (RFC 9111)
+        if date is None:
+            return None
+        return max(int((expires - date).total_seconds()), 0)
+    return None
+
+
+def estimate_interval(change_times: List[float], now: float, previous_seconds: float) -> float:
+    """
+    Estimate a sync interval from observed change times.
+
+    Half the typical time between changes, so a change is usually picked up
+    within half its period. The time since the last change counts too: a
+    feed that stopped changing is polled less and less often.
+
+    Args:
+        change_times: Epoch seconds of observed changes (oldest first)
+        now: Current epoch seconds
+        previous_seconds: Current interval (grown when no change was ever seen)
+
+    Returns:
+        Unclamped interval in seconds
+
+    Pure function - arithmetic only.
+    """
+    if not change_times:
+        return previous_seconds * UNCHANGED_BACKOFF
+
+    since_last_change = now - change_times[-1]
+    gaps = [later - earlier for earlier, later in zip(change_times, change_times[1:])]
+    typical_gap = median(gaps) if gaps else since_last_change
+    return max(typical_gap, since_last_change) / 2
+
+
+def update_schedule(schedule: Optional[Dict[str, Any]], content_hash: str, now: float,
+                    max_age: Optional[int], min_seconds: float, max_seconds: float,
+                    default_seconds: float, written: bool = True) -> Tuple[Dict[str, Any], bool]:
+    """
+    Record a fetch and compute the next due time.
+
+    Args:
+        schedule: Current schedule state (None for a feed not seen before)
+        content_hash: feed_content_hash of the fetched content
+        now: Current epoch seconds
+        max_age: upstream_max_age of the response (never polled sooner)
+        min_seconds: Lower interval bound
+        max_seconds: Upper interval bound
+        default_seconds: Interval of a feed not seen before
+        written: Whether the events were written (see needs_rewrite)
+
+    Returns:
+        Tuple of (new schedule state, content changed)
+
+    Pure function - creates new state.
+    """
+    schedule = schedule or {}
+    changed = schedule.get("content_hash") != content_hash
+    change_times = list(schedule.get("change_times", []))
+    if changed and schedule:
+        change_times = (change_times + [now])[-CHANGE_HISTORY_SIZE:]
+
+    if schedule:
+        interval = estimate_interval(change_times, now, schedule.get("interval_seconds", default_seconds))
+    else:
+        interval = default_seconds
+    interval = min(max(interval, max_age or 0, min_seconds), max_seconds)
+
+    return {
+        "content_hash": content_hash,
+        "changed": changed,
+        "change_times": change_times,
+        "interval_seconds": interval,
+        "next_due": now + interval,
+        "written_at": now if written else schedule.get("written_at", now),
+    }, changed
+
+
+def needs_rewrite(schedule: Optional[Dict[str, Any]], content_hash: str, now: float,
+                  max_write_age_seconds: float) -> bool:
+    """
+    Check whether fetched content must be parsed and written.
+
+    Unchanged content is skipped, but rewritten at least every
+    max_write_age_seconds so past events are still pruned.
+
+    Pure function - comparison only.
+    """
+    if not schedule or schedule.get("content_hash") != content_hash:
+        return True
+    return now - schedule.get("written_at", 0) >= max_write_age_seconds
+
+
+def due_feeds(feeds: Dict[str, Optional[Dict[str, Any]]], subscriber_counts: Mapping[str, int],
+              now: float) -> List[str]:
+    """
+    Select feeds due for sync, most subscribed first.
+
+    Args:
+        feeds: Schedule state by feed key (None: never scheduled, always due)
+        subscriber_counts: Number of subscriptions (filters) by feed key
+        now: Current epoch seconds
+
+    Returns:
+        Due feed keys by subscriber count (desc), then longest overdue
+
+    Pure function - filtering and sorting.
+    """
+    due = [key for key, schedule in feeds.items() if not schedule or schedule.get("next_due", 0) <= now]
+    return sorted(
+        due,
+        key=lambda key: (-subscriber_counts.get(key, 0), (feeds[key] or {}).get("next_due", 0), key),
+    )
+
+
+def fallback_schedule(last_fetched: Optional[datetime], interval_seconds: float) -> Optional[Dict[str, Any]]:
+    """
+    Build a schedule for a feed without schedule state from its last fetch.
+
+    Feeds synced before schedule state was kept are due interval_seconds
+    after their last fetch instead of on every tick.
+
+    Args:
+        last_fetched: Calendar last_fetched (naive datetimes are UTC)
+        interval_seconds: Sync interval of feeds without history
+
+    Returns:
+        {"next_due": epoch seconds}, or None (always due) if never fetched
+
+    Pure function - date arithmetic.
+    """
+    if last_fetched is None:
+        return None
+    if last_fetched.tzinfo is None:
+        last_fetched = last_fetched.replace(tzinfo=timezone.utc)
+    return {"next_due": last_fetched.timestamp() + interval_seconds}
+
+
+def user_refresh_queue(calendars: List[Tuple[int, Optional[datetime]]], export_counts: Mapping[int, int],
+                       now: datetime, min_age_seconds: float, limit: int) -> List[int]:
+    """
+    Pick the user calendars to refresh next.
+
+    Priority is staleness weighted by recent export traffic, so calendars
+    that subscribers poll are refreshed first and idle ones still get their
+    turn as they age. Calendars refreshed within min_age_seconds wait.
+
+    Args:
+        calendars: (calendar_id, last_fetched) pairs; naive datetimes are UTC
+        export_counts: Recent export requests by calendar_id
+        now: Current time (timezone-aware)
+        min_age_seconds: Minimum time between refreshes of one calendar
+        limit: Maximum number of calendars to return
+
+    Returns:
+        Calendar IDs by priority (highest first)
+
+    Pure function - priority selection.
+    """
+    def staleness(last_fetched: Optional[datetime]) -> float:
+        if last_fetched is None:
+            return float("inf")  # Never fetched
+        if last_fetched.tzinfo is None:
+            last_fetched = last_fetched.replace(tzinfo=timezone.utc)
+        return (now - last_fetched).total_seconds()
+
+    candidates = [
+        (staleness(last_fetched) * (1 + export_counts.get(calendar_id, 0)), calendar_id)
+        for calendar_id, last_fetched in calendars
+        if staleness(last_fetched) >= min_age_seconds
+    ]
+    return [calendar_id for _, calendar_id in heapq.nlargest(limit, candidates)]
@@ -0,0 +1,102 @@
+"""
+Pure functions for partitioning scheduled domain sync into shards.
+
+FUNCTIONAL CORE - No side effects, fully testable.
+Shard assignment, resume ordering and result aggregation without I/O.
+"""
+
+import zlib
+from typing import Dict, Any, List, Optional
+
+
+def shard_for_domain(domain_key: str, shard_count: int) -> int:
+    """
+    Get the shard a domain is synced by.
+
+    Uses CRC32 so assignment is stable across processes (unlike hash()).
+
+    Args:
+        domain_key: Domain identifier
+        shard_count: Number of shards
+
+    Returns:
+        Shard index in [0, shard_count)
+
+    Pure function - deterministic assignment.
+    """
+    return zlib.crc32(domain_key.encode("utf-8")) % max(shard_count, 1)
+
+
+def partition_domains(domain_keys: List[str], shard_count: int) -> List[List[str]]:
+    """
+    Split domain keys into shards.
+
+    Args:
+        domain_keys: All configured domain keys
+        shard_count: Number of shards
+
+    Returns:
+        One sorted list of domain keys per shard
+
+    Pure function - creates new lists.
+    """
+    shards = [[] for _ in range(max(shard_count, 1))]
+    for domain_key in sorted(domain_keys):
+        shards[shard_for_domain(domain_key, shard_count)].append(domain_key)
+    return shards
+
+
+def order_from_checkpoint(domain_keys: List[str], resume_from: Optional[str]) -> List[str]:
+    """
+    Rotate a shard's domains so a run starts where the previous one stopped.
+
+    Domains skipped when the previous run ran out of time go first, so the
+    tail of a shard is not starved by slow feeds at its head.
+
+    Args:
+        domain_keys: Domain keys of the shard (sorted)
+        resume_from: First domain not synced by the previous run
+
+    Returns:
+        Domain keys in sync order
+
+    Pure function - creates new list.
+    """
+    if resume_from not in domain_keys:
+        return list(domain_keys)
+    start = domain_keys.index(resume_from)
+    return domain_keys[start:] + domain_keys[:start]
+
+
+def aggregate_shard_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine per-shard sync results into one run summary.
+
+    Args:
+        results: Result dictionaries returned by each shard
+
+    Returns:
+        Summary with totals, errors and per-shard results
+
+    Pure function - creates new dictionary.
+    """
+    errors = [error for result in results for error in (result.get("errors") or [])]
+    failed_shards = [result for result in results if result.get("status") == "error"]
+    deferred = sum(result.get("deferred", 0) for result in results)
+
+    if failed_shards and len(failed_shards) == len(results):
+        status = "error"
+    elif errors or failed_shards or deferred:
+        status = "partial"
+    else:
+        status = "success"
+
+    return {
+        "status": status,
+        "synced": sum(result.get("synced", 0) for result in results),
+        "cached": sum(result.get("cached", 0) for result in results),
+        "deferred": deferred,
+        "not_due": sum(result.get("not_due", 0) for result in results),
+        "errors": errors if errors else None,
+        "shards": results,
+    }
@@ -0,0 +1,90 @@
+"""
+Backfill sparse index attributes on existing DynamoDB items.
+
+Items written before the EntityIndex, FilterDomainIndex and ResetTokenIndex
+existed lack their key attributes (entity_type/entity_sort,
+filter_domain_key) or store reset_token as NULL, which index keys reject.
+Re-serializing each item through its model fixes all three.
+
+Rollout:
+    1. Deploy with DYNAMODB_INDEXED_LOOKUPS=false (repository keeps scanning)
+    2. Wait for the new GSIs to become ACTIVE
+    3. python -m app.db.backfill_indexes
+    4. Redeploy with DYNAMODB_INDEXED_LOOKUPS=true (the default)
+
+The backfill is idempotent and safe to re-run.
+"""
+
+import argparse
+
+from boto3.dynamodb.conditions import Attr
+
+from .dynamodb import parallel_scan, parallel_batch_write
+from .models import Domain, Filter, DomainRequest, Admin
+
+
+# PK prefix -> model whose to_dynamo_item writes the index attributes
+INDEXED_ENTITIES = {
+    "DOMAIN#": Domain,
+    "FILTER#": Filter,
+    "DOMAIN_REQUEST#": DomainRequest,
+    "ADMIN#": Admin,
+}
+
+
+def _needs_backfill(item: dict, rewritten: dict) -> bool:
+    """Check whether the stored item differs from its re-serialized form."""
+    return any(item.get(key) != value for key, value in rewritten.items()) or \
+        any(key not in rewritten for key in item)
+
+
+def backfill_index_attributes(dry_run: bool = False) -> dict:
+    """
+    Rewrite metadata items so they carry their sparse index attributes.
+
+    Timestamps are preserved (items are re-serialized, not re-saved).
+
+    Args:
+        dry_run: Only count items that would be rewritten
+
+    Returns:
+        Counts per PK prefix: {prefix: {"scanned": n, "rewritten": m}}
+    """
+    items = parallel_scan(Attr("SK").eq("METADATA"))
+
+    counts = {prefix: {"scanned": 0, "rewritten": 0} for prefix in INDEXED_ENTITIES}
+    rewrites = []
+
+    for item in items:
+        for prefix, model in INDEXED_ENTITIES.items():
+            if not item["PK"].startswith(prefix):
+                continue
+            counts[prefix]["scanned"] += 1
+            rewritten = model.from_dynamo_item(item).to_dynamo_item()
+            # Keep attributes the model does not know about
+            rewritten = {**{k: v for k, v in item.items() if k != "reset_token"}, **rewritten}
+            if _needs_backfill(item, rewritten):
+                counts[prefix]["rewritten"] += 1
+                rewrites.append(rewritten)
+            break
+
+    if rewrites and not dry_run:
+        parallel_batch_write(items=rewrites)
+
+    return counts
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Backfill DynamoDB sparse index attributes")
+    parser.add_argument("--dry-run", action="store_true", help="Only report items that need rewriting")
+    args = parser.parse_args()
+
+    counts = backfill_index_attributes(dry_run=args.dry_run)
+    for prefix, entity_counts in counts.items():
+        action = "would rewrite" if args.dry_run else "rewrote"
+        print(f"{prefix:<16} scanned {entity_counts['scanned']:>6}, {action} {entity_counts['rewritten']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,19 @@ DynamoDB client setup and table operations.
 
 Single-table design with the following key patterns:
 - PK: DOMAIN#<key>, FILTER#<uuid>, ADMIN#<email>, CALENDAR#<id>
-- SK: METADATA, EVENT#<date>#<uid>, GROUP#<id>, etc.
+- SK: METADATA, EVENT#<date>#<uid>, ASSIGN#<title>, GROUP#<id>, etc.
 """
 
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Optional
+from typing import Callable, Iterator, Optional, TypeVar
 
 import boto3
 from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
 
 
 # Table name from environment (set by SST)
@@ -20,6 +24,36 @@ TABLE_NAME = os.environ.get("DYNAMODB_TABLE_NAME", "filter-ical-table")
 # AWS region
 REGION = os.environ.get("AWS_REGION", "eu-north-1")
 
+# BatchWriteItem limits and retry behaviour
+BATCH_WRITE_SIZE = 25  # DynamoDB maximum per BatchWriteItem call
+BATCH_WRITE_WORKERS = int(os.environ.get("DYNAMODB_BATCH_WRITE_WORKERS", "4"))
+BATCH_WRITE_MAX_RETRIES = 8
+BATCH_WRITE_BASE_DELAY = 0.05  # Seconds, doubled per retry (with jitter)
+
+# Version-guarded writes: attempts before a conflict is surfaced
+CONFLICT_RETRY_ATTEMPTS = 5
+CONFLICT_RETRY_BASE_DELAY = 0.02  # Seconds, doubled per retry (with jitter)
+
+# Parallel scan segments (each segment paginates independently)
+SCAN_SEGMENTS = int(os.environ.get("DYNAMODB_SCAN_SEGMENTS", "4"))
+
+# Global secondary indexes (sparse - only items carrying the key attribute are indexed)
+LINK_UUID_INDEX = "LinkUuidIndex"  # link_uuid -> filter
+ENTITY_INDEX = "EntityIndex"  # entity_type + entity_sort ("{status}#...") -> domains, domain requests
+FILTER_DOMAIN_INDEX = "FilterDomainIndex"  # filter_domain_key -> filters of a domain
+RESET_TOKEN_INDEX = "ResetTokenIndex"  # reset_token -> admin
+ASSIGNMENT_GROUP_INDEX = "AssignmentGroupIndex"  # assign_group ("{domain}#{group_id}") -> assignments
+
+# Container-local Domain document cache (0 disables)
+DOMAIN_CACHE_TTL_SECONDS = float(os.environ.get("DYNAMODB_DOMAIN_CACHE_TTL_SECONDS", "30"))
+
+# Set to "false" until app.db.backfill_indexes has run (falls back to scans)
+USE_INDEXED_LOOKUPS = os.environ.get("DYNAMODB_INDEXED_LOOKUPS", "true").lower() == "true"
+
+
+class VersionConflictError(Exception):
+    """A version-guarded write found the item at a different version."""
+
 
 @lru_cache()
 def get_client():
@@ -75,60 +109,199 @@ def group_sk(group_id: int) -> str:
     return f"GROUP#{group_id}"
 
 
+def assignment_sk(title: str) -> str:
+    """Sort key for recurring event assignment records."""
+    return f"ASSIGN#{title}"
+
+
+def assignment_group_key(domain_key: str, group_id: int) -> str:
+    """AssignmentGroupIndex key: assignments of one group."""
+    return f"{domain_key}#{group_id}"
+
+
 # Query helpers
-def query_by_pk(pk: str, sk_prefix: Optional[str] = None) -> list:
+def _projection_kwargs(projection: Optional[list[str]]) -> dict:
+    """
+    Build ProjectionExpression arguments.
+
+    Attribute names are always aliased, so reserved words (e.g. "location")
+    can be projected.
+    """
+    if not projection:
+        return {}
+    names = {f"#p{i}": attr for i, attr in enumerate(projection)}
+    return {
+        "ProjectionExpression": ", ".join(names.keys()),
+        "ExpressionAttributeNames": names,
+    }
+
+
+def _paginate(operation, **kwargs) -> Iterator[dict]:
+    """Yield items from a Query/Scan call, following LastEvaluatedKey."""
+    while True:
+        response = operation(**kwargs)
+        yield from response.get("Items", [])
+
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        kwargs["ExclusiveStartKey"] = last_key
+
+
+def iter_query(
+    key_condition,
+    index_name: Optional[str] = None,
+    projection: Optional[list[str]] = None,
+    descending: bool = False,
+    consistent_read: bool = False,
+) -> Iterator[dict]:
+    """
+    Iterate over all items of a query, page by page.
+
+    Args:
+        key_condition: boto3 KeyConditionExpression
+        index_name: Optional GSI name
+        projection: Optional attribute names to fetch (default: full items)
+        descending: Return items in descending sort key order
+        consistent_read: Strongly consistent read (base table only, double cost)
+
+    Yields:
+        Items across all response pages
+    """
+    kwargs = {"KeyConditionExpression": key_condition, **_projection_kwargs(projection)}
+    if index_name:
+        kwargs["IndexName"] = index_name
+    if descending:
+        kwargs["ScanIndexForward"] = False
+    if consistent_read:
+        kwargs["ConsistentRead"] = True
+
+    yield from _paginate(get_table().query, **kwargs)
+
+
+def query_by_pk(
+    pk: str,
+    sk_prefix: Optional[str] = None,
+    projection: Optional[list[str]] = None,
+    consistent_read: bool = False,
+) -> list:
     """
     Query items by partition key, optionally filtering by sort key prefix.
 
     Args:
         pk: Partition key value
         sk_prefix: Optional sort key prefix to filter by
+        projection: Optional attribute names to fetch (default: full items)
+        consistent_read: Strongly consistent read (double cost)
 
     Returns:
-        List of items matching the query
+        List of all items matching the query (all pages)
     """
-    table = get_table()
-
+    key_condition = Key("PK").eq(pk)
     if sk_prefix:
-        response = table.query(
-            KeyConditionExpression=Key("PK").eq(pk) & Key("SK").begins_with(sk_prefix)
-        )
-    else:
-        response = table.query(
-            KeyConditionExpression=Key("PK").eq(pk)
-        )
+        key_condition = key_condition & Key("SK").begins_with(sk_prefix)
+
+    return list(iter_query(key_condition, projection=projection, consistent_read=consistent_read))
+
+
+def parallel_scan(
+    filter_expression=None,
+    projection: Optional[list[str]] = None,
+    total_segments: Optional[int] = None,
+) -> list:
+    """
+    Scan the table with parallel segments, each following LastEvaluatedKey.
+
+    Args:
+        filter_expression: Optional boto3 FilterExpression (conditions.Attr)
+        projection: Optional attribute names to fetch (default: full items)
+        total_segments: Number of parallel segments (default SCAN_SEGMENTS)
+
+    Returns:
+        List of all matching items
+    """
+    total_segments = total_segments or SCAN_SEGMENTS
+    # Resource-level client is thread-safe and keeps plain Python values
+    client = get_table().meta.client
+
+    def scan_segment(segment: int) -> list:
+        kwargs = {
+            "TableName": TABLE_NAME,
+            "Segment": segment,
+            "TotalSegments": total_segments,
+            **_projection_kwargs(projection),
+        }
+        if filter_expression is not None:
+            kwargs["FilterExpression"] = filter_expression
+        return list(_paginate(client.scan, **kwargs))
 
-    return response.get("Items", [])
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        segments = list(executor.map(scan_segment, range(total_segments)))
 
+    return [item for segment_items in segments for item in segment_items]
 
-def get_item(pk: str, sk: str) -> Optional[dict]:
+
+def get_item(pk: str, sk: str, projection: Optional[list[str]] = None) -> Optional[dict]:
     """
     Get a single item by primary key.
 
     Args:
         pk: Partition key value
         sk: Sort key value
+        projection: Attribute names to return (default: all)
 
     Returns:
         Item dict or None if not found
     """
     table = get_table()
-    response = table.get_item(Key={"PK": pk, "SK": sk})
+    response = table.get_item(Key={"PK": pk, "SK": sk}, **_projection_kwargs(projection))
     return response.get("Item")
 
 
-def put_item(item: dict) -> dict:
+def _version_condition(expected_version: int, names: dict, values: dict) -> str:
+    """
+    Build a condition matching items stored at expected_version.
+
+    Version 0 also matches items written before versioning existed.
+    """
+    names["#version"] = "version"
+    values[":expected_version"] = expected_version
+    if expected_version == 0:
+        return "(attribute_not_exists(#version) OR #version = :expected_version)"
+    return "#version = :expected_version"
+
+
+def _raise_on_version_conflict(error: ClientError) -> None:
+    """Translate a failed version condition into VersionConflictError."""
+    if error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+        raise VersionConflictError(str(error)) from error
+    raise error
+
+
+def put_item(item: dict, expected_version: Optional[int] = None) -> dict:
     """
     Put an item into the table.
 
     Args:
         item: Item dict (must include PK and SK)
+        expected_version: Only replace an item stored at this version
+            (raises VersionConflictError otherwise)
 
     Returns:
         The item that was put
     """
     table = get_table()
-    table.put_item(Item=item)
+    kwargs = {}
+    if expected_version is not None:
+        names, values = {}, {}
+        kwargs["ConditionExpression"] = _version_condition(expected_version, names, values)
+        kwargs["ExpressionAttributeNames"] = names
+        kwargs["ExpressionAttributeValues"] = values
+
+    try:
+        table.put_item(Item=item, **kwargs)
+    except ClientError as e:
+        _raise_on_version_conflict(e)
     return item
 
 
@@ -148,14 +321,66 @@ def delete_item(pk: str, sk: str) -> bool:
     return True
 
 
-def update_item(pk: str, sk: str, updates: dict) -> dict:
+T = TypeVar("T")
+
+
+def retry_on_conflict(operation: Callable[[], T], attempts: int = CONFLICT_RETRY_ATTEMPTS) -> T:
+    """
+    Run a read-modify-write operation, retrying when it loses a version race.
+
+    The operation must re-read the item on every call so each retry plans
+    against the latest version.
+
+    Raises:
+        VersionConflictError: Still conflicting after all attempts
+    """
+    for attempt in range(attempts):
+        try:
+            return operation()
+        except VersionConflictError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(random.uniform(0, CONFLICT_RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+def _path_expression(path: str, names: dict) -> str:
+    """Alias each attribute name of a document path ("groups[2].name" -> "#a0[2].#a1")."""
+    segments = []
+    for segment in path.split("."):
+        name, bracket, index = segment.partition("[")
+        alias = f"#a{len(names)}"
+        names[alias] = name
+        segments.append(alias + bracket + index)
+    return ".".join(segments)
+
+
+def update_item(
+    pk: str,
+    sk: str,
+    updates: Optional[dict] = None,
+    append: Optional[dict] = None,
+    remove: Optional[list[str]] = None,
+    increment: Optional[dict] = None,
+    expected_version: Optional[int] = None,
+    must_exist: bool = False,
+) -> dict:
     """
     Update specific attributes of an item.
 
+    Keys of updates/append and entries of remove are document paths, so
+    nested attributes can be changed without rewriting the whole item
+    (e.g. "groups[2].name").
+
     Args:
         pk: Partition key value
         sk: Sort key value
-        updates: Dict of attribute names to new values
+        updates: Dict of attribute paths to new values
+        append: Dict of list attribute paths to items appended to them
+        remove: Attribute paths (or list elements) to remove
+        increment: Dict of numeric attribute names to atomically add (ADD)
+        expected_version: Only update an existing item stored at this version
+            and increment its version (raises VersionConflictError otherwise)
+        must_exist: Never create the item (raises VersionConflictError if missing)
 
     Returns:
         Updated item
@@ -163,31 +388,68 @@ def update_item(pk: str, sk: str, updates: dict) -> dict:
     table = get_table()
 
     # Build update expression
-    update_expr_parts = []
-    expr_attr_names = {}
-    expr_attr_values = {}
-
-    for i, (key, value) in enumerate(updates.items()):
-        attr_name = f"#attr{i}"
-        attr_value = f":val{i}"
-        update_expr_parts.append(f"{attr_name} = {attr_value}")
-        expr_attr_names[attr_name] = key
-        expr_attr_values[attr_value] = value
-
-    update_expr = "SET " + ", ".join(update_expr_parts)
-
-    response = table.update_item(
-        Key={"PK": pk, "SK": sk},
-        UpdateExpression=update_expr,
-        ExpressionAttributeNames=expr_attr_names,
-        ExpressionAttributeValues=expr_attr_values,
-        ReturnValues="ALL_NEW"
-    )
+    names, values = {}, {}
+    set_parts = []
+
+    for path, value in (updates or {}).items():
+        placeholder = f":val{len(values)}"
+        values[placeholder] = value
+        set_parts.append(f"{_path_expression(path, names)} = {placeholder}")
+
+    for path, new_items in (append or {}).items():
+        placeholder = f":val{len(values)}"
+        values[placeholder] = new_items
+        values[":empty_list"] = []
+        attr = _path_expression(path, names)
+        set_parts.append(f"{attr} = list_append(if_not_exists({attr}, :empty_list), {placeholder})")
+
+    kwargs = {}
+    if expected_version is not None:
+        condition = _version_condition(expected_version, names, values)
+        kwargs["ConditionExpression"] = f"attribute_exists(PK) AND {condition}"
+        values[":next_version"] = expected_version + 1
+        set_parts.append("#version = :next_version")
+    elif must_exist:
+        kwargs["ConditionExpression"] = "attribute_exists(PK)"
+
+    clauses = ["SET " + ", ".join(set_parts)] if set_parts else []
+    if increment:
+        add_parts = []
+        for path, amount in increment.items():
+            placeholder = f":val{len(values)}"
+            values[placeholder] = amount
+            add_parts.append(f"{_path_expression(path, names)} {placeholder}")
+        clauses.append("ADD " + ", ".join(add_parts))
+    if remove:
+        clauses.append("REMOVE " + ", ".join(_path_expression(path, names) for path in remove))
+    update_expr = " ".join(clauses)
+
+    if values:
+        kwargs["ExpressionAttributeValues"] = values
+
+    try:
+        response = table.update_item(
+            Key={"PK": pk, "SK": sk},
+            UpdateExpression=update_expr,
+            ExpressionAttributeNames=names,
+            ReturnValues="ALL_NEW",
+            **kwargs
+        )
+    except ClientError as e:
+        _raise_on_version_conflict(e)
 
     return response.get("Attributes", {})
 
 
-def query_by_gsi(index_name: str, key_name: str, key_value: str) -> list:
+def query_by_gsi(
+    index_name: str,
+    key_name: str,
+    key_value: str,
+    projection: Optional[list[str]] = None,
+    sort_key_name: Optional[str] = None,
+    sort_key_prefix: Optional[str] = None,
+    descending: bool = False,
+) -> list:
     """
     Query items using a Global Secondary Index.
 
@@ -195,16 +457,21 @@ def query_by_gsi(index_name: str, key_name: str, key_value: str) -> list:
         index_name: Name of the GSI
         key_name: Attribute name to query on
         key_value: Value to match
+        projection: Optional attribute names to fetch (default: full items)
+        sort_key_name: Optional GSI sort key attribute
+        sort_key_prefix: Optional sort key prefix to filter by
+        descending: Return items in descending sort key order
 
     Returns:
-        List of items matching the query
+        List of all items matching the query (all pages)
     """
-    table = get_table()
-    response = table.query(
-        IndexName=index_name,
-        KeyConditionExpression=Key(key_name).eq(key_value)
-    )
-    return response.get("Items", [])
+    key_condition = Key(key_name).eq(key_value)
+    if sort_key_name and sort_key_prefix:
+        key_condition = key_condition & Key(sort_key_name).begins_with(sort_key_prefix)
+
+    return list(iter_query(
+        key_condition, index_name=index_name, projection=projection, descending=descending
+    ))
 
 
 def batch_write(items: list[dict]) -> None:
@@ -233,3 +500,57 @@ def batch_delete(keys: list[tuple[str, str]]) -> None:
     with table.batch_writer() as batch:
         for pk, sk in keys:
             batch.delete_item(Key={"PK": pk, "SK": sk})
+
+
+def _batch_write_requests(client, requests: list[dict]) -> None:
+    """
+    Send one BatchWriteItem call (max 25 requests), retrying UnprocessedItems.
+
+    Uses exponential backoff with full jitter between retries.
+
+    Raises:
+        RuntimeError: If items remain unprocessed after all retries
+    """
+    pending = {TABLE_NAME: requests}
+
+    for attempt in range(BATCH_WRITE_MAX_RETRIES + 1):
+        response = client.batch_write_item(RequestItems=pending)
+        pending = response.get("UnprocessedItems") or {}
+        if not pending:
+            return
+        time.sleep(random.uniform(0, BATCH_WRITE_BASE_DELAY * (2 ** attempt)))
+
+    unprocessed = sum(len(reqs) for reqs in pending.values())
+    raise RuntimeError(f"BatchWriteItem left {unprocessed} unprocessed items after retries")
+
+
+def parallel_batch_write(
+    items: Optional[list[dict]] = None,
+    delete_keys: Optional[list[tuple[str, str]]] = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Write puts and deletes through parallel BatchWriteItem workers.
+
+    Requests are chunked into batches of 25 and sent concurrently. Each batch
+    retries its UnprocessedItems with backoff. A key must not appear twice
+    across items and delete_keys.
+
+    Args:
+        items: Items to put (each must include PK and SK)
+        delete_keys: List of (pk, sk) tuples to delete
+        max_workers: Concurrent BatchWriteItem calls (default BATCH_WRITE_WORKERS)
+    """
+    requests = [{"PutRequest": {"Item": item}} for item in items or []]
+    requests += [{"DeleteRequest": {"Key": {"PK": pk, "SK": sk}}} for pk, sk in delete_keys or []]
+    if not requests:
+        return
+
+    # Resource-level client accepts plain Python values and is thread-safe
+    client = get_table().meta.client
+    chunks = [requests[i:i + BATCH_WRITE_SIZE] for i in range(0, len(requests), BATCH_WRITE_SIZE)]
+    workers = min(max_workers or BATCH_WRITE_WORKERS, len(chunks))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() re-raises the first worker failure
+        list(executor.map(lambda chunk: _batch_write_requests(client, chunk), chunks))
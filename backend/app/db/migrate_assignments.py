@@ -0,0 +1,67 @@
+"""
+Move embedded recurring_assignments maps out of Domain items.
+
+Domains written before assignments became separate items carry the whole
+title -> group_id map in their METADATA item. This writes one ASSIGN#<title>
+item per entry, then drops the map from the domain item.
+
+Rollout:
+    1. Deploy the AssignmentGroupIndex and wait for it to become ACTIVE
+    2. Deploy the application code (Repository.get_assignments reads
+       ASSIGN# items merged over any remaining embedded map)
+    3. python -m app.db.migrate_assignments
+
+Assignments are written before the map is dropped, and the map is dropped
+with a version-guarded update (concurrent domain edits are re-read, never
+overwritten), so the migration is idempotent and safe to re-run after a
+partial failure.
+"""
+
+import argparse
+
+from boto3.dynamodb.conditions import Attr
+
+from .dynamodb import parallel_scan
+from .repository import Repository
+
+
+def migrate_recurring_assignments(dry_run: bool = False) -> dict:
+    """
+    Split embedded recurring_assignments maps into Assignment items.
+
+    Args:
+        dry_run: Only count domains and assignments that would be migrated
+
+    Returns:
+        Counts: {"domains": n, "assignments": m}
+    """
+    items = parallel_scan(
+        Attr("PK").begins_with("DOMAIN#") & Attr("SK").eq("METADATA") & Attr("recurring_assignments").exists()
+    )
+
+    repo = Repository()
+    counts = {"domains": 0, "assignments": 0}
+
+    for item in items:
+        assignments = item.get("recurring_assignments") or {}
+        counts["domains"] += 1
+        counts["assignments"] += len(assignments)
+        if not dry_run:
+            repo.split_embedded_assignments(item["domain_key"])
+
+    return counts
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Split recurring_assignments out of DynamoDB domain items")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be migrated")
+    args = parser.parse_args()
+
+    counts = migrate_recurring_assignments(dry_run=args.dry_run)
+    action = "would migrate" if args.dry_run else "migrated"
+    print(f"{action} {counts['assignments']} assignments from {counts['domains']} domains")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+Copy the SQL database into the DynamoDB table.
+
+Streams domains (with their groups and rules), recurring event
+assignments, domain filters and events from the SQLAlchemy models,
+converts them to DynamoDB documents and writes them with parallel
+BatchWriteItem calls.
+
+- Rows are read in id order through server-side cursors (yield_per), so
+  memory stays bounded by batch size x in-flight batches.
+- After every written batch the last copied id of the stage is stored in
+  a JSON checkpoint file; re-running resumes after it. Items are keyed
+  deterministically, so re-copying a batch is harmless.
+- User (non-domain) filters have no DynamoDB counterpart and are skipped.
+- DynamoDB filters select groups and unselected titles only; individually
+  subscribed recurring events (subscribed_event_ids) of domain filters are
+  lost. Such filters are reported before copying; --strict aborts instead.
+
+Intended for an empty target table (copied domains start at version 0).
+
+Usage:
+    python -m app.db.migrate_sql --checkpoint migrate.json [--database-url URL] [--strict]
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import create_engine, or_, select
+from sqlalchemy.orm import Session
+
+from ..models.calendar import (
+    AssignmentRule as SQLAssignmentRule,
+    Event as SQLEvent,
+    Filter as SQLFilter,
+    Group as SQLGroup,
+    RecurringEventGroup as SQLRecurringEventGroup,
+)
+from ..models.domain import Domain as SQLDomain
+from .dynamodb import parallel_batch_write
+from .models import Assignment, AssignmentRule, Domain, DomainGroup, Event, Filter, RuleCondition
+
+# Stages in copy order
+STAGES = ["domains", "assignments", "filters", "events"]
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_IN_FLIGHT = 4  # Batches written concurrently (each split across BATCH_WRITE_WORKERS)
+REPORT_INTERVAL_SECONDS = 5.0
+
+
+class MigrationDataLossError(Exception):
+    """Raised in strict mode when copied items would lose data."""
+
+
+class MigrationCheckpoint:
+    """Last copied id per stage, persisted to a JSON file after every batch."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.state = {"last_id": {}, "completed": []}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.state = json.load(f)
+
+    def last_id(self, stage: str) -> int:
+        return self.state["last_id"].get(stage, 0)
+
+    def is_completed(self, stage: str) -> bool:
+        return stage in self.state["completed"]
+
+    def advance(self, stage: str, last_id: int) -> None:
+        self.state["last_id"][stage] = last_id
+        self._save()
+
+    def complete(self, stage: str) -> None:
+        if stage not in self.state["completed"]:
+            self.state["completed"].append(stage)
+        self._save()
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.path)
+
+
+# =============================================================================
+# Row streaming and conversion
+# =============================================================================
+
+def _stream_batches(db: Session, columns: list, after_id: int, batch_size: int,
+                    where=None) -> Iterator[list]:
+    """Yield batches of rows in id order after after_id (first column is the id)."""
+    id_column = columns[0]
+    stmt = select(*columns).where(id_column > after_id).order_by(id_column)
+    if where is not None:
+        stmt = stmt.where(where)
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield partition
+
+
+def _unique_by_key(items: list[dict]) -> list[dict]:
+    """Drop duplicate (PK, SK) items of a batch (BatchWriteItem rejects them); last wins."""
+    return list({(item["PK"], item["SK"]): item for item in items}.values())
+
+
+def _timestamps(row) -> dict:
+    """created_at/updated_at of a row, leaving NULL columns to the model defaults."""
+    return {
+        field: getattr(row, field)
+        for field in ("created_at", "updated_at")
+        if getattr(row, field) is not None
+    }
+
+
+def _domain_keys_by_id(db: Session) -> dict[int, str]:
+    return dict(db.execute(select(SQLDomain.id, SQLDomain.domain_key)).all())
+
+
+def _build_groups(db: Session) -> dict[int, list[DomainGroup]]:
+    """Groups with their rules per SQL domain id (configuration data - loaded at once)."""
+    rules = db.execute(select(SQLAssignmentRule).order_by(SQLAssignmentRule.id)).scalars().all()
+    children = {}
+    for rule in rules:
+        if rule.parent_rule_id is not None:
+            children.setdefault(rule.parent_rule_id, []).append(
+                RuleCondition(type=rule.rule_type, value=rule.rule_value or "")
+            )
+
+    rules_by_group = {}
+    for rule in rules:
+        if rule.parent_rule_id is not None:
+            continue
+        rules_by_group.setdefault(rule.target_group_id, []).append(AssignmentRule(
+            id=rule.id,
+            type=rule.rule_type,
+            value=rule.rule_value,
+            operator=rule.operator or "AND",
+            is_compound=bool(rule.is_compound),
+            conditions=children.get(rule.id, []),
+        ))
+
+    groups = {}
+    for group in db.execute(select(SQLGroup).order_by(SQLGroup.id)).scalars():
+        groups.setdefault(group.domain_id, []).append(DomainGroup(
+            id=group.id,
+            name=group.name,
+            rules=rules_by_group.get(group.id, []),
+            **_timestamps(group),
+        ))
+    return groups
+
+
+def _domain_batches(db: Session, after_id: int, batch_size: int) -> Iterator[tuple[list[dict], int]]:
+    groups = _build_groups(db)
+    columns = [
+        SQLDomain.id, SQLDomain.domain_key, SQLDomain.name, SQLDomain.calendar_url, SQLDomain.status,
+        SQLDomain.admin_password_hash, SQLDomain.user_password_hash, SQLDomain.owner_id,
+        SQLDomain.created_at, SQLDomain.updated_at,
+    ]
+    for rows in _stream_batches(db, columns, after_id, batch_size):
+        items = [
+            Domain(
+                domain_key=row.domain_key,
+                name=row.name,
+                calendar_url=row.calendar_url,
+                status=row.status or "active",
+                admin_password_hash=row.admin_password_hash,
+                user_password_hash=row.user_password_hash,
+                owner_id=row.owner_id,
+                groups=groups.get(row.id, []),
+                **_timestamps(row),
+            ).to_dynamo_item()
+            for row in rows
+        ]
+        yield items, rows[-1].id
+
+
+def _assignment_batches(db: Session, after_id: int, batch_size: int) -> Iterator[tuple[list[dict], int]]:
+    domain_keys = _domain_keys_by_id(db)
+    columns = [
+        SQLRecurringEventGroup.id, SQLRecurringEventGroup.domain_id, SQLRecurringEventGroup.domain_key,
+        SQLRecurringEventGroup.recurring_event_title, SQLRecurringEventGroup.group_id,
+    ]
+    for rows in _stream_batches(db, columns, after_id, batch_size):
+        items = []
+        for row in rows:
+            domain_key = domain_keys.get(row.domain_id) or row.domain_key
+            if domain_key:
+                items.append(Assignment(
+                    domain_key=domain_key, title=row.recurring_event_title, group_id=row.group_id
+                ).to_dynamo_item())
+        yield _unique_by_key(items), rows[-1].id
+
+
+def _filter_batches(db: Session, after_id: int, batch_size: int) -> Iterator[tuple[list[dict], int]]:
+    domain_keys = _domain_keys_by_id(db)
+    columns = [
+        SQLFilter.id, SQLFilter.domain_id, SQLFilter.domain_key, SQLFilter.link_uuid, SQLFilter.name,
+        SQLFilter.subscribed_group_ids, SQLFilter.unselected_event_ids, SQLFilter.include_future_events,
+        SQLFilter.user_id, SQLFilter.created_at, SQLFilter.updated_at,
+    ]
+    domain_filters = or_(SQLFilter.domain_id.isnot(None), SQLFilter.domain_key.isnot(None))
+    for rows in _stream_batches(db, columns, after_id, batch_size, where=domain_filters):
+        items = [
+            Filter(
+                link_uuid=row.link_uuid,
+                domain_key=domain_keys.get(row.domain_id) or row.domain_key,
+                name=row.name,
+                subscribed_group_ids=row.subscribed_group_ids or [],
+                unselected_event_titles=row.unselected_event_ids or [],
+                include_future_events=bool(row.include_future_events),
+                user_id=row.user_id,
+                **_timestamps(row),
+            ).to_dynamo_item()
+            for row in rows
+        ]
+        yield items, rows[-1].id
+
+
+def _filters_losing_subscriptions(db: Session) -> list[str]:
+    """Link UUIDs of domain filters with subscribed_event_ids (not copied)."""
+    domain_filters = or_(SQLFilter.domain_id.isnot(None), SQLFilter.domain_key.isnot(None))
+    rows = db.execute(
+        select(SQLFilter.link_uuid, SQLFilter.subscribed_event_ids).where(domain_filters).order_by(SQLFilter.id)
+    )
+    return [link_uuid for link_uuid, subscribed_event_ids in rows if subscribed_event_ids]
+
+
+def _event_batches(db: Session, after_id: int, batch_size: int) -> Iterator[tuple[list[dict], int]]:
+    calendar_domains = dict(db.execute(
+        select(SQLDomain.calendar_id, SQLDomain.domain_key).where(SQLDomain.calendar_id.isnot(None))
+    ).all())
+    if not calendar_domains:
+        return
+    columns = [
+        SQLEvent.id, SQLEvent.calendar_id, SQLEvent.uid, SQLEvent.title, SQLEvent.start_time,
+        SQLEvent.end_time, SQLEvent.description, SQLEvent.location, SQLEvent.other_ical_fields,
+        SQLEvent.created_at, SQLEvent.updated_at,
+    ]
+    domain_events = SQLEvent.calendar_id.in_(list(calendar_domains))
+    for rows in _stream_batches(db, columns, after_id, batch_size, where=domain_events):
+        items = [
+            Event(
+                domain_key=calendar_domains[row.calendar_id],
+                uid=row.uid,
+                start_date=row.start_time.strftime("%Y-%m-%d"),
+                title=row.title,
+                start_time=row.start_time,
+                end_time=row.end_time,
+                description=row.description,
+                location=row.location,
+                other_fields=row.other_ical_fields or {},
+                **_timestamps(row),
+            ).to_dynamo_item()
+            for row in rows
+        ]
+        yield _unique_by_key(items), rows[-1].id
+
+
+STAGE_BATCHES = {
+    "domains": _domain_batches,
+    "assignments": _assignment_batches,
+    "filters": _filter_batches,
+    "events": _event_batches,
+}
+
+
+# =============================================================================
+# Copy pipeline
+# =============================================================================
+
+def _copy_stage(stage: str, batches: Iterator[tuple[list[dict], int]], checkpoint: MigrationCheckpoint,
+                max_in_flight: int, report: Callable[[str], None]) -> int:
+    """
+    Write batches concurrently, advancing the checkpoint in id order.
+
+    At most max_in_flight batches are pending; reading the next batch
+    overlaps with writing the previous ones.
+    """
+    started = last_report = time.monotonic()
+    copied = 0
+    in_flight = deque()
+
+    def finish_oldest() -> None:
+        nonlocal copied, last_report
+        future, last_id, count = in_flight.popleft()
+        future.result()
+        checkpoint.advance(stage, last_id)
+        copied += count
+        now = time.monotonic()
+        if now - last_report >= REPORT_INTERVAL_SECONDS:
+            last_report = now
+            report(f"{stage}: {copied} items ({copied / (now - started):,.0f}/s), at id {last_id}")
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        for items, last_id in batches:
+            in_flight.append((executor.submit(parallel_batch_write, items=items), last_id, len(items)))
+            while in_flight and (len(in_flight) >= max_in_flight or in_flight[0][0].done()):
+                finish_oldest()
+        while in_flight:
+            finish_oldest()
+
+    elapsed = time.monotonic() - started
+    report(f"{stage}: done, {copied} items in {elapsed:.1f}s ({copied / max(elapsed, 1e-9):,.0f}/s)")
+    return copied
+
+
+def migrate_sql_to_dynamodb(
+    db: Session,
+    checkpoint: Optional[MigrationCheckpoint] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    report: Callable[[str], None] = print,
+    strict: bool = False,
+) -> dict:
+    """
+    Copy all domain data from SQL into DynamoDB (resumable).
+
+    Args:
+        db: Database session
+        checkpoint: Progress store (default: in-memory, not resumable)
+        batch_size: Rows per streamed batch
+        max_in_flight: Batches written concurrently
+        report: Progress line sink
+        strict: Raise MigrationDataLossError before copying if filters would lose subscriptions
+
+    Returns:
+        Items copied per stage in this run
+    """
+    checkpoint = checkpoint or MigrationCheckpoint()
+    copied = {}
+
+    lossy_filters = [] if checkpoint.is_completed("filters") else _filters_losing_subscriptions(db)
+    if lossy_filters:
+        message = (f"filters: {len(lossy_filters)} domain filters lose their subscribed_event_ids "
+                   f"(no DynamoDB counterpart): {', '.join(lossy_filters)}")
+        if strict:
+            raise MigrationDataLossError(message)
+        report(f"WARNING {message}")
+
+    for stage in STAGES:
+        if checkpoint.is_completed(stage):
+            report(f"{stage}: already completed, skipping")
+            copied[stage] = 0
+            continue
+        batches = STAGE_BATCHES[stage](db, checkpoint.last_id(stage), batch_size)
+        copied[stage] = _copy_stage(stage, batches, checkpoint, max_in_flight, report)
+        checkpoint.complete(stage)
+
+    return copied
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Copy the SQL database into DynamoDB (resumable)")
+    parser.add_argument("--database-url", help="SQLAlchemy URL (default: configured database)")
+    parser.add_argument("--checkpoint", default="sql_to_dynamodb_checkpoint.json", help="Progress file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument("--strict", action="store_true", help="Abort if any data would not be copied")
+    args = parser.parse_args()
+
+    if args.database_url:
+        db = Session(create_engine(args.database_url))
+    else:
+        from ..core.database import SessionLocal
+        db = SessionLocal()
+
+    try:
+        copied = migrate_sql_to_dynamodb(
+            db, MigrationCheckpoint(args.checkpoint), args.batch_size, args.max_in_flight, strict=args.strict
+        )
+    except MigrationDataLossError as e:
+        parser.exit(1, f"Aborted (--strict): {e}\n")
+    finally:
+        db.close()
+
+    print(", ".join(f"{stage}: {count}" for stage, count in copied.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ Pydantic models for DynamoDB documents.
 Uses denormalized document design - relationships embedded as nested objects.
 """
 
+import hashlib
+import json
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
@@ -41,6 +43,13 @@ class DomainGroup(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    def to_dynamo_map(self) -> dict:
+        """Convert to an embedded DynamoDB map (ISO datetime strings)."""
+        group_dict = self.model_dump()
+        group_dict["created_at"] = self.created_at.isoformat()
+        group_dict["updated_at"] = self.updated_at.isoformat()
+        return group_dict
+
 
 # =============================================================================
 # Top-level document models
@@ -67,8 +76,7 @@ class Domain(BaseModel):
     # Embedded groups (denormalized)
     groups: list[DomainGroup] = Field(default_factory=list)
 
-    # Recurring event to group mapping: {"Event Title": group_id}
-    recurring_assignments: dict[str, int] = Field(default_factory=dict)
+    # Recurring event assignments are separate Assignment items (ASSIGN#<title>)
 
     # Ownership
     owner_id: Optional[int] = None
@@ -77,19 +85,15 @@ class Domain(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Optimistic concurrency: incremented by every write (0 = never written)
+    version: int = 0
+
+    # Change counters for versioned response caches
+    sync_generation: int = 0  # Incremented when a sync changes events
+    assignment_version: int = 0  # Incremented when recurring assignments change
+
     def to_dynamo_item(self) -> dict:
         """Convert to DynamoDB item format."""
-        # Serialize groups with ISO datetime strings
-        groups_serialized = []
-        for g in self.groups:
-            group_dict = g.model_dump()
-            # Convert datetime fields to ISO strings
-            if isinstance(group_dict.get("created_at"), datetime):
-                group_dict["created_at"] = group_dict["created_at"].isoformat()
-            if isinstance(group_dict.get("updated_at"), datetime):
-                group_dict["updated_at"] = group_dict["updated_at"].isoformat()
-            groups_serialized.append(group_dict)
-
         return {
             "PK": f"DOMAIN#{self.domain_key}",
             "SK": "METADATA",
@@ -99,11 +103,16 @@ class Domain(BaseModel):
             "status": self.status,
             "admin_password_hash": self.admin_password_hash,
             "user_password_hash": self.user_password_hash,
-            "groups": groups_serialized,
-            "recurring_assignments": self.recurring_assignments,
+            "groups": [g.to_dynamo_map() for g in self.groups],
             "owner_id": self.owner_id,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
+            "version": self.version,
+            "sync_generation": self.sync_generation,
+            "assignment_version": self.assignment_version,
+            # EntityIndex keys: list domains (optionally by status) without scanning
+            "entity_type": "DOMAIN",
+            "entity_sort": f"{self.status}#{self.domain_key}",
         }
 
     @classmethod
@@ -118,10 +127,48 @@ class Domain(BaseModel):
             admin_password_hash=item.get("admin_password_hash"),
             user_password_hash=item.get("user_password_hash"),
             groups=groups,
-            recurring_assignments=item.get("recurring_assignments", {}),
             owner_id=item.get("owner_id"),
             created_at=datetime.fromisoformat(item["created_at"]) if item.get("created_at") else datetime.utcnow(),
             updated_at=datetime.fromisoformat(item["updated_at"]) if item.get("updated_at") else datetime.utcnow(),
+            version=int(item.get("version", 0)),
+            sync_generation=int(item.get("sync_generation", 0)),
+            assignment_version=int(item.get("assignment_version", 0)),
+        )
+
+
+class Assignment(BaseModel):
+    """
+    Recurring event title assigned to a group.
+
+    Stored as separate items under the domain partition, so assignment
+    changes are single-item writes and domain metadata stays small.
+    """
+    domain_key: str  # For PK: DOMAIN#{domain_key}
+    title: str  # For SK: ASSIGN#{title}
+    group_id: int
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    def to_dynamo_item(self) -> dict:
+        """Convert to DynamoDB item format."""
+        return {
+            "PK": f"DOMAIN#{self.domain_key}",
+            "SK": f"ASSIGN#{self.title}",
+            "domain_key": self.domain_key,
+            "title": self.title,
+            "group_id": self.group_id,
+            "updated_at": self.updated_at.isoformat(),
+            # AssignmentGroupIndex key: titles assigned to one group
+            "assign_group": f"{self.domain_key}#{self.group_id}",
+        }
+
+    @classmethod
+    def from_dynamo_item(cls, item: dict) -> "Assignment":
+        """Create from DynamoDB item."""
+        return cls(
+            domain_key=item["domain_key"],
+            title=item["title"],
+            group_id=int(item["group_id"]),
+            updated_at=datetime.fromisoformat(item["updated_at"]) if item.get("updated_at") else datetime.utcnow(),
         )
 
 
@@ -150,6 +197,20 @@ class Event(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    def content_hash(self) -> str:
+        """Hash of the event content (excludes timestamps) for differential sync."""
+        content = [
+            self.title,
+            self.start_time.isoformat(),
+            self.end_time.isoformat() if self.end_time else None,
+            self.description,
+            self.location,
+            self.other_fields,
+        ]
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     def to_dynamo_item(self) -> dict:
         """Convert to DynamoDB item format."""
         return {
@@ -163,6 +224,7 @@ class Event(BaseModel):
             "description": self.description,
             "location": self.location,
             "other_fields": self.other_fields,
+            "content_hash": self.content_hash(),
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -189,6 +251,53 @@ class Event(BaseModel):
         )
 
 
+_UNPARSED = object()
+
+
+class EventRecord:
+    """
+    Read-only event view for hot read paths.
+
+    Built straight from a DynamoDB item without pydantic validation;
+    start_time/end_time are parsed on first access. Exposes the Event
+    attributes the export and event routers read. Writes always go
+    through the validated Event model.
+    """
+    __slots__ = (
+        "domain_key", "uid", "start_date", "title", "description", "location",
+        "_start_raw", "_end_raw", "_start_time", "_end_time",
+    )
+
+    # Attributes to project when reading items for EventRecord
+    ATTRIBUTES = ["SK", "domain_key", "uid", "title", "start_time", "end_time", "description", "location"]
+
+    def __init__(self, item: dict):
+        self.domain_key = item["domain_key"]
+        self.uid = item["uid"]
+        # Extract start_date from SK: EVENT#{date}#{uid}
+        sk_parts = item["SK"].split("#", 2)
+        self.start_date = sk_parts[1] if len(sk_parts) > 1 else ""
+        self.title = item["title"]
+        self.description = item.get("description")
+        self.location = item.get("location")
+        self._start_raw = item["start_time"]
+        self._end_raw = item.get("end_time")
+        self._start_time = _UNPARSED
+        self._end_time = _UNPARSED
+
+    @property
+    def start_time(self) -> datetime:
+        if self._start_time is _UNPARSED:
+            self._start_time = datetime.fromisoformat(self._start_raw)
+        return self._start_time
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        if self._end_time is _UNPARSED:
+            self._end_time = datetime.fromisoformat(self._end_raw) if self._end_raw else None
+        return self._end_time
+
+
 class Filter(BaseModel):
     """
     User filter configuration for iCal export.
@@ -221,6 +330,7 @@ class Filter(BaseModel):
             "SK": "METADATA",
             "link_uuid": self.link_uuid,  # Also stored for GSI
             "domain_key": self.domain_key,
+            "filter_domain_key": self.domain_key,  # FilterDomainIndex key (events carry domain_key too)
             "name": self.name,
             "subscribed_group_ids": self.subscribed_group_ids,
             "unselected_event_titles": self.unselected_event_titles,
@@ -327,6 +437,9 @@ class DomainRequest(BaseModel):
             "approved_domain_key": self.approved_domain_key,
             "created_at": self.created_at.isoformat(),
             "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at else None,
+            # EntityIndex keys: list requests by status, newest first
+            "entity_type": "DOMAIN_REQUEST",
+            "entity_sort": f"{self.status}#{self.created_at.isoformat()}",
         }
 
     @classmethod
@@ -371,16 +484,19 @@ class Admin(BaseModel):
 
     def to_dynamo_item(self) -> dict:
         """Convert to DynamoDB item format."""
-        return {
+        item = {
             "PK": f"ADMIN#{self.email}",
             "SK": "METADATA",
             "email": self.email,
             "password_hash": self.password_hash,
-            "reset_token": self.reset_token,
             "reset_token_expires": self.reset_token_expires.isoformat() if self.reset_token_expires else None,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+        # ResetTokenIndex key: omitted when unset (index keys cannot be NULL)
+        if self.reset_token:
+            item["reset_token"] = self.reset_token
+        return item
 
     @classmethod
     def from_dynamo_item(cls, item: dict) -> "Admin":
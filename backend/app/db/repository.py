@@ -5,26 +5,92 @@ Provides a clean interface for CRUD operations on all document types.
 Services should use this instead of direct DynamoDB calls.
 """
 
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 import uuid as uuid_lib
 
+from boto3.dynamodb.conditions import Attr
+
 from .dynamodb import (
     get_item,
     put_item,
     delete_item,
     update_item,
+    retry_on_conflict,
+    VersionConflictError,
     query_by_pk,
     query_by_gsi,
     batch_write,
     batch_delete,
+    parallel_batch_write,
+    parallel_scan,
+    ENTITY_INDEX,
+    FILTER_DOMAIN_INDEX,
+    LINK_UUID_INDEX,
+    RESET_TOKEN_INDEX,
+    ASSIGNMENT_GROUP_INDEX,
+    USE_INDEXED_LOOKUPS,
+    DOMAIN_CACHE_TTL_SECONDS,
     domain_pk,
     filter_pk,
     admin_pk,
     metadata_sk,
     event_sk,
+    assignment_sk,
+    assignment_group_key,
+)
+from .models import (
+    Domain, Assignment, Event, EventRecord, Filter, Admin, DomainGroup, AssignmentRule, AppSettings, DomainRequest
 )
-from .models import Domain, Event, Filter, Admin, DomainGroup, AssignmentRule, AppSettings, DomainRequest
+
+
+# Counters keying versioned caches of derived domain data
+DOMAIN_GENERATION_ATTRIBUTES = ["version", "sync_generation", "assignment_version"]
+
+
+class DomainCache:
+    """
+    Container-local TTL cache of parsed Domain documents.
+
+    Fresh entries are served without touching DynamoDB. Expired entries are
+    revalidated with a projected read of version and only re-fetched and
+    re-parsed when the stored document changed. Callers always get a copy,
+    so mutating a returned domain never leaks into the cache.
+    """
+
+    def __init__(self, ttl_seconds: float = DOMAIN_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, Domain]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, domain_key: str) -> tuple[Optional[Domain], bool]:
+        """Return (cached domain or None, still fresh)."""
+        with self._lock:
+            entry = self._entries.get(domain_key)
+        if entry is None:
+            return None, False
+        expires_at, domain = entry
+        return domain, time.monotonic() < expires_at
+
+    def put(self, domain: Domain) -> None:
+        """Store (or re-arm) a domain for another TTL period."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[domain.domain_key] = (time.monotonic() + self.ttl_seconds, domain)
+
+    def invalidate(self, domain_key: Optional[str] = None) -> None:
+        """Drop one domain, or every domain when no key is given."""
+        with self._lock:
+            if domain_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(domain_key, None)
+
+
+_domain_cache = DomainCache()
 
 
 class Repository:
@@ -41,40 +107,144 @@ class Repository:
     # Domain operations
     # =========================================================================
 
-    def get_domain(self, domain_key: str) -> Optional[Domain]:
-        """Get domain by key."""
+    def get_domain(self, domain_key: str, cached: bool = True) -> Optional[Domain]:
+        """
+        Get domain by key.
+
+        Served from the container-local domain cache when possible; pass
+        cached=False for read-modify-write cycles that need the stored copy.
+        """
+        if cached:
+            domain, fresh = _domain_cache.get(domain_key)
+            if domain is not None:
+                if not fresh:
+                    stored = get_item(domain_pk(domain_key), metadata_sk(), projection=["version"])
+                    fresh = stored is not None and int(stored.get("version", 0)) == domain.version
+                    if fresh:
+                        _domain_cache.put(domain)
+                if fresh:
+                    return domain.model_copy(deep=True)
+
         item = get_item(domain_pk(domain_key), metadata_sk())
         if not item:
+            _domain_cache.invalidate(domain_key)
             return None
-        return Domain.from_dynamo_item(item)
+        domain = Domain.from_dynamo_item(item)
+        _domain_cache.put(domain.model_copy(deep=True))
+        return domain
 
     def save_domain(self, domain: Domain) -> Domain:
-        """Save (create or update) a domain."""
+        """
+        Save (create or replace) a whole domain (writes through to the domain cache).
+
+        Guarded by the version the domain was read at: raises
+        VersionConflictError if it changed in the meantime. Prefer the
+        targeted mutators below for edits of existing domains.
+        """
+        expected_version = domain.version
+        domain.version = expected_version + 1
         domain.updated_at = datetime.utcnow()
-        put_item(domain.to_dynamo_item())
+        try:
+            put_item(domain.to_dynamo_item(), expected_version=expected_version)
+        except VersionConflictError:
+            domain.version = expected_version
+            raise
+        _domain_cache.put(domain.model_copy(deep=True))
         return domain
 
+    def _update_domain(self, domain_key: str, plan_update: Callable[[Domain], Optional[tuple[dict, Any]]]) -> Any:
+        """
+        Apply a targeted, version-guarded UpdateItem to a domain.
+
+        plan_update inspects the stored domain and returns (update, result),
+        where update holds update_item's updates/append/remove arguments
+        (empty: nothing to write), or None when the target does not exist.
+        Lost races re-read the domain and re-plan.
+
+        Returns:
+            result, or None if the domain or target does not exist
+        """
+        def attempt() -> Any:
+            domain = self.get_domain(domain_key, cached=False)
+            if not domain:
+                return None
+            plan = plan_update(domain)
+            if plan is None:
+                return None
+            update, result = plan
+            if not update:
+                return result
+            item = update_item(
+                domain_pk(domain_key), metadata_sk(),
+                updates={**update.get("updates", {}), "updated_at": datetime.utcnow().isoformat()},
+                append=update.get("append"),
+                remove=update.get("remove"),
+                expected_version=domain.version,
+            )
+            _domain_cache.put(Domain.from_dynamo_item(item))
+            return result
+
+        return retry_on_conflict(attempt)
+
+    def get_domain_generation(self, domain_key: str) -> Optional[dict]:
+        """
+        Read a domain's change counters (version, sync_generation, assignment_version).
+
+        A small projected read - used to key versioned response caches.
+        """
+        item = get_item(domain_pk(domain_key), metadata_sk(), projection=DOMAIN_GENERATION_ATTRIBUTES)
+        if not item:
+            return None
+        return {name: int(item.get(name, 0)) for name in DOMAIN_GENERATION_ATTRIBUTES}
+
+    def _bump_domain_counter(self, domain_key: str, counter: str) -> None:
+        """
+        Atomically increment a change counter (and the version) of a domain.
+
+        Bumping the version makes concurrent version-guarded writes of a
+        stale domain fail instead of resetting the counter.
+        """
+        try:
+            item = update_item(
+                domain_pk(domain_key), metadata_sk(),
+                increment={counter: 1, "version": 1}, must_exist=True
+            )
+        except VersionConflictError:
+            # Domain deleted meanwhile
+            _domain_cache.invalidate(domain_key)
+            return
+        _domain_cache.put(Domain.from_dynamo_item(item))
+
+    def update_domain_fields(self, domain_key: str, fields: dict) -> bool:
+        """Set top-level domain attributes (e.g. password hashes) without rewriting the domain."""
+        return bool(self._update_domain(domain_key, lambda domain: ({"updates": fields}, True)))
+
     def delete_domain(self, domain_key: str) -> bool:
-        """Delete domain and all its events."""
-        # Delete events first
-        events = query_by_pk(domain_pk(domain_key), "EVENT#")
-        if events:
-            keys = [(e["PK"], e["SK"]) for e in events]
-            batch_delete(keys)
+        """Delete domain with all its events and assignments."""
+        # Delete events and assignments first (keys only)
+        for sk_prefix in ("EVENT#", "ASSIGN#"):
+            items = query_by_pk(domain_pk(domain_key), sk_prefix, projection=["PK", "SK"])
+            if items:
+                batch_delete([(item["PK"], item["SK"]) for item in items])
 
         # Delete domain metadata
-        return delete_item(domain_pk(domain_key), metadata_sk())
-
-    def list_domains(self) -> list[Domain]:
-        """List all domains (scans table - use sparingly)."""
-        # Note: In production, you might want to use a GSI for this
-        from .dynamodb import get_table
-        table = get_table()
-        response = table.scan(
-            FilterExpression="begins_with(PK, :pk) AND SK = :sk",
-            ExpressionAttributeValues={":pk": "DOMAIN#", ":sk": "METADATA"}
-        )
-        return [Domain.from_dynamo_item(item) for item in response.get("Items", [])]
+        deleted = delete_item(domain_pk(domain_key), metadata_sk())
+        _domain_cache.invalidate(domain_key)
+        return deleted
+
+    def list_domains(self, status: Optional[str] = None) -> list[Domain]:
+        """List all domains, optionally only those with the given status."""
+        if USE_INDEXED_LOOKUPS:
+            items = query_by_gsi(
+                ENTITY_INDEX, "entity_type", "DOMAIN",
+                sort_key_name="entity_sort", sort_key_prefix=f"{status}#" if status else None
+            )
+        else:
+            condition = Attr("PK").begins_with("DOMAIN#") & Attr("SK").eq("METADATA")
+            if status:
+                condition = condition & Attr("status").eq(status)
+            items = parallel_scan(condition)
+        return [Domain.from_dynamo_item(item) for item in items]
 
     # =========================================================================
     # Group operations (within domain)
@@ -82,43 +252,41 @@ class Repository:
 
     def add_group(self, domain_key: str, name: str) -> Optional[DomainGroup]:
         """Add a group to a domain."""
-        domain = self.get_domain(domain_key)
-        if not domain:
-            return None
+        def plan(domain: Domain):
+            # Generate ID (max existing + 1)
+            max_id = max([g.id for g in domain.groups], default=0)
+            group = DomainGroup(id=max_id + 1, name=name)
+            return {"append": {"groups": [group.to_dynamo_map()]}}, group
 
-        # Generate ID (max existing + 1)
-        max_id = max([g.id for g in domain.groups], default=0)
-        group = DomainGroup(id=max_id + 1, name=name)
-        domain.groups.append(group)
-        self.save_domain(domain)
-        return group
+        return self._update_domain(domain_key, plan)
 
     def update_group(self, domain_key: str, group_id: int, name: str) -> Optional[DomainGroup]:
         """Update a group name."""
-        domain = self.get_domain(domain_key)
-        if not domain:
-            return None
-
-        for group in domain.groups:
-            if group.id == group_id:
-                group.name = name
-                group.updated_at = datetime.utcnow()
-                self.save_domain(domain)
-                return group
-        return None
+        def plan(domain: Domain):
+            index = _group_index(domain, group_id)
+            if index is None:
+                return None
+            group = domain.groups[index]
+            group.name = name
+            group.updated_at = datetime.utcnow()
+            return {"updates": {
+                f"groups[{index}].name": name,
+                f"groups[{index}].updated_at": group.updated_at.isoformat(),
+            }}, group
+
+        return self._update_domain(domain_key, plan)
 
     def delete_group(self, domain_key: str, group_id: int) -> bool:
         """Delete a group from a domain."""
-        domain = self.get_domain(domain_key)
-        if not domain:
+        def plan(domain: Domain):
+            index = _group_index(domain, group_id)
+            return ({"remove": [f"groups[{index}]"]} if index is not None else {}), True
+
+        if not self._update_domain(domain_key, plan):
             return False
 
-        domain.groups = [g for g in domain.groups if g.id != group_id]
         # Remove assignments to this group
-        domain.recurring_assignments = {
-            k: v for k, v in domain.recurring_assignments.items() if v != group_id
-        }
-        self.save_domain(domain)
+        self.unassign_events(domain_key, self.get_group_assignment_titles(domain_key, group_id))
         return True
 
     # =========================================================================
@@ -133,78 +301,192 @@ class Repository:
         rule_value: str
     ) -> Optional[AssignmentRule]:
         """Add a simple assignment rule to a group."""
-        domain = self.get_domain(domain_key)
-        if not domain:
-            return None
+        def plan(domain: Domain):
+            index = _group_index(domain, group_id)
+            if index is None:
+                return None
+            max_id = max([r.id for r in domain.groups[index].rules], default=0)
+            rule = AssignmentRule(
+                id=max_id + 1,
+                type=rule_type,
+                value=rule_value,
+                is_compound=False
+            )
+            return {
+                "append": {f"groups[{index}].rules": [rule.model_dump()]},
+                "updates": {f"groups[{index}].updated_at": datetime.utcnow().isoformat()},
+            }, rule
 
-        for group in domain.groups:
-            if group.id == group_id:
-                max_id = max([r.id for r in group.rules], default=0)
-                rule = AssignmentRule(
-                    id=max_id + 1,
-                    type=rule_type,
-                    value=rule_value,
-                    is_compound=False
-                )
-                group.rules.append(rule)
-                group.updated_at = datetime.utcnow()
-                self.save_domain(domain)
-                return rule
-        return None
+        return self._update_domain(domain_key, plan)
 
     def delete_rule(self, domain_key: str, group_id: int, rule_id: int) -> bool:
         """Delete an assignment rule from a group."""
-        domain = self.get_domain(domain_key)
-        if not domain:
-            return False
-
-        for group in domain.groups:
-            if group.id == group_id:
-                group.rules = [r for r in group.rules if r.id != rule_id]
-                group.updated_at = datetime.utcnow()
-                self.save_domain(domain)
-                return True
-        return False
+        def plan(domain: Domain):
+            index = _group_index(domain, group_id)
+            if index is None:
+                return None
+            rule_index = next((i for i, r in enumerate(domain.groups[index].rules) if r.id == rule_id), None)
+            if rule_index is None:
+                return {}, True
+            return {
+                "remove": [f"groups[{index}].rules[{rule_index}]"],
+                "updates": {f"groups[{index}].updated_at": datetime.utcnow().isoformat()},
+            }, True
+
+        return bool(self._update_domain(domain_key, plan))
 
     # =========================================================================
     # Recurring assignment operations
     # =========================================================================
 
+    def get_assignments(self, domain_key: str, consistent: bool = False) -> dict[str, int]:
+        """
+        Get the recurring event title -> group_id map of a domain.
+
+        Domains not yet migrated (see app.db.migrate_assignments) still carry
+        an embedded recurring_assignments map; it is merged in below the
+        assignment items, which are always newer.
+        """
+        items = query_by_pk(
+            domain_pk(domain_key), "ASSIGN#", projection=["title", "group_id"], consistent_read=consistent
+        )
+        return {
+            **self._get_embedded_assignments(domain_key),
+            **{item["title"]: int(item["group_id"]) for item in items},
+        }
+
+    def _get_embedded_assignments(self, domain_key: str) -> dict[str, int]:
+        """Get the embedded recurring_assignments map of a domain item ({} once migrated)."""
+        item = get_item(domain_pk(domain_key), metadata_sk(), projection=["recurring_assignments"])
+        embedded = (item or {}).get("recurring_assignments") or {}
+        return {title: int(group_id) for title, group_id in embedded.items()}
+
+    def split_embedded_assignments(self, domain_key: str) -> int:
+        """
+        Move the embedded recurring_assignments map of a domain into assignment items.
+
+        Titles that already have an item keep it. The map is dropped with a
+        version-guarded update, so a concurrent domain edit makes it re-read
+        and retry instead of being overwritten.
+
+        Returns:
+            Number of assignment items written
+        """
+        def attempt() -> int:
+            item = get_item(domain_pk(domain_key), metadata_sk(), projection=["recurring_assignments", "version"])
+            if not item or "recurring_assignments" not in item:
+                return 0
+
+            existing = {
+                stored["title"]
+                for stored in query_by_pk(domain_pk(domain_key), "ASSIGN#", projection=["title"], consistent_read=True)
+            }
+            now = datetime.utcnow()
+            missing = [
+                Assignment(domain_key=domain_key, title=title, group_id=int(group_id), updated_at=now)
+                for title, group_id in (item["recurring_assignments"] or {}).items()
+                if title not in existing
+            ]
+            if missing:
+                parallel_batch_write(items=[assignment.to_dynamo_item() for assignment in missing])
+
+            updated = update_item(
+                domain_pk(domain_key), metadata_sk(),
+                remove=["recurring_assignments"], expected_version=int(item.get("version", 0))
+            )
+            _domain_cache.put(Domain.from_dynamo_item(updated))
+            return len(missing)
+
+        return retry_on_conflict(attempt)
+
+    def get_group_assignment_titles(self, domain_key: str, group_id: int) -> list[str]:
+        """Get the recurring event titles assigned to one group."""
+        if self._get_embedded_assignments(domain_key):
+            # Not migrated yet: the index only covers assignment items
+            return [title for title, assigned in self.get_assignments(domain_key).items() if assigned == group_id]
+
+        items = query_by_gsi(
+            ASSIGNMENT_GROUP_INDEX, "assign_group", assignment_group_key(domain_key, group_id),
+            projection=["title"]
+        )
+        return [item["title"] for item in items]
+
     def assign_event_to_group(
         self,
         domain_key: str,
         event_title: str,
         group_id: int
     ) -> bool:
-        """Assign a recurring event title to a group."""
-        domain = self.get_domain(domain_key)
-        if not domain:
+        """Assign a recurring event title to a group (single-item write)."""
+        if not self.get_domain(domain_key):
             return False
 
-        domain.recurring_assignments[event_title] = group_id
-        self.save_domain(domain)
+        put_item(Assignment(domain_key=domain_key, title=event_title, group_id=group_id).to_dynamo_item())
+        self._bump_domain_counter(domain_key, "assignment_version")
         return True
 
+    def assign_events(self, domain_key: str, assignments: dict[str, int]) -> int:
+        """Assign many recurring event titles ({title: group_id}) in batches."""
+        if not assignments or not self.get_domain(domain_key):
+            return 0
+
+        now = datetime.utcnow()
+        parallel_batch_write(items=[
+            Assignment(domain_key=domain_key, title=title, group_id=group_id, updated_at=now).to_dynamo_item()
+            for title, group_id in assignments.items()
+        ])
+        self._bump_domain_counter(domain_key, "assignment_version")
+        return len(assignments)
+
     def unassign_event(self, domain_key: str, event_title: str) -> bool:
         """Remove a recurring event assignment."""
-        domain = self.get_domain(domain_key)
-        if not domain:
+        if not self.get_domain(domain_key):
             return False
 
-        if event_title in domain.recurring_assignments:
-            del domain.recurring_assignments[event_title]
-            self.save_domain(domain)
+        # An embedded entry would otherwise outlive the deleted item
+        self.split_embedded_assignments(domain_key)
+        delete_item(domain_pk(domain_key), assignment_sk(event_title))
+        self._bump_domain_counter(domain_key, "assignment_version")
         return True
 
+    def unassign_events(self, domain_key: str, event_titles: list[str]) -> int:
+        """Remove many recurring event assignments in batches."""
+        titles = set(event_titles)
+        if titles:
+            self.split_embedded_assignments(domain_key)
+            parallel_batch_write(delete_keys=[
+                (domain_pk(domain_key), assignment_sk(title)) for title in titles
+            ])
+            self._bump_domain_counter(domain_key, "assignment_version")
+        return len(titles)
+
     # =========================================================================
     # Event operations
     # =========================================================================
 
-    def get_events(self, domain_key: str) -> list[Event]:
-        """Get all events for a domain."""
-        items = query_by_pk(domain_pk(domain_key), "EVENT#")
+    def get_events(
+        self, domain_key: str, lightweight: bool = False, consistent: bool = False
+    ) -> list[Event] | list[EventRecord]:
+        """
+        Get all events for a domain.
+
+        With lightweight=True, returns unvalidated EventRecord views built
+        from projected items (for read-only paths over many events).
+        consistent=True reads strongly consistent (e.g. to fill versioned caches).
+        """
+        if lightweight:
+            items = query_by_pk(
+                domain_pk(domain_key), "EVENT#", projection=EventRecord.ATTRIBUTES, consistent_read=consistent
+            )
+            return [EventRecord(item) for item in items]
+        items = query_by_pk(domain_pk(domain_key), "EVENT#", consistent_read=consistent)
         return [Event.from_dynamo_item(item) for item in items]
 
+    def get_event_titles(self, domain_key: str, consistent: bool = False) -> list[str]:
+        """Get the title of every event of a domain (projected read)."""
+        items = query_by_pk(domain_pk(domain_key), "EVENT#", projection=["title"], consistent_read=consistent)
+        return [item["title"] for item in items]
+
     def save_event(self, event: Event) -> Event:
         """Save (create or update) an event."""
         event.updated_at = datetime.utcnow()
@@ -226,12 +508,41 @@ class Repository:
 
     def delete_all_events(self, domain_key: str) -> int:
         """Delete all events for a domain."""
-        items = query_by_pk(domain_pk(domain_key), "EVENT#")
+        items = query_by_pk(domain_pk(domain_key), "EVENT#", projection=["PK", "SK"])
         if items:
             keys = [(item["PK"], item["SK"]) for item in items]
             batch_delete(keys)
         return len(items)
 
+    def sync_events(self, domain_key: str, events: list[Event]) -> dict:
+        """
+        Replace a domain's events with a differential write.
+
+        Only new or changed events are put and only vanished events are
+        deleted. Puts go out before deletes, so readers see the old or new
+        event set (briefly their union), never an empty domain.
+
+        Returns:
+            Counts: put_count, deleted_count, unchanged_count
+        """
+        existing_items = query_by_pk(
+            domain_pk(domain_key), "EVENT#", projection=["PK", "SK", "content_hash", "created_at"]
+        )
+        puts, delete_keys, unchanged_count = diff_event_items(existing_items, events)
+
+        if puts:
+            parallel_batch_write(items=puts)
+        if delete_keys:
+            parallel_batch_write(delete_keys=delete_keys)
+        if puts or delete_keys:
+            self._bump_domain_counter(domain_key, "sync_generation")
+
+        return {
+            "put_count": len(puts),
+            "deleted_count": len(delete_keys),
+            "unchanged_count": unchanged_count,
+        }
+
     # =========================================================================
     # Filter operations
     # =========================================================================
@@ -251,7 +562,7 @@ class Repository:
             return filter_obj
 
         # Try GSI lookup (for legacy UUIDs)
-        items = query_by_gsi("LinkUuidIndex", "link_uuid", link_uuid)
+        items = query_by_gsi(LINK_UUID_INDEX, "link_uuid", link_uuid)
         if items:
             return Filter.from_dynamo_item(items[0])
         return None
@@ -273,14 +584,12 @@ class Repository:
         return delete_item(filter_pk(link_uuid), metadata_sk())
 
     def list_filters_for_domain(self, domain_key: str) -> list[Filter]:
-        """List all filters for a domain (scans - use sparingly)."""
-        from .dynamodb import get_table
-        table = get_table()
-        response = table.scan(
-            FilterExpression="begins_with(PK, :pk) AND domain_key = :dk",
-            ExpressionAttributeValues={":pk": "FILTER#", ":dk": domain_key}
-        )
-        return [Filter.from_dynamo_item(item) for item in response.get("Items", [])]
+        """List all filters for a domain."""
+        if USE_INDEXED_LOOKUPS:
+            items = query_by_gsi(FILTER_DOMAIN_INDEX, "filter_domain_key", domain_key)
+        else:
+            items = parallel_scan(Attr("PK").begins_with("FILTER#") & Attr("domain_key").eq(domain_key))
+        return [Filter.from_dynamo_item(item) for item in items]
 
     # =========================================================================
     # Admin operations
@@ -304,14 +613,11 @@ class Repository:
         return delete_item(admin_pk(email), metadata_sk())
 
     def get_admin_by_reset_token(self, token: str) -> Optional[Admin]:
-        """Find admin by reset token (scans - acceptable for rare operation)."""
-        from .dynamodb import get_table
-        table = get_table()
-        response = table.scan(
-            FilterExpression="begins_with(PK, :pk) AND reset_token = :token",
-            ExpressionAttributeValues={":pk": "ADMIN#", ":token": token}
-        )
-        items = response.get("Items", [])
+        """Find admin by reset token."""
+        if USE_INDEXED_LOOKUPS:
+            items = query_by_gsi(RESET_TOKEN_INDEX, "reset_token", token)
+        else:
+            items = parallel_scan(Attr("PK").begins_with("ADMIN#") & Attr("reset_token").eq(token))
         if items:
             return Admin.from_dynamo_item(items[0])
         return None
@@ -419,26 +725,18 @@ class Repository:
 
     def list_domain_requests(self, status: Optional[str] = None) -> list[DomainRequest]:
         """List all domain requests, optionally filtered by status."""
-        from .dynamodb import get_table
-        table = get_table()
-
-        if status:
-            response = table.scan(
-                FilterExpression="begins_with(PK, :pk) AND SK = :sk AND #s = :status",
-                ExpressionAttributeNames={"#s": "status"},
-                ExpressionAttributeValues={
-                    ":pk": "DOMAIN_REQUEST#",
-                    ":sk": "METADATA",
-                    ":status": status
-                }
+        if USE_INDEXED_LOOKUPS:
+            items = query_by_gsi(
+                ENTITY_INDEX, "entity_type", "DOMAIN_REQUEST",
+                sort_key_name="entity_sort", sort_key_prefix=f"{status}#" if status else None
             )
         else:
-            response = table.scan(
-                FilterExpression="begins_with(PK, :pk) AND SK = :sk",
-                ExpressionAttributeValues={":pk": "DOMAIN_REQUEST#", ":sk": "METADATA"}
-            )
+            condition = Attr("PK").begins_with("DOMAIN_REQUEST#") & Attr("SK").eq("METADATA")
+            if status:
+                condition = condition & Attr("status").eq(status)
+            items = parallel_scan(condition)
 
-        requests = [DomainRequest.from_dynamo_item(item) for item in response.get("Items", [])]
+        requests = [DomainRequest.from_dynamo_item(item) for item in items]
         # Sort by created_at descending (newest first)
         requests.sort(key=lambda r: r.created_at, reverse=True)
         return requests
@@ -478,10 +776,51 @@ class Repository:
         return None
 
 
+def _group_index(domain: Domain, group_id: int) -> Optional[int]:
+    """Position of a group in domain.groups (used in update expression paths)."""
+    return next((i for i, g in enumerate(domain.groups) if g.id == group_id), None)
+
+
 # Singleton instance for convenience
 _repository: Optional[Repository] = None
 
 
+def diff_event_items(existing_items: list[dict], events: list[Event]) -> tuple[list[dict], list[tuple[str, str]], int]:
+    """
+    Diff stored event items against freshly synced events by content hash.
+
+    Events are keyed by (PK, SK); duplicate keys in the feed keep the last
+    occurrence. Changed events keep their original created_at. Items stored
+    before content hashes existed are rewritten once to backfill the hash.
+
+    Returns:
+        Tuple of (items_to_put, keys_to_delete, unchanged_count)
+    """
+    existing_by_key = {(item["PK"], item["SK"]): item for item in existing_items}
+
+    new_by_key = {}
+    for event in events:
+        new_by_key[(domain_pk(event.domain_key), event_sk(event.start_date, event.uid))] = event
+
+    now = datetime.utcnow()
+    puts = []
+    unchanged_count = 0
+    for key, event in new_by_key.items():
+        existing = existing_by_key.get(key)
+        if existing is not None:
+            if existing.get("content_hash") == event.content_hash():
+                unchanged_count += 1
+                continue
+            if existing.get("created_at"):
+                event.created_at = datetime.fromisoformat(existing["created_at"])
+        event.updated_at = now
+        puts.append(event.to_dynamo_item())
+
+    delete_keys = [key for key in existing_by_key if key not in new_by_key]
+
+    return puts, delete_keys, unchanged_count
+
+
 def get_repository() -> Repository:
     """Get singleton repository instance."""
     global _repository
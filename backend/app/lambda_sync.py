@@ -1,26 +1,45 @@
 """
 Lambda handler for scheduled domain calendar sync task.
 
-This function is triggered by EventBridge every 30 minutes to:
-- Sync domain calendars from external sources
+This function is triggered by EventBridge every 10 minutes (a tick) to:
+- Sync the domain calendars that are due by their adaptive per-feed
+  schedule (see services/sync_schedule_service.py), most subscribed first
 - Apply assignment rules to events
 - Warm the cache for each domain
+- Precompute filter exports for each domain
+- Refresh a batch of personal calendars (most stale / most exported first)
+
+Domains are partitioned into settings.sync_shard_count shards by a stable
+hash. The scheduled invocation acts as coordinator: it invokes this same
+function once per shard ({"shard": i, "shard_count": n}) and aggregates the
+results, or loops over the shards in-process outside Lambda. Each shard has
+its own time budget; a shard that runs out of time stores the first domain
+it did not reach, and its next run starts there.
+
+Feed schedules and per-feed health (backoff and circuit breaking,
+services/feed_health_service.py) live on the calendar rows; host health is
+shared in Redis when available and per container otherwise. Shard
+checkpoints are kept in Redis only: without a reachable REDIS_URL a shard
+restarts from its first due domain every run, and each run logs a warning.
 
 Replaces APScheduler background tasks from ECS Fargate deployment.
 """
 
 import asyncio
-from typing import Dict, Any, List
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
 from sqlalchemy.orm import Session
 
 from .core.config import settings
 from .core.database import get_db
-from .services.cache_service import warm_domain_cache
-from .services.domain_service import (
-    ensure_domain_calendar_exists,
-    load_domains_config,
-    auto_assign_events_with_rules
-)
+from .core.redis import set_cache, get_cache, delete_cache, is_redis_reachable
+from .data.sync_shards import partition_domains, order_from_checkpoint, aggregate_shard_results
+from .services.domain_service import load_domains_config
+from .services.domain_sync_service import sync_domain
+from .services.sync_schedule_service import get_due_domains
+from .services.user_calendar_refresh_service import refresh_user_calendars
 
 
 def get_domain_keys() -> List[str]:
@@ -45,20 +64,28 @@ def get_domain_keys() -> List[str]:
         return []
 
 
-async def sync_all_domain_calendars(db: Session) -> Dict[str, Any]:
+SHARD_CHECKPOINT_TTL_SECONDS = 24 * 60 * 60
+
+
+async def sync_all_domain_calendars(db: Session, domain_keys: Optional[List[str]] = None,
+                                    budget_seconds: Optional[float] = None) -> Dict[str, Any]:
     """
-    Sync all domain calendars and warm cache.
+    Sync domain calendars and warm cache.
 
     Args:
         db: Database session
+        domain_keys: Domains to sync in order (default: all configured domains)
+        budget_seconds: Stop starting new domains after this many seconds
 
     Returns:
-        Dictionary with sync results
+        Dictionary with sync results; "resume_from" names the first domain
+        not reached when the budget ran out
     """
     print("🔄 Starting scheduled domain calendar sync...")
 
     # Get all configured domains
-    domain_keys = get_domain_keys()
+    if domain_keys is None:
+        domain_keys = get_domain_keys()
     if not domain_keys:
         print("⚠️ No domains configured for sync")
         return {
@@ -68,51 +95,26 @@ async def sync_all_domain_calendars(db: Session) -> Dict[str, Any]:
             "cached": 0,
         }
 
-    # Load domains configuration
-    success, config, error = load_domains_config(settings.domains_config_path)
-    if not success:
-        print(f"❌ Failed to load domains config: {error}")
-        return {
-            "status": "error",
-            "message": f"Failed to load config: {error}",
-            "synced": 0,
-            "cached": 0,
-        }
-
     # Process each domain
+    started = time.monotonic()
     synced_count = 0
     cached_count = 0
     errors = []
+    resume_from = None
+    deferred = 0
+
+    for position, domain_key in enumerate(domain_keys):
+        if budget_seconds is not None and time.monotonic() - started >= budget_seconds:
+            resume_from = domain_key
+            deferred = len(domain_keys) - position
+            print(f"⏱️ Sync budget exhausted, deferring {deferred} domains starting at: {domain_key}")
+            break
 
-    for domain_key in domain_keys:
         try:
-            # Ensure domain calendar exists and is synced
-            success, calendar, sync_error = await ensure_domain_calendar_exists(db, domain_key)
-
-            if success:
-                print(f"✅ Synced domain calendar: {domain_key}")
-                synced_count += 1
-
-                # Apply assignment rules to newly synced events
-                rule_success, assignment_count, rule_error = await auto_assign_events_with_rules(
-                    db, domain_key
-                )
-                if rule_success and assignment_count > 0:
-                    print(f"📋 Applied {assignment_count} assignment rules for domain: {domain_key}")
-                elif not rule_success:
-                    print(f"⚠️ Rule application failed for domain {domain_key}: {rule_error}")
-                    errors.append(f"{domain_key}: {rule_error}")
-
-                # Warm cache for this domain
-                cache_success = warm_domain_cache(db, domain_key)
-                if cache_success:
-                    print(f"🔥 Warmed cache for domain: {domain_key}")
-                    cached_count += 1
-                else:
-                    print(f"⚠️ Cache warming failed for domain: {domain_key}")
-            else:
-                print(f"❌ Failed to sync domain {domain_key}: {sync_error}")
-                errors.append(f"{domain_key}: {sync_error}")
+            result = await sync_domain(db, domain_key)
+            synced_count += result["synced"]
+            cached_count += result["cached"]
+            errors.extend(result["errors"])
 
         except Exception as domain_error:
             print(f"❌ Error processing domain {domain_key}: {domain_error}")
@@ -122,19 +124,168 @@ async def sync_all_domain_calendars(db: Session) -> Dict[str, Any]:
     print(f"📊 Sync completed: {synced_count} calendars synced, {cached_count} caches warmed")
 
     return {
-        "status": "success" if not errors else "partial",
+        "status": "success" if not errors and not deferred else "partial",
         "synced": synced_count,
         "cached": cached_count,
+        "deferred": deferred,
+        "resume_from": resume_from,
         "errors": errors if errors else None,
     }
 
 
+def _shard_checkpoint_key(shard: int, shard_count: int) -> str:
+    """Redis key of a shard's resume point (resharding starts fresh)."""
+    return f"sync_shard_checkpoint:{shard_count}:{shard}"
+
+
+def run_shard(shard: int, shard_count: int, budget_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Sync the domains of one shard with its own session, budget and checkpoint.
+
+    Args:
+        shard: Shard index
+        shard_count: Total number of shards
+        budget_seconds: Time budget (default: settings.sync_shard_budget_seconds)
+
+    Returns:
+        Shard sync result
+    """
+    if budget_seconds is None:
+        budget_seconds = settings.sync_shard_budget_seconds
+
+    domain_keys = partition_domains(get_domain_keys(), shard_count)[shard]
+    checkpoint_key = _shard_checkpoint_key(shard, shard_count)
+    checkpoint = get_cache(checkpoint_key) or {}
+
+    db_generator = get_db()
+    db: Session = next(db_generator)
+    try:
+        # Only feeds due by their adaptive schedule, most subscribed first
+        due = get_due_domains(db, domain_keys)
+        ordered = order_from_checkpoint(due, checkpoint.get("resume_from"))
+        not_due = len(domain_keys) - len(due)
+        print(f"🧩 Shard {shard + 1}/{shard_count}: {len(ordered)} of {len(domain_keys)} domains due")
+
+        if not ordered:
+            return {"shard": shard, "status": "success", "synced": 0, "cached": 0, "deferred": 0,
+                    "not_due": not_due, "errors": None}
+
+        result = asyncio.run(sync_all_domain_calendars(db, ordered, budget_seconds))
+        db.commit()
+    finally:
+        db.close()
+
+    if result.get("resume_from"):
+        set_cache(checkpoint_key, {"resume_from": result["resume_from"]}, SHARD_CHECKPOINT_TTL_SECONDS)
+    elif checkpoint:
+        delete_cache(checkpoint_key)
+
+    return {"shard": shard, **result, "not_due": not_due}
+
+
+def lambda_shard_invoker(function_name: str) -> Callable[[int, int], Dict[str, Any]]:
+    """
+    Build a shard runner that invokes a worker Lambda synchronously.
+
+    Args:
+        function_name: Name of the sync function (workers run the same code)
+
+    Returns:
+        Callable (shard, shard_count) -> shard result
+    """
+    import boto3
+    from botocore.config import Config
+
+    # Workers may run up to the function timeout; don't let the client time out first
+    client = boto3.client("lambda", config=Config(read_timeout=900, retries={"max_attempts": 0}))
+
+    def invoke(shard: int, shard_count: int) -> Dict[str, Any]:
+        response = client.invoke(
+            FunctionName=function_name,
+            InvocationType="RequestResponse",
+            Payload=json.dumps({"shard": shard, "shard_count": shard_count}).encode("utf-8"),
+        )
+        payload = json.loads(response["Payload"].read() or b"{}")
+        if response.get("FunctionError"):
+            message = payload.get("errorMessage", response["FunctionError"])
+            return {"shard": shard, "status": "error", "errors": [f"shard {shard}: {message}"]}
+        body = payload.get("body", payload)
+        body.setdefault("shard", shard)
+        if body.get("status") == "error" and not body.get("errors"):
+            body["errors"] = [f"shard {shard}: {body.get('message')}"]
+        return body
+
+    return invoke
+
+
+def run_coordinator(shard_count: int,
+                    invoke_shard: Optional[Callable[[int, int], Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Run every shard and aggregate the results.
+
+    Args:
+        shard_count: Number of shards
+        invoke_shard: Remote shard runner; None runs shards in-process one after another
+
+    Returns:
+        Aggregated sync result
+    """
+    print(f"🧭 Coordinating sync across {shard_count} shards")
+
+    if invoke_shard is None:
+        results = [run_shard(shard, shard_count) for shard in range(shard_count)]
+    else:
+        def run_remote(shard: int) -> Dict[str, Any]:
+            try:
+                return invoke_shard(shard, shard_count)
+            except Exception as invoke_error:
+                print(f"❌ Shard {shard} invocation failed: {invoke_error}")
+                return {"shard": shard, "status": "error", "errors": [f"shard {shard}: {invoke_error}"]}
+
+        with ThreadPoolExecutor(max_workers=shard_count) as executor:
+            results = list(executor.map(run_remote, range(shard_count)))
+
+    return aggregate_shard_results(results)
+
+
+USER_REFRESH_TIMEOUT_MARGIN_SECONDS = 15
+# Longest a shard worker runs past its budget: the domain in flight (fetch timeout + export precompute)
+SHARD_OVERRUN_SECONDS = 90
+
+
+def run_user_calendar_refresh(remaining_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Refresh a batch of personal calendars after the domain sync.
+
+    Args:
+        remaining_seconds: Time left in this invocation (None: unknown)
+
+    Returns:
+        Refresh summary, or {"skipped": reason}
+    """
+    if not settings.user_calendar_refresh_enabled:
+        return {"skipped": "disabled"}
+
+    budget_seconds = settings.user_calendar_refresh_budget_seconds
+    if remaining_seconds is not None:
+        budget_seconds = min(budget_seconds, remaining_seconds - USER_REFRESH_TIMEOUT_MARGIN_SECONDS)
+    if budget_seconds <= 0:
+        return {"skipped": "no time left"}
+
+    result = asyncio.run(refresh_user_calendars(budget_seconds))
+    print(f"👤 User calendar refresh: {result}")
+    return result
+
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
-    Lambda handler for EventBridge scheduled events.
+    Lambda handler for EventBridge scheduled events and shard workers.
+
+    Scheduled events run the coordinator; events with a "shard" key (sent
+    by the coordinator) sync that shard only.
 
     Args:
-        event: EventBridge event (contains schedule info)
+        event: EventBridge event (contains schedule info) or shard assignment
         context: Lambda context
 
     Returns:
@@ -142,28 +293,34 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     print(f"🚀 Lambda sync task started (request ID: {context.request_id})")
     print(f"📅 Event: {event.get('source', 'N/A')} - {event.get('detail-type', 'N/A')}")
+    if not is_redis_reachable():
+        print("⚠️ Redis unreachable: shard checkpoints are not kept this run")
 
     try:
-        # Get database session
-        db_generator = get_db()
-        db: Session = next(db_generator)
-
-        try:
-            # Run sync operation
-            result = asyncio.run(sync_all_domain_calendars(db))
-
-            # Commit changes
-            db.commit()
-
-            print(f"✅ Sync completed successfully: {result}")
-            return {
-                "statusCode": 200,
-                "body": result,
-            }
-
-        finally:
-            # Ensure database session is closed
-            db.close()
+        if "shard" in event:
+            result = run_shard(int(event["shard"]), int(event["shard_count"]))
+        else:
+            shard_count = max(settings.sync_shard_count, 1)
+            remaining_ms = getattr(context, "get_remaining_time_in_millis", None)
+            invoke_shard = None
+            if shard_count > 1 and settings.is_lambda:
+                invoke_shard = lambda_shard_invoker(context.function_name)
+                worker_seconds = settings.sync_shard_budget_seconds + SHARD_OVERRUN_SECONDS
+                if callable(remaining_ms) and remaining_ms() / 1000 < worker_seconds:
+                    print(f"⚠️ Function timeout below the shard workers' {worker_seconds:.0f}s: "
+                          f"the coordinator may time out before its workers")
+            result = run_coordinator(shard_count, invoke_shard)
+
+            # Personal calendars refresh once per tick, in the coordinator
+            result["user_calendars"] = run_user_calendar_refresh(
+                remaining_ms() / 1000 if callable(remaining_ms) else None
+            )
+
+        print(f"✅ Sync completed successfully: {result}")
+        return {
+            "statusCode": 200,
+            "body": result,
+        }
 
     except Exception as e:
         print(f"❌ Sync task error: {e}")
@@ -174,7 +174,7 @@ async def lifespan(app: FastAPI):
 
     # Start background scheduler for domain calendar sync (configurable)
     if settings.should_enable_background_tasks:
-        print(f"⏰ Starting background scheduler (sync every {settings.actual_sync_interval_minutes} minutes)")
+        print(f"⏰ Starting background scheduler (due feeds checked every {settings.sync_tick_minutes} minutes)")
         start_scheduler()
     else:
         print("⏰ Background tasks disabled (testing environment)")
@@ -184,6 +184,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if settings.should_enable_background_tasks:
         stop_scheduler()
+    from .core.executors import shutdown_executors
+    shutdown_executors()
     print("🛑 Shutting down Filter iCal")
 
 
@@ -321,6 +323,19 @@ def create_application() -> FastAPI:
     async def health_check():
         """Health check endpoint for monitoring."""
         return {"status": "healthy", "app": settings.app_name}
+
+    if not settings.use_dynamodb:
+        @app.get("/health/db")
+        async def database_health():
+            """Connection pool metrics (checkout latency, saturation) for monitoring."""
+            from .core.database import get_pool_metrics
+            return get_pool_metrics()
+
+        @app.get("/health/executors")
+        async def executor_health():
+            """Parse / blocking DB executor metrics (queue depth, wait and run durations)."""
+            from .core.executors import get_executor_metrics
+            return get_executor_metrics()
     
     return app
 
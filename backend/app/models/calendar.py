@@ -32,6 +32,8 @@ class Calendar(Base):
     type = Column(String(50), nullable=False)  # 'user' or 'domain'
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Owner (nullable for domain calendars)
     last_fetched = Column(DateTime, default=func.now())
+    # Adaptive sync schedule and last processed content hash (see sync_schedule_service)
+    sync_state = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
@@ -280,7 +280,7 @@ async def seed_domain_from_config(
             # Sync calendar events
             from ..services.calendar_service import sync_calendar_events
             try:
-                sync_success, event_count, sync_error = await sync_calendar_events(db, calendar)
+                sync_success, event_count, sync_error = await sync_calendar_events(db, calendar, user_triggered=True)
                 if sync_success:
                     print(f"✅ Synced {event_count} events for domain '{domain_key}'")
                 else:
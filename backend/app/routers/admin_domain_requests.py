@@ -148,7 +148,7 @@ async def approve_domain_request(
         # 6. Sync calendar events from source URL
         from ..services.calendar_service import sync_calendar_events
         try:
-            success, event_count, error = await sync_calendar_events(db, calendar)
+            success, event_count, error = await sync_calendar_events(db, calendar, user_triggered=True)
             if success:
                 print(f"✅ Synced {event_count} events for domain '{domain_key}'")
             else:
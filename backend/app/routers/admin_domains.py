@@ -15,7 +15,7 @@ from ..core.database import get_db
 from ..core.auth import verify_admin_auth
 from ..models.domain import Domain
 from ..models.calendar import Calendar
-from ..data.ical_parser import parse_ical_content
+from ..services.calendar_service import parse_ical_feed
 from ..core.config import settings
 
 router = APIRouter()
@@ -123,7 +123,7 @@ async def create_domain_directly(
             ical_content = response.text
 
         # Parse iCal content to verify it's valid
-        parse_result = parse_ical_content(ical_content)
+        parse_result = await parse_ical_feed(ical_content)
 
         if not parse_result.is_success:
             raise HTTPException(
@@ -221,7 +221,7 @@ async def create_domain_directly(
         # 4. Sync calendar events from source URL
         from app.services.calendar_service import sync_calendar_events
         try:
-            success, event_count, error = await sync_calendar_events(db, calendar)
+            success, event_count, error = await sync_calendar_events(db, calendar, user_triggered=True)
             if success:
                 print(f"✅ Synced {event_count} events for domain '{domain_data.domain_key}'")
             else:
@@ -7,10 +7,11 @@ Implements user calendar endpoints from OpenAPI specification.
 from typing import List, Optional, Dict, Any, Union
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from ..core.database import get_db
+from ..core.database import get_db, get_async_db
 from ..core.auth import get_current_user_id, require_user_auth
 from ..core.messages import ErrorMessages
 from ..i18n.utils import get_locale_from_request, format_error_message
@@ -19,6 +20,7 @@ from ..services.calendar_service import (
     get_calendar_events, sync_calendar_events, create_filter, get_filters,
     delete_filter, get_filter_by_id
 )
+from ..services.export_service import invalidate_filter_export
 
 router = APIRouter()
 
@@ -51,7 +53,7 @@ async def add_calendar(
             raise HTTPException(status_code=400, detail=error)
         
         # Sync calendar events
-        sync_success, event_count, sync_error = await sync_calendar_events(db, calendar)
+        sync_success, event_count, sync_error = await sync_calendar_events(db, calendar, user_triggered=True)
         warnings = []
         if not sync_success:
             # Calendar created but sync failed - still return calendar with warning
@@ -133,7 +135,7 @@ async def sync_calendar_endpoint(
             raise HTTPException(status_code=404, detail=ErrorMessages.CALENDAR_NOT_FOUND)
             
         # Sync calendar events
-        sync_success, event_count, sync_error = await sync_calendar_events(db, calendar)
+        sync_success, event_count, sync_error = await sync_calendar_events(db, calendar, user_triggered=True)
         
         if not sync_success:
             raise HTTPException(status_code=400, detail=f"Sync failed: {sync_error}")
@@ -174,35 +176,40 @@ async def delete_user_calendar(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _load_calendar_events(db: Session, calendar_id: int, user_id: Optional[int]) -> Optional[List[Dict[str, Any]]]:
+    """Load a calendar's events in OpenAPI schema format (None if no access)."""
+    # Verify calendar exists and user has access
+    calendar = get_calendar_by_id(db, calendar_id, user_id=user_id)
+    if not calendar:
+        return None
+
+    # Get events and transform to OpenAPI schema format
+    return [
+        {
+            "id": event.id,
+            "title": event.title,
+            "start_time": event.start_time.isoformat() if event.start_time else None,
+            "end_time": event.end_time.isoformat() if event.end_time else None,
+            "description": event.description or "",
+            "location": event.location,
+            "uid": event.uid
+        }
+        for event in get_calendar_events(db, calendar_id)
+    ]
+
+
 @router.get("/{calendar_id}/events")
 async def get_calendar_events_endpoint(
     calendar_id: int,
     user_id: Optional[int] = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Get calendar events (flat structure for user calendars)."""
     try:
-        # Verify calendar exists and user has access
-        calendar = get_calendar_by_id(db, calendar_id, user_id=user_id)
-        if not calendar:
+        events_response = await db.run_sync(_load_calendar_events, calendar_id, user_id)
+        if events_response is None:
             raise HTTPException(status_code=404, detail=ErrorMessages.CALENDAR_NOT_FOUND)
 
-        # Get events
-        events = get_calendar_events(db, calendar_id)
-        
-        # Transform to OpenAPI schema format
-        events_response = []
-        for event in events:
-            events_response.append({
-                "id": event.id,
-                "title": event.title,
-                "start_time": event.start_time.isoformat() if event.start_time else None,
-                "end_time": event.end_time.isoformat() if event.end_time else None,
-                "description": event.description or "",
-                "location": event.location,
-                "uid": event.uid
-            })
-        
         return {
             "events": events_response
         }
@@ -354,6 +361,7 @@ async def update_calendar_filter(
         existing_filter.updated_at = func.now()
         db.commit()
         db.refresh(existing_filter)
+        invalidate_filter_export(existing_filter.link_uuid)
         
         # Return updated filter data
         return {
@@ -18,6 +18,7 @@ from ..services.domain_service import (
     create_assignment_rule, get_assignment_rules,
     auto_assign_events_with_rules, delete_assignment_rule
 )
+from ..services.export_service import invalidate_domain_filter_exports
 
 router = APIRouter()
 
@@ -72,6 +73,7 @@ async def create_domain_assignment_rule(
     apply_success, assignment_count, apply_error = await auto_assign_events_with_rules(
         db, domain_obj.domain_key
     )
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     # Note: We don't fail the rule creation if application fails
     # Rule is already created, we just inform the user about application status
@@ -154,6 +156,7 @@ async def apply_domain_assignment_rules(
     success, assignment_count, error = await auto_assign_events_with_rules(db, domain_obj.domain_key)
     if not success:
         raise HTTPException(status_code=500, detail=f"Rule application failed: {error}")
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "success": True,
@@ -232,6 +235,7 @@ async def create_compound_assignment_rule(
     apply_success, assignment_count, apply_error = await auto_assign_events_with_rules(
         db, domain_obj.domain_key
     )
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     # Return with child_conditions populated (follows OpenAPI schema) + application results
     return {
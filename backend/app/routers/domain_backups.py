@@ -18,6 +18,7 @@ from ..models.domain import Domain
 from ..services.backup_service import (
     create_backup, list_backups, get_backup, delete_backup, restore_backup
 )
+from ..services.export_service import invalidate_domain_filter_exports
 
 router = APIRouter()
 
@@ -130,6 +131,7 @@ async def restore_domain_backup(
         if "not found" in restore_error.lower():
             raise HTTPException(status_code=404, detail=restore_error)
         raise HTTPException(status_code=500, detail=restore_error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "success": True,
@@ -19,6 +19,7 @@ from ..services.domain_config_service import (
     export_domain_configuration, import_domain_configuration,
     load_domain_configuration
 )
+from ..services.export_service import invalidate_domain_filter_exports
 
 router = APIRouter()
 
@@ -108,6 +109,7 @@ async def import_domain_config(
     success, error = import_domain_configuration(db, domain_obj.domain_key, config_data)
     if not success:
         raise HTTPException(status_code=400, detail=f"Import error: {error}")
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "success": True,
@@ -132,6 +134,7 @@ async def reset_domain_config(
     success, error = import_domain_configuration(db, domain_obj.domain_key, baseline_config)
     if not success:
         raise HTTPException(status_code=400, detail=f"Reset error: {error}")
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "success": True,
@@ -6,13 +6,17 @@ Implements event-related endpoints from OpenAPI specification.
 
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.database import get_db
+from ..core.database import get_async_db
 from ..core.error_handlers import handle_endpoint_errors
-from ..core.auth import get_verified_domain
+from ..core.messages import ErrorMessages
+from ..core.responses import FastJSONResponse
 from ..models.domain import Domain
-from ..services.cache_service import get_or_build_domain_events
+from ..data.grouping import build_domain_events_summary, select_domain_event_instances, paginate_events
+from ..data.event_projection import parse_event_fields
+from ..services.cache_service import get_domain_events_with_fields
+from .domain_utils import get_verified_domain_async
 
 router = APIRouter()
 
@@ -20,16 +24,57 @@ router = APIRouter()
 @router.get("/{domain}/events")
 @handle_endpoint_errors
 async def get_domain_events(
-    domain_obj: Domain = Depends(get_verified_domain),
+    domain_obj: Domain = Depends(get_verified_domain_async),
     username: Optional[str] = Query(None),
     force_refresh: bool = Query(False, description="Force refresh cache"),
-    db: Session = Depends(get_db)
+    summary: bool = Query(False, description="Return groups and titles with counts only"),
+    fields: Optional[str] = Query(None, description="Comma-separated event fields to include"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get domain calendar events (grouped structure) - cached for performance."""
+    fields_result = parse_event_fields(fields)
+    if not fields_result.is_success:
+        raise HTTPException(status_code=400, detail=fields_result.error)
+
     # Get cached domain events or build if needed
-    success, response_data, error = get_or_build_domain_events(db, domain_obj.domain_key, force_refresh)
+    success, response_data, error = await db.run_sync(
+        get_domain_events_with_fields, domain_obj.domain_key, fields_result.value, force_refresh
+    )
+
+    if not success:
+        raise HTTPException(status_code=500, detail=f"Cache error: {error}")
+
+    if summary:
+        return build_domain_events_summary(response_data)
+
+    return FastJSONResponse(content=response_data)
+
+
+@router.get("/{domain}/events/instances")
+@handle_endpoint_errors
+async def get_domain_event_instances(
+    domain_obj: Domain = Depends(get_verified_domain_async),
+    title: Optional[str] = Query(None, description="Recurring event title"),
+    group_id: Optional[int] = Query(None, description="Group ID"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(50, ge=1, le=500, description="Number of events per page"),
+    fields: Optional[str] = Query(None, description="Comma-separated event fields to include"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get event instances of one recurring title or group (paginated)."""
+    if title is None and group_id is None:
+        raise HTTPException(status_code=400, detail=ErrorMessages.EVENT_SELECTION_REQUIRED)
+
+    fields_result = parse_event_fields(fields)
+    if not fields_result.is_success:
+        raise HTTPException(status_code=400, detail=fields_result.error)
+
+    success, response_data, error = await db.run_sync(
+        get_domain_events_with_fields, domain_obj.domain_key, fields_result.value
+    )
 
     if not success:
         raise HTTPException(status_code=500, detail=f"Cache error: {error}")
 
-    return response_data
+    events = select_domain_event_instances(response_data, title=title, group_id=group_id)
+    return FastJSONResponse(content=paginate_events(events, page, limit))
@@ -6,15 +6,18 @@ Implements filter-related endpoints from OpenAPI specification.
 
 from typing import Optional
 from fastapi import APIRouter, Body, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from ..core.database import get_db
+from ..core.database import get_db, get_async_db
 from ..core.error_handlers import handle_endpoint_errors
 from ..core.auth import require_user_auth, get_current_user_id, get_verified_domain
 from ..core.messages import ErrorMessages
 from ..models.domain import Domain
 from ..services.calendar_service import get_filters, create_filter, delete_filter, get_filter_by_id
+from ..services.export_service import invalidate_filter_export
+from .domain_utils import get_verified_domain_async
 
 router = APIRouter()
 
@@ -73,9 +76,9 @@ async def create_domain_filter(
 @router.get("/{domain}/filters")
 @handle_endpoint_errors
 async def get_domain_filters(
-    domain_obj: Domain = Depends(get_verified_domain),
+    domain_obj: Domain = Depends(get_verified_domain_async),
     user_id: Optional[int] = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List filters for domain calendar (authentication optional - returns user's filters if authenticated)."""
     # Only get filters if user is authenticated
@@ -83,7 +86,7 @@ async def get_domain_filters(
         return []
 
     # Get filters for authenticated user
-    filters = get_filters(db, domain_key=domain_obj.domain_key, user_id=user_id)
+    filters = await db.run_sync(get_filters, domain_key=domain_obj.domain_key, user_id=user_id)
 
     # Transform to OpenAPI schema format
     return [_format_filter_response(filter_obj) for filter_obj in filters]
@@ -122,6 +125,7 @@ async def update_domain_filter(
         existing_filter.updated_at = func.now()
         db.commit()
         db.refresh(existing_filter)
+        invalidate_filter_export(existing_filter.link_uuid)
 
         return _format_filter_response(existing_filter)
     except Exception as e:
@@ -18,6 +18,7 @@ from ..services.domain_service import (
     bulk_unassign_recurring_events, update_group, delete_group,
     remove_events_from_specific_group
 )
+from ..services.export_service import invalidate_domain_filter_exports
 
 router = APIRouter()
 
@@ -113,6 +114,7 @@ async def delete_domain_group(
             raise HTTPException(status_code=404, detail=error)
         else:
             raise HTTPException(status_code=400, detail=error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     # Return 204 No Content on successful deletion
     return None
@@ -139,6 +141,7 @@ async def assign_recurring_events(
     success, count, error = assign_recurring_events_to_group(db, domain_obj.domain_key, group_id, event_titles)
     if not success:
         raise HTTPException(status_code=400, detail=error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "message": f"{count} recurring events assigned to group"
@@ -169,6 +172,7 @@ async def remove_events_from_group(
             raise HTTPException(status_code=404, detail=error)
         else:
             raise HTTPException(status_code=400, detail=error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "message": f"{count} events removed from group",
@@ -226,6 +230,7 @@ async def bulk_assign_events_to_group(
     success, count, error = assign_recurring_events_to_group(db, domain_obj.domain_key, group_id, event_titles)
     if not success:
         raise HTTPException(status_code=400, detail=error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "message": f"{count} recurring events assigned to group",
@@ -254,6 +259,7 @@ async def bulk_unassign_events(
     success, count, error = bulk_unassign_recurring_events(db, domain_obj.domain_key, event_titles)
     if not success:
         raise HTTPException(status_code=400, detail=error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "message": f"{count} recurring events unassigned",
@@ -279,6 +285,7 @@ async def unassign_single_event(
     success, count, error = bulk_unassign_recurring_events(db, domain_obj.domain_key, [event_title])
     if not success:
         raise HTTPException(status_code=400, detail=error)
+    invalidate_domain_filter_exports(db, domain_obj.domain_key)
 
     return {
         "message": f"Event '{event_title}' unassigned",
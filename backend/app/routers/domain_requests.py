@@ -19,7 +19,7 @@ from ..models.domain import Domain
 from ..models.user import User
 from ..services.email_service import send_domain_request_notification
 from ..services.auth_service import hash_password
-from ..data.ical_parser import parse_ical_content
+from ..services.calendar_service import parse_ical_feed
 
 router = APIRouter()
 
@@ -163,7 +163,7 @@ async def create_domain_request(
                 )
 
             # Parse iCal content
-            parse_result = parse_ical_content(ical_content)
+            parse_result = await parse_ical_feed(ical_content)
 
             if not parse_result.is_success:
                 raise HTTPException(
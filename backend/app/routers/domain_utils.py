@@ -4,9 +4,12 @@ Shared utilities for domain routers.
 Provides common helper functions used across domain-related endpoints.
 """
 
-from fastapi import HTTPException
+from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..core.auth import load_verified_domain
+from ..core.database import get_async_db
 from ..models.domain import Domain
 
 
@@ -28,3 +31,17 @@ def verify_domain_exists(db: Session, domain_key: str) -> Domain:
     if not domain:
         raise HTTPException(status_code=404, detail=f"Domain '{domain_key}' not found")
     return domain
+
+
+async def get_verified_domain_async(domain: str, db: AsyncSession = Depends(get_async_db)) -> Domain:
+    """
+    FastAPI dependency: get_verified_domain on the async session.
+
+    For routers whose endpoint uses get_async_db: depending on get_async_db
+    directly lets FastAPI hand the lookup and the endpoint the same session,
+    and the lookup doesn't block the event loop.
+
+    Raises:
+        HTTPException 404: Domain not found
+    """
+    return await db.run_sync(load_verified_domain, domain)
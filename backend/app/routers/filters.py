@@ -6,9 +6,9 @@ Implements user filter endpoints from OpenAPI specification.
 
 from typing import Optional
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.database import get_db
+from ..core.database import get_async_db
 from ..core.auth import get_current_user_id
 from ..services.calendar_service import get_filters
 
@@ -18,7 +18,7 @@ router = APIRouter()
 @router.get("")
 async def get_user_filters(
     user_id: Optional[int] = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all filters for a user (both calendar and domain filters).
@@ -42,7 +42,7 @@ async def get_user_filters(
             return []
 
         # Get all filters for the authenticated user
-        filters = get_filters(db, user_id=user_id)
+        filters = await db.run_sync(get_filters, user_id=user_id)
 
         # Transform to OpenAPI schema format
         filters_response = []
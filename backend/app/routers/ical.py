@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 import httpx
 
-from ..data.ical_parser import parse_ical_content
+from ..services.calendar_service import parse_ical_feed
 
 router = APIRouter()
 
@@ -57,7 +57,7 @@ async def preview_ical(request: ICalPreviewRequest) -> ICalPreviewResponse:
             ical_content = response.text
 
         # Parse iCal content
-        parse_result = parse_ical_content(ical_content)
+        parse_result = await parse_ical_feed(ical_content)
 
         if not parse_result.is_success:
             return ICalPreviewResponse(
@@ -11,6 +11,7 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException
 
 from .deps import get_repo
+from ..db.dynamodb import VersionConflictError
 from ..db.models import Domain, DomainGroup, AssignmentRule, Event
 from ..core.config import settings
 
@@ -153,14 +154,14 @@ async def seed_domain_from_yaml(domain_key: str):
     repo = get_repo()
 
     # Check if domain already exists
-    existing = repo.get_domain(domain_key)
+    existing = repo.get_domain(domain_key, cached=False)
     if existing:
         return {
             "success": True,
             "message": f"Domain '{domain_key}' already exists",
             "domain_key": domain_key,
             "group_count": len(existing.groups),
-            "assignment_count": len(existing.recurring_assignments),
+            "assignment_count": len(repo.get_assignments(domain_key)),
             "already_existed": True
         }
 
@@ -219,10 +220,14 @@ async def seed_domain_from_yaml(domain_key: str):
         calendar_url=domain_config.get("calendar_url", ""),
         status="active",
         groups=groups,
-        recurring_assignments=recurring_assignments,
     )
 
-    repo.save_domain(domain)
+    try:
+        repo.save_domain(domain)
+    except VersionConflictError:
+        # Created concurrently since the existence check
+        raise HTTPException(status_code=409, detail=f"Domain '{domain_key}' already exists")
+    repo.assign_events(domain_key, recurring_assignments)
 
     # Fetch and save events from calendar
     event_count = 0
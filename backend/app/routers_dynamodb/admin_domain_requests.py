@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from typing import Optional
 
 from .deps import get_repo, require_admin_auth
+from ..db.dynamodb import VersionConflictError
 from ..db.models import Domain, DomainGroup
 from .admin_domain_configs import fetch_and_parse_ical
 
@@ -147,7 +148,7 @@ async def approve_domain_request(
     domain_key = (data.domain_key if data and data.domain_key else request.requested_domain_key).lower()
 
     # Check if domain already exists
-    existing = repo.get_domain(domain_key)
+    existing = repo.get_domain(domain_key, cached=False)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -163,10 +164,16 @@ async def approve_domain_request(
         admin_password_hash=request.default_password_hash,
         user_password_hash=request.user_password_hash,
         groups=[],  # Start with no custom groups (auto-groups will be created on first load)
-        recurring_assignments={}
     )
 
-    repo.save_domain(domain)
+    try:
+        repo.save_domain(domain)
+    except VersionConflictError:
+        # Created concurrently since the existence check
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Domain key '{domain_key}' already exists"
+        )
 
     # Fetch and import events
     event_count = 0
@@ -10,6 +10,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, Body
 
 from .deps import get_repo
+from ..db.dynamodb import VersionConflictError
 from ..db.models import Domain, Event
 
 router = APIRouter()
@@ -135,7 +136,7 @@ async def create_domain(data: dict = Body(...)):
     repo = get_repo()
 
     # Check if domain already exists
-    existing = repo.get_domain(domain_key)
+    existing = repo.get_domain(domain_key, cached=False)
     if existing:
         raise HTTPException(status_code=409, detail=f"Domain '{domain_key}' already exists")
 
@@ -151,7 +152,11 @@ async def create_domain(data: dict = Body(...)):
         calendar_url=calendar_url,
         status="active"
     )
-    repo.save_domain(domain)
+    try:
+        repo.save_domain(domain)
+    except VersionConflictError:
+        # Created concurrently since the existence check
+        raise HTTPException(status_code=409, detail=f"Domain '{domain_key}' already exists")
 
     # Save events
     event_objs = []
@@ -214,10 +219,7 @@ async def sync_domain_events(domain_key: str):
     # Fetch events
     events = await fetch_and_parse_ical(domain.calendar_url)
 
-    # Delete old events
-    deleted_count = repo.delete_all_events(domain_key)
-
-    # Save new events
+    # Build new events
     event_objs = []
     for e in events:
         event_objs.append(Event(
@@ -231,11 +233,11 @@ async def sync_domain_events(domain_key: str):
             location=e.get("location")
         ))
 
-    if event_objs:
-        repo.save_events(event_objs)
+    # Differential write: only changed events are put, vanished ones deleted
+    write_counts = repo.sync_events(domain_key, event_objs)
 
     return {
         "success": True,
-        "deleted_count": deleted_count,
+        "deleted_count": write_counts["deleted_count"],
         "synced_count": len(event_objs)
     }
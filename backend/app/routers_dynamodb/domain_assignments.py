@@ -26,11 +26,7 @@ async def assign_events_to_group(domain: str, group_id: int, data: dict = Body(.
         raise HTTPException(status_code=400, detail="event_titles is required")
 
     repo = get_repo()
-
-    assigned_count = 0
-    for title in event_titles:
-        if repo.assign_event_to_group(domain, title, group_id):
-            assigned_count += 1
+    assigned_count = repo.assign_events(domain, {title: group_id for title in event_titles})
 
     return {
         "success": True,
@@ -56,12 +52,9 @@ async def remove_events_from_group(domain: str, group_id: int, data: dict = Body
 
     repo = get_repo()
 
-    removed_count = 0
-    for title in event_titles:
-        # Only remove if assigned to this specific group
-        if domain_obj.recurring_assignments.get(title) == group_id:
-            if repo.unassign_event(domain, title):
-                removed_count += 1
+    # Only remove titles assigned to this specific group
+    group_titles = set(repo.get_group_assignment_titles(domain, group_id))
+    removed_count = repo.unassign_events(domain, [title for title in event_titles if title in group_titles])
 
     return {
         "success": True,
@@ -81,13 +74,11 @@ async def bulk_assign_events(domain: str, data: dict = Body(...)):
 
     repo = get_repo()
 
-    assigned_count = 0
-    for assignment in assignments:
-        title = assignment.get("title")
-        group_id = assignment.get("group_id")
-        if title and group_id:
-            if repo.assign_event_to_group(domain, title, group_id):
-                assigned_count += 1
+    assigned_count = repo.assign_events(domain, {
+        assignment["title"]: assignment["group_id"]
+        for assignment in assignments
+        if assignment.get("title") and assignment.get("group_id")
+    })
 
     return {
         "success": True,
@@ -105,11 +96,7 @@ async def bulk_unassign_events(domain: str, data: dict = Body(...)):
         raise HTTPException(status_code=400, detail="event_titles is required")
 
     repo = get_repo()
-
-    unassigned_count = 0
-    for title in event_titles:
-        if repo.unassign_event(domain, title):
-            unassigned_count += 1
+    unassigned_count = repo.unassign_events(domain, event_titles)
 
     return {
         "success": True,
@@ -72,17 +72,15 @@ async def verify_user_password(domain: str, data: dict = Body(...)):
 @router.patch("/{domain}/auth/set-admin-password")
 async def set_admin_password(domain: str, data: dict = Body(...)):
     """Set or update admin password for a domain."""
-    domain_obj = await get_verified_domain_ddb(domain)
+    await get_verified_domain_ddb(domain)
 
     password = data.get("password", "")
 
     if len(password) < 4:
         raise HTTPException(status_code=400, detail="Password must be at least 4 characters")
 
-    domain_obj.admin_password_hash = hash_password(password)
-
     repo = get_repo()
-    repo.save_domain(domain_obj)
+    repo.update_domain_fields(domain, {"admin_password_hash": hash_password(password)})
 
     return {"success": True, "message": "Admin password updated"}
 
@@ -90,19 +88,19 @@ async def set_admin_password(domain: str, data: dict = Body(...)):
 @router.patch("/{domain}/auth/set-user-password")
 async def set_user_password(domain: str, data: dict = Body(...)):
     """Set or update user password for a domain."""
-    domain_obj = await get_verified_domain_ddb(domain)
+    await get_verified_domain_ddb(domain)
 
     password = data.get("password")
 
     if password is None:
         # Clear password (make public)
-        domain_obj.user_password_hash = None
+        user_password_hash = None
     elif len(password) < 4:
         raise HTTPException(status_code=400, detail="Password must be at least 4 characters")
     else:
-        domain_obj.user_password_hash = hash_password(password)
+        user_password_hash = hash_password(password)
 
     repo = get_repo()
-    repo.save_domain(domain_obj)
+    repo.update_domain_fields(domain, {"user_password_hash": user_password_hash})
 
     return {"success": True, "message": "User password updated"}
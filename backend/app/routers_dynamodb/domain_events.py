@@ -6,27 +6,33 @@ Implements event listing and grouping endpoints.
 
 from datetime import datetime
 from collections import defaultdict
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
 
 from .deps import get_repo, get_verified_domain_ddb
+from .events_cache import get_or_build, GROUPED_EVENTS_COUNTERS, TITLE_COUNTS_COUNTERS
+from ..core.messages import ErrorMessages
+from ..core.responses import FastJSONResponse
+from ..data.grouping import (
+    build_domain_events_summary, select_domain_event_instances, paginate_events,
+    AUTO_RECURRING_GROUP_ID, AUTO_UNIQUE_GROUP_ID
+)
+from ..data.event_projection import parse_event_fields, project_domain_events_response
+from ..db.models import Domain, Event, EventRecord
+from ..db.repository import Repository
 
 router = APIRouter()
 
 
-@router.get("/{domain}/events")
-async def get_domain_events(domain: str):
+def build_domain_events(domain_obj: Domain, assignments: dict[str, int], events: list[Event | EventRecord]) -> dict:
     """
-    Get events for domain calendar grouped by title.
+    Build grouped events structure for a domain.
+
+    assignments is the domain's recurring event title -> group_id map.
 
     Returns events with their group assignments in the format expected by frontend:
     {groups: [{id, name, recurring_events: [{title, event_count, events}]}]}
     """
-    domain_obj = await get_verified_domain_ddb(domain)
-    repo = get_repo()
-
-    # Get all events for this domain
-    events = repo.get_events(domain)
-
     # Build groups lookup
     groups_by_id = {g.id: g for g in domain_obj.groups}
 
@@ -46,6 +52,7 @@ async def get_domain_events(domain: str):
         for event in title_events:
             event_instances.append({
                 "uid": event.uid,
+                "title": event.title,
                 "start_time": event.start_time.isoformat(),
                 "end_time": event.end_time.isoformat() if event.end_time else None,
                 "description": event.description,
@@ -64,7 +71,7 @@ async def get_domain_events(domain: str):
 
     for title, title_events in events_by_title.items():
         recurring_event = build_recurring_event(title, title_events)
-        group_id = domain_obj.recurring_assignments.get(title)
+        group_id = assignments.get(title)
 
         if group_id and group_id in groups_by_id:
             group_recurring_events[group_id].append(recurring_event)
@@ -97,14 +104,14 @@ async def get_domain_events(domain: str):
 
         if recurring_ungrouped:
             groups_with_events.append({
-                "id": -1,  # Auto-group ID
+                "id": AUTO_RECURRING_GROUP_ID,
                 "name": "📅 Other Recurring Events",
                 "recurring_events": recurring_ungrouped
             })
 
         if unique_ungrouped:
             groups_with_events.append({
-                "id": -2,  # Auto-group ID
+                "id": AUTO_UNIQUE_GROUP_ID,
                 "name": "🎯 Special Events",
                 "recurring_events": unique_ungrouped
             })
@@ -112,21 +119,106 @@ async def get_domain_events(domain: str):
     return {"groups": groups_with_events}
 
 
+def get_cached_domain_events(repo: Repository, domain_obj: Domain) -> dict:
+    """
+    Grouped events of a domain, cached per domain generation.
+
+    Only cache misses read the domain's event items (strongly consistent,
+    so the entry matches the generation it is stored under).
+    """
+    domain_key = domain_obj.domain_key
+    generation = repo.get_domain_generation(domain_key) or {}
+
+    def build() -> dict:
+        current = domain_obj
+        if generation and domain_obj.version != generation["version"]:
+            # Cached domain document predates the generation being cached
+            current = repo.get_domain(domain_key, cached=False) or domain_obj
+        events = repo.get_events(domain_key, lightweight=True, consistent=True)
+        return build_domain_events(current, repo.get_assignments(domain_key, consistent=True), events)
+
+    return get_or_build("grouped_events", domain_key, generation, GROUPED_EVENTS_COUNTERS, build)
+
+
+def get_cached_title_counts(repo: Repository, domain_key: str) -> dict[str, int]:
+    """Event count per title of a domain, cached per sync generation."""
+    generation = repo.get_domain_generation(domain_key) or {}
+
+    def build() -> dict[str, int]:
+        title_counts = defaultdict(int)
+        for title in repo.get_event_titles(domain_key, consistent=True):
+            title_counts[title] += 1
+        return dict(title_counts)
+
+    return get_or_build("title_counts", domain_key, generation, TITLE_COUNTS_COUNTERS, build)
+
+
+@router.get("/{domain}/events")
+async def get_domain_events(
+    domain: str,
+    summary: bool = Query(False, description="Return groups and titles with counts only"),
+    fields: Optional[str] = Query(None, description="Comma-separated event fields to include")
+):
+    """
+    Get events for domain calendar grouped by title.
+
+    With summary=true, event instances are replaced by counts and the next
+    occurrence; fetch them via /{domain}/events/instances.
+    """
+    fields_result = parse_event_fields(fields)
+    if not fields_result.is_success:
+        raise HTTPException(status_code=400, detail=fields_result.error)
+
+    domain_obj = await get_verified_domain_ddb(domain)
+    repo = get_repo()
+
+    response_data = get_cached_domain_events(repo, domain_obj)
+
+    if summary:
+        return build_domain_events_summary(response_data)
+
+    return FastJSONResponse(content=project_domain_events_response(response_data, fields_result.value))
+
+
+@router.get("/{domain}/events/instances")
+async def get_domain_event_instances(
+    domain: str,
+    title: Optional[str] = Query(None, description="Recurring event title"),
+    group_id: Optional[int] = Query(None, description="Group ID"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(50, ge=1, le=500, description="Number of events per page"),
+    fields: Optional[str] = Query(None, description="Comma-separated event fields to include")
+):
+    """Get event instances of one recurring title or group (paginated)."""
+    if title is None and group_id is None:
+        raise HTTPException(status_code=400, detail=ErrorMessages.EVENT_SELECTION_REQUIRED)
+
+    fields_result = parse_event_fields(fields)
+    if not fields_result.is_success:
+        raise HTTPException(status_code=400, detail=fields_result.error)
+
+    domain_obj = await get_verified_domain_ddb(domain)
+    repo = get_repo()
+
+    response_data = project_domain_events_response(get_cached_domain_events(repo, domain_obj), fields_result.value)
+
+    instances = select_domain_event_instances(response_data, title=title, group_id=group_id)
+    return FastJSONResponse(content=paginate_events(instances, page, limit))
+
+
 @router.get("/{domain}/recurring-events")
 async def get_recurring_events(domain: str):
     """Get available recurring event titles for assignment."""
-    domain_obj = await get_verified_domain_ddb(domain)
+    await get_verified_domain_ddb(domain)
     repo = get_repo()
 
-    events = repo.get_events(domain)
-
-    # Get unique titles
-    titles = set(e.title for e in events)
+    titles = get_cached_title_counts(repo, domain)
+    assignments = repo.get_assignments(domain)
 
     # Build response with assignment status
     recurring_events = []
     for title in sorted(titles):
-        group_id = domain_obj.recurring_assignments.get(title)
+        group_id = assignments.get(title)
         recurring_events.append({
             "title": title,
             "assigned_group_id": group_id
@@ -141,19 +233,15 @@ async def get_recurring_events_with_assignments(domain: str):
     domain_obj = await get_verified_domain_ddb(domain)
     repo = get_repo()
 
-    events = repo.get_events(domain)
-
-    # Count events per title
-    title_counts = defaultdict(int)
-    for event in events:
-        title_counts[event.title] += 1
+    title_counts = get_cached_title_counts(repo, domain)
 
     # Build response
     groups_by_id = {g.id: g.name for g in domain_obj.groups}
+    assignments = repo.get_assignments(domain)
     recurring_events = []
 
     for title in sorted(title_counts.keys()):
-        group_id = domain_obj.recurring_assignments.get(title)
+        group_id = assignments.get(title)
         group_name = groups_by_id.get(group_id) if group_id else None
 
         recurring_events.append({
@@ -100,7 +100,7 @@ async def create_domain_request(request_data: DomainRequestCreate):
     requested_key = request_data.requested_domain_key.strip().lower()
 
     # Check if domain already exists
-    existing_domain = repo.get_domain(requested_key)
+    existing_domain = repo.get_domain(requested_key, cached=False)
     if existing_domain:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -0,0 +1,83 @@
+"""
+Versioned cache for derived DynamoDB domain data.
+
+Responses built from every event item of a domain (grouped events, title
+counts) are cached under keys embedding the domain's change counters
+(see Repository.get_domain_generation), so entries are never invalidated:
+a sync, assignment or group change simply produces a new key.
+
+Two tiers: an in-process LRU per container, then Redis when configured.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from ..core.config import settings
+from ..core.redis import get_cache, set_cache
+from ..data.cache import generate_versioned_domain_cache_key
+
+# Cached data kind -> domain counters it depends on
+GROUPED_EVENTS_COUNTERS = ["version", "sync_generation", "assignment_version"]
+TITLE_COUNTS_COUNTERS = ["sync_generation"]
+
+_local_entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _get_local(key: str) -> Any:
+    with _local_lock:
+        entry = _local_entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            del _local_entries[key]
+            return None
+        _local_entries.move_to_end(key)
+        return value
+
+
+def _set_local(key: str, value: Any) -> None:
+    with _local_lock:
+        _local_entries[key] = (time.monotonic() + settings.versioned_cache_ttl_seconds, value)
+        _local_entries.move_to_end(key)
+        while len(_local_entries) > settings.versioned_cache_max_local_entries:
+            _local_entries.popitem(last=False)
+
+
+def clear_local_cache() -> None:
+    """Drop every in-process entry (tests, memory pressure)."""
+    with _local_lock:
+        _local_entries.clear()
+
+
+def get_or_build(kind: str, domain_key: str, generation: dict, counters: list[str],
+                 build: Callable[[], Any]) -> Any:
+    """
+    Return cached derived data for the given domain generation, building it on a miss.
+
+    Args:
+        kind: Cached data kind (part of the key)
+        domain_key: Domain identifier
+        generation: Domain change counters from Repository.get_domain_generation
+        counters: Counters the data depends on
+        build: Builds the (JSON-serializable) data on a miss
+
+    Returns:
+        Cached or freshly built data
+    """
+    key = generate_versioned_domain_cache_key(kind, domain_key, generation, counters)
+
+    value = _get_local(key)
+    if value is not None:
+        return value
+
+    value = get_cache(key)
+    if value is None:
+        value = build()
+        set_cache(key, value, settings.versioned_cache_ttl_seconds)
+
+    _set_local(key, value)
+    return value
@@ -85,12 +85,13 @@ async def export_filtered_ical(link_uuid: str, request: Request):
         raise HTTPException(status_code=404, detail="Domain not found")
 
     # Get all events
-    all_events = repo.get_events(filter_obj.domain_key)
+    all_events = repo.get_events(filter_obj.domain_key, lightweight=True)
 
     # Apply filter
     filtered_events = []
     subscribed_group_ids = set(filter_obj.subscribed_group_ids)
     unselected_titles = set(filter_obj.unselected_event_titles)
+    assignments = repo.get_assignments(filter_obj.domain_key) if subscribed_group_ids else {}
 
     for event in all_events:
         # Skip unselected events
@@ -103,7 +104,7 @@ async def export_filtered_ical(link_uuid: str, request: Request):
             continue
 
         # Check if event's title is assigned to a subscribed group
-        assigned_group_id = domain_obj.recurring_assignments.get(event.title)
+        assigned_group_id = assignments.get(event.title)
         if assigned_group_id in subscribed_group_ids:
             filtered_events.append(event)
 
@@ -99,10 +99,7 @@ async def sync_domain_calendar(domain_key: str) -> dict:
     if not parsed_events:
         return {"success": False, "error": "No events found in calendar"}
 
-    # Delete old events
-    deleted_count = repo.delete_all_events(domain_key)
-
-    # Save new events
+    # Build new events
     event_objs = []
     for e in parsed_events:
         event_objs.append(Event(
@@ -116,12 +113,15 @@ async def sync_domain_calendar(domain_key: str) -> dict:
             location=e.get("location")
         ))
 
-    repo.save_events(event_objs)
+    # Differential write: only changed events are put, vanished ones deleted
+    write_counts = repo.sync_events(domain_key, event_objs)
 
     return {
         "success": True,
         "domain_key": domain_key,
-        "deleted_count": deleted_count,
+        "deleted_count": write_counts["deleted_count"],
+        "put_count": write_counts["put_count"],
+        "unchanged_count": write_counts["unchanged_count"],
         "synced_count": len(event_objs)
     }
 
@@ -133,16 +133,13 @@ async def sync_all_domains() -> dict:
     Used by scheduled Lambda task.
     """
     repo = get_repository()
-    domains = repo.list_domains()
+    domains = repo.list_domains(status="active")
 
     results = []
     success_count = 0
     error_count = 0
 
     for domain in domains:
-        if domain.status != "active":
-            continue
-
         result = await sync_domain_calendar(domain.domain_key)
         results.append(result)
 
@@ -4,7 +4,7 @@ Cache service for domain events and data management.
 IMPERATIVE SHELL - Orchestrates pure functions with Redis I/O operations.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from ..core.redis import set_cache, get_cache, delete_cache, cache_exists
@@ -14,16 +14,21 @@ from ..data.cache import (
     prepare_domain_events_for_cache, create_cache_metadata,
     is_cache_stale, validate_cached_domain_events, get_cache_keys_for_domain
 )
+from ..data.event_projection import (
+    DEFAULT_EVENT_FIELDS, requires_full_events, project_domain_events_response
+)
 from .domain_service import build_domain_events_response_data
 
 
-def cache_domain_events(db: Session, domain_key: str) -> Tuple[bool, Optional[Dict[str, Any]], str]:
+def cache_domain_events(db: Session, domain_key: str,
+                        events: Optional[List[Dict[str, Any]]] = None) -> Tuple[bool, Optional[Dict[str, Any]], str]:
     """
     Build and cache domain events data.
     
     Args:
         db: Database session
         domain_key: Domain identifier
+        events: Domain events already in memory (default: read from database)
         
     Returns:
         Tuple of (success, cached_data, error_message)
@@ -32,10 +37,13 @@ def cache_domain_events(db: Session, domain_key: str) -> Tuple[bool, Optional[Di
     """
     try:
         # Build domain events response from database
-        domain_events_response = build_domain_events_response_data(db, domain_key)
+        domain_events_response = build_domain_events_response_data(db, domain_key, events)
+        
+        # Only the lean event shape is cached (raw_ical and datetimes stay out of Redis)
+        lean_response = project_domain_events_response(domain_events_response, DEFAULT_EVENT_FIELDS)
         
         # Prepare data for caching using pure function
-        cache_data = prepare_domain_events_for_cache(domain_events_response)
+        cache_data = prepare_domain_events_for_cache(lean_response)
         
         # Try to cache the domain events data (graceful degradation if Redis unavailable)
         events_cache_key = generate_domain_events_cache_key(domain_key)
@@ -189,13 +197,51 @@ def get_or_build_domain_events(db: Session, domain_key: str, force_refresh: bool
         return False, None, f"Get or build domain events error: {str(e)}"
 
 
-def warm_domain_cache(db: Session, domain_key: str) -> bool:
+def get_domain_events_with_fields(db: Session, domain_key: str, fields: Tuple[str, ...],
+                                  force_refresh: bool = False) -> Tuple[bool, Optional[Dict[str, Any]], str]:
+    """
+    Get domain events with event instances projected onto the selected fields.
+    
+    Selections within the lean default set are served from cache. Selections
+    needing heavy fields (raw_ical, datetimes) are built from the database.
+    
+    Args:
+        db: Database session
+        domain_key: Domain identifier
+        fields: Selected event fields (see app.data.event_projection)
+        force_refresh: Force rebuild cache even if valid
+        
+    Returns:
+        Tuple of (success, domain_events_data, error_message)
+        
+    I/O Operation - Cache-first retrieval with projection.
+    """
+    try:
+        if requires_full_events(fields):
+            domain_events_response = build_domain_events_response_data(db, domain_key)
+            return True, project_domain_events_response(domain_events_response, fields), ""
+        
+        success, domain_events_response, error = get_or_build_domain_events(db, domain_key, force_refresh)
+        if not success:
+            return False, None, error
+        
+        if fields == DEFAULT_EVENT_FIELDS:
+            return True, domain_events_response, ""
+        
+        return True, project_domain_events_response(domain_events_response, fields), ""
+        
+    except Exception as e:
+        return False, None, f"Get domain events with fields error: {str(e)}"
+
+
+def warm_domain_cache(db: Session, domain_key: str, events: Optional[List[Dict[str, Any]]] = None) -> bool:
     """
     Pre-warm cache for a domain (background task).
     
     Args:
         db: Database session
         domain_key: Domain identifier
+        events: Domain events already in memory (default: read from database)
         
     Returns:
         Success status
@@ -203,7 +249,7 @@ def warm_domain_cache(db: Session, domain_key: str) -> bool:
     I/O Operation - Cache warming for performance.
     """
     try:
-        success, _, error = cache_domain_events(db, domain_key)
+        success, _, error = cache_domain_events(db, domain_key, events)
         if not success:
             print(f"Cache warming failed for domain {domain_key}: {error}")
         return success
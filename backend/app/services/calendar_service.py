@@ -4,8 +4,10 @@ Calendar service for database operations and iCal synchronization.
 IMPERATIVE SHELL - Orchestrates pure functions with I/O operations.
 """
 
+import asyncio
 import httpx
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from sqlalchemy.orm import Session
@@ -19,16 +21,27 @@ from ..data.calendar import (
     create_event_data, create_filter_data, validate_calendar_data,
     validate_filter_data, apply_filter_to_events as apply_filter_pure
 )
-from ..data.ical_parser import parse_ical_content
-
-
-async def fetch_ical_content(url: str, timeout: int = 30) -> Tuple[bool, str, str]:
+from ..data.ical_parser import parse_ical_content, split_ical_chunks, merge_parsed_chunks
+from ..core.config import settings
+from ..core.executors import parse_executor, blocking_db_executor
+from ..core.database import bulk_insert, bulk_insert_returning_ids
+from ..core.sync_lock import run_exclusive
+from ..data.sync_schedule import feed_content_hash, needs_rewrite
+from .sync_schedule_service import get_feed_schedule, record_feed_fetch
+from .feed_health_service import guarded_fetch
+from ..core.result import Result
+from ..data.filter_index import evaluate_filters
+
+
+async def fetch_ical_content(url: str, timeout: int = 30,
+                             response_headers: Optional[Dict[str, str]] = None) -> Tuple[bool, str, str]:
     """
     Fetch iCal content from URL.
     
     Args:
         url: iCal URL to fetch
         timeout: Request timeout in seconds
+        response_headers: If given, filled with the response headers (lower-case names)
         
     Returns:
         Tuple of (success, content, error_message)
@@ -39,12 +52,16 @@ async def fetch_ical_content(url: str, timeout: int = 30) -> Tuple[bool, str, st
         async with httpx.AsyncClient(timeout=timeout) as client:
             response = await client.get(url)
             response.raise_for_status()
+            if response_headers is not None:
+                response_headers.update((name.lower(), value) for name, value in response.headers.items())
             return True, response.text, ""
     
     except httpx.TimeoutException:
         return False, "", f"Timeout fetching calendar from {url}"
     except httpx.HTTPStatusError as e:
         return False, "", f"HTTP {e.response.status_code} error fetching calendar"
+    except httpx.NetworkError as e:
+        return False, "", f"Connection error fetching calendar from {url}: {str(e)}"
     except Exception as e:
         return False, "", f"Error fetching calendar: {str(e)}"
 
@@ -203,27 +220,93 @@ def delete_calendar(db: Session, calendar_id: int,
         return False, f"Database error: {str(e)}"
 
 
-async def sync_calendar_events(db: Session, calendar: Calendar) -> Tuple[bool, int, str]:
+async def parse_ical_feed(ical_content: str) -> Result[List[Dict[str, Any]]]:
+    """
+    Parse iCal content in the parse executor.
+
+    Feeds above settings.parallel_parse_min_bytes are split into VEVENT
+    chunks parsed concurrently across the worker processes (one chunk per
+    worker) and merged in order; the result equals parse_ical_content.
+
+    Args:
+        ical_content: Raw iCal content
+
+    Returns:
+        Result containing events list or error message
+
+    I/O Operation - Runs parsing in worker processes/threads.
+    """
+    if parse_executor.kind != "process" or parse_executor.max_workers < 2 \
+            or len(ical_content) < settings.parallel_parse_min_bytes:
+        return await parse_executor.run(parse_ical_content, ical_content)
+
+    chunks, first_blocks = split_ical_chunks(ical_content, parse_executor.max_workers)
+    results = await asyncio.gather(*(parse_executor.run(parse_ical_content, chunk) for chunk in chunks))
+    return merge_parsed_chunks(list(results), first_blocks)
+
+
+async def sync_calendar_events(db: Session, calendar: Calendar,
+                               written_events: Optional[List[Dict[str, Any]]] = None,
+                               user_triggered: bool = False) -> Tuple[bool, int, str]:
     """
     Synchronize calendar events from iCal source.
+
+    Only one sync per calendar runs at a time across workers; a request
+    arriving meanwhile gets the result of the sync in flight.
     
     Args:
         db: Database session
         calendar: Calendar object to sync
+        written_events: If given, filled with the stored event rows (including
+            "id") when this call rewrote the events; left empty otherwise
+        user_triggered: Sync requested by a user; fetched even while the
+            feed's host is backed off
         
     Returns:
         Tuple of (success, event_count, error_message)
         
+    I/O Operation - Orchestrates HTTP fetch and database updates.
+    """
+    calendar_id = calendar.id
+
+    def stored_result() -> Tuple[bool, int, str]:
+        return True, db.query(Event).filter(Event.calendar_id == calendar_id).count(), ""
+
+    return await run_exclusive(
+        f"calendar:{calendar_id}", lambda: _sync_calendar_events(db, calendar, written_events, user_triggered),
+        stored_result
+    )
+
+
+async def _sync_calendar_events(db: Session, calendar: Calendar,
+                                written_events: Optional[List[Dict[str, Any]]] = None,
+                                user_triggered: bool = False) -> Tuple[bool, int, str]:
+    """
+    Fetch, parse and store a calendar's events (caller holds the sync lease).
+
     I/O Operation - Orchestrates HTTP fetch and database updates.
     """
     try:
-        # Fetch iCal content
-        success, ical_content, error = await fetch_ical_content(calendar.source_url)
+        # Fetch iCal content (skipped while the feed, or unless user-triggered its host, is backed off)
+        response_headers = {}
+        success, ical_content, error = await guarded_fetch(calendar, lambda: fetch_ical_content(
+            calendar.source_url, timeout=settings.feed_fetch_timeout_seconds, response_headers=response_headers
+        ), bypass_host=user_triggered)
         if not success:
+            # Store the feed's backoff state recorded on the calendar row
+            await blocking_db_executor.run(db.commit)
             return False, 0, error
+
+        # Unchanged feed: skip parsing and rewriting, only reschedule
+        content_hash = feed_content_hash(ical_content)
+        max_write_age = settings.feed_sync_max_interval_minutes * 60
+        if not needs_rewrite(get_feed_schedule(calendar), content_hash, time.time(), max_write_age):
+            record_feed_fetch(calendar, content_hash, response_headers, written=False)
+            await blocking_db_executor.run(_mark_calendar_fetched, db, calendar)
+            return True, db.query(Event).filter(Event.calendar_id == calendar.id).count(), ""
         
-        # Parse iCal content using pure function
-        parse_result = parse_ical_content(ical_content)
+        # Parse iCal content using pure function (off the event loop)
+        parse_result = await parse_ical_feed(ical_content)
         if not parse_result.is_success:
             return False, 0, parse_result.error
         events_data = parse_result.value
@@ -249,25 +332,17 @@ async def sync_calendar_events(db: Session, calendar: Calendar) -> Tuple[bool, i
                 # If no start time, keep the event
                 filtered_events.append(event_data)
         
-        # Clear existing events for this calendar
-        db.query(Event).filter(Event.calendar_id == calendar.id).delete()
-        
-        # Create new events (only recent/future ones)
-        event_count = 0
-        for event_data in filtered_events:
-            # Transform to database format using pure function
-            db_event_data = create_event_data(calendar.id, event_data)
-            event = Event(**db_event_data)
-            db.add(event)
-            event_count += 1
-        
-        # Update calendar last_fetched using pure function
-        updated_calendar_data = mark_calendar_fetched(calendar.__dict__)
-        for key, value in updated_calendar_data.items():
-            if hasattr(calendar, key):
-                setattr(calendar, key, value)
-        
-        db.commit()
+        # Stored with the events by the commit below
+        record_feed_fetch(calendar, content_hash, response_headers, written=True)
+
+        # Blocking ORM writes run in a worker thread; the session is only used there meanwhile
+        event_count = await blocking_db_executor.run(
+            _replace_calendar_events, db, calendar, filtered_events, written_events
+        )
+
+        # Exports cached before this sync would keep serving the old events
+        from .export_service import invalidate_calendar_filter_exports  # export_service imports this module
+        invalidate_calendar_filter_exports(db, calendar.id)
         return True, event_count, ""
         
     except Exception as e:
@@ -275,6 +350,50 @@ async def sync_calendar_events(db: Session, calendar: Calendar) -> Tuple[bool, i
         return False, 0, f"Sync error: {str(e)}"
 
 
+def _replace_calendar_events(db: Session, calendar: Calendar, events_data: List[Dict[str, Any]],
+                             written_events: Optional[List[Dict[str, Any]]] = None) -> int:
+    """
+    Replace a calendar's events and mark it fetched.
+
+    Args:
+        written_events: If given, filled with the inserted rows and their new ids
+
+    Returns:
+        Number of events written
+
+    I/O Operation - Blocking database writes (run via blocking_db_executor).
+    """
+    # Clear existing events for this calendar
+    db.query(Event).filter(Event.calendar_id == calendar.id).delete()
+
+    # Create new events (only recent/future ones) as batched multi-row INSERTs
+    rows = [create_event_data(calendar.id, event_data) for event_data in events_data]
+    if written_events is None:
+        event_count = bulk_insert(db, Event, rows)
+    else:
+        # Keep the rows for in-memory processing after sync (see domain_sync_service)
+        ids = bulk_insert_returning_ids(db, Event, rows)
+        written_events.extend({**row, "id": event_id} for row, event_id in zip(rows, ids))
+        event_count = len(ids)
+
+    _mark_calendar_fetched(db, calendar)
+    return event_count
+
+
+def _mark_calendar_fetched(db: Session, calendar: Calendar) -> None:
+    """
+    Update calendar last_fetched and commit.
+
+    I/O Operation - Blocking database write (run via blocking_db_executor).
+    """
+    updated_calendar_data = mark_calendar_fetched(calendar.__dict__)
+    for key, value in updated_calendar_data.items():
+        if hasattr(calendar, key):
+            setattr(calendar, key, value)
+
+    db.commit()
+
+
 def get_calendar_events(db: Session, calendar_id: int) -> List[Event]:
     """
     Get events for calendar.
@@ -517,4 +636,57 @@ def apply_filter_to_events(db: Session, events: List[Dict[str, Any]],
         return apply_filter_pure(events, filter_data, group_event_titles=group_titles)
 
     # Personal filters: No I/O needed, call pure function directly
-    return apply_filter_pure(events, filter_data)
\ No newline at end of file
+    return apply_filter_pure(events, filter_data)
+
+
+def apply_filters_to_events_batch(db: Session, events: List[Dict[str, Any]],
+                                  filters: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Apply many filters over the same event set (Service layer wrapper).
+
+    IMPERATIVE SHELL - Resolves group assignments once, then calls pure function.
+
+    All domain filters in the batch share one title index, so each filter
+    costs a few bit operations instead of a full event scan.
+
+    Args:
+        db: Database session
+        events: List of all events (one domain or calendar)
+        filters: Filter configuration dicts (must have 'id')
+
+    Returns:
+        Mapping filter id -> filtered events
+
+    I/O Operation - Single query for group assignments of all domains in the batch.
+    """
+    domain_keys = {f.get("domain_key") for f in filters if f.get("domain_key") is not None}
+    group_titles = get_group_titles_for_domains(db, domain_keys)
+
+    return evaluate_filters(events, filters, group_titles)
+
+
+def get_group_titles_for_domains(db: Session, domain_keys) -> Dict[int, set]:
+    """
+    Get event titles assigned to each group of the given domains.
+
+    Args:
+        db: Database session
+        domain_keys: Domain identifiers
+
+    Returns:
+        Mapping group_id -> set of recurring event titles
+
+    I/O Operation - Single query for all group assignments.
+    """
+    group_titles = {}
+    if not domain_keys:
+        return group_titles
+
+    assignments = db.query(RecurringEventGroup).filter(
+        RecurringEventGroup.domain_key.in_(list(domain_keys))
+    ).all()
+
+    for assignment in assignments:
+        group_titles.setdefault(assignment.group_id, set()).add(assignment.recurring_event_title)
+
+    return group_titles
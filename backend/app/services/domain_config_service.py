@@ -17,6 +17,7 @@ from sqlalchemy.sql import func
 
 from ..models.calendar import Calendar, Group, RecurringEventGroup, AssignmentRule
 from ..core.config import settings
+from ..core.database import bulk_insert
 from ..data.grouping import (
     validate_group_data, validate_assignment_rule_data,
     create_group_data, create_recurring_event_group_data, create_assignment_rule_data
@@ -325,8 +326,9 @@ def import_domain_configuration(db: Session, domain_key: str, config: Dict[str,
 
             id_mapping[semantic_id] = new_group.id
         
-        # Create assignments using semantic IDs
+        # Create assignments using semantic IDs (batched multi-row INSERTs)
         assignments_config = config['assignments']
+        assignment_rows = []
         for semantic_group_id, event_titles in assignments_config.items():
             if semantic_group_id not in id_mapping:
                 return False, f"Unknown group ID in assignments: {semantic_group_id} (available: {list(id_mapping.keys())})"
@@ -334,11 +336,10 @@ def import_domain_configuration(db: Session, domain_key: str, config: Dict[str,
             db_group_id = id_mapping[semantic_group_id]
             
             for event_title in event_titles:
-                assignment_data = create_recurring_event_group_data(
+                assignment_rows.append(create_recurring_event_group_data(
                     domain_key, event_title, db_group_id
-                )
-                assignment = RecurringEventGroup(**assignment_data)
-                db.add(assignment)
+                ))
+        bulk_insert(db, RecurringEventGroup, assignment_rows)
         
         # Create assignment rules using semantic IDs
         rules_config = config['rules']
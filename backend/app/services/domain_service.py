@@ -17,9 +17,14 @@ from ..data.grouping import (
     build_domain_events_with_auto_groups, validate_group_data, validate_assignment_rule_data
 )
 from ..data.ical_parser import group_events_by_title
+from ..data.calendar import create_domain_event_data
 from .calendar_service import get_calendar_by_domain, sync_calendar_events
 
 
+# Event columns used by create_domain_event_data
+_DOMAIN_EVENT_FIELDS = ("id", "title", "start_time", "end_time", "description", "location", "uid", "other_ical_fields")
+
+
 def load_domains_config(config_path: Path) -> Tuple[bool, Dict[str, Any], str]:
     """
     Load domain configuration from file.
@@ -49,13 +54,17 @@ def load_domains_config(config_path: Path) -> Tuple[bool, Dict[str, Any], str]:
         return False, {}, f"Error reading domain configuration: {str(e)}"
 
 
-async def ensure_domain_calendar_exists(db: Session, domain_key: str) -> Tuple[bool, Optional[Calendar], str]:
+async def ensure_domain_calendar_exists(db: Session, domain_key: str,
+                                        written_events: Optional[List[Dict[str, Any]]] = None
+                                        ) -> Tuple[bool, Optional[Calendar], str]:
     """
     Ensure domain calendar exists and is up to date.
 
     Args:
         db: Database session
         domain_key: Domain identifier
+        written_events: If given, filled with the event rows the sync stored
+            (see sync_calendar_events)
 
     Returns:
         Tuple of (success, calendar_obj, error_message)
@@ -91,7 +100,7 @@ async def ensure_domain_calendar_exists(db: Session, domain_key: str) -> Tuple[b
             db.commit()
 
         # Sync calendar events
-        sync_success, event_count, sync_error = await sync_calendar_events(db, calendar)
+        sync_success, event_count, sync_error = await sync_calendar_events(db, calendar, written_events)
         if not sync_success:
             return False, calendar, sync_error
 
@@ -121,41 +130,10 @@ def get_domain_events(db: Session, domain_key: str) -> List[Dict[str, Any]]:
     events = db.query(Event).filter(Event.calendar_id == calendar.id).all()
     
     # Transform to dictionaries for pure function processing
-    event_dicts = []
-    for event in events:
-        # Extract raw_ical for category matching
-        raw_ical = ""
-        if event.other_ical_fields and isinstance(event.other_ical_fields, dict):
-            # Prefer original raw_ical if available (contains full iCal data)
-            raw_ical = event.other_ical_fields.get('raw_ical', '')
-
-            # If no raw_ical but we have parsed categories, reconstruct minimal format
-            if not raw_ical:
-                categories = event.other_ical_fields.get('categories', [])
-                if categories:
-                    raw_ical = "\n".join([f"CATEGORIES:{cat}" for cat in categories])
-
-        event_dict = {
-            "id": f"evt_{event.id}",
-            "calendar_id": f"domain_{domain_key}",
-            "title": event.title,
-            "start_time": event.start_time,  # Fixed: use start_time for export compatibility
-            "end_time": event.end_time,      # Fixed: use end_time for export compatibility
-            "description": event.description or "",
-            "location": event.location,
-            "uid": event.uid,
-            "raw_ical": raw_ical,  # For category matching in rules (reconstructed with CATEGORIES)
-            "other_ical_fields": {           # Fixed: nest raw_ical for export compatibility
-                "raw_ical": event.other_ical_fields.get("raw_ical", "") if event.other_ical_fields else ""
-            },
-            # Keep legacy format for domain UI compatibility
-            "start": event.start_time.isoformat() if event.start_time else None,
-            "end": event.end_time.isoformat() if event.end_time else None,
-            "is_recurring": False  # Will be determined by grouping
-        }
-        event_dicts.append(event_dict)
-
-    return event_dicts
+    return [
+        create_domain_event_data({field: getattr(event, field) for field in _DOMAIN_EVENT_FIELDS}, domain_key)
+        for event in events
+    ]
 
 
 def get_domain_groups(db: Session, domain_key: str) -> List[Group]:
@@ -351,13 +329,15 @@ def get_recurring_event_assignments(db: Session, domain_key: str) -> List[Recurr
     ).all()
 
 
-def build_domain_events_response_data(db: Session, domain_key: str) -> Dict[str, Any]:
+def build_domain_events_response_data(db: Session, domain_key: str,
+                                      events: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """
     Build complete domain events response with auto-grouping.
     
     Args:
         db: Database session
         domain_key: Domain identifier
+        events: Domain events already in memory (default: read from database)
         
     Returns:
         Domain events response with all events in groups (no ungrouped_events)
@@ -365,7 +345,8 @@ def build_domain_events_response_data(db: Session, domain_key: str) -> Dict[str,
     I/O Operation - Orchestrates database queries with pure functions.
     """
     # Get events and transform for processing
-    events = get_domain_events(db, domain_key)
+    if events is None:
+        events = get_domain_events(db, domain_key)
     
     # Group events by title using pure function
     events_by_title = group_events_by_title(events)
@@ -435,13 +416,15 @@ def build_domain_events_response_data_legacy(db: Session, domain_key: str) -> Di
     return build_domain_events_response(events_by_title, groups_data, assignments_data)
 
 
-async def auto_assign_events_with_rules(db: Session, domain_key: str) -> Tuple[bool, int, str]:
+async def auto_assign_events_with_rules(db: Session, domain_key: str,
+                                        events: Optional[List[Dict[str, Any]]] = None) -> Tuple[bool, int, str]:
     """
     Auto-assign events to groups using assignment rules.
 
     Args:
         db: Database session
         domain_key: Domain identifier
+        events: Domain events already in memory (default: read from database)
 
     Returns:
         Tuple of (success, assignment_count, error_message)
@@ -449,13 +432,15 @@ async def auto_assign_events_with_rules(db: Session, domain_key: str) -> Tuple[b
     I/O Operation - Orchestrates rule application with database updates.
     """
     try:
-        # Get events and rules
-        events = get_domain_events(db, domain_key)
+        # Get rules, then events (not needed without rules)
         rules = get_assignment_rules(db, domain_key)
 
         if not rules:
             return True, 0, "No assignment rules defined"
 
+        if events is None:
+            events = get_domain_events(db, domain_key)
+
         # Transform rules to dictionaries for pure function
         # Only include parent rules (child rules are nested within)
         parent_rules = [r for r in rules if r.parent_rule_id is None]
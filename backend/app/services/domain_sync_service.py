@@ -0,0 +1,89 @@
+"""
+Fused sync pipeline of one domain: sync, rules, cache warm-up, exports.
+
+The events the sync just parsed and stored are carried in memory through
+rule application, response building and export precompute. The event
+table is only written; it is read once only when this worker did not
+write the events itself (attached to another worker's sync, or retrying
+processing of an unchanged feed). Rules, groups and assignments are
+still read per step.
+
+IMPERATIVE SHELL - Orchestrates pure functions with I/O operations.
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy.orm import Session
+
+from ..data.calendar import create_domain_event_data
+from .cache_service import warm_domain_cache
+from .domain_service import ensure_domain_calendar_exists, auto_assign_events_with_rules, get_domain_events
+from .export_service import precompute_domain_filter_exports
+from .sync_schedule_service import get_feed_processing_state, mark_feed_processed
+
+
+async def sync_domain(db: Session, domain_key: str) -> Dict[str, Any]:
+    """
+    Sync one domain calendar, apply rules, warm cache and precompute exports.
+
+    Args:
+        db: Database session
+        domain_key: Domain identifier
+
+    Returns:
+        Dictionary with "synced", "cached" flags and "errors" list
+
+    I/O Operation - Orchestrates calendar sync, database writes and Redis writes.
+    """
+    result = {"synced": False, "cached": False, "errors": []}
+
+    # Ensure domain calendar exists and is synced
+    written_events: List[Dict[str, Any]] = []
+    success, calendar, sync_error = await ensure_domain_calendar_exists(db, domain_key, written_events)
+
+    if not success:
+        print(f"❌ Failed to sync domain {domain_key}: {sync_error}")
+        result["errors"].append(f"{domain_key}: {sync_error}")
+        return result
+
+    print(f"✅ Synced domain calendar: {domain_key}")
+    result["synced"] = True
+
+    # Unchanged feed: rules, cache and exports still match the stored events
+    needs_processing, content_hash = get_feed_processing_state(calendar)
+    if not needs_processing:
+        print(f"💤 Feed unchanged, skipping rules/cache/exports: {domain_key}")
+        return result
+
+    # One event set for every step below
+    if written_events:
+        events = [create_domain_event_data(row, domain_key) for row in written_events]
+    else:
+        events = get_domain_events(db, domain_key)
+
+    # Apply assignment rules to newly synced events
+    rule_success, assignment_count, rule_error = await auto_assign_events_with_rules(db, domain_key, events)
+    if rule_success and assignment_count > 0:
+        print(f"📋 Applied {assignment_count} assignment rules for domain: {domain_key}")
+    elif not rule_success:
+        print(f"⚠️ Rule application failed for domain {domain_key}: {rule_error}")
+        result["errors"].append(f"{domain_key}: {rule_error}")
+
+    # Warm cache for this domain
+    cache_success = warm_domain_cache(db, domain_key, events)
+    if cache_success:
+        print(f"🔥 Warmed cache for domain: {domain_key}")
+        result["cached"] = True
+    else:
+        print(f"⚠️ Cache warming failed for domain: {domain_key}")
+
+    # Precompute filter exports so subscriber polls after sync hit the cache
+    export_success, export_count, export_error = precompute_domain_filter_exports(db, domain_key, events=events)
+    if export_success and export_count > 0:
+        print(f"📤 Precomputed {export_count} filter exports for domain: {domain_key}")
+    elif not export_success:
+        print(f"⚠️ Export precompute failed for domain {domain_key}: {export_error}")
+
+    if not result["errors"]:
+        mark_feed_processed(db, calendar, content_hash)
+    return result
@@ -0,0 +1,213 @@
+"""
+Export service for precomputed filter exports.
+
+IMPERATIVE SHELL - Orchestrates pure functions with database and Redis I/O.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from ..core.redis import set_cache, get_cache, delete_cache
+from ..core.config import settings
+from ..models.calendar import Filter
+from ..models.domain import Domain
+from ..data.cache import (
+    generate_filter_export_cache_key, create_filter_export_cache_entry,
+    validate_cached_filter_export
+)
+from ..data.calendar import (
+    render_vevent_fragments, assemble_export_from_fragments, generate_export_etag
+)
+from ..data.filter_index import build_title_index, build_group_bitsets, compute_filter_positions
+from .calendar_service import get_group_titles_for_domains
+from .domain_service import get_domain_events
+
+
+def get_cached_filter_export(link_uuid: str) -> Tuple[bool, Optional[Dict[str, Any]], str]:
+    """
+    Get a precomputed filter export.
+
+    Args:
+        link_uuid: Filter export UUID
+
+    Returns:
+        Tuple of (success, export_entry, error_message)
+
+    I/O Operation - Redis read with validation.
+    """
+    try:
+        cached_data = get_cache(generate_filter_export_cache_key(link_uuid))
+
+        if not cached_data:
+            return False, None, "No cached export found"
+
+        if not validate_cached_filter_export(cached_data):
+            return False, None, "Invalid cached export structure"
+
+        return True, cached_data, ""
+
+    except Exception as e:
+        return False, None, f"Get cached filter export error: {str(e)}"
+
+
+def cache_filter_export(link_uuid: str, ical_content: str, etag: str, last_modified: datetime) -> bool:
+    """
+    Store a rendered filter export.
+
+    Args:
+        link_uuid: Filter export UUID
+        ical_content: Rendered iCal body
+        etag: ETag header value
+        last_modified: Last-Modified timestamp
+
+    Returns:
+        Success status (False when Redis is unavailable)
+
+    I/O Operation - Redis write.
+    """
+    entry = create_filter_export_cache_entry(ical_content, etag, last_modified)
+    return set_cache(generate_filter_export_cache_key(link_uuid), entry, settings.export_cache_ttl_seconds)
+
+
+def invalidate_filter_export(link_uuid: str) -> bool:
+    """
+    Drop a precomputed filter export (after filter changes).
+
+    Args:
+        link_uuid: Filter export UUID
+
+    Returns:
+        Success status
+
+    I/O Operation - Redis delete.
+    """
+    return delete_cache(generate_filter_export_cache_key(link_uuid))
+
+
+def _invalidate_filter_exports(db: Session, condition) -> int:
+    try:
+        link_uuids = [link_uuid for (link_uuid,) in db.query(Filter.link_uuid).filter(condition).all()]
+        return sum(1 for link_uuid in link_uuids if invalidate_filter_export(link_uuid))
+    except Exception as e:
+        # Exports then expire after export_cache_ttl_seconds; never fail the write that triggered this
+        print(f"Invalidate filter exports error: {e}")
+        return 0
+
+
+def invalidate_domain_filter_exports(db: Session, domain_key: str) -> int:
+    """
+    Drop the precomputed exports of every filter of a domain.
+
+    Called after writes that change which events filters select or
+    contain (group, assignment and rule edits, event syncs).
+
+    Args:
+        db: Database session
+        domain_key: Domain identifier
+
+    Returns:
+        Number of exports dropped
+
+    I/O Operation - Database read + Redis deletes.
+    """
+    return _invalidate_filter_exports(db, Filter.domain_key == domain_key)
+
+
+def invalidate_calendar_filter_exports(db: Session, calendar_id: int) -> int:
+    """
+    Drop the precomputed exports of every filter on a calendar's events.
+
+    Covers the calendar's own filters and, for a domain calendar, the
+    domain's filters.
+
+    Args:
+        db: Database session
+        calendar_id: Calendar ID
+
+    Returns:
+        Number of exports dropped
+
+    I/O Operation - Database read + Redis deletes.
+    """
+    domain_keys = select(Domain.domain_key).where(Domain.calendar_id == calendar_id)
+    return _invalidate_filter_exports(
+        db, or_(Filter.calendar_id == calendar_id, Filter.domain_key.in_(domain_keys))
+    )
+
+
+def precompute_domain_filter_exports(db: Session, domain_key: str,
+                                     max_workers: Optional[int] = None,
+                                     budget_seconds: Optional[float] = None,
+                                     events: Optional[List[Dict[str, Any]]] = None) -> Tuple[bool, int, str]:
+    """
+    Render and cache the export of every filter of a domain in one batch.
+
+    Events and group assignments are loaded once, all filters are evaluated
+    against a shared title index, and each event's VEVENT fragment is
+    rendered once and reused by every export containing it. Filters not
+    reached within the time budget are rendered on demand by the export
+    endpoint instead.
+
+    Args:
+        db: Database session
+        domain_key: Domain identifier
+        max_workers: Concurrent render/cache writes (default from settings)
+        budget_seconds: Time budget for this domain (default from settings)
+        events: Domain events already in memory (default: read from database)
+
+    Returns:
+        Tuple of (success, precomputed_count, error_message)
+
+    I/O Operation - Database reads + Redis writes.
+    """
+    max_workers = max_workers or settings.export_precompute_max_workers
+    budget_seconds = budget_seconds if budget_seconds is not None else settings.export_precompute_budget_seconds
+    deadline = time.monotonic() + budget_seconds
+
+    try:
+        filters = db.query(Filter).filter(Filter.domain_key == domain_key).all()
+        if not filters:
+            return True, 0, ""
+
+        if events is None:
+            events = get_domain_events(db, domain_key)
+        group_titles = get_group_titles_for_domains(db, {domain_key})
+
+        # Evaluate every filter against one shared index
+        index = build_title_index(events)
+        group_bitsets = build_group_bitsets(index, group_titles)
+        filter_positions = [
+            (filter_obj, compute_filter_positions(events, index, filter_obj.__dict__, group_bitsets))
+            for filter_obj in filters
+        ]
+
+        # Render each needed event once; fixed DTSTAMP keeps ETags stable until the next sync
+        needed_positions = sorted(set().union(*(positions for _, positions in filter_positions)))
+        dtstamp = datetime.now(timezone.utc)
+        fragments = dict(zip(
+            needed_positions,
+            render_vevent_fragments([events[position] for position in needed_positions], dtstamp)
+        ))
+
+        def render_and_cache(filter_obj: Filter, positions) -> bool:
+            if time.monotonic() > deadline:
+                return False
+            ical_content = assemble_export_from_fragments(
+                [fragments[position] for position in positions], filter_obj.name
+            )
+            return cache_filter_export(
+                filter_obj.link_uuid, ical_content, generate_export_etag(ical_content),
+                filter_obj.updated_at or dtstamp
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda item: render_and_cache(*item), filter_positions))
+
+        return True, sum(1 for cached in results if cached), ""
+
+    except Exception as e:
+        return False, 0, f"Precompute filter exports error: {str(e)}"
@@ -0,0 +1,169 @@
+"""
+Upstream feed politeness: per-host concurrency caps, backoff and circuit breaking.
+
+Every calendar fetch of a sync goes through guarded_fetch. Feed health
+(see data/feed_health.py) is stored on the Calendar row (sync_state, next
+to the sync schedule), so it is kept wherever the database is reachable,
+including the sync Lambda: a failing feed is backed off on its own.
+
+Host health is shared across processes in Redis when available and kept
+per process otherwise. Once several feeds on a host fail with timeouts,
+connection errors, 5xx or 429, the dead or overloaded upstream costs one
+timeout per backoff window instead of one per feed and run, and feeds on
+it are skipped until a probe succeeds. User-triggered syncs bypass the
+host-level skip.
+
+IMPERATIVE SHELL - Orchestrates pure functions with I/O operations.
+"""
+
+import asyncio
+import random
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..core.config import settings
+from ..core.redis import get_cache, set_cache
+from ..data.feed_health import (
+    fetch_admission, host_admission, claim_probe, record_fetch_success, record_fetch_failure,
+    record_host_success, record_host_failure, is_host_failure
+)
+from ..models.calendar import Calendar
+
+FEED_HEALTH_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Per event loop (uvicorn, scheduler threads) and host
+_host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = \
+    weakref.WeakKeyDictionary()
+
+# Host health seen by this process (the only host tier without Redis)
+_local_host_health: Dict[str, Dict[str, Any]] = {}
+
+
+def _host_key(host: str) -> str:
+    return f"feed_health:host:{host}"
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or url).lower()
+
+
+def _host_semaphore(host: str) -> asyncio.Semaphore:
+    semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if host not in semaphores:
+        semaphores[host] = asyncio.Semaphore(settings.feed_fetch_host_concurrency)
+    return semaphores[host]
+
+
+def _get_host_health(host: str) -> Optional[Dict[str, Any]]:
+    return get_cache(_host_key(host)) or _local_host_health.get(host)
+
+
+def _set_host_health(host: str, health: Dict[str, Any]) -> None:
+    _local_host_health[host] = health
+    set_cache(_host_key(host), health, FEED_HEALTH_TTL_SECONDS)
+
+
+def _set_calendar_health(calendar: Calendar, health: Dict[str, Any]) -> None:
+    # New dict: in-place changes of JSON columns are not tracked
+    calendar.sync_state = {**(calendar.sync_state or {}), "health": {**health, "url": calendar.source_url}}
+
+
+def get_feed_health(calendar: Calendar) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Get the recorded health of a calendar's feed and its host.
+
+    Health recorded for a previous source URL of the calendar is ignored.
+
+    Returns:
+        {"feed": state or None, "host": state or None}
+
+    I/O Operation - Calendar row and Redis reads.
+    """
+    feed = (calendar.sync_state or {}).get("health")
+    if feed and feed.get("url") != calendar.source_url:
+        feed = None
+    return {"feed": feed, "host": _get_host_health(_host(calendar.source_url))}
+
+
+def is_feed_available(calendar: Calendar, now: Optional[float] = None) -> bool:
+    """
+    Check whether a fetch of the calendar's feed would be attempted (not backed off).
+
+    Args:
+        calendar: Calendar (or row) with source_url and sync_state
+        now: Current epoch seconds (default: time.time())
+
+    I/O Operation - Calendar row and Redis reads.
+    """
+    now = time.time() if now is None else now
+    return "skip" not in _admissions(get_feed_health(calendar), now).values()
+
+
+def _admissions(health: Dict[str, Optional[Dict[str, Any]]], now: float) -> Dict[str, str]:
+    return {
+        "feed": fetch_admission(health["feed"], now, settings.feed_circuit_failure_threshold),
+        "host": host_admission(health["host"], now, settings.feed_host_circuit_min_feeds),
+    }
+
+
+async def guarded_fetch(calendar: Calendar, fetch: Callable[[], Awaitable[Tuple[bool, str, str]]],
+                        bypass_host: bool = False) -> Tuple[bool, str, str]:
+    """
+    Fetch a calendar's feed unless it or its host is backed off, and record the outcome.
+
+    Feed health is set on calendar.sync_state; the caller's next commit
+    stores it (also after a failed fetch). Concurrent fetches of one
+    calendar are already prevented by its sync lease.
+
+    Args:
+        calendar: Calendar whose feed is fetched
+        fetch: Performs the fetch, returns (success, content, error_message)
+        bypass_host: Fetch even while the host is backed off (user-triggered syncs)
+
+    Returns:
+        Tuple of (success, content, error_message)
+
+    I/O Operation - Calendar row update (uncommitted) and Redis reads/writes around the HTTP fetch.
+    """
+    host = _host(calendar.source_url)
+    health = {scope: state or {} for scope, state in get_feed_health(calendar).items()}
+    now = time.time()
+
+    decisions = _admissions(health, now)
+    if bypass_host:
+        decisions["host"] = "allow"
+    if "skip" in decisions.values():
+        scope = "host" if decisions["host"] == "skip" else "feed"
+        wait = int(health[scope]["retry_at"] - now)
+        return False, "", (
+            f"Upstream {'host ' + host if scope == 'host' else 'feed'} unavailable after "
+            f"{health[scope]['failures']} failed fetches ({health[scope].get('last_error')}), retrying in {wait}s"
+        )
+    if decisions["host"] == "probe":
+        _set_host_health(host, claim_probe(health["host"], now, settings.feed_fetch_timeout_seconds * 2))
+
+    async with _host_semaphore(host):
+        started = time.monotonic()
+        success, content, error = await fetch()
+        duration_ms = (time.monotonic() - started) * 1000
+
+    now = time.time()
+    if success:
+        _set_calendar_health(calendar, record_fetch_success(health["feed"], now, duration_ms))
+        if health["host"].get("failures"):
+            _set_host_health(host, record_host_success(health["host"], now, duration_ms))
+        return success, content, error
+
+    backoff = (settings.feed_backoff_base_seconds, settings.feed_backoff_max_seconds)
+    _set_calendar_health(calendar, record_fetch_failure(health["feed"], error, now, *backoff, random.random()))
+    if is_host_failure(error):
+        _set_host_health(host, record_host_failure(
+            health["host"], f"calendar:{calendar.id}", error, now, *backoff, random.random()
+        ))
+    elif error.startswith("HTTP "):
+        # The host answered; only this feed is broken
+        if health["host"].get("failures"):
+            _set_host_health(host, record_host_success(health["host"], now, duration_ms))
+    return success, content, error
@@ -0,0 +1,151 @@
+"""
+Adaptive per-feed sync scheduling.
+
+Each calendar feed has a schedule state (see data/sync_schedule.py) stored
+on its Calendar row (sync_state), so it is kept wherever the database is
+reachable, including the sync Lambda: fetches record whether the content
+changed and the upstream cache headers, which adjust the feed's interval
+within the configured bounds. Scheduled runs (EventBridge / APScheduler
+ticks) sync only the due feeds, most subscribed first.
+
+Calendars without schedule state yet are due actual_sync_interval_minutes
+after their last_fetched; never fetched calendars are always due.
+
+IMPERATIVE SHELL - Orchestrates pure functions with I/O operations.
+"""
+
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..data.sync_schedule import update_schedule, upstream_max_age, due_feeds, fallback_schedule
+from ..models.calendar import Calendar, Filter
+from ..models.domain import Domain
+
+
+def get_feed_schedule(calendar: Calendar) -> Optional[Dict[str, Any]]:
+    """
+    Get a calendar feed's schedule state.
+
+    Returns:
+        Schedule state or None if not scheduled yet
+
+    Pure function - reads the loaded calendar row.
+    """
+    return (calendar.sync_state or {}).get("schedule")
+
+
+def record_feed_fetch(calendar: Calendar, content_hash: str, headers: Mapping[str, str],
+                      written: bool, now: Optional[float] = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Record a fetch of a calendar feed and schedule its next sync.
+
+    Sets calendar.sync_state; the caller's next commit stores it.
+
+    Args:
+        calendar: Calendar whose feed was fetched
+        content_hash: feed_content_hash of the fetched content
+        headers: Response headers of the fetch
+        written: Whether the events were parsed and written
+        now: Current epoch seconds (default: time.time())
+
+    Returns:
+        Tuple of (new schedule state, content changed)
+
+    I/O Operation - Calendar row update (uncommitted).
+    """
+    now = time.time() if now is None else now
+    schedule, changed = update_schedule(
+        get_feed_schedule(calendar),
+        content_hash,
+        now,
+        upstream_max_age(headers),
+        settings.sync_tick_minutes * 60,
+        settings.feed_sync_max_interval_minutes * 60,
+        settings.actual_sync_interval_minutes * 60,
+        written,
+    )
+    # New dict: in-place changes of JSON columns are not tracked
+    calendar.sync_state = {**(calendar.sync_state or {}), "schedule": schedule}
+    return schedule, changed
+
+
+def get_domain_subscriber_counts(db: Session, domain_keys: List[str]) -> Dict[str, int]:
+    """
+    Count filters (subscription links) per domain.
+
+    I/O Operation - Database aggregate query.
+    """
+    rows = (
+        db.query(Filter.domain_key, func.count(Filter.id))
+        .filter(Filter.domain_key.in_(domain_keys))
+        .group_by(Filter.domain_key)
+        .all()
+    )
+    return {domain_key: count for domain_key, count in rows}
+
+
+def get_due_domains(db: Session, domain_keys: List[str], now: Optional[float] = None) -> List[str]:
+    """
+    Select the domains whose calendar feed is due for sync.
+
+    Domains without a calendar yet are always due (the sync creates it).
+
+    Args:
+        db: Database session
+        domain_keys: Candidate domain keys
+        now: Current epoch seconds (default: time.time())
+
+    Returns:
+        Due domain keys, most subscribed first
+
+    I/O Operation - Database reads.
+    """
+    if not domain_keys:
+        return []
+    now = time.time() if now is None else now
+
+    rows = (
+        db.query(Domain.domain_key, Calendar.sync_state, Calendar.last_fetched)
+        .outerjoin(Calendar, Calendar.id == Domain.calendar_id)
+        .filter(Domain.domain_key.in_(domain_keys))
+        .all()
+    )
+    fallback_interval = settings.actual_sync_interval_minutes * 60
+    schedules: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(domain_keys)
+    for domain_key, sync_state, last_fetched in rows:
+        schedules[domain_key] = (sync_state or {}).get("schedule") or \
+            fallback_schedule(last_fetched, fallback_interval)
+    return due_feeds(schedules, get_domain_subscriber_counts(db, domain_keys), now)
+
+
+def get_feed_processing_state(calendar: Calendar) -> Tuple[bool, Optional[str]]:
+    """
+    Check whether a domain's post-sync work (rules, cache, exports) is needed.
+
+    It is skipped when the feed content is the one it last ran for.
+
+    Returns:
+        Tuple of (needs processing, content hash to pass to mark_feed_processed)
+
+    Pure function - reads the loaded calendar row.
+    """
+    schedule = get_feed_schedule(calendar)
+    if not schedule:
+        return True, None
+    processed_hash = (calendar.sync_state or {}).get("processed_hash")
+    return processed_hash != schedule["content_hash"], schedule["content_hash"]
+
+
+def mark_feed_processed(db: Session, calendar: Calendar, content_hash: Optional[str]) -> None:
+    """
+    Record that post-sync work ran for the given feed content.
+
+    I/O Operation - Database write.
+    """
+    if content_hash:
+        calendar.sync_state = {**(calendar.sync_state or {}), "processed_hash": content_hash}
+        db.commit()
@@ -0,0 +1,162 @@
+"""
+Background refresh of personal (user) calendars.
+
+User calendars used to refresh only on POST /api/calendars/{id}/sync, so
+their filtered exports went stale. Every scheduler tick now refreshes a
+bounded batch of them, picked by staleness weighted by recent export
+traffic (see data/sync_schedule.user_refresh_queue), with bounded
+concurrency through sync_calendar_events: leases, off-loop parsing and
+unchanged-feed skips apply as for domain calendars.
+
+IMPERATIVE SHELL - Orchestrates pure functions with I/O operations.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import get_session_sync
+from ..core.redis import REDIS_AVAILABLE, get_redis_client
+from ..data.sync_schedule import user_refresh_queue
+from ..models.calendar import Calendar
+from .calendar_service import sync_calendar_events
+from .feed_health_service import is_feed_available
+
+EXPORT_TRAFFIC_TTL_SECONDS = 2 * 24 * 60 * 60
+
+
+def _traffic_key(day: datetime) -> str:
+    return f"user_calendar_exports:{day:%Y%m%d}"
+
+
+def record_calendar_export(calendar_id: int, now: Optional[datetime] = None) -> None:
+    """
+    Count an export request of a user calendar (today's sorted set).
+
+    I/O Operation - Redis write (best effort).
+    """
+    if not REDIS_AVAILABLE:
+        return
+    try:
+        client = get_redis_client()
+        if client is None:
+            return
+        key = _traffic_key(now or datetime.now(timezone.utc))
+        pipeline = client.pipeline(transaction=False)
+        pipeline.zincrby(key, 1, calendar_id)
+        pipeline.expire(key, EXPORT_TRAFFIC_TTL_SECONDS)
+        pipeline.execute()
+    except Exception:
+        # Silently fail when Redis is unavailable (graceful degradation)
+        pass
+
+
+def get_recent_export_counts(now: Optional[datetime] = None) -> Dict[int, int]:
+    """
+    Export requests per user calendar today and yesterday.
+
+    I/O Operation - Redis read.
+    """
+    if not REDIS_AVAILABLE:
+        return {}
+    now = now or datetime.now(timezone.utc)
+    counts: Dict[int, int] = {}
+    try:
+        client = get_redis_client()
+        if client is None:
+            return {}
+        for day in (now, now - timedelta(days=1)):
+            for calendar_id, score in client.zrange(_traffic_key(day), 0, -1, withscores=True):
+                counts[int(calendar_id)] = counts.get(int(calendar_id), 0) + int(score)
+    except Exception:
+        return {}
+    return counts
+
+
+def select_user_calendars_to_refresh(db: Session, now: Optional[datetime] = None) -> List[int]:
+    """
+    Pick this tick's batch of user calendars.
+
+    Calendars whose feed or upstream host is backed off after failed
+    fetches (see feed_health_service) are skipped.
+
+    Args:
+        db: Database session
+        now: Current time (default: now, UTC)
+
+    Returns:
+        Calendar IDs by priority, at most settings.user_calendar_refresh_batch_size
+
+    I/O Operation - Database and Redis reads.
+    """
+    now = now or datetime.now(timezone.utc)
+    min_age_seconds = settings.user_calendar_refresh_min_age_minutes * 60
+    cutoff = (now - timedelta(seconds=min_age_seconds)).replace(tzinfo=None)
+
+    calendars = (
+        db.query(Calendar.id, Calendar.last_fetched, Calendar.source_url, Calendar.sync_state)
+        .filter(Calendar.type == "user")
+        .filter(or_(Calendar.last_fetched.is_(None), Calendar.last_fetched <= cutoff))
+        .all()
+    )
+    batch_size = settings.user_calendar_refresh_batch_size
+    # Over-select so backed-off calendars don't shrink the batch
+    rows = {calendar.id: calendar for calendar in calendars}
+    queue = user_refresh_queue(
+        [(calendar.id, calendar.last_fetched) for calendar in calendars],
+        get_recent_export_counts(now), now, min_age_seconds, batch_size * 2,
+    )
+    return [calendar_id for calendar_id in queue if is_feed_available(rows[calendar_id])][:batch_size]
+
+
+async def refresh_user_calendars(budget_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Refresh a batch of user calendars with bounded concurrency.
+
+    Args:
+        budget_seconds: Don't start refreshes after this many seconds
+
+    Returns:
+        Dictionary with selected/refreshed/failed/deferred counts
+
+    I/O Operation - Orchestrates calendar syncs.
+    """
+    db = get_session_sync()
+    try:
+        calendar_ids = select_user_calendars_to_refresh(db)
+    finally:
+        db.close()
+
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(settings.user_calendar_refresh_concurrency)
+
+    async def refresh(calendar_id: int) -> str:
+        async with semaphore:
+            if budget_seconds is not None and time.monotonic() - started >= budget_seconds:
+                return "deferred"
+            # One session per concurrent sync
+            db = get_session_sync()
+            try:
+                calendar = db.query(Calendar).filter(Calendar.id == calendar_id).first()
+                if not calendar:
+                    return "deferred"
+                success, _, error = await sync_calendar_events(db, calendar)
+            finally:
+                db.close()
+            if not success:
+                print(f"⚠️ User calendar {calendar_id} refresh failed: {error}")
+                return "failed"
+            return "refreshed"
+
+    outcomes = await asyncio.gather(*(refresh(calendar_id) for calendar_id in calendar_ids))
+    return {
+        "selected": len(calendar_ids),
+        "refreshed": outcomes.count("refreshed"),
+        "failed": outcomes.count("failed"),
+        "deferred": outcomes.count("deferred"),
+    }
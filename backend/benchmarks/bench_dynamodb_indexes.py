@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark indexed lookups against table scans (moto, in-memory).
+
+Seeds a growing number of event items and times the repository lookups
+that used to scan the whole table. Indexed lookups stay flat while scans
+grow with every event item.
+
+Usage (from backend/):
+    python -m benchmarks.bench_dynamodb_indexes [--sizes 1000 5000 20000]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from app.db import repository as repository_module
+from app.db.models import Admin, Domain, Event, Filter
+from app.db.repository import Repository
+from benchmarks.dynamodb_table import mock_table
+
+DOMAINS = 5
+FILTERS_PER_DOMAIN = 20
+REPEATS = 5
+
+
+def _seed(repo: Repository, event_count: int) -> None:
+    """Seed domains, filters, requests, an admin and event_count events."""
+    start = datetime(2025, 1, 1)
+    for d in range(DOMAINS):
+        domain_key = f"domain{d}"
+        repo.save_domain(Domain(domain_key=domain_key, name=domain_key, calendar_url="https://example.com/cal.ics"))
+        for f in range(FILTERS_PER_DOMAIN):
+            repo.save_filter(Filter(link_uuid=f"{domain_key}-filter-{f}", domain_key=domain_key))
+        repo.save_events([
+            Event(
+                domain_key=domain_key,
+                uid=f"{domain_key}-{i}",
+                start_date=(start + timedelta(days=i % 365)).strftime("%Y-%m-%d"),
+                title=f"Event {i % 50}",
+                start_time=start + timedelta(days=i % 365),
+            )
+            for i in range(event_count // DOMAINS)
+        ])
+    repo.create_domain_request(
+        requester_email="someone@example.com", requested_domain_key="new",
+        calendar_url="https://example.com/new.ics", description="benchmark"
+    )
+    repo.save_admin(Admin(email="admin@example.com", password_hash="x", reset_token="token-123"))
+
+
+def _time_ms(func) -> float:
+    """Median wall time of func in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+LOOKUPS = {
+    "list_domains(active)": lambda repo: repo.list_domains(status="active"),
+    "list_filters_for_domain": lambda repo: repo.list_filters_for_domain("domain0"),
+    "list_domain_requests(pending)": lambda repo: repo.list_domain_requests(status="pending"),
+    "get_admin_by_reset_token": lambda repo: repo.get_admin_by_reset_token("token-123"),
+}
+
+
+def run(sizes: list[int]) -> list[dict]:
+    """Run the benchmark for each event count; returns result rows."""
+    rows = []
+    for size in sizes:
+        with mock_table():
+            repo = Repository()
+            _seed(repo, size)
+            for name, lookup in LOOKUPS.items():
+                row = {"events": size, "lookup": name}
+                for mode, indexed in (("indexed_ms", True), ("scan_ms", False)):
+                    with patch.object(repository_module, "USE_INDEXED_LOOKUPS", indexed):
+                        row[mode] = _time_ms(lambda: lookup(repo))
+                rows.append(row)
+    return rows
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = parser.parse_args()
+
+    print(f"{'events':>8}  {'lookup':<30} {'indexed ms':>11} {'scan ms':>9}")
+    for row in run(args.sizes):
+        print(f"{row['events']:>8}  {row['lookup']:<30} {row['indexed_ms']:>11.2f} {row['scan_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark writing a synced calendar's events to the SQL database.
+
+Compares one ORM Event object per row (db.add + flush) with bulk_insert
+(batched multi-row INSERTs). Runs on a temporary SQLite file by default;
+pass --database-url to benchmark PostgreSQL (tables are created if missing,
+the benchmark calendar is removed afterwards).
+
+Usage (from backend/):
+    python -m benchmarks.bench_event_insert [--events 10000] [--database-url postgresql://...]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.database import Base, bulk_insert
+from app.data.calendar import create_event_data
+from app.models.calendar import Calendar, Event
+
+
+def _parsed_events(count: int) -> list[dict]:
+    """Build parsed events as returned by the iCal parser."""
+    start = datetime(2025, 1, 1, 18, 0, tzinfo=timezone.utc)
+    return [
+        {
+            "title": f"Training group {i % 40}",
+            "start_time": start + timedelta(days=i % 365, hours=i % 3),
+            "end_time": start + timedelta(days=i % 365, hours=i % 3 + 2),
+            "description": "Weekly training session of the club",
+            "location": "Sports hall",
+            "uid": f"event-{i}@bench.example.com",
+            "raw_ical": f"BEGIN:VEVENT\r\nUID:event-{i}@bench.example.com\r\nSUMMARY:Training\r\nEND:VEVENT",
+        }
+        for i in range(count)
+    ]
+
+
+def _orm_add(db: Session, calendar_id: int, events: list[dict]) -> None:
+    for event_data in events:
+        db.add(Event(**create_event_data(calendar_id, event_data)))
+    db.flush()
+
+
+def _bulk(db: Session, calendar_id: int, events: list[dict]) -> None:
+    bulk_insert(db, Event, [create_event_data(calendar_id, event_data) for event_data in events])
+
+
+CASES = {
+    "ORM objects (db.add)": _orm_add,
+    "bulk_insert": _bulk,
+}
+
+
+def run(database_url: str, event_count: int, repeats: int = 3) -> dict:
+    """Best wall-clock seconds per case (each run rolled back)."""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    events = _parsed_events(event_count)
+
+    with Session(engine) as db:
+        calendar = Calendar(name="bench", source_url="https://bench.example.com/feed.ics", type="user")
+        db.add(calendar)
+        db.commit()
+        calendar_id = calendar.id
+
+    results = {}
+    try:
+        for name, case in CASES.items():
+            results[name] = min(_timed(engine, case, calendar_id, events) for _ in range(repeats))
+    finally:
+        with Session(engine) as db:
+            db.query(Event).filter(Event.calendar_id == calendar_id).delete()
+            db.query(Calendar).filter(Calendar.id == calendar_id).delete()
+            db.commit()
+        engine.dispose()
+    return results
+
+
+def _timed(engine, case, calendar_id: int, events: list[dict]) -> float:
+    with Session(engine) as db:
+        started = time.perf_counter()
+        case(db, calendar_id, events)
+        elapsed = time.perf_counter() - started
+        db.rollback()
+    return elapsed
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--database-url", help="Database to benchmark (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{directory}/bench.db"
+        results = run(database_url, args.events)
+
+    print(f"{database_url.split(':')[0]}, {args.events} events")
+    for name, seconds in results.items():
+        print(f"{name:<30} {seconds:>8.3f} s  {seconds / args.events * 1_000_000:>8.1f} us/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-event deserialization cost of DynamoDB event items.
+
+Compares the validated Event model with the EventRecord read view, for
+title-only access (filtering) and full access (rendering).
+
+Usage (from backend/):
+    python -m benchmarks.bench_event_parsing [--events 20000]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from app.db.models import Event, EventRecord
+
+
+def _items(count: int) -> list[dict]:
+    """Build stored event items as returned by a query."""
+    start = datetime(2025, 1, 1, 9, 0)
+    return [
+        Event(
+            domain_key="bench",
+            uid=f"event-{i}",
+            start_date=(start + timedelta(days=i % 365)).strftime("%Y-%m-%d"),
+            title=f"Event {i % 50}",
+            start_time=start + timedelta(days=i % 365),
+            end_time=start + timedelta(days=i % 365, hours=2),
+            description="Weekly meeting of the committee",
+            location="Town hall",
+        ).to_dynamo_item()
+        for i in range(count)
+    ]
+
+
+def _titles(events) -> None:
+    for event in events:
+        event.title
+
+
+def _render_fields(events) -> None:
+    for event in events:
+        (event.uid, event.title, event.start_time, event.end_time, event.description, event.location)
+
+
+CASES = {
+    "Event.from_dynamo_item + titles": lambda items: _titles([Event.from_dynamo_item(i) for i in items]),
+    "EventRecord + titles": lambda items: _titles([EventRecord(i) for i in items]),
+    "Event.from_dynamo_item + all fields": lambda items: _render_fields([Event.from_dynamo_item(i) for i in items]),
+    "EventRecord + all fields": lambda items: _render_fields([EventRecord(i) for i in items]),
+}
+
+
+def run(event_count: int, repeats: int = 3) -> dict:
+    """Per-event cost in microseconds for each case (best of repeats)."""
+    items = _items(event_count)
+    results = {}
+    for name, case in CASES.items():
+        best = min(_timed(case, items) for _ in range(repeats))
+        results[name] = best / event_count * 1_000_000
+    return results
+
+
+def _timed(case, items) -> float:
+    started = time.perf_counter()
+    case(items)
+    return time.perf_counter() - started
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    for name, per_event_us in run(args.events).items():
+        print(f"{name:<40} {per_event_us:>8.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pure parser, grouping, rule, filter and export hot paths.
+
+Times parse_ical_content, group_events_by_title, apply_assignment_rules,
+build_domain_events_with_auto_groups, apply_filter_to_events (one filter
+per group) and transform_events_for_export on deterministic synthetic
+feeds (see feed_generator.py) of several sizes and shapes.
+
+Results are best-of-repeats seconds per profile and function, and the
+median time relative to a fixed pure-Python calibration loop timed right
+before each repeat. Comparisons use the relative figures, so CPU speed
+changes between (or during) runs and machines largely cancel out. With
+--compare the run fails (exit code 1) when a case got slower than the
+baseline by more than --threshold.
+
+Usage (from backend/):
+    python -m benchmarks.bench_hot_paths [--profiles small,large] [--repeats 3]
+    python -m benchmarks.bench_hot_paths --save-baseline
+    python -m benchmarks.bench_hot_paths --compare [--threshold 0.5]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.data.calendar import (
+    create_event_data, create_domain_event_data, apply_filter_to_events, transform_events_for_export
+)
+from app.data.grouping import apply_assignment_rules, build_domain_events_with_auto_groups
+from app.data.ical_parser import parse_ical_content, group_events_by_title
+
+from .feed_generator import FeedProfile, generate_feed, generate_rules
+
+PROFILES = {
+    "small": FeedProfile(events=200, recurring_ratio=0.5, categories=5, timezones=2, rules=5),
+    "recurring": FeedProfile(events=2000, recurring_ratio=0.9, categories=10, timezones=2, rules=20),
+    "varied": FeedProfile(events=2000, recurring_ratio=0.1, categories=40, timezones=6, rules=20),
+    "large": FeedProfile(events=10000, recurring_ratio=0.7, categories=20, timezones=4, rules=60),
+}
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "hot_paths.json"
+DOMAIN_KEY = "bench"
+
+
+def _cases(profile: FeedProfile) -> Dict[str, Callable[[], Any]]:
+    """Prepare the inputs of every hot path once; return the timed calls."""
+    feed = generate_feed(profile)
+    parsed = parse_ical_content(feed)
+    if not parsed.is_success:
+        raise RuntimeError(f"Synthetic feed failed to parse: {parsed.error}")
+
+    # Same event shape as domain syncs hand to rules, grouping and exports
+    events = [
+        create_domain_event_data({**create_event_data(1, event), "id": index}, DOMAIN_KEY)
+        for index, event in enumerate(parsed.value)
+    ]
+    rules = generate_rules(profile)
+    grouped = group_events_by_title(events)
+    assignments = apply_assignment_rules(events, rules)
+    groups_data = [{"id": group_id, "name": f"Group {group_id}"}
+                   for group_id in sorted({rule["target_group_id"] for rule in rules})]
+    assignments_data = [{"group_id": group_id, "recurring_event_title": title}
+                        for group_id, titles in assignments.items() for title in titles]
+    filters = [
+        ({"domain_key": DOMAIN_KEY, "subscribed_group_ids": [group["id"]],
+          "subscribed_event_ids": [events[0]["title"]], "unselected_event_ids": []},
+         set(assignments.get(group["id"], [])))
+        for group in groups_data
+    ]
+
+    return {
+        "parse_ical_content": lambda: parse_ical_content(feed),
+        "group_events_by_title": lambda: group_events_by_title(events),
+        "apply_assignment_rules": lambda: apply_assignment_rules(events, rules),
+        "build_domain_events_with_auto_groups": lambda: build_domain_events_with_auto_groups(
+            grouped, groups_data, assignments_data, DOMAIN_KEY
+        ),
+        "apply_filter_to_events": lambda: [
+            apply_filter_to_events(events, filter_data, titles) for filter_data, titles in filters
+        ],
+        "transform_events_for_export": lambda: transform_events_for_export(events, "Benchmark"),
+    }
+
+
+def _seconds(call: Callable[[], Any]) -> float:
+    # Like timeit: collection pauses depend on heap state, not on the code timed
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        call()
+        return time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def _calibration() -> None:
+    """Fixed pure-Python workload (string, dict and sort operations)."""
+    table: Dict[str, int] = {}
+    for index in range(50_000):
+        key = f"title {index % 5000}".lower()
+        table[key] = table.get(key, 0) + index
+    sorted(table.items(), key=lambda item: item[1])
+
+
+def run(profile_names: List[str], repeats: int = 3) -> Dict[str, Any]:
+    """
+    Time every hot path for the given profiles.
+
+    Returns:
+        {"python": str, "results": {"profile/function": {"seconds": float, "relative": float}}}
+        with the best seconds and the median seconds / calibration seconds
+    """
+    results = {}
+    for name in profile_names:
+        for case, call in _cases(PROFILES[name]).items():
+            timings = [(_seconds(call), _seconds(_calibration)) for _ in range(repeats)]
+            results[f"{name}/{case}"] = {
+                "seconds": min(seconds for seconds, _ in timings),
+                "relative": statistics.median(seconds / calibration for seconds, calibration in timings),
+            }
+    return {"python": platform.python_version(), "results": results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+            min_seconds: float) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compare a run with a baseline on calibration-relative times.
+
+    A case regresses when it is more than threshold (0.5: 50%) slower than
+    the baseline and the difference exceeds min_seconds (timer noise of
+    very fast cases).
+
+    Returns:
+        (case, expected seconds, current seconds, ratio, regressed) per case
+        in both runs; expected is the baseline at this run's calibration speed
+    """
+    rows = []
+    for case, result in current["results"].items():
+        if case not in baseline["results"]:
+            continue
+        ratio = result["relative"] / baseline["results"][case]["relative"]
+        seconds = result["seconds"]
+        expected = seconds / ratio
+        regressed = ratio > 1 + threshold and seconds - expected > min_seconds
+        rows.append((case, expected, seconds, ratio, regressed))
+    return rows
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="Comma-separated: " + ", ".join(PROFILES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to --baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail on regressions against --baseline")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Allowed slowdown (0.5: 50%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.002, help="Ignore smaller differences")
+    args = parser.parse_args()
+
+    profile_names = [name.strip() for name in args.profiles.split(",") if name.strip()]
+    unknown = [name for name in profile_names if name not in PROFILES]
+    if unknown:
+        parser.error(f"Unknown profiles: {', '.join(unknown)}")
+
+    current = run(profile_names, args.repeats)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+
+    if not args.compare:
+        for case, result in current["results"].items():
+            print(f"{case:<50} {result['seconds'] * 1000:>10.2f} ms {result['relative']:>10.3f}x calibration")
+        return
+
+    rows = compare(json.loads(args.baseline.read_text()), current, args.threshold, args.min_seconds)
+    for case, expected, seconds, ratio, regressed in rows:
+        print(f"{case:<50} {expected * 1000:>10.2f} ms -> {seconds * 1000:>10.2f} ms  "
+              f"{ratio:>5.2f}x{'  REGRESSION' if regressed else ''}")
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"{len(regressions)} regressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} ({len(rows)} cases)")
+
+
+if __name__ == "__main__":
+    main()
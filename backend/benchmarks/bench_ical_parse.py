@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing of large iCal feeds.
+
+Compares parsing in a single worker with VEVENT chunks parsed concurrently
+across a process pool (parse_ical_feed for feeds above
+settings.parallel_parse_min_bytes).
+
+Usage (from backend/):
+    python -m benchmarks.bench_ical_parse [--events 5000] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core.executors import InstrumentedExecutor
+from app.data.ical_parser import parse_ical_content, split_ical_chunks, merge_parsed_chunks
+
+
+def _feed(event_count: int) -> str:
+    """Build a feed with a timezone definition and weekly events."""
+    lines = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Bench//Bench//EN",
+        "BEGIN:VTIMEZONE", "TZID:Europe/Berlin",
+        "BEGIN:STANDARD", "DTSTART:19701025T030000", "TZOFFSETFROM:+0200", "TZOFFSETTO:+0100",
+        "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU", "END:STANDARD",
+        "BEGIN:DAYLIGHT", "DTSTART:19700329T020000", "TZOFFSETFROM:+0100", "TZOFFSETTO:+0200",
+        "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU", "END:DAYLIGHT",
+        "END:VTIMEZONE",
+    ]
+    for i in range(event_count):
+        day = 1 + i % 28
+        month = 1 + i % 12
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:event-{i}@bench.example.com",
+            f"DTSTART;TZID=Europe/Berlin:2025{month:02d}{day:02d}T180000",
+            f"DTEND;TZID=Europe/Berlin:2025{month:02d}{day:02d}T200000",
+            f"SUMMARY:Training group {i % 40}",
+            "DESCRIPTION:Weekly training session of the club, bring your own equipment and",
+            "  water bottle. Changes are announced in the group chat.",
+            "LOCATION:Sports hall, Main street 1",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines)
+
+
+async def _parse_parallel(executor: InstrumentedExecutor, feed: str):
+    chunks, first_blocks = split_ical_chunks(feed, executor.max_workers)
+    results = await asyncio.gather(*(executor.run(parse_ical_content, chunk) for chunk in chunks))
+    return merge_parsed_chunks(list(results), first_blocks)
+
+
+def run(event_count: int, workers: int, repeats: int = 3) -> dict:
+    """Best wall-clock seconds for serial and chunked parallel parsing."""
+    feed = _feed(event_count)
+    executor = InstrumentedExecutor("bench", "process", workers)
+    try:
+        # Warm up the pool so worker start-up isn't measured
+        asyncio.run(executor.run(parse_ical_content, _feed(1)))
+
+        serial = min(_timed(lambda: parse_ical_content(feed)) for _ in range(repeats))
+        parallel = min(_timed(lambda: asyncio.run(_parse_parallel(executor, feed))) for _ in range(repeats))
+        equal = asyncio.run(_parse_parallel(executor, feed)).value == parse_ical_content(feed).value
+    finally:
+        executor.shutdown()
+
+    return {"feed_mb": len(feed) / 1_000_000, "serial": serial, "parallel": parallel, "equal": equal}
+
+
+def _timed(case) -> float:
+    started = time.perf_counter()
+    case()
+    return time.perf_counter() - started
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    result = run(args.events, args.workers)
+    print(f"feed size: {result['feed_mb']:.2f} MB, {args.events} events")
+    print(f"{'serial':<30} {result['serial']:>8.3f} s")
+    print(f"{f'parallel ({args.workers} processes)':<30} {result['parallel']:>8.3f} s")
+    print(f"{'speedup':<30} {result['serial'] / result['parallel']:>8.2f}x")
+    print(f"{'results equal':<30} {result['equal']!s:>8}")
+
+
+if __name__ == "__main__":
+    main()
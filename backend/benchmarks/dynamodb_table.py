@@ -0,0 +1,68 @@
+"""
+In-memory DynamoDB table (moto) matching the deployed single-table schema.
+
+Shared by DynamoDB benchmarks and tests. Keep the index definitions in sync
+with sst.config.ts.
+"""
+
+import os
+from contextlib import contextmanager
+
+import boto3
+
+from app.db import dynamodb, repository
+
+INDEX_KEYS = {
+    dynamodb.LINK_UUID_INDEX: ("link_uuid", None),
+    dynamodb.ENTITY_INDEX: ("entity_type", "entity_sort"),
+    dynamodb.FILTER_DOMAIN_INDEX: ("filter_domain_key", None),
+    dynamodb.RESET_TOKEN_INDEX: ("reset_token", None),
+    dynamodb.ASSIGNMENT_GROUP_INDEX: ("assign_group", None),
+}
+
+
+def _clear_client_caches():
+    dynamodb.get_client.cache_clear()
+    dynamodb.get_resource.cache_clear()
+    dynamodb.get_table.cache_clear()
+    repository._domain_cache.invalidate()
+
+
+@contextmanager
+def mock_table():
+    """Create the table inside moto and point app.db.dynamodb at it."""
+    from moto import mock_aws
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+    with mock_aws():
+        _clear_client_caches()
+        attributes = {"PK", "SK"}
+        indexes = []
+        for index_name, (hash_key, range_key) in INDEX_KEYS.items():
+            key_schema = [{"AttributeName": hash_key, "KeyType": "HASH"}]
+            attributes.add(hash_key)
+            if range_key:
+                key_schema.append({"AttributeName": range_key, "KeyType": "RANGE"})
+                attributes.add(range_key)
+            indexes.append({
+                "IndexName": index_name,
+                "KeySchema": key_schema,
+                "Projection": {"ProjectionType": "ALL"},
+            })
+
+        boto3.client("dynamodb", region_name=dynamodb.REGION).create_table(
+            TableName=dynamodb.TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[{"AttributeName": name, "AttributeType": "S"} for name in sorted(attributes)],
+            GlobalSecondaryIndexes=indexes,
+            BillingMode="PAY_PER_REQUEST",
+        )
+        try:
+            yield dynamodb.get_table()
+        finally:
+            _clear_client_caches()
@@ -0,0 +1,106 @@
+"""
+Deterministic synthetic iCal feeds and assignment rules for benchmarks.
+
+A FeedProfile describes the shape of a feed: its size, the share of events
+that belong to recurring series (same title), how many categories and
+timezones are in use and how many assignment rules a domain defines. The
+same profile and seed always produce the same feed and rules.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+TIMEZONES = ["UTC", "Europe/Berlin", "America/New_York", "Asia/Tokyo", "Australia/Sydney", "Europe/London"]
+WORDS = [
+    "training", "match", "youth", "seniors", "board", "meeting", "tournament", "practice", "camp",
+    "workshop", "concert", "rehearsal", "league", "cup", "open", "session", "team", "club",
+]
+RULE_TYPES = ["title_contains", "description_contains", "category_contains", "title_not_contains"]
+
+
+@dataclass(frozen=True)
+class FeedProfile:
+    """Shape of a synthetic feed."""
+    events: int
+    recurring_ratio: float  # Share of events in recurring series
+    categories: int
+    timezones: int  # Number of TIMEZONES used (UTC first)
+    rules: int
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(3)).title()
+
+
+def generate_feed(profile: FeedProfile, seed: int = 0) -> str:
+    """
+    Build an iCal feed with the profile's shape.
+
+    Recurring events reuse one of a few series titles (weekly instances);
+    the others get unique titles. Events carry 0-3 categories and start in
+    one of the profile's timezones (UTC as Z times, others with TZID).
+    """
+    rng = random.Random(seed)
+    series = [f"{_title(rng)} {index}" for index in range(max(1, profile.events // 20))]
+    categories = [f"Category {index}" for index in range(profile.categories)]
+    timezones = TIMEZONES[:max(1, profile.timezones)]
+    start = datetime(2030, 1, 6, 8, 0)
+
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Filter iCal//Benchmark//EN"]
+    for index in range(profile.events):
+        recurring = rng.random() < profile.recurring_ratio
+        title = rng.choice(series) if recurring else f"{_title(rng)} #{index}"
+        begins = start + timedelta(days=rng.randrange(365), hours=rng.randrange(12), minutes=15 * rng.randrange(4))
+        ends = begins + timedelta(minutes=30 * rng.randint(1, 6))
+        timezone = rng.choice(timezones)
+        if timezone == "UTC":
+            dtstart, dtend = f"DTSTART:{begins:%Y%m%dT%H%M%S}Z", f"DTEND:{ends:%Y%m%dT%H%M%S}Z"
+        else:
+            dtstart = f"DTSTART;TZID={timezone}:{begins:%Y%m%dT%H%M%S}"
+            dtend = f"DTEND;TZID={timezone}:{ends:%Y%m%dT%H%M%S}"
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:event-{index}-{seed}@bench.example.com",
+            dtstart,
+            dtend,
+            f"SUMMARY:{title}",
+            f"DESCRIPTION:{' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 30)))}",
+            f"LOCATION:Hall {rng.randrange(10)}",
+        ]
+        event_categories = rng.sample(categories, k=min(len(categories), rng.randint(0, 3)))
+        if event_categories:
+            lines.append(f"CATEGORIES:{','.join(event_categories)}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines)
+
+
+def generate_rules(profile: FeedProfile, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Build the profile's assignment rules in the shape apply_assignment_rules takes.
+
+    Mixes title, description and category conditions, negative rules and
+    compound (AND) rules, spread over profile.rules // 3 + 1 groups.
+    """
+    rng = random.Random(seed + 1)
+    group_count = profile.rules // 3 + 1
+
+    def condition() -> Dict[str, Any]:
+        rule_type = rng.choice(RULE_TYPES)
+        if rule_type == "category_contains" and profile.categories:
+            value = f"Category {rng.randrange(profile.categories)}"
+        else:
+            value = rng.choice(WORDS)
+        return {"rule_type": rule_type, "rule_value": value}
+
+    rules = []
+    for index in range(profile.rules):
+        target = {"target_group_id": 1 + index % group_count}
+        if index % 5 == 4:
+            rules.append({"is_compound": True, "operator": "AND",
+                          "child_conditions": [condition(), condition()], **target})
+        else:
+            rules.append({"is_compound": False, **condition(), **target})
+    return rules
@@ -40,6 +40,13 @@ IMPORTANT NOTES:
 4. Clean state: test_domain automatically cleans up existing domains
 """
 
+import os
+
+# Parse in threads: tests patch parser functions with (unpicklable) mocks
+os.environ.setdefault("PARSE_EXECUTOR_KIND", "thread")
+# In-process sync leases: no Redis server in the test environment
+os.environ.setdefault("SYNC_LOCK_BACKEND", "local")
+
 import pytest
 import yaml
 from pathlib import Path
@@ -51,7 +58,7 @@ from sqlalchemy.pool import StaticPool
 from openapi_core import Spec, validate_request, validate_response
 
 from app.main import create_application
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_async_db
 from app.core.config import settings
 
 
@@ -167,6 +174,15 @@ def test_client(test_db_engine) -> Generator[TestClient, None, None]:
             # Don't close the session here - we'll close it at the end of the test
             pass
     
+    class SharedAsyncSession:
+        """Async-session stand-in running run_sync work on the shared session."""
+
+        async def run_sync(self, fn, *args, **kwargs):
+            return fn(shared_session, *args, **kwargs)
+
+    async def override_get_async_db():
+        yield SharedAsyncSession()
+
     # Import FastAPI and create minimal app without lifespan for testing
     from fastapi import FastAPI
     from fastapi.middleware.cors import CORSMiddleware
@@ -190,6 +206,7 @@ def test_client(test_db_engine) -> Generator[TestClient, None, None]:
     
     # Override database dependency BEFORE importing routers
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     
     # Import and include routers
     from app.routers import (
@@ -27,7 +27,8 @@ from app.services.calendar_service import (
     get_filter_by_uuid,
     get_filter_by_id,
     delete_filter,
-    apply_filter_to_events
+    apply_filter_to_events,
+    apply_filters_to_events_batch
 )
 from app.models.calendar import Calendar, Event, Filter, RecurringEventGroup
 from app.models.domain import Domain
@@ -345,7 +346,7 @@ class TestSyncCalendarEvents:
     async def test_sync_calendar_events_success(self):
         """Test successful event synchronization."""
         mock_db = Mock(spec=Session)
-        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics")
+        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics", sync_state=None)
 
         # Use a date within the last week (events older than 1 week are filtered out)
         today = datetime.now(timezone.utc)
@@ -376,7 +377,7 @@ class TestSyncCalendarEvents:
     async def test_sync_calendar_events_fetch_failure(self):
         """Test sync failure when fetch fails."""
         mock_db = Mock(spec=Session)
-        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics")
+        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics", sync_state=None)
 
         with patch('app.services.calendar_service.fetch_ical_content', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = (False, "", "Fetch error")
@@ -391,7 +392,7 @@ class TestSyncCalendarEvents:
     async def test_sync_calendar_events_parse_failure(self):
         """Test sync failure when parsing fails."""
         mock_db = Mock(spec=Session)
-        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics")
+        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics", sync_state=None)
 
         with patch('app.services.calendar_service.fetch_ical_content', new_callable=AsyncMock) as mock_fetch:
             with patch('app.services.calendar_service.parse_ical_content') as mock_parse:
@@ -408,7 +409,7 @@ class TestSyncCalendarEvents:
     async def test_sync_calendar_events_filters_old_events(self):
         """Test that old events are filtered out."""
         mock_db = Mock(spec=Session)
-        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics")
+        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics", sync_state=None)
 
         old_date = datetime(2020, 1, 1, 10, 0, tzinfo=timezone.utc)
         recent_date = datetime.now(timezone.utc)
@@ -443,7 +444,7 @@ class TestSyncCalendarEvents:
     async def test_sync_calendar_events_database_error(self):
         """Test sync with database error."""
         mock_db = Mock(spec=Session)
-        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics")
+        mock_calendar = Mock(id=1, source_url="https://example.com/cal.ics", sync_state=None)
         mock_db.commit.side_effect = Exception("Database error")
 
         mock_event_data = [
@@ -884,3 +885,37 @@ class TestApplyFilterToEvents:
 
         # Team Meeting should be filtered out by unselected_event_ids
         assert len(result) == 1
+
+
+@pytest.mark.unit
+class TestApplyFiltersToEventsBatch:
+    """Test batch filter evaluation over a shared title index."""
+
+    def test_batch_matches_single_filter_results(self):
+        """Test batch results equal per-filter results with one assignment query."""
+        mock_db = Mock(spec=Session)
+
+        events = [
+            {"id": "evt_1", "title": "Team Meeting"},
+            {"id": "evt_2", "title": "Project Review"},
+            {"id": "evt_3", "title": "Daily Standup"},
+            {"id": "evt_4", "title": "Team Meeting"}
+        ]
+
+        filters = [
+            {"id": 1, "domain_key": "test-domain", "subscribed_group_ids": [1],
+             "subscribed_event_ids": ["Daily Standup"], "unselected_event_ids": []},
+            {"id": 2, "domain_key": "test-domain", "subscribed_group_ids": [1, 2],
+             "subscribed_event_ids": [], "unselected_event_ids": ["Team Meeting"]}
+        ]
+
+        mock_db.query.return_value.filter.return_value.all.return_value = [
+            Mock(recurring_event_title="Team Meeting", group_id=1),
+            Mock(recurring_event_title="Project Review", group_id=2)
+        ]
+
+        result = apply_filters_to_events_batch(mock_db, events, filters)
+
+        assert mock_db.query.call_count == 1
+        assert [e["id"] for e in result[1]] == ["evt_1", "evt_3", "evt_4"]
+        assert [e["id"] for e in result[2]] == ["evt_2"]
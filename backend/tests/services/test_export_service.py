@@ -0,0 +1,150 @@
+"""
+Unit tests for export service.
+
+Tests batch precomputation of filter exports with mocked database and Redis.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.database import Base
+from app.models.calendar import Calendar, Filter
+from app.models.domain import Domain
+from app.services.export_service import (
+    precompute_domain_filter_exports, get_cached_filter_export,
+    invalidate_domain_filter_exports, invalidate_calendar_filter_exports
+)
+
+
+def _domain_filter(filter_id, name, group_ids, unselected=None):
+    """Build a mock domain filter."""
+    filter_obj = Mock(
+        id=filter_id,
+        domain_key="test-domain",
+        calendar_id=None,
+        link_uuid=f"uuid-{filter_id}",
+        subscribed_group_ids=group_ids,
+        subscribed_event_ids=[],
+        unselected_event_ids=unselected or [],
+        updated_at=datetime(2025, 10, 1, tzinfo=timezone.utc)
+    )
+    filter_obj.name = name  # Mock(name=...) names the mock itself
+    return filter_obj
+
+
+EVENTS = [
+    {"id": "evt_1", "uid": "u1", "title": "Meeting", "start_time": datetime(2025, 10, 2, 9, 0, tzinfo=timezone.utc)},
+    {"id": "evt_2", "uid": "u2", "title": "Review", "start_time": datetime(2025, 10, 3, 9, 0, tzinfo=timezone.utc)},
+]
+
+
+@pytest.mark.unit
+class TestPrecomputeDomainFilterExports:
+    """Test batch filter export precomputation."""
+
+    def test_precompute_renders_each_filter_once(self):
+        """Each filter export is cached with its own events and ETag."""
+        mock_db = Mock(spec=Session)
+        filters = [
+            _domain_filter(1, "Meetings", [10]),
+            _domain_filter(2, "Everything", [10, 20], unselected=["Meeting"])
+        ]
+        mock_db.query.return_value.filter.return_value.all.return_value = filters
+
+        with patch('app.services.export_service.get_domain_events', return_value=EVENTS), \
+             patch('app.services.export_service.get_group_titles_for_domains',
+                   return_value={10: {"Meeting"}, 20: {"Review"}}), \
+             patch('app.services.export_service.set_cache', return_value=True) as mock_set:
+
+            success, count, error = precompute_domain_filter_exports(mock_db, "test-domain", max_workers=2)
+
+        assert success and count == 2 and error == ""
+        cached = {call.args[0]: call.args[1] for call in mock_set.call_args_list}
+        assert "X-WR-CALNAME:Meetings" in cached["filter_export:uuid-1"]["content"]
+        assert "SUMMARY:Meeting" in cached["filter_export:uuid-1"]["content"]
+        assert "SUMMARY:Review" not in cached["filter_export:uuid-1"]["content"]
+        assert "SUMMARY:Review" in cached["filter_export:uuid-2"]["content"]
+        assert "SUMMARY:Meeting" not in cached["filter_export:uuid-2"]["content"]
+
+    def test_precompute_stops_when_budget_exhausted(self):
+        """No exports are written once the time budget is used up."""
+        mock_db = Mock(spec=Session)
+        mock_db.query.return_value.filter.return_value.all.return_value = [_domain_filter(1, "Meetings", [10])]
+
+        with patch('app.services.export_service.get_domain_events', return_value=EVENTS), \
+             patch('app.services.export_service.get_group_titles_for_domains', return_value={10: {"Meeting"}}), \
+             patch('app.services.export_service.set_cache', return_value=True) as mock_set:
+
+            success, count, _ = precompute_domain_filter_exports(mock_db, "test-domain", budget_seconds=-1)
+
+        assert success and count == 0
+        mock_set.assert_not_called()
+
+    def test_precompute_without_filters(self):
+        """Domains without filters skip event loading."""
+        mock_db = Mock(spec=Session)
+        mock_db.query.return_value.filter.return_value.all.return_value = []
+
+        with patch('app.services.export_service.get_domain_events') as mock_events:
+            success, count, _ = precompute_domain_filter_exports(mock_db, "test-domain")
+
+        assert success and count == 0
+        mock_events.assert_not_called()
+
+    def test_get_cached_filter_export_miss(self):
+        """Missing cache entries are reported as a miss."""
+        with patch('app.services.export_service.get_cache', return_value=None):
+            success, entry, error = get_cached_filter_export("uuid-1")
+
+        assert not success and entry is None
+
+
+@pytest.fixture
+def filters_db(tmp_path):
+    """A domain calendar and a user calendar with filters in a SQLite file."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'exports.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    domain_calendar = Calendar(name="Club", source_url="https://example.com/club.ics", type="domain")
+    user_calendar = Calendar(name="Mine", source_url="https://example.com/mine.ics", type="user")
+    db.add_all([domain_calendar, user_calendar])
+    db.flush()
+    db.add_all([
+        Domain(domain_key="club", name="Club", calendar_url="https://example.com/club.ics",
+               calendar_id=domain_calendar.id),
+        Filter(name="Club A", domain_key="club", link_uuid="club-a"),
+        Filter(name="Club B", domain_key="club", link_uuid="club-b"),
+        Filter(name="Other", domain_key="other", link_uuid="other-a"),
+        Filter(name="Mine", calendar_id=user_calendar.id, link_uuid="mine-a"),
+    ])
+    db.commit()
+    yield db, domain_calendar.id, user_calendar.id
+    db.close()
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestInvalidateFilterExports:
+    """Test writes drop the cached exports of the affected filters only."""
+
+    def test_domain_edits_drop_domain_exports(self, filters_db):
+        db, _, _ = filters_db
+
+        with patch('app.services.export_service.delete_cache', return_value=True) as mock_delete:
+            assert invalidate_domain_filter_exports(db, "club") == 2
+
+        assert sorted(call.args[0] for call in mock_delete.call_args_list) == \
+            ["filter_export:club-a", "filter_export:club-b"]
+
+    def test_calendar_sync_drops_calendar_and_domain_exports(self, filters_db):
+        db, domain_calendar_id, user_calendar_id = filters_db
+
+        with patch('app.services.export_service.delete_cache', return_value=True) as mock_delete:
+            invalidate_calendar_filter_exports(db, domain_calendar_id)
+            invalidate_calendar_filter_exports(db, user_calendar_id)
+
+        assert sorted(call.args[0] for call in mock_delete.call_args_list) == \
+            ["filter_export:club-a", "filter_export:club-b", "filter_export:mine-a"]
@@ -0,0 +1,182 @@
+"""
+Unit tests for the async database engine and session dependency.
+
+Runs existing sync service functions through AsyncSession.run_sync on an
+aiosqlite database file.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("aiosqlite")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core import config
+from app.core.database import Base, create_async_db_engine, get_async_db
+from app.models.calendar import Calendar, Event, Filter
+from app.models.domain import Domain
+from app.services.auth_service import create_jwt_token
+from app.services.calendar_service import get_filters, get_filter_by_uuid
+
+
+@pytest.mark.unit
+class TestAsyncDatabaseUrl:
+    """Test async driver selection."""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("postgresql://u:p@db:5432/app", "postgresql+asyncpg://u:p@db:5432/app"),
+        ("postgresql+psycopg2://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+        ("sqlite:///./data/app.db", "sqlite+aiosqlite:///./data/app.db"),
+        ("sqlite+aiosqlite:///./data/app.db", "sqlite+aiosqlite:///./data/app.db"),
+    ])
+    def test_async_driver_for_scheme(self, url, expected):
+        with patch.object(config, "get_database_url", return_value=url):
+            assert config.get_async_database_url() == expected
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(Filter.__table__.insert(), [
+            {"name": f"Filter {i}", "domain_key": "exter", "user_id": 1, "link_uuid": f"uuid-{i}"}
+            for i in range(3)
+        ])
+        connection.execute(Domain.__table__.insert(), [
+            {"domain_key": "exter", "name": "Exter", "calendar_url": "https://example.com/exter.ics",
+             "status": "active"}
+        ])
+        connection.execute(Calendar.__table__.insert(), [
+            {"id": 1, "name": "Training", "source_url": "https://example.com/training.ics", "type": "user",
+             "user_id": 1}
+        ])
+        connection.execute(Event.__table__.insert(), [
+            {"calendar_id": 1, "title": "Match", "uid": "match-1", "start_time": datetime(2026, 5, 1, 18),
+             "end_time": datetime(2026, 5, 1, 20)}
+        ])
+        connection.execute(Filter.__table__.insert(), [
+            {"name": "Matches", "calendar_id": 1, "user_id": 1, "link_uuid": "uuid-calendar",
+             "subscribed_event_ids": ["Match"]}
+        ])
+    engine.dispose()
+    return path
+
+
+@pytest.mark.unit
+class TestAsyncSessionRunSync:
+    """Sync service functions run unchanged on async sessions."""
+
+    async def test_service_functions_via_run_sync(self, database_path):
+        engine = create_async_db_engine(f"sqlite+aiosqlite:///{database_path}")
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        try:
+            async with sessions() as db:
+                filters = await db.run_sync(get_filters, domain_key="exter", user_id=1)
+                filter_obj = await db.run_sync(get_filter_by_uuid, "uuid-1")
+
+            assert sorted(f.link_uuid for f in filters) == ["uuid-0", "uuid-1", "uuid-2"]
+            assert filter_obj.name == "Filter 1"
+        finally:
+            await engine.dispose()
+
+    async def test_concurrent_sessions(self, database_path):
+        engine = create_async_db_engine(f"sqlite+aiosqlite:///{database_path}")
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def lookup(link_uuid):
+            async with sessions() as db:
+                return await db.run_sync(get_filter_by_uuid, link_uuid)
+
+        try:
+            results = await asyncio.gather(*(lookup(f"uuid-{i % 3}") for i in range(12)))
+            assert [f.link_uuid for f in results] == [f"uuid-{i % 3}" for i in range(12)]
+        finally:
+            await engine.dispose()
+
+
+@pytest.fixture
+async def async_client(database_path):
+    """Client for the async read routers on a real aiosqlite AsyncSession."""
+    from app.routers import calendars, domain_events, domain_filters, filters, ical_export
+
+    engine = create_async_db_engine(f"sqlite+aiosqlite:///{database_path}")
+    sessions = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    opened = []
+
+    async def override_get_async_db():
+        async with sessions() as db:
+            opened.append(db)
+            yield db
+
+    app = FastAPI()
+    app.include_router(calendars.router, prefix="/api/calendars")
+    app.include_router(filters.router, prefix="/api/filters")
+    app.include_router(domain_events.router, prefix="/api/domains")
+    app.include_router(domain_filters.router, prefix="/api/domains")
+    app.include_router(ical_export.router, prefix="/ical")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {create_jwt_token(1)}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        client.opened_sessions = opened
+        yield client
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestAsyncEndpoints:
+    """Endpoints on get_async_db served by a real AsyncSession."""
+
+    async def test_domain_events_share_one_session(self, async_client):
+        response = await async_client.get("/api/domains/exter/events", params={"force_refresh": True})
+
+        assert response.status_code == 200
+        assert response.json()["groups"] == []
+        # Domain lookup and endpoint use the same session
+        assert len(async_client.opened_sessions) == 1
+
+    async def test_unknown_domain_is_404(self, async_client):
+        response = await async_client.get("/api/domains/missing/events")
+
+        assert response.status_code == 404
+        assert len(async_client.opened_sessions) == 1
+
+    async def test_domain_filters(self, async_client):
+        response = await async_client.get("/api/domains/exter/filters")
+
+        assert response.status_code == 200
+        assert sorted(f["link_uuid"] for f in response.json()) == ["uuid-0", "uuid-1", "uuid-2"]
+        assert len(async_client.opened_sessions) == 1
+
+    async def test_user_filters(self, async_client):
+        response = await async_client.get("/api/filters")
+
+        assert response.status_code == 200
+        assert sorted(f["link_uuid"] for f in response.json()) == ["uuid-0", "uuid-1", "uuid-2", "uuid-calendar"]
+
+    async def test_calendar_events(self, async_client):
+        response = await async_client.get("/api/calendars/1/events")
+
+        assert response.status_code == 200
+        assert [event["uid"] for event in response.json()["events"]] == ["match-1"]
+
+    async def test_filtered_calendar_export(self, async_client):
+        response = await async_client.get("/ical/uuid-calendar.ics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        assert "SUMMARY:Match" in response.text
+
+        cached = await async_client.get("/ical/uuid-calendar.ics", headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
@@ -0,0 +1,113 @@
+"""
+Unit tests for bulk inserts in the SQL sync path.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, bulk_insert, bulk_insert_returning_ids
+from app.models.calendar import Calendar, Event, RecurringEventGroup
+from app.models.domain import Domain
+from app.services.calendar_service import _replace_calendar_events
+from app.services.domain_config_service import import_domain_configuration
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+def _events(count: int):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    return [
+        {
+            "title": f"Event {i % 5}",
+            "start_time": start + timedelta(hours=i),
+            "end_time": start + timedelta(hours=i + 1),
+            "description": "Training",
+            "location": None,
+            "uid": f"event-{i}",
+            "raw_ical": f"BEGIN:VEVENT\nUID:event-{i}\nEND:VEVENT",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestBulkInsert:
+    """Test batched multi-row inserts."""
+
+    def test_inserts_in_batches_with_defaults(self, engine, db):
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        rows = [{"recurring_event_title": f"Title {i}", "group_id": 1, "domain_key": "test"} for i in range(10)]
+        assert bulk_insert(db, RecurringEventGroup, rows, batch_size=4) == 10
+        db.commit()
+
+        inserts = [statement for statement in statements if statement.startswith("INSERT")]
+        assert len(inserts) == 3  # Multi-row INSERTs, not one per row
+        stored = db.query(RecurringEventGroup).all()
+        assert len(stored) == 10
+        assert all(assignment.created_at is not None for assignment in stored)
+
+    def test_no_rows(self, db):
+        assert bulk_insert(db, Event, []) == 0
+
+    def test_returning_ids_in_row_order(self, db):
+        calendar = Calendar(name="Club", source_url="https://example.com/club.ics", type="user")
+        db.add(calendar)
+        db.commit()
+        rows = [
+            {"calendar_id": calendar.id, "title": f"Event {i}", "uid": f"event-{i}",
+             "start_time": datetime(2030, 1, 1) + timedelta(days=i)}
+            for i in range(7)
+        ]
+
+        ids = bulk_insert_returning_ids(db, Event, rows, batch_size=3)
+        db.commit()
+
+        assert [db.get(Event, event_id).uid for event_id in ids] == [row["uid"] for row in rows]
+
+    def test_replace_calendar_events(self, db):
+        calendar = Calendar(name="Club", source_url="https://example.com/club.ics", type="user")
+        db.add(calendar)
+        db.commit()
+
+        _replace_calendar_events(db, calendar, _events(25))
+        count = _replace_calendar_events(db, calendar, _events(12))
+
+        stored = db.query(Event).filter(Event.calendar_id == calendar.id).order_by(Event.start_time).all()
+        assert count == len(stored) == 12
+        assert stored[3].uid == "event-3"
+        assert stored[3].other_ical_fields == {"raw_ical": "BEGIN:VEVENT\nUID:event-3\nEND:VEVENT"}
+        assert calendar.last_fetched is not None
+
+    def test_import_domain_configuration_assignments(self, db):
+        db.add(Domain(domain_key="club", name="Club", calendar_url="https://example.com/club.ics"))
+        db.commit()
+        config = {
+            "domain": {"key": "club"},
+            "groups": [{"id": "football", "name": "Football"}, {"id": "swimming", "name": "Swimming"}],
+            "assignments": {"football": ["Training U10", "Match"], "swimming": ["Pool session"]},
+            "rules": [],
+        }
+
+        success, message = import_domain_configuration(db, "club", config)
+
+        assert success, message
+        stored = {(a.recurring_event_title, a.group.name) for a in db.query(RecurringEventGroup).all()}
+        assert stored == {("Training U10", "Football"), ("Match", "Football"), ("Pool session", "Swimming")}
@@ -18,7 +18,10 @@ from app.data.cache import (
     is_cache_stale,
     extract_cache_statistics,
     validate_cached_domain_events,
-    get_cache_keys_for_domain
+    get_cache_keys_for_domain,
+    generate_filter_export_cache_key,
+    create_filter_export_cache_entry,
+    validate_cached_filter_export
 )
 
 
@@ -484,4 +487,29 @@ class TestCacheStatistics:
         result = extract_cache_statistics(cached_data)
         
         assert result["total_groups"] == 1
-        assert result["total_events"] == 2  # Only from ungrouped events
\ No newline at end of file
+        assert result["total_events"] == 2  # Only from ungrouped events
+
+
+@pytest.mark.unit
+class TestFilterExportCache:
+    """Test filter export cache entries."""
+
+    def test_generate_filter_export_cache_key(self):
+        """Test generating filter export cache key."""
+        assert generate_filter_export_cache_key("abc-123") == "filter_export:abc-123"
+
+    def test_create_and_validate_filter_export_entry(self):
+        """Test created entries pass validation and keep export headers."""
+        last_modified = datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+        entry = create_filter_export_cache_entry("BEGIN:VCALENDAR", '"etag"', last_modified)
+
+        assert entry["content"] == "BEGIN:VCALENDAR"
+        assert entry["etag"] == '"etag"'
+        assert datetime.fromisoformat(entry["last_modified"]) == last_modified
+        assert validate_cached_filter_export(entry)
+
+    def test_validate_filter_export_rejects_incomplete_entry(self):
+        """Test entries missing content are rejected."""
+        assert not validate_cached_filter_export({"etag": '"etag"', "last_modified": "2025-10-01"})
+        assert not validate_cached_filter_export(None)
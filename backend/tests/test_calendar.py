@@ -19,6 +19,9 @@ from app.data.calendar import (
     create_filter_data,
     apply_filter_to_events,
     transform_events_for_export,
+    render_vevent_fragments,
+    assemble_export_from_fragments,
+    generate_export_etag,
     validate_filter_data,
     validate_calendar_data
 )
@@ -791,4 +794,38 @@ class TestApplyFilterEdgeCases:
 
         # Should only match exact "Meeting" title
         assert len(result) == 1
-        assert result[0]["id"] == 1
\ No newline at end of file
+        assert result[0]["id"] == 1
+
+
+@pytest.mark.unit
+class TestExportFragments:
+    """Test shared VEVENT fragment rendering for batch exports."""
+
+    def test_assembled_export_matches_transform_layout(self):
+        """Fragments assembled per filter produce the same calendar as direct export."""
+        dtstamp = datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+        events = [
+            {"uid": "a", "title": "A", "start_time": datetime(2025, 10, 2, 9, 0, tzinfo=timezone.utc)},
+            {"uid": "b", "title": "B", "start_time": datetime(2025, 10, 3, 9, 0, tzinfo=timezone.utc)}
+        ]
+
+        fragments = render_vevent_fragments(events, dtstamp)
+        assembled = assemble_export_from_fragments(fragments, "My Filter")
+        direct = transform_events_for_export(events, "My Filter")
+
+        assert len(fragments) == 2
+        assert "DTSTAMP:20251001T120000Z" in fragments[0]
+        # Only DTSTAMP/LAST-MODIFIED differ from a direct export (rendered at "now")
+        strip = lambda text: [l for l in text.split("\n") if not l.startswith(("DTSTAMP", "LAST-MODIFIED"))]
+        assert strip(assembled) == strip(direct)
+
+    def test_fixed_dtstamp_gives_stable_etag(self):
+        """Same events and dtstamp always produce the same ETag."""
+        dtstamp = datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+        events = [{"uid": "a", "title": "A", "start_time": datetime(2025, 10, 2, 9, 0, tzinfo=timezone.utc)}]
+
+        first = assemble_export_from_fragments(render_vevent_fragments(events, dtstamp), "F")
+        second = assemble_export_from_fragments(render_vevent_fragments(events, dtstamp), "F")
+
+        assert generate_export_etag(first) == generate_export_etag(second)
+        assert generate_export_etag(first).startswith('"')
@@ -0,0 +1,111 @@
+"""
+Unit tests for database pool strategies and pool metrics.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.core import database, db_pool
+from app.core.database import create_db_engine
+from app.core.db_pool import pool_options, resolve_pool_strategy, instrument_engine
+
+POSTGRES_URL = "postgresql://user:secret@db:5432/filter_ical"
+
+
+@pytest.mark.unit
+class TestPoolOptions:
+    """Test engine options per strategy."""
+
+    def test_auto_resolves_by_environment(self):
+        with patch.object(db_pool.settings, "db_pool_strategy", "auto"), \
+             patch.object(db_pool.settings, "is_lambda", True):
+            assert resolve_pool_strategy() == "lambda"
+        with patch.object(db_pool.settings, "db_pool_strategy", "auto"), \
+             patch.object(db_pool.settings, "is_lambda", False):
+            assert resolve_pool_strategy() == "server"
+
+    def test_unknown_strategy_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_pool_strategy("huge")
+
+    def test_lambda_pool_is_small_and_recycled(self):
+        options = pool_options(POSTGRES_URL, "lambda")
+
+        assert (options["pool_size"], options["max_overflow"]) == (1, 1)
+        assert options["pool_pre_ping"] is True
+        assert options["pool_recycle"] == db_pool.settings.db_lambda_pool_recycle_seconds
+
+    def test_server_pool_uses_configured_size(self):
+        with patch.object(db_pool.settings, "db_pool_size", 8):
+            options = pool_options(POSTGRES_URL, "server")
+
+        assert options["pool_size"] == 8
+        assert options["pool_pre_ping"] is True
+
+    def test_external_pooler_disables_app_pooling_and_statement_caches(self):
+        assert pool_options(POSTGRES_URL, "external") == {"poolclass": NullPool}
+        async_options = pool_options("postgresql+asyncpg://u:p@pgbouncer:6432/app", "external")
+        assert async_options["connect_args"]["statement_cache_size"] == 0
+
+    def test_sqlite_keeps_defaults(self):
+        assert pool_options("sqlite:///./data/app.db", "lambda") == {}
+
+    def test_engine_created_with_strategy(self):
+        with patch.object(db_pool.settings, "db_pool_strategy", "lambda"), \
+             patch.dict(database._pool_metrics):
+            engine = create_db_engine(POSTGRES_URL)
+
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 1
+        engine.dispose()
+
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Test checkout latency and saturation tracking."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        options = {"pool_size": 2, "max_overflow": 0, "pool_timeout": 0.05}
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, **options)
+        metrics = instrument_engine(engine, POSTGRES_URL, options, "server")
+        yield engine, metrics
+        engine.dispose()
+
+    def test_tracks_in_use_and_saturation(self, engine):
+        engine, metrics = engine
+
+        first = engine.connect()
+        second = engine.connect()
+        busy = metrics.snapshot()
+        first.close()
+        second.close()
+        idle = metrics.snapshot()
+
+        assert (busy["in_use"], busy["saturation"]) == (2, 1.0)
+        assert (idle["in_use"], idle["peak_in_use"], idle["checkouts"]) == (0, 2, 2)
+        assert idle["checkout_ms"]["max"] >= idle["checkout_ms"]["p50"] >= 0
+
+    def test_counts_checkout_timeouts(self, engine):
+        engine, metrics = engine
+        held = [engine.connect(), engine.connect()]
+
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+        for connection in held:
+            connection.close()
+        assert metrics.snapshot()["timeouts"] == 1
+
+    def test_metrics_survive_dispose(self, engine):
+        engine, metrics = engine
+        engine.dispose()
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert metrics.snapshot()["checkouts"] == 1
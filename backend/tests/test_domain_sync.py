@@ -0,0 +1,109 @@
+"""
+Unit tests for the fused domain sync pipeline.
+
+Tests that the events written by a sync are carried in memory through rule
+application, cache warm-up and export precompute without reading the event
+table back, and that the results match those built from the database.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.calendar import AssignmentRule, Filter, Group, RecurringEventGroup
+from app.models.domain import Domain
+from app.services import calendar_service, cache_service, domain_sync_service, export_service
+from app.services.domain_service import build_domain_events_response_data
+
+FEED = "\r\n".join(
+    ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Test//Test//EN"]
+    + [
+        line
+        for index, (title, start) in enumerate([
+            ("Training", "20300107T180000Z"),
+            ("Training", "20300114T180000Z"),
+            ("Match", "20300110T150000Z"),
+        ])
+        for line in [
+            "BEGIN:VEVENT", f"UID:event-{index}", f"SUMMARY:{title}", f"DTSTART:{start}",
+            f"DTEND:{start[:9]}200000Z", "END:VEVENT",
+        ]
+    ]
+    + ["END:VCALENDAR"]
+)
+
+
+@pytest.fixture
+def domain_db(tmp_path):
+    """A domain with a rule and a filter in a SQLite file; event SELECTs recorded."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'domain_sync.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    domain = Domain(domain_key="club", name="Club", calendar_url="https://example.com/club.ics")
+    db.add(domain)
+    db.commit()
+    group = Group(domain_id=domain.id, domain_key="club", name="Trainings")
+    db.add(group)
+    db.commit()
+    db.add_all([
+        AssignmentRule(domain_id=domain.id, domain_key="club", rule_type="title_contains",
+                       rule_value="Training", target_group_id=group.id),
+        Filter(name="Trainings only", domain_key="club", subscribed_group_ids=[group.id]),
+    ])
+    db.commit()
+
+    event_reads = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM events" in statement:
+            event_reads.append(statement)
+
+    yield db, event_reads
+    db.close()
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestFusedDomainSync:
+    """Test one in-memory event set feeds rules, cache and exports."""
+
+    async def test_processing_does_not_read_events_back(self, domain_db):
+        db, event_reads = domain_db
+        exports = {}
+
+        with patch.object(calendar_service, "fetch_ical_content", new_callable=AsyncMock) as fetch, \
+             patch.object(cache_service, "build_domain_events_response_data",
+                          wraps=build_domain_events_response_data) as build, \
+             patch.object(export_service, "cache_filter_export",
+                          side_effect=lambda uuid, content, etag, modified: exports.__setitem__(uuid, content)):
+            fetch.return_value = (True, FEED, "")
+            result = await domain_sync_service.sync_domain(db, "club")
+
+            assert result == {"synced": True, "cached": True, "errors": []}
+            assert event_reads == []
+
+            # Same results as from events read back from the database
+            fused_response = build.call_args
+            fused_exports = dict(exports)
+            export_service.precompute_domain_filter_exports(db, "club")
+
+        assert [a.recurring_event_title for a in db.query(RecurringEventGroup).all()] == ["Training"]
+        fused_events = fused_response.args[2]
+
+        def grouped_events(response):  # Groups carry build timestamps
+            return [(group["name"], group["recurring_events"]) for group in response["groups"]]
+
+        assert grouped_events(build_domain_events_response_data(db, "club")) == \
+            grouped_events(build_domain_events_response_data(db, "club", fused_events))
+        assert fused_events[0]["start"] == "2030-01-07T18:00:00"
+
+        def strip_dtstamp(content):
+            return [line for line in content.splitlines() if not line.startswith("DTSTAMP")]
+
+        assert {uuid: strip_dtstamp(content) for uuid, content in fused_exports.items()} == \
+            {uuid: strip_dtstamp(content) for uuid, content in exports.items()}
+        assert sum("SUMMARY:Training" in line for line in next(iter(exports.values())).splitlines()) == 2
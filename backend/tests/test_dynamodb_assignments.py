@@ -0,0 +1,137 @@
+"""
+Unit tests for DynamoDB recurring event assignment items.
+
+Runs against an in-memory moto table with the deployed index layout.
+"""
+
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("moto")
+
+from app.db import repository
+from app.db.dynamodb import get_table
+from app.db.migrate_assignments import migrate_recurring_assignments
+from app.db.models import Domain
+from app.db.repository import Repository
+from benchmarks.dynamodb_table import mock_table
+
+
+@pytest.fixture
+def repo():
+    with mock_table():
+        repo = Repository()
+        repo.save_domain(Domain(domain_key="exter", name="Exter", calendar_url="https://example.com/a.ics"))
+        repo.add_group("exter", "Sports")
+        repo.add_group("exter", "Music")
+        yield repo
+
+
+def _domain_item():
+    return get_table().get_item(Key={"PK": "DOMAIN#exter", "SK": "METADATA"})["Item"]
+
+
+@pytest.mark.unit
+class TestAssignmentItems:
+    """Assignments are separate items, written and read per title or group."""
+
+    def test_assign_and_read_back(self, repo):
+        repo.assign_event_to_group("exter", "Match", 1)
+        repo.assign_events("exter", {"Concert": 2, "Training": 1})
+
+        assert repo.get_assignments("exter") == {"Match": 1, "Concert": 2, "Training": 1}
+        assert sorted(repo.get_group_assignment_titles("exter", 1)) == ["Match", "Training"]
+        assert "recurring_assignments" not in _domain_item()
+
+    def test_reassign_moves_title_between_groups(self, repo):
+        repo.assign_event_to_group("exter", "Match", 1)
+        repo.assign_event_to_group("exter", "Match", 2)
+
+        assert repo.get_group_assignment_titles("exter", 1) == []
+        assert repo.get_group_assignment_titles("exter", 2) == ["Match"]
+
+    def test_unassign(self, repo):
+        repo.assign_events("exter", {"Match": 1, "Concert": 2, "Training": 1})
+
+        repo.unassign_event("exter", "Match")
+        repo.unassign_events("exter", ["Concert", "Unknown"])
+
+        assert repo.get_assignments("exter") == {"Training": 1}
+
+    def test_assign_to_missing_domain(self, repo):
+        assert repo.assign_event_to_group("missing", "Match", 1) is False
+        assert repo.get_assignments("missing") == {}
+
+    def test_delete_group_removes_its_assignments(self, repo):
+        repo.assign_events("exter", {"Match": 1, "Concert": 2})
+
+        repo.delete_group("exter", 1)
+
+        assert repo.get_assignments("exter") == {"Concert": 2}
+
+    def test_delete_domain_removes_assignments(self, repo):
+        repo.assign_events("exter", {"Match": 1})
+
+        repo.delete_domain("exter")
+
+        assert repo.get_assignments("exter") == {}
+
+
+@pytest.mark.unit
+class TestMigrateRecurringAssignments:
+    """Embedded maps are split into assignment items."""
+
+    def test_migrates_embedded_map(self, repo):
+        get_table().put_item(Item={**_domain_item(), "recurring_assignments": {"Match": 1, "Concert": 2}})
+
+        assert migrate_recurring_assignments(dry_run=True) == {"domains": 1, "assignments": 2}
+        assert "recurring_assignments" in _domain_item()
+
+        assert migrate_recurring_assignments() == {"domains": 1, "assignments": 2}
+
+        assert repo.get_assignments("exter") == {"Match": 1, "Concert": 2}
+        assert "recurring_assignments" not in _domain_item()
+        assert _domain_item()["name"] == "Exter"
+        assert migrate_recurring_assignments() == {"domains": 0, "assignments": 0}
+
+    def test_embedded_map_is_read_before_migration(self, repo):
+        repo.assign_event_to_group("exter", "Match", 2)
+        get_table().put_item(Item={**_domain_item(), "recurring_assignments": {"Match": 1, "Concert": 2}})
+
+        assert repo.get_assignments("exter") == {"Match": 2, "Concert": 2}
+        assert sorted(repo.get_group_assignment_titles("exter", 2)) == ["Concert", "Match"]
+
+        migrate_recurring_assignments()
+
+        # The assignment item is newer than the embedded entry
+        assert repo.get_assignments("exter") == {"Match": 2, "Concert": 2}
+
+    def test_unassign_embedded_title_before_migration(self, repo):
+        get_table().put_item(Item={**_domain_item(), "recurring_assignments": {"Match": 1, "Concert": 2}})
+
+        repo.unassign_event("exter", "Match")
+        repo.delete_group("exter", 2)
+
+        assert repo.get_assignments("exter") == {}
+        assert "recurring_assignments" not in _domain_item()
+
+    def test_concurrent_domain_edit_is_kept(self, repo):
+        get_table().put_item(Item={**_domain_item(), "recurring_assignments": {"Match": 1}})
+        get_item = repository.get_item
+        edited = []
+
+        def get_item_then_edit(*args, **kwargs):
+            item = get_item(*args, **kwargs)
+            if not edited:
+                # Domain renamed between the migration's read and its write
+                edited.append(True)
+                repo.update_domain_fields("exter", {"name": "Renamed"})
+            return item
+
+        with patch.object(repository, "get_item", side_effect=get_item_then_edit):
+            assert migrate_recurring_assignments() == {"domains": 1, "assignments": 1}
+
+        assert edited == [True]
+        assert _domain_item()["name"] == "Renamed"
+        assert "recurring_assignments" not in _domain_item()
+        assert repo.get_assignments("exter") == {"Match": 1}
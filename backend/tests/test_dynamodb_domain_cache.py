@@ -0,0 +1,83 @@
+"""
+Unit tests for the container-local DynamoDB domain cache.
+
+Runs against an in-memory moto table and counts GetItem calls.
+"""
+
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("moto")
+
+from app.db import repository as repository_module
+from app.db.dynamodb import get_table
+from app.db.models import Domain
+from app.db.repository import Repository, DomainCache
+from benchmarks.dynamodb_table import mock_table
+
+
+@pytest.fixture
+def repo():
+    with mock_table(), patch.object(repository_module, "_domain_cache", DomainCache(ttl_seconds=30)):
+        repo = Repository()
+        repo.save_domain(Domain(domain_key="exter", name="Exter", calendar_url="https://example.com/a.ics"))
+        yield repo
+
+
+def _count_reads(repo, func):
+    with patch.object(repository_module, "get_item", wraps=repository_module.get_item) as spy:
+        result = func()
+    return result, spy.call_args_list
+
+
+@pytest.mark.unit
+class TestDomainCache:
+    """Domain documents are served from memory and invalidated on writes."""
+
+    def test_fresh_hits_do_not_read_dynamodb(self, repo):
+        domain, calls = _count_reads(repo, lambda: repo.get_domain("exter"))
+
+        assert domain.name == "Exter"
+        assert calls == []
+
+    def test_returned_domains_are_copies(self, repo):
+        repo.get_domain("exter").name = "Changed"
+
+        assert repo.get_domain("exter").name == "Exter"
+
+    def test_mutators_write_through(self, repo):
+        group = repo.add_group("exter", "Sports")
+        repo.add_rule("exter", group.id, "title_contains", "Match")
+
+        domain, calls = _count_reads(repo, lambda: repo.get_domain("exter"))
+
+        assert calls == []
+        assert [g.name for g in domain.groups] == ["Sports"]
+        assert [r.value for r in domain.groups[0].rules] == ["Match"]
+
+    def test_expired_entry_revalidates_with_projected_read(self, repo):
+        repository_module._domain_cache.ttl_seconds = 0.0001
+        repo.get_domain("exter", cached=False)
+
+        domain, calls = _count_reads(repo, lambda: repo.get_domain("exter"))
+
+        assert domain.name == "Exter"
+        assert len(calls) == 1
+        assert calls[0].kwargs["projection"] == ["version"]
+
+    def test_expired_entry_refetches_changed_document(self, repo):
+        repository_module._domain_cache.ttl_seconds = 0.0001
+        repo.get_domain("exter", cached=False)
+        # Another container updates the domain
+        item = get_table().get_item(Key={"PK": "DOMAIN#exter", "SK": "METADATA"})["Item"]
+        get_table().put_item(Item={**item, "name": "Renamed", "version": item["version"] + 1})
+
+        domain, calls = _count_reads(repo, lambda: repo.get_domain("exter"))
+
+        assert domain.name == "Renamed"
+        assert len(calls) == 2
+
+    def test_delete_invalidates(self, repo):
+        repo.delete_domain("exter")
+
+        assert repo.get_domain("exter") is None
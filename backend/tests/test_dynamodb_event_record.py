@@ -0,0 +1,56 @@
+"""
+Unit tests for the lightweight EventRecord read view.
+"""
+
+import pytest
+from datetime import datetime
+
+from app.db.models import Event, EventRecord
+
+
+def _event(**overrides):
+    fields = dict(
+        domain_key="exter",
+        uid="u1",
+        start_date="2025-10-10",
+        title="Meeting",
+        start_time=datetime(2025, 10, 10, 10, 0),
+        end_time=datetime(2025, 10, 10, 12, 0),
+        description="Weekly",
+        location="Hall",
+    )
+    fields.update(overrides)
+    return Event(**fields)
+
+
+@pytest.mark.unit
+class TestEventRecord:
+    """EventRecord exposes the same read attributes as Event."""
+
+    @pytest.mark.parametrize("overrides", [{}, {"end_time": None, "description": None, "location": None}])
+    def test_matches_validated_model(self, overrides):
+        item = _event(**overrides).to_dynamo_item()
+
+        event = Event.from_dynamo_item(item)
+        record = EventRecord(item)
+
+        for attr in ("domain_key", "uid", "start_date", "title", "start_time", "end_time", "description", "location"):
+            assert getattr(record, attr) == getattr(event, attr)
+
+    def test_datetimes_are_parsed_lazily(self):
+        record = EventRecord(_event().to_dynamo_item())
+
+        assert record._start_raw == "2025-10-10T10:00:00"
+        assert record.title == "Meeting"
+        assert record.start_time is record.start_time
+
+    def test_projected_attributes_are_sufficient(self):
+        item = _event().to_dynamo_item()
+        projected = {key: item[key] for key in EventRecord.ATTRIBUTES if key in item}
+
+        assert EventRecord(projected).end_time == datetime(2025, 10, 10, 12, 0)
+
+    def test_uid_with_separator_keeps_start_date(self):
+        record = EventRecord(_event(uid="a#b").to_dynamo_item())
+
+        assert record.start_date == "2025-10-10"
@@ -0,0 +1,103 @@
+"""
+Unit tests for the versioned DynamoDB domain events cache.
+
+Runs against an in-memory moto table; Redis is disabled.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+pytest.importorskip("moto")
+
+from app.data.cache import generate_versioned_domain_cache_key
+from app.data.grouping import AUTO_RECURRING_GROUP_ID, AUTO_UNIQUE_GROUP_ID
+from app.db.models import Domain, Event
+from app.db.repository import Repository
+from app.routers_dynamodb import events_cache
+from app.routers_dynamodb.domain_events import get_cached_domain_events, get_cached_title_counts
+from benchmarks.dynamodb_table import mock_table
+
+
+def _event(uid, title):
+    return Event(domain_key="exter", uid=uid, start_date="2025-10-10", title=title,
+                 start_time=datetime(2025, 10, 10, 10, 0))
+
+
+@pytest.fixture
+def repo():
+    events_cache.clear_local_cache()
+    with mock_table(), \
+         patch.object(events_cache, "get_cache", return_value=None), \
+         patch.object(events_cache, "set_cache", return_value=False):
+        repo = Repository()
+        repo.save_domain(Domain(domain_key="exter", name="Exter", calendar_url="https://example.com/a.ics"))
+        repo.add_group("exter", "Sports")
+        repo.sync_events("exter", [_event("u1", "Match"), _event("u2", "Match"), _event("u3", "Concert")])
+        yield repo
+    events_cache.clear_local_cache()
+
+
+def _grouped(repo):
+    return get_cached_domain_events(repo, repo.get_domain("exter"))
+
+
+def _group_titles(response):
+    return {g["id"]: [e["title"] for e in g["recurring_events"]] for g in response["groups"]}
+
+
+@pytest.mark.unit
+class TestVersionedDomainEventsCache:
+    """Event items are read once per domain generation."""
+
+    def test_repeat_requests_do_not_read_events(self, repo):
+        first = _grouped(repo)
+
+        with patch.object(repo, "get_events", wraps=repo.get_events) as get_events:
+            second = _grouped(repo)
+
+        get_events.assert_not_called()
+        assert second == first
+
+    def test_assignment_change_rebuilds(self, repo):
+        _grouped(repo)
+
+        repo.assign_event_to_group("exter", "Match", 1)
+
+        assert _group_titles(_grouped(repo))[1] == ["Match"]
+
+    def test_sync_change_rebuilds_and_unchanged_sync_does_not(self, repo):
+        _grouped(repo)
+        generation = repo.get_domain_generation("exter")
+
+        repo.sync_events("exter", [_event("u1", "Match"), _event("u2", "Match"), _event("u3", "Concert")])
+        assert repo.get_domain_generation("exter") == generation
+
+        repo.sync_events("exter", [_event("u1", "Match")])
+        assert repo.get_domain_generation("exter")["sync_generation"] == generation["sync_generation"] + 1
+        assert get_cached_title_counts(repo, "exter") == {"Match": 1}
+
+    def test_auto_groups_use_shared_ids(self, repo):
+        # Same ids as the SQL backend, so group_id selection works on both
+        assert _group_titles(_grouped(repo)) == {AUTO_RECURRING_GROUP_ID: ["Match"], AUTO_UNIQUE_GROUP_ID: ["Concert"]}
+
+    def test_title_counts_survive_assignment_changes(self, repo):
+        assert get_cached_title_counts(repo, "exter") == {"Match": 2, "Concert": 1}
+
+        repo.assign_event_to_group("exter", "Match", 1)
+
+        with patch.object(repo, "get_event_titles") as get_event_titles:
+            assert get_cached_title_counts(repo, "exter") == {"Match": 2, "Concert": 1}
+        get_event_titles.assert_not_called()
+
+
+@pytest.mark.unit
+class TestVersionedCacheKey:
+    """Keys embed only the counters the data depends on."""
+
+    def test_key_uses_selected_counters(self):
+        generation = {"version": 3, "sync_generation": 7, "assignment_version": 2}
+
+        key = generate_versioned_domain_cache_key("title_counts", "exter", generation, ["sync_generation"])
+
+        assert key == "ddb_title_counts:exter:sync_generation=7"
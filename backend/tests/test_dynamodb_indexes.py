@@ -0,0 +1,94 @@
+"""
+Unit tests for DynamoDB sparse index lookups and the index backfill.
+
+Runs against an in-memory moto table with the deployed index layout.
+"""
+
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("moto")
+
+from app.db import repository as repository_module
+from app.db.backfill_indexes import backfill_index_attributes
+from app.db.dynamodb import get_table
+from app.db.models import Admin, Domain, Filter
+from app.db.repository import Repository
+from benchmarks.dynamodb_table import mock_table
+
+
+@pytest.fixture
+def repo():
+    with mock_table():
+        yield Repository()
+
+
+def _seed(repo):
+    repo.save_domain(Domain(domain_key="exter", name="Exter", calendar_url="https://example.com/a.ics"))
+    repo.save_domain(Domain(domain_key="old", name="Old", calendar_url="https://example.com/b.ics", status="inactive"))
+    repo.save_filter(Filter(link_uuid="f1", domain_key="exter"))
+    repo.save_filter(Filter(link_uuid="f2", domain_key="old"))
+    repo.save_admin(Admin(email="admin@example.com", password_hash="x", reset_token="token-1"))
+    repo.save_admin(Admin(email="other@example.com", password_hash="x"))
+    repo.create_domain_request(
+        requester_email="someone@example.com", requested_domain_key="new",
+        calendar_url="https://example.com/c.ics", description="please"
+    )
+
+
+@pytest.mark.unit
+class TestIndexedLookups:
+    """Indexed lookups return the same results as the scan fallback."""
+
+    @pytest.mark.parametrize("indexed", [True, False])
+    def test_lookups(self, repo, indexed):
+        _seed(repo)
+
+        with patch.object(repository_module, "USE_INDEXED_LOOKUPS", indexed):
+            assert sorted(d.domain_key for d in repo.list_domains()) == ["exter", "old"]
+            assert [d.domain_key for d in repo.list_domains(status="active")] == ["exter"]
+            assert [f.link_uuid for f in repo.list_filters_for_domain("exter")] == ["f1"]
+            assert repo.get_admin_by_reset_token("token-1").email == "admin@example.com"
+            assert repo.get_admin_by_reset_token("missing") is None
+            assert [r.requested_domain_key for r in repo.list_domain_requests(status="pending")] == ["new"]
+            assert repo.list_domain_requests(status="approved") == []
+
+    def test_admin_without_token_is_not_indexed(self, repo):
+        _seed(repo)
+
+        item = get_table().get_item(Key={"PK": "ADMIN#other@example.com", "SK": "METADATA"})["Item"]
+
+        assert "reset_token" not in item
+
+
+@pytest.mark.unit
+class TestBackfillIndexAttributes:
+    """Legacy items gain their index attributes."""
+
+    def test_backfill_rewrites_legacy_items(self, repo):
+        _seed(repo)
+        table = get_table()
+        # Simulate items written before the indexes existed
+        domain = table.get_item(Key={"PK": "DOMAIN#exter", "SK": "METADATA"})["Item"]
+        for key in ("entity_type", "entity_sort"):
+            domain.pop(key)
+        table.put_item(Item=domain)
+        filter_item = table.get_item(Key={"PK": "FILTER#f1", "SK": "METADATA"})["Item"]
+        filter_item.pop("filter_domain_key")
+        table.put_item(Item=filter_item)
+
+        assert repo.list_domains(status="active") == []
+        assert repo.list_filters_for_domain("exter") == []
+
+        dry_run = backfill_index_attributes(dry_run=True)
+        assert dry_run["DOMAIN#"]["rewritten"] == 1
+        assert repo.list_domains(status="active") == []
+
+        counts = backfill_index_attributes()
+
+        assert counts["DOMAIN#"] == {"scanned": 2, "rewritten": 1}
+        assert counts["FILTER#"] == {"scanned": 2, "rewritten": 1}
+        assert counts["ADMIN#"]["rewritten"] == 0
+        assert [d.domain_key for d in repo.list_domains(status="active")] == ["exter"]
+        assert [f.link_uuid for f in repo.list_filters_for_domain("exter")] == ["f1"]
+        assert backfill_index_attributes()["DOMAIN#"]["rewritten"] == 0
@@ -0,0 +1,135 @@
+"""
+Unit tests for the SQL -> DynamoDB migration.
+
+Copies an in-memory SQLite database into an in-memory moto table.
+"""
+
+import pytest
+
+pytest.importorskip("moto")
+
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.db import migrate_sql
+from app.db.migrate_sql import MigrationCheckpoint, migrate_sql_to_dynamodb
+from app.db.repository import Repository
+from app.models.calendar import (
+    AssignmentRule, Calendar, Event, Filter, Group, RecurringEventGroup
+)
+from app.models.domain import Domain
+from benchmarks.dynamodb_table import mock_table
+
+
+@pytest.fixture
+def sql_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = Session(engine)
+    calendar = Calendar(name="Exter", source_url="https://example.com/a.ics", type="domain")
+    db.add(calendar)
+    db.flush()
+    domain = Domain(domain_key="exter", name="Exter", calendar_url="https://example.com/a.ics",
+                    calendar_id=calendar.id, admin_password_hash="hash")
+    db.add(domain)
+    db.flush()
+    sports = Group(domain_id=domain.id, domain_key="exter", name="Sports")
+    db.add(sports)
+    db.flush()
+    db.add(AssignmentRule(domain_id=domain.id, rule_type="title_contains", rule_value="Match",
+                          target_group_id=sports.id))
+    compound = AssignmentRule(domain_id=domain.id, is_compound=True, operator="OR", target_group_id=sports.id)
+    db.add(compound)
+    db.flush()
+    db.add(AssignmentRule(domain_id=domain.id, rule_type="title_contains", rule_value="Run",
+                          parent_rule_id=compound.id, target_group_id=sports.id))
+    db.add(RecurringEventGroup(domain_id=domain.id, recurring_event_title="Training", group_id=sports.id))
+    db.add(Filter(name="Sports only", domain_id=domain.id, link_uuid="uuid-1",
+                  subscribed_group_ids=[sports.id], unselected_event_ids=["Training"]))
+    db.add(Filter(name="Personal", calendar_id=calendar.id, link_uuid="uuid-2"))
+    db.add_all([
+        Event(calendar_id=calendar.id, uid=f"uid-{i}", title=f"Match {i % 3}",
+              start_time=datetime(2025, 10, 1 + i % 28, 18, 0), other_ical_fields={"status": "CONFIRMED"})
+        for i in range(45)
+    ])
+    db.commit()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestSqlMigration:
+    """Domains, assignments, filters and events are copied in resumable batches."""
+
+    def test_full_copy(self, sql_db):
+        with mock_table():
+            copied = migrate_sql_to_dynamodb(sql_db, batch_size=10, report=lambda line: None)
+            repo = Repository()
+
+            domain = repo.get_domain("exter", cached=False)
+            events = repo.get_events("exter")
+            assignments = repo.get_assignments("exter")
+            domain_filter = repo.get_filter("uuid-1")
+
+        assert copied == {"domains": 1, "assignments": 1, "filters": 1, "events": 45}
+        assert domain.admin_password_hash == "hash"
+        rules = domain.groups[0].rules
+        assert [rule.value for rule in rules if not rule.is_compound] == ["Match"]
+        compound = next(rule for rule in rules if rule.is_compound)
+        assert compound.operator == "OR"
+        assert [condition.value for condition in compound.conditions] == ["Run"]
+        assert assignments == {"Training": domain.groups[0].id}
+        assert domain_filter.subscribed_group_ids == [domain.groups[0].id]
+        assert domain_filter.unselected_event_titles == ["Training"]
+        assert len(events) == 45
+        assert events[0].other_fields == {"status": "CONFIRMED"}
+
+    def test_resumes_after_checkpoint(self, sql_db, tmp_path):
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        written = []
+        real_write = migrate_sql.parallel_batch_write
+
+        def failing_write(items):
+            if len(written) == 2:
+                raise RuntimeError("throttled")
+            written.append(len(items))
+            real_write(items=items)
+
+        with mock_table():
+            migrate_sql_to_dynamodb(sql_db, MigrationCheckpoint(checkpoint_path), batch_size=10,
+                                    report=lambda line: None)
+            # Start over for the events stage only, failing after two batches
+            checkpoint = MigrationCheckpoint(checkpoint_path)
+            checkpoint.state["completed"].remove("events")
+            checkpoint.advance("events", 0)
+            with patch.object(migrate_sql, "parallel_batch_write", failing_write), pytest.raises(RuntimeError):
+                migrate_sql_to_dynamodb(sql_db, checkpoint, batch_size=10, max_in_flight=1,
+                                        report=lambda line: None)
+
+            resumed = MigrationCheckpoint(checkpoint_path)
+            assert resumed.last_id("events") == 20
+            copied = migrate_sql_to_dynamodb(sql_db, resumed, batch_size=10, report=lambda line: None)
+
+            assert copied == {"domains": 0, "assignments": 0, "filters": 0, "events": 25}
+            assert len(Repository().get_events("exter")) == 45
+
+    def test_reports_filters_losing_subscriptions(self, sql_db):
+        sql_db.add(Filter(name="Picked events", domain_key="exter", link_uuid="uuid-3",
+                          subscribed_event_ids=["Match 1"]))
+        sql_db.commit()
+        lines = []
+
+        with mock_table():
+            with pytest.raises(migrate_sql.MigrationDataLossError, match="uuid-3"):
+                migrate_sql_to_dynamodb(sql_db, batch_size=10, report=lines.append, strict=True)
+            assert Repository().get_domain("exter", cached=False) is None  # Nothing copied
+
+            copied = migrate_sql_to_dynamodb(sql_db, batch_size=10, report=lines.append)
+
+        assert copied["filters"] == 2
+        assert lines[0] == ("WARNING filters: 1 domain filters lose their subscribed_event_ids "
+                            "(no DynamoDB counterpart): uuid-3")
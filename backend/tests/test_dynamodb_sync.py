@@ -0,0 +1,136 @@
+"""
+Unit tests for DynamoDB differential event sync.
+
+Tests the event diff, BatchWriteItem retries and paginated reads without AWS access.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from app.db.models import Event
+from app.db.repository import diff_event_items
+from app.db.dynamodb import TABLE_NAME, _batch_write_requests, parallel_batch_write, query_by_pk, parallel_scan
+
+
+def _event(uid, title="Meeting", start_date="2025-10-10"):
+    return Event(
+        domain_key="exter",
+        uid=uid,
+        start_date=start_date,
+        title=title,
+        start_time=datetime(2025, 10, 10, 10, 0),
+        created_at=datetime(2025, 10, 1),
+        updated_at=datetime(2025, 10, 1),
+    )
+
+
+@pytest.mark.unit
+class TestDiffEventItems:
+    """Test content-hash based event diffing."""
+
+    def test_unchanged_events_are_not_written(self):
+        existing = [_event("a").to_dynamo_item(), _event("b").to_dynamo_item()]
+
+        puts, deletes, unchanged = diff_event_items(existing, [_event("a"), _event("b")])
+
+        assert puts == []
+        assert deletes == []
+        assert unchanged == 2
+
+    def test_changed_new_and_removed_events(self):
+        existing = [_event("a").to_dynamo_item(), _event("b").to_dynamo_item()]
+        changed = _event("a", title="Renamed")
+        changed.created_at = datetime(2025, 10, 9)
+
+        puts, deletes, unchanged = diff_event_items(existing, [changed, _event("c")])
+
+        assert sorted(item["uid"] for item in puts) == ["a", "c"]
+        assert deletes == [("DOMAIN#exter", "EVENT#2025-10-10#b")]
+        assert unchanged == 0
+        # Changed events keep their original creation time
+        renamed = next(item for item in puts if item["uid"] == "a")
+        assert renamed["created_at"] == datetime(2025, 10, 1).isoformat()
+
+    def test_items_without_stored_hash_are_rewritten(self):
+        item = _event("a").to_dynamo_item()
+        del item["content_hash"]
+
+        puts, deletes, unchanged = diff_event_items([item], [_event("a")])
+
+        assert len(puts) == 1 and "content_hash" in puts[0]
+        assert (deletes, unchanged) == ([], 0)
+
+    def test_duplicate_feed_keys_are_written_once(self):
+        puts, _, _ = diff_event_items([], [_event("a"), _event("a", title="Later")])
+
+        assert len(puts) == 1
+        assert puts[0]["title"] == "Later"
+
+
+@pytest.mark.unit
+class TestBatchWriteRetry:
+    """Test BatchWriteItem retry on UnprocessedItems."""
+
+    def test_retries_unprocessed_items(self):
+        client = Mock()
+        unprocessed = {TABLE_NAME: [{"PutRequest": {"Item": {"PK": "x", "SK": "y"}}}]}
+        client.batch_write_item.side_effect = [{"UnprocessedItems": unprocessed}, {"UnprocessedItems": {}}]
+
+        with patch("app.db.dynamodb.time.sleep"):
+            _batch_write_requests(client, [{"PutRequest": {"Item": {"PK": "x", "SK": "y"}}}])
+
+        assert client.batch_write_item.call_count == 2
+        assert client.batch_write_item.call_args.kwargs["RequestItems"] == unprocessed
+
+    def test_raises_after_retries_exhausted(self):
+        client = Mock()
+        unprocessed = {TABLE_NAME: [{"DeleteRequest": {"Key": {"PK": "x", "SK": "y"}}}]}
+        client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+        with patch("app.db.dynamodb.time.sleep"), pytest.raises(RuntimeError):
+            _batch_write_requests(client, unprocessed[TABLE_NAME])
+
+    def test_parallel_batch_write_chunks_requests(self):
+        client = Mock()
+        client.batch_write_item.return_value = {"UnprocessedItems": {}}
+        items = [{"PK": "DOMAIN#exter", "SK": f"EVENT#2025-10-10#{i}"} for i in range(60)]
+
+        with patch("app.db.dynamodb.get_table") as mock_table:
+            mock_table.return_value.meta.client = client
+            parallel_batch_write(items=items, delete_keys=[("DOMAIN#exter", "EVENT#old")])
+
+        sizes = sorted(len(call.kwargs["RequestItems"][TABLE_NAME])
+                       for call in client.batch_write_item.call_args_list)
+        assert sizes == [11, 25, 25]
+
+
+@pytest.mark.unit
+class TestPaginatedQuery:
+    """Test query pagination and projection."""
+
+    def test_query_by_pk_follows_last_evaluated_key(self):
+        table = Mock()
+        table.query.side_effect = [
+            {"Items": [{"SK": "EVENT#1"}], "LastEvaluatedKey": {"PK": "p", "SK": "EVENT#1"}},
+            {"Items": [{"SK": "EVENT#2"}]},
+        ]
+
+        with patch("app.db.dynamodb.get_table", return_value=table):
+            items = query_by_pk("DOMAIN#exter", "EVENT#", projection=["PK", "SK"])
+
+        assert [item["SK"] for item in items] == ["EVENT#1", "EVENT#2"]
+        second_call = table.query.call_args_list[1].kwargs
+        assert second_call["ExclusiveStartKey"] == {"PK": "p", "SK": "EVENT#1"}
+        assert second_call["ProjectionExpression"] == "#p0, #p1"
+        assert second_call["ExpressionAttributeNames"] == {"#p0": "PK", "#p1": "SK"}
+
+    def test_parallel_scan_reads_every_segment(self):
+        client = Mock()
+        client.scan.side_effect = lambda **kwargs: {"Items": [{"segment": kwargs["Segment"]}]}
+
+        with patch("app.db.dynamodb.get_table") as mock_table:
+            mock_table.return_value.meta.client = client
+            items = parallel_scan(total_segments=3)
+
+        assert sorted(item["segment"] for item in items) == [0, 1, 2]
@@ -0,0 +1,118 @@
+"""
+Unit tests for targeted, version-guarded DynamoDB domain updates.
+
+Runs against an in-memory moto table.
+"""
+
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+
+pytest.importorskip("moto")
+
+from app.db import repository as repository_module
+from app.db.dynamodb import VersionConflictError, get_table, retry_on_conflict
+from app.db.models import Domain
+from app.db.repository import Repository
+from app.routers_dynamodb import admin_domain_configs
+from benchmarks.dynamodb_table import mock_table
+
+
+@pytest.fixture
+def repo():
+    with mock_table():
+        repo = Repository()
+        repo.save_domain(Domain(domain_key="exter", name="Exter", calendar_url="https://example.com/a.ics"))
+        yield repo
+
+
+def _stored_domain():
+    item = get_table().get_item(Key={"PK": "DOMAIN#exter", "SK": "METADATA"})["Item"]
+    return Domain.from_dynamo_item(item)
+
+
+@pytest.mark.unit
+class TestTargetedDomainUpdates:
+    """Group and rule edits touch only their attributes and bump the version."""
+
+    def test_group_and_rule_lifecycle(self, repo):
+        sports = repo.add_group("exter", "Sports")
+        music = repo.add_group("exter", "Music")
+        repo.update_group("exter", music.id, "Concerts")
+        rule = repo.add_rule("exter", music.id, "title_contains", "Concert")
+        repo.add_rule("exter", music.id, "title_contains", "Gig")
+        repo.delete_rule("exter", music.id, rule.id)
+        repo.delete_group("exter", sports.id)
+
+        domain = _stored_domain()
+        assert [(g.id, g.name) for g in domain.groups] == [(music.id, "Concerts")]
+        assert [r.value for r in domain.groups[0].rules] == ["Gig"]
+        assert domain.version == 8
+        assert domain.name == "Exter"
+
+    def test_missing_targets(self, repo):
+        assert repo.update_group("exter", 99, "Nope") is None
+        assert repo.add_rule("exter", 99, "title_contains", "x") is None
+        assert repo.delete_rule("exter", 99, 1) is False
+        assert repo.add_group("missing", "Sports") is None
+        assert _stored_domain().version == 1
+
+    def test_update_domain_fields(self, repo):
+        assert repo.update_domain_fields("exter", {"admin_password_hash": "hash"})
+
+        assert _stored_domain().admin_password_hash == "hash"
+        assert repo.get_domain("exter").admin_password_hash == "hash"
+
+
+@pytest.mark.unit
+class TestVersionConflicts:
+    """Concurrent edits are retried instead of overwriting each other."""
+
+    def test_stale_save_domain_is_rejected(self, repo):
+        stale = repo.get_domain("exter", cached=False)
+        repo.add_group("exter", "Sports")
+
+        stale.name = "Renamed"
+        with pytest.raises(VersionConflictError):
+            repo.save_domain(stale)
+
+        assert [g.name for g in _stored_domain().groups] == ["Sports"]
+
+    def test_concurrent_edit_is_replanned(self, repo):
+        real_update = repository_module.update_item
+        calls = []
+
+        def racing_update(*args, **kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                # Another container adds a group between our read and write
+                real_update("DOMAIN#exter", "METADATA", append={"groups": [{"id": 1, "name": "Sports"}]},
+                            expected_version=1)
+            return real_update(*args, **kwargs)
+
+        with patch.object(repository_module, "update_item", side_effect=racing_update), \
+             patch("app.db.dynamodb.time.sleep"):
+            group = repo.add_group("exter", "Music")
+
+        assert len(calls) == 2
+        assert group.id == 2
+        assert [g.name for g in _stored_domain().groups] == ["Sports", "Music"]
+
+    def test_retry_on_conflict_gives_up(self):
+        def always_conflicts():
+            raise VersionConflictError("conflict")
+
+        with patch("app.db.dynamodb.time.sleep"), pytest.raises(VersionConflictError):
+            retry_on_conflict(always_conflicts, attempts=3)
+
+    async def test_concurrent_domain_creation_is_conflict(self, repo):
+        # Created by another request between the existence check and the write
+        with patch.object(admin_domain_configs, "get_repo", return_value=repo), \
+             patch.object(repo, "get_domain", return_value=None), \
+             patch.object(admin_domain_configs, "load_yaml_config",
+                          return_value={"domain": {"name": "Exter"}}), \
+             pytest.raises(HTTPException) as raised:
+            await admin_domain_configs.seed_domain_from_yaml("exter")
+
+        assert raised.value.status_code == 409
+        assert _stored_domain().name == "Exter"
@@ -0,0 +1,109 @@
+"""
+Unit tests for event projection functions.
+
+Tests pure functions from app.data.event_projection module.
+Keeps event API payloads lean while allowing explicit field selection.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from app.data.event_projection import (
+    DEFAULT_EVENT_FIELDS,
+    parse_event_fields,
+    requires_full_events,
+    project_event,
+    project_domain_events_response
+)
+
+
+def _internal_event():
+    """Event dictionary as built by the domain service."""
+    start = datetime(2025, 10, 10, 10, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 10, 10, 11, 0, tzinfo=timezone.utc)
+    return {
+        "id": "evt_1",
+        "calendar_id": "domain_exter",
+        "title": "Weekly Meeting",
+        "start_time": start,
+        "end_time": end,
+        "description": "Sync",
+        "location": "Room A",
+        "uid": "uid-1",
+        "raw_ical": "BEGIN:VEVENT\nCATEGORIES:Work\nEND:VEVENT",
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "is_recurring": False
+    }
+
+
+@pytest.mark.unit
+class TestParseEventFields:
+    """Test fields= query parsing."""
+
+    def test_none_returns_default_fields(self):
+        result = parse_event_fields(None)
+        assert result.is_success
+        assert result.value == DEFAULT_EVENT_FIELDS
+
+    def test_parses_and_deduplicates(self):
+        result = parse_event_fields(" title, start ,title,,raw_ical")
+        assert result.is_success
+        assert result.value == ("title", "start", "raw_ical")
+
+    def test_unknown_field_fails(self):
+        result = parse_event_fields("title,password")
+        assert not result.is_success
+        assert "password" in result.error
+
+    def test_requires_full_events(self):
+        assert not requires_full_events(DEFAULT_EVENT_FIELDS)
+        assert not requires_full_events(("title", "start"))
+        assert requires_full_events(("title", "raw_ical"))
+
+
+@pytest.mark.unit
+class TestProjectEvent:
+    """Test event projection."""
+
+    def test_default_projection_drops_heavy_fields(self):
+        projected = project_event(_internal_event(), DEFAULT_EVENT_FIELDS)
+
+        assert set(projected) == set(DEFAULT_EVENT_FIELDS)
+        assert "raw_ical" not in projected
+        assert projected["start"] == "2025-10-10T10:00:00+00:00"
+
+    def test_datetimes_are_serialized(self):
+        projected = project_event(_internal_event(), ("start_time", "end_time"))
+        assert projected == {
+            "start_time": "2025-10-10T10:00:00+00:00",
+            "end_time": "2025-10-10T11:00:00+00:00"
+        }
+
+    def test_start_end_derived_from_start_time(self):
+        event = {"uid": "uid-1", "start_time": "2025-10-10T10:00:00", "end_time": None}
+        projected = project_event(event, ("uid", "start", "end"))
+        assert projected == {"uid": "uid-1", "start": "2025-10-10T10:00:00", "end": None}
+
+    def test_missing_fields_are_omitted(self):
+        projected = project_event({"title": "Only Title"}, DEFAULT_EVENT_FIELDS)
+        assert projected == {"title": "Only Title"}
+
+    def test_domain_events_response_keeps_structure(self):
+        response = {
+            "groups": [{
+                "id": 1,
+                "name": "Group",
+                "recurring_events": [{"title": "Weekly Meeting", "event_count": 1, "events": [_internal_event()]}]
+            }],
+            "cached_at": "2025-10-10T00:00:00+00:00"
+        }
+
+        projected = project_domain_events_response(response, ("title",))
+
+        assert projected["cached_at"] == response["cached_at"]
+        recurring_event = projected["groups"][0]["recurring_events"][0]
+        assert recurring_event["event_count"] == 1
+        assert recurring_event["events"] == [{"title": "Weekly Meeting"}]
+        # Input unchanged
+        assert "raw_ical" in response["groups"][0]["recurring_events"][0]["events"][0]
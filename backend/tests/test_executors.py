@@ -0,0 +1,109 @@
+"""
+Unit tests for the parse / blocking DB executors.
+
+Tests off-loop execution, process pool parsing and executor metrics.
+"""
+
+import asyncio
+import time
+import pytest
+
+from app.core.executors import InstrumentedExecutor, resolve_parse_executor_kind
+from app.data.ical_parser import parse_ical_content
+
+ICAL = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+BEGIN:VEVENT
+UID:test-event-1
+DTSTART:20250923T100000Z
+DTEND:20250923T110000Z
+SUMMARY:Test Event
+END:VEVENT
+END:VCALENDAR"""
+
+
+def _fail():
+    raise ValueError("broken feed")
+
+
+@pytest.mark.unit
+class TestInstrumentedExecutor:
+    """Test executors keep the loop free and record metrics."""
+
+    async def test_event_loop_stays_responsive(self):
+        executor = InstrumentedExecutor("test", "thread", 1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        try:
+            await asyncio.gather(executor.run(time.sleep, 0.1), ticker())
+        finally:
+            executor.shutdown()
+
+        # Ticks kept coming while the blocking call ran
+        assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.1
+
+    async def test_metrics_record_queue_wait_and_failures(self):
+        executor = InstrumentedExecutor("test", "thread", 1)
+
+        try:
+            await asyncio.gather(executor.run(time.sleep, 0.05), executor.run(time.sleep, 0.05))
+            with pytest.raises(ValueError):
+                await executor.run(_fail)
+        finally:
+            executor.shutdown()
+
+        metrics = executor.snapshot()
+        assert (metrics["completed"], metrics["failed"]) == (2, 1)
+        assert metrics["peak_in_flight"] == 2
+        assert (metrics["in_flight"], metrics["queue_depth"]) == (0, 0)
+        # The second sleep waited for the single worker
+        assert metrics["wait_ms"]["max"] >= 40
+        assert metrics["run_ms"]["p50"] >= 40
+
+    async def test_process_pool_parses_feed(self):
+        executor = InstrumentedExecutor("test", "process", 1)
+
+        try:
+            result = await executor.run(parse_ical_content, ICAL)
+        finally:
+            executor.shutdown()
+
+        assert result.is_success
+        assert [event["title"] for event in result.value] == ["Test Event"]
+
+    def test_parse_executor_kind(self):
+        assert resolve_parse_executor_kind("process") == "process"
+        assert resolve_parse_executor_kind("thread") == "thread"
+        with pytest.raises(ValueError):
+            resolve_parse_executor_kind("gpu")
+
+
+@pytest.mark.unit
+class TestParallelFeedParsing:
+    """Test large feeds are parsed in chunks across the process pool."""
+
+    async def test_chunked_process_parse_equals_serial(self):
+        from unittest.mock import patch
+        from app.services import calendar_service
+        from tests.test_ical_parser import _feed
+
+        feed = _feed(30, overrides_every=10)
+        executor = InstrumentedExecutor("test", "process", 2)
+
+        try:
+            with patch.object(calendar_service, "parse_executor", executor), \
+                 patch.object(calendar_service.settings, "parallel_parse_min_bytes", 0):
+                result = await calendar_service.parse_ical_feed(feed)
+        finally:
+            executor.shutdown()
+
+        assert result.is_success
+        assert result.value == parse_ical_content(feed).value
+        # One chunk per worker
+        assert executor.snapshot()["completed"] == 2
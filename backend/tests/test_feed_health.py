@@ -0,0 +1,214 @@
+"""
+Unit tests for upstream feed health, backoff and circuit breaking.
+
+Tests the backoff/circuit state transitions, failure classification and
+the guarded fetch of calendar syncs (feed health on Calendar rows, Redis
+replaced by a dict).
+"""
+
+import asyncio
+import itertools
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.data.feed_health import (
+    backoff_seconds, fetch_admission, host_admission, claim_probe, record_fetch_success, record_fetch_failure,
+    record_host_failure, record_host_success, is_host_failure
+)
+from app.models.calendar import Calendar
+from app.services import feed_health_service
+
+BASE, MAX, THRESHOLD, MIN_FEEDS = 60, 3600, 3, 2
+_calendar_ids = itertools.count(1)
+
+
+def _calendar(url):
+    return Calendar(id=next(_calendar_ids), name=url, source_url=url, type="user")
+
+
+def _fail(health, now, jitter=0.0):
+    return record_fetch_failure(health, "Timeout fetching calendar", now, BASE, MAX, jitter)
+
+
+@pytest.mark.unit
+class TestBackoffAndCircuit:
+    """Test backoff growth and the closed/open/half-open transitions."""
+
+    def test_backoff_doubles_with_jitter_up_to_max(self):
+        assert [backoff_seconds(n, BASE, MAX, 0.0) for n in (1, 2, 3)] == [30, 60, 120]
+        assert [backoff_seconds(n, BASE, MAX, 0.999) for n in (1, 2, 3)] == pytest.approx([60, 120, 240], abs=1)
+        assert backoff_seconds(20, BASE, MAX, 0.0) == MAX / 2
+
+    def test_failing_feed_is_skipped_until_retry(self):
+        health = _fail(None, now=0)
+
+        assert fetch_admission(None, 0, THRESHOLD) == "allow"
+        assert fetch_admission(health, 29, THRESHOLD) == "skip"
+        assert fetch_admission(health, 30, THRESHOLD) == "allow"
+
+    def test_open_circuit_lets_single_probe_through(self):
+        health = None
+        for now in (0, 100, 200):
+            health = _fail(health, now)
+        retry_at = health["retry_at"]
+
+        assert fetch_admission(health, retry_at - 1, THRESHOLD) == "skip"
+        assert fetch_admission(health, retry_at, THRESHOLD) == "probe"
+        claimed = claim_probe(health, retry_at, 60)
+        assert fetch_admission(claimed, retry_at + 1, THRESHOLD) == "skip"
+
+        # Failed probe: longer backoff; successful probe: closed
+        assert _fail(claimed, retry_at)["retry_at"] - retry_at == 240
+        closed = record_fetch_success(claimed, retry_at + 5, 120.0)
+        assert fetch_admission(closed, retry_at + 5, THRESHOLD) == "allow"
+        assert closed["last_error"] == "Timeout fetching calendar"  # History kept
+
+    def test_host_circuit_needs_several_failing_feeds(self):
+        health = None
+        for now in (0, 100, 200):
+            health = record_host_failure(health, "feed-a", "Timeout fetching calendar", now, BASE, MAX, 0.0)
+
+        assert health["failed_feeds"] == ["feed-a"]
+        assert host_admission(health, 201, MIN_FEEDS) == "allow"  # One broken feed
+
+        health = record_host_failure(health, "feed-b", "Timeout fetching calendar", 300, BASE, MAX, 0.0)
+        assert host_admission(health, 301, MIN_FEEDS) == "skip"
+        assert host_admission(health, health["retry_at"], MIN_FEEDS) == "probe"
+        assert host_admission(record_host_success(health, 400, 50.0), 401, MIN_FEEDS) == "allow"
+
+    @pytest.mark.parametrize("error, host_failure", [
+        ("Timeout fetching calendar from https://example.com/a.ics", True),
+        ("Connection error fetching calendar from https://example.com/a.ics: [Errno 111] Connection refused", True),
+        ("Error fetching calendar: Exceeded maximum allowed redirects.", False),
+        ("Error fetching calendar: Request URL is missing an 'http://' or 'https://' protocol.", False),
+        ("HTTP 503 error fetching calendar", True),
+        ("HTTP 429 error fetching calendar", True),
+        ("HTTP 404 error fetching calendar", False),
+        ("HTTP 403 error fetching calendar", False),
+    ])
+    def test_failure_classification(self, error, host_failure):
+        assert is_host_failure(error) is host_failure
+
+
+@pytest.fixture
+def health_cache():
+    cache = {}
+    with patch.object(feed_health_service, "get_cache", side_effect=cache.get), \
+         patch.object(feed_health_service, "set_cache",
+                      side_effect=lambda key, data, ttl: cache.__setitem__(key, data)), \
+         patch.object(feed_health_service, "_local_host_health", {}), \
+         patch.object(feed_health_service.settings, "feed_circuit_failure_threshold", THRESHOLD), \
+         patch.object(feed_health_service.settings, "feed_host_circuit_min_feeds", MIN_FEEDS):
+        yield cache
+
+
+@pytest.mark.unit
+class TestGuardedFetch:
+    """Test dead hosts are skipped, probed and capped per host."""
+
+    async def test_dead_host_fails_fast_for_other_feeds(self, health_cache):
+        fetch = AsyncMock(return_value=(False, "", "Timeout fetching calendar from https://dead.example.com/a.ics"))
+        dead = [_calendar(f"https://dead.example.com/{name}.ics") for name in ("a", "b", "c")]
+
+        for calendar in dead[:2]:
+            await feed_health_service.guarded_fetch(calendar, fetch)
+        third = await feed_health_service.guarded_fetch(dead[2], fetch)
+        other_host = await feed_health_service.guarded_fetch(_calendar("https://example.org/d.ics"), fetch)
+
+        assert fetch.await_count == 3  # Not for c.ics
+        assert third[0] is other_host[0] is False
+        assert third[2].startswith("Upstream host dead.example.com unavailable after 2 failed fetches")
+        assert not feed_health_service.is_feed_available(dead[2])
+
+    async def test_host_backoff_without_redis(self, health_cache):
+        fetch = AsyncMock(return_value=(False, "", "HTTP 503 error fetching calendar"))
+
+        with patch.object(feed_health_service, "set_cache", return_value=False), \
+             patch.object(feed_health_service, "get_cache", return_value=None):
+            for name in ("a", "b"):
+                await feed_health_service.guarded_fetch(_calendar(f"https://down.example.com/{name}.ics"), fetch)
+            skipped = await feed_health_service.guarded_fetch(_calendar("https://down.example.com/c.ics"), fetch)
+
+        assert fetch.await_count == 2
+        assert skipped[2].startswith("Upstream host down.example.com unavailable")
+
+    async def test_feed_health_is_stored_on_calendar(self, health_cache):
+        calendar = _calendar("https://example.com/gone.ics")
+        fetch = AsyncMock(return_value=(False, "", "HTTP 404 error fetching calendar"))
+
+        await feed_health_service.guarded_fetch(calendar, fetch)
+
+        assert calendar.sync_state["health"]["failures"] == 1
+        assert calendar.sync_state["health"]["url"] == calendar.source_url
+        assert not any(key.startswith("feed_health:feed") for key in health_cache)
+        assert not feed_health_service.is_feed_available(calendar)
+
+        # Health of a previous source URL doesn't apply
+        calendar.source_url = "https://example.com/moved.ics"
+        assert feed_health_service.is_feed_available(calendar)
+
+    async def test_one_broken_feed_does_not_block_host(self, health_cache):
+        broken = AsyncMock(return_value=(False, "", "Timeout fetching calendar from https://shared.example.com/a.ics"))
+        ok = AsyncMock(return_value=(True, "BEGIN:VCALENDAR", ""))
+        broken_calendar = _calendar("https://shared.example.com/a.ics")
+
+        await feed_health_service.guarded_fetch(broken_calendar, broken)
+        result = await feed_health_service.guarded_fetch(_calendar("https://shared.example.com/b.ics"), ok)
+
+        assert result == (True, "BEGIN:VCALENDAR", "")
+        assert not feed_health_service.is_feed_available(broken_calendar)  # Feed backoff
+
+    async def test_user_triggered_fetch_bypasses_host_backoff(self, health_cache):
+        fetch = AsyncMock(return_value=(False, "", "HTTP 503 error fetching calendar"))
+        for name in ("a", "b"):
+            await feed_health_service.guarded_fetch(_calendar(f"https://busy.example.com/{name}.ics"), fetch)
+        fetch.return_value = (True, "BEGIN:VCALENDAR", "")
+        calendar = _calendar("https://busy.example.com/c.ics")
+
+        skipped = await feed_health_service.guarded_fetch(calendar, fetch)
+        manual = await feed_health_service.guarded_fetch(calendar, fetch, bypass_host=True)
+
+        assert skipped[0] is False and manual[0] is True
+        assert feed_health_service.get_feed_health(calendar)["host"]["failed_feeds"] == []
+
+    async def test_feed_error_does_not_block_host(self, health_cache):
+        missing = AsyncMock(return_value=(False, "", "HTTP 404 error fetching calendar"))
+        ok = AsyncMock(return_value=(True, "BEGIN:VCALENDAR", ""))
+        calendar = _calendar("https://example.com/ok.ics")
+
+        await feed_health_service.guarded_fetch(_calendar("https://example.com/gone.ics"), missing)
+        result = await feed_health_service.guarded_fetch(calendar, ok)
+
+        assert result == (True, "BEGIN:VCALENDAR", "")
+        health = feed_health_service.get_feed_health(calendar)
+        assert health["feed"]["failures"] == 0 and health["host"] is None
+
+    async def test_probe_success_closes_circuit(self, health_cache):
+        calendar = _calendar("https://example.com/cal.ics")
+        health = None
+        for now in (0, 100, 200):
+            health = _fail(health, now)
+        calendar.sync_state = {"health": {**health, "retry_at": 0, "url": calendar.source_url}}  # Backoff expired
+        fetch = AsyncMock(return_value=(True, "BEGIN:VCALENDAR", ""))
+
+        assert (await feed_health_service.guarded_fetch(calendar, fetch))[0] is True
+        assert feed_health_service.get_feed_health(calendar)["feed"]["failures"] == 0
+
+    async def test_concurrent_fetches_capped_per_host(self, health_cache):
+        running, peak = 0, 0
+
+        async def fetch():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True, "", ""
+
+        with patch.object(feed_health_service.settings, "feed_fetch_host_concurrency", 2):
+            await asyncio.gather(*(
+                feed_health_service.guarded_fetch(_calendar(f"https://capped.example.com/{i}.ics"), fetch)
+                for i in range(6)
+            ))
+
+        assert peak == 2
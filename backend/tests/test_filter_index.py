@@ -0,0 +1,115 @@
+"""
+Unit tests for title-index batch filter evaluation.
+
+Tests pure functions from app.data.filter_index module.
+Results must match app.data.calendar.apply_filter_to_events exactly.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from app.data.calendar import apply_filter_to_events
+from app.data.filter_index import (
+    build_title_index,
+    titles_to_bitset,
+    build_group_bitsets,
+    compute_filter_bitset,
+    bitset_to_positions,
+    select_filtered_events,
+    evaluate_filters
+)
+
+
+EVENTS = [
+    {"id": "evt_1", "title": "A"},
+    {"id": "evt_2", "title": "B"},
+    {"id": "evt_3", "title": "C"},
+    {"id": "evt_4", "title": "A"},
+    {"id": "evt_5", "title": "D"},
+]
+
+GROUP_TITLES = {1: {"A", "B"}, 2: {"D", "Unknown"}}
+
+
+@pytest.mark.unit
+class TestTitleIndex:
+    """Test index construction and bitset conversion."""
+
+    def test_build_title_index(self):
+        index = build_title_index(EVENTS)
+
+        assert index["titles"] == ["A", "B", "C", "D"]
+        assert index["title_ids"] == {"A": 0, "B": 1, "C": 2, "D": 3}
+        assert index["positions"] == [[0, 3], [1], [2], [4]]
+
+    def test_titles_to_bitset_ignores_unknown_titles(self):
+        index = build_title_index(EVENTS)
+
+        assert titles_to_bitset(index, ["A", "C", "Unknown"]) == 0b101
+        assert titles_to_bitset(index, None) == 0
+
+    def test_bitset_to_positions_keeps_event_order(self):
+        index = build_title_index(EVENTS)
+
+        assert bitset_to_positions(index, 0b1001) == [0, 3, 4]
+        assert bitset_to_positions(index, 0) == []
+
+
+@pytest.mark.unit
+class TestFilterEvaluation:
+    """Test filter evaluation matches the scanning implementation."""
+
+    @pytest.mark.parametrize("filter_data", [
+        {"domain_key": "d", "subscribed_group_ids": [1], "subscribed_event_ids": ["C"], "unselected_event_ids": ["B"]},
+        {"domain_key": "d", "subscribed_group_ids": [1, 2], "subscribed_event_ids": [], "unselected_event_ids": []},
+        {"domain_key": "d", "subscribed_group_ids": [], "subscribed_event_ids": ["D"], "unselected_event_ids": ["D"]},
+        {"domain_key": "d", "subscribed_group_ids": [99], "subscribed_event_ids": None, "unselected_event_ids": None},
+        {"calendar_id": 1, "subscribed_event_ids": ["A", "D"]},
+        {"calendar_id": 1, "subscribed_event_ids": []},
+    ])
+    def test_matches_apply_filter_to_events(self, filter_data):
+        index = build_title_index(EVENTS)
+        group_bitsets = build_group_bitsets(index, GROUP_TITLES)
+
+        group_titles = set()
+        for group_id in filter_data.get("subscribed_group_ids") or []:
+            group_titles |= GROUP_TITLES.get(group_id, set())
+
+        expected = apply_filter_to_events(
+            EVENTS, {k: v or [] for k, v in filter_data.items()},
+            group_titles if "domain_key" in filter_data else None
+        )
+
+        assert select_filtered_events(EVENTS, index, filter_data, group_bitsets) == expected
+
+    def test_unselected_wins_over_group_and_subscription(self):
+        index = build_title_index(EVENTS)
+        group_bitsets = build_group_bitsets(index, GROUP_TITLES)
+        filter_data = {"domain_key": "d", "subscribed_group_ids": [1],
+                       "subscribed_event_ids": ["A"], "unselected_event_ids": ["A"]}
+
+        assert compute_filter_bitset(index, filter_data, group_bitsets) == 0b10
+
+    def test_personal_frozen_mode_skips_newer_events(self):
+        created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        events = [
+            {"title": "A", "created_at": datetime(2024, 12, 1, tzinfo=timezone.utc)},
+            {"title": "A", "created_at": datetime(2025, 2, 1, tzinfo=timezone.utc)},
+        ]
+        filter_data = {"subscribed_event_ids": ["A"], "include_future_events": False, "created_at": created}
+
+        result = select_filtered_events(events, build_title_index(events), filter_data)
+
+        assert result == apply_filter_to_events(events, filter_data)
+        assert len(result) == 1
+
+    def test_evaluate_filters_keyed_by_filter_id(self):
+        filters = [
+            {"id": 10, "domain_key": "d", "subscribed_group_ids": [1], "unselected_event_ids": ["B"]},
+            {"id": 11, "domain_key": "d", "subscribed_group_ids": [2]},
+        ]
+
+        result = evaluate_filters(EVENTS, filters, GROUP_TITLES)
+
+        assert [e["id"] for e in result[10]] == ["evt_1", "evt_4"]
+        assert [e["id"] for e in result[11]] == ["evt_5"]
@@ -23,7 +23,12 @@ from app.data.grouping import (
     validate_group_data,
     validate_assignment_rule_data,
     _extract_categories_from_raw_ical,
-    _event_matches_rule
+    _event_matches_rule,
+    build_domain_events_summary,
+    select_domain_event_instances,
+    paginate_events,
+    AUTO_RECURRING_GROUP_ID,
+    AUTO_UNIQUE_GROUP_ID
 )
 
 
@@ -1521,4 +1526,126 @@ class TestApplyAssignmentRulesWithNOT:
         assert 2 in result
         assert len(result[2]) == 2  # Both events match
         assert "Regular Event" in result[2]
-        assert "Test Event" in result[2]
\ No newline at end of file
+        assert "Test Event" in result[2]
+
+
+@pytest.mark.unit
+class TestDomainEventsSummary:
+    """Test summary and lazy instance loading of domain events."""
+
+    NOW = datetime(2025, 1, 10, tzinfo=timezone.utc)
+
+    def _response(self):
+        return {
+            "groups": [
+                {
+                    "id": 1,
+                    "name": "Sport",
+                    "recurring_events": [
+                        {
+                            "title": "Training",
+                            "event_count": 3,
+                            "events": [
+                                {"title": "Training", "start_time": "2025-01-17T18:00:00+00:00"},
+                                {"title": "Training", "start_time": "2025-01-03T18:00:00+00:00"},
+                                {"title": "Training", "start_time": datetime(2025, 1, 24, 18, 0)}
+                            ]
+                        },
+                        {
+                            "title": "Match",
+                            "event_count": 1,
+                            "events": [{"title": "Match", "start_time": "2025-01-01T10:00:00+00:00"}]
+                        }
+                    ]
+                },
+                {
+                    "id": 2,
+                    "name": "Youth",
+                    "recurring_events": [
+                        {
+                            "title": "Training",
+                            "event_count": 3,
+                            "events": [
+                                {"title": "Training", "start_time": "2025-01-17T18:00:00+00:00"},
+                                {"title": "Training", "start_time": "2025-01-03T18:00:00+00:00"},
+                                {"title": "Training", "start_time": datetime(2025, 1, 24, 18, 0)}
+                            ]
+                        }
+                    ]
+                }
+            ]
+        }
+
+    def test_summary_drops_event_instances(self):
+        """Summary keeps titles and counts but no event lists."""
+        result = build_domain_events_summary(self._response(), now=self.NOW)
+
+        sport = result["groups"][0]
+        assert sport["id"] == 1
+        assert sport["event_count"] == 4
+        assert [e["title"] for e in sport["recurring_events"]] == ["Training", "Match"]
+        assert all("events" not in e for e in sport["recurring_events"])
+
+    def test_summary_next_occurrence(self):
+        """Next occurrence is the earliest upcoming start, None if all past."""
+        result = build_domain_events_summary(self._response(), now=self.NOW)
+
+        training, match = result["groups"][0]["recurring_events"]
+        assert training["next_occurrence"] == "2025-01-17T18:00:00+00:00"
+        assert match["next_occurrence"] is None
+
+    def test_select_instances_by_title_deduplicates_groups(self):
+        """A title assigned to several groups is returned once, sorted by start."""
+        events = select_domain_event_instances(self._response(), title="Training")
+
+        assert len(events) == 3
+        assert events[0]["start_time"] == "2025-01-03T18:00:00+00:00"
+        assert events[-1]["start_time"] == datetime(2025, 1, 24, 18, 0)
+
+    def test_select_instances_by_group(self):
+        """Group selection returns instances of all its titles."""
+        events = select_domain_event_instances(self._response(), group_id=1)
+
+        assert len(events) == 4
+        assert events[0]["title"] == "Match"
+
+    def test_select_instances_of_auto_group(self):
+        """Auto-groups have ids in the summary and can be selected by them."""
+        def instances(title, starts):
+            return {"event_count": len(starts),
+                    "events": [{"title": title, "start_time": start} for start in starts]}
+
+        response = build_domain_events_with_auto_groups({
+            "Training": instances("Training", ["2025-01-17T18:00:00+00:00", "2025-01-03T18:00:00+00:00"]),
+            "Gala": instances("Gala", ["2025-02-01T19:00:00+00:00"]),
+        }, [], [], "club")
+
+        summary = build_domain_events_summary(response, now=self.NOW)
+        assert [group["id"] for group in summary["groups"]] == [AUTO_RECURRING_GROUP_ID, AUTO_UNIQUE_GROUP_ID]
+
+        recurring = select_domain_event_instances(response, group_id=AUTO_RECURRING_GROUP_ID)
+        assert [event["start_time"] for event in recurring] == \
+            ["2025-01-03T18:00:00+00:00", "2025-01-17T18:00:00+00:00"]
+        assert [event["title"] for event in select_domain_event_instances(response, group_id=AUTO_UNIQUE_GROUP_ID)] == \
+            ["Gala"]
+
+    def test_select_instances_unknown_group(self):
+        """Unknown group yields no instances."""
+        assert select_domain_event_instances(self._response(), group_id=99) == []
+
+    def test_paginate_events(self):
+        """Pagination slices events and reports totals."""
+        events = [{"title": f"E{i}"} for i in range(5)]
+
+        result = paginate_events(events, page=2, limit=2)
+
+        assert [e["title"] for e in result["events"]] == ["E2", "E3"]
+        assert result["total"] == 5
+        assert result["total_pages"] == 3
+
+    def test_paginate_events_past_end(self):
+        """Page beyond the end is empty."""
+        result = paginate_events([{"title": "E"}], page=3, limit=10)
+
+        assert result["events"] == []
+        assert result["total"] == 1
@@ -17,7 +17,9 @@ from app.data.ical_parser import (
     validate_calendar_data,
     create_fallback_datetime,
     _generate_event_id,
-    _parse_datetime
+    _parse_datetime,
+    split_ical_chunks,
+    merge_parsed_chunks
 )
 
 
@@ -620,4 +622,78 @@ class TestNormalizeEventTitleEdgeCases:
     def test_normalize_numbers_only(self):
         """Edge case: Title with only numbers."""
         assert normalize_event_title("12345") == "12345"
-        assert normalize_event_title(" 678 ") == "678"
\ No newline at end of file
+        assert normalize_event_title(" 678 ") == "678"
+
+def _feed(event_count: int, overrides_every: int = 0) -> str:
+    """Feed with a VTIMEZONE, timed/all-day events, folded lines and recurrence overrides."""
+    lines = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Test//Test//EN",
+        "BEGIN:VTIMEZONE", "TZID:Europe/Berlin",
+        "BEGIN:STANDARD", "DTSTART:19701025T030000", "TZOFFSETFROM:+0200", "TZOFFSETTO:+0100",
+        "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU", "END:STANDARD",
+        "BEGIN:DAYLIGHT", "DTSTART:19700329T020000", "TZOFFSETFROM:+0100", "TZOFFSETTO:+0200",
+        "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU", "END:DAYLIGHT",
+        "END:VTIMEZONE",
+    ]
+    for i in range(event_count):
+        day = 1 + i % 28
+        if i % 5 == 0:
+            start, end = f"DTSTART;VALUE=DATE:202503{day:02d}", f"DTEND;VALUE=DATE:202503{day:02d}"
+        else:
+            start, end = f"DTSTART;TZID=Europe/Berlin:202503{day:02d}T100000", f"DTEND;TZID=Europe/Berlin:202503{day:02d}T110000"
+        lines += [
+            "BEGIN:VEVENT", f"UID:event-{i}@example.com", start, end, f"SUMMARY:Event {i % 7}",
+            "DESCRIPTION:A long description that is folded onto a continuation",
+            " line by the producing calendar",
+            "END:VEVENT",
+        ]
+    if overrides_every:
+        # Overrides at the end of the feed share the UID of an early master
+        for i in range(0, event_count, overrides_every):
+            lines += [
+                "BEGIN:VEVENT", f"UID:event-{i}@example.com", "RECURRENCE-ID:20250401T100000Z",
+                "DTSTART:20250402T100000Z", f"SUMMARY:Moved {i}", "END:VEVENT",
+            ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines)
+
+
+@pytest.mark.unit
+class TestChunkedParsing:
+    """Chunked parsing must equal the serial parse."""
+
+    @pytest.mark.parametrize("chunk_count", [2, 3, 8])
+    def test_chunks_merge_to_serial_result(self, chunk_count):
+        feed = _feed(40, overrides_every=10)
+
+        chunks, first_blocks = split_ical_chunks(feed, chunk_count)
+        merged = merge_parsed_chunks([parse_ical_content(chunk) for chunk in chunks], first_blocks)
+
+        assert len(chunks) == chunk_count
+        assert merged.is_success
+        assert merged.value == parse_ical_content(feed).value
+
+    def test_override_keeps_master_raw_block(self):
+        feed = _feed(10, overrides_every=5)
+
+        events = parse_ical_content(feed).value
+
+        override = next(event for event in events if event["title"] == "Moved 0")
+        assert "SUMMARY:Event 0" in override["raw_ical"]
+
+    def test_chunks_share_timezones(self):
+        chunks, _ = split_ical_chunks(_feed(6), 3)
+
+        assert all("TZID:Europe/Berlin" in chunk for chunk in chunks)
+        assert all(chunk.count("BEGIN:VEVENT") == 2 for chunk in chunks)
+
+    def test_small_feed_is_one_chunk(self):
+        feed = _feed(1)
+
+        assert split_ical_chunks(feed, 4) == ([feed], {})
+
+    def test_chunk_failure_is_reported(self):
+        chunks, first_blocks = split_ical_chunks(_feed(4), 2)
+        results = [parse_ical_content(chunks[0]), parse_ical_content("not a calendar")]
+
+        assert not merge_parsed_chunks(results, first_blocks).is_success
@@ -0,0 +1,126 @@
+"""
+Unit tests for sharded scheduled sync.
+
+Tests shard partitioning, the in-process coordinator, per-shard budgets
+and checkpoints with mocked domain sync, database and Redis.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app import lambda_sync
+from app.data.sync_shards import (
+    shard_for_domain, partition_domains, order_from_checkpoint, aggregate_shard_results
+)
+
+DOMAINS = [f"domain-{i}" for i in range(12)]
+
+
+@pytest.mark.unit
+class TestPartitionDomains:
+    """Test stable shard assignment."""
+
+    def test_every_domain_in_exactly_one_shard(self):
+        shards = partition_domains(DOMAINS, 4)
+
+        assert len(shards) == 4
+        assert sorted(key for shard in shards for key in shard) == sorted(DOMAINS)
+        for index, shard in enumerate(shards):
+            assert all(shard_for_domain(key, 4) == index for key in shard)
+
+    def test_assignment_does_not_depend_on_other_domains(self):
+        shards = partition_domains(DOMAINS, 3)
+        fewer = partition_domains(DOMAINS[:5], 3)
+
+        for index in range(3):
+            assert set(fewer[index]) <= set(shards[index])
+
+    def test_order_from_checkpoint_rotates(self):
+        assert order_from_checkpoint(["a", "b", "c"], "b") == ["b", "c", "a"]
+        assert order_from_checkpoint(["a", "b", "c"], "gone") == ["a", "b", "c"]
+        assert order_from_checkpoint(["a", "b", "c"], None) == ["a", "b", "c"]
+
+    def test_aggregate_shard_results(self):
+        summary = aggregate_shard_results([
+            {"shard": 0, "status": "success", "synced": 2, "cached": 2, "deferred": 0},
+            {"shard": 1, "status": "error", "errors": ["shard 1: timeout"]},
+        ])
+
+        assert summary["status"] == "partial"
+        assert (summary["synced"], summary["cached"]) == (2, 2)
+        assert summary["errors"] == ["shard 1: timeout"]
+
+
+@pytest.fixture
+def sync_env():
+    """Patch configuration, database, Redis and per-domain sync."""
+    cache = {}
+    synced = []
+
+    async def fake_sync_domain(db, domain_key):
+        synced.append(domain_key)
+        return {"synced": True, "cached": True, "errors": []}
+
+    with patch.object(lambda_sync, "get_domain_keys", return_value=DOMAINS), \
+         patch.object(lambda_sync, "get_db", side_effect=lambda: iter([Mock()])), \
+         patch.object(lambda_sync, "sync_domain", side_effect=fake_sync_domain), \
+         patch.object(lambda_sync, "get_due_domains", side_effect=lambda db, keys: list(keys)), \
+         patch.object(lambda_sync, "get_cache", side_effect=cache.get), \
+         patch.object(lambda_sync, "set_cache", side_effect=lambda key, data, ttl: cache.__setitem__(key, data)), \
+         patch.object(lambda_sync, "delete_cache", side_effect=lambda key: cache.pop(key, None)):
+        yield synced, cache
+
+
+@pytest.mark.unit
+class TestShardedSync:
+    """Test the coordinator and shard workers in-process."""
+
+    def test_local_coordinator_syncs_every_domain_once(self, sync_env):
+        synced, _ = sync_env
+
+        result = lambda_sync.run_coordinator(3)
+
+        assert sorted(synced) == sorted(DOMAINS)
+        assert result["status"] == "success"
+        assert result["synced"] == len(DOMAINS)
+        assert [shard["shard"] for shard in result["shards"]] == [0, 1, 2]
+
+    def test_exhausted_budget_checkpoints_and_resumes(self, sync_env):
+        synced, cache = sync_env
+        shard_domains = partition_domains(DOMAINS, 1)[0]
+
+        # Each domain takes 4 seconds of a 10 second budget
+        clock = Mock()
+        clock.monotonic.side_effect = lambda: len(synced) * 4
+        with patch.object(lambda_sync, "time", clock):
+            first = lambda_sync.run_shard(0, 1, budget_seconds=10)
+
+        assert first["synced"] == 3 and first["deferred"] == len(DOMAINS) - 3
+        assert cache == {"sync_shard_checkpoint:1:0": {"resume_from": shard_domains[3]}}
+
+        synced.clear()
+        second = lambda_sync.run_shard(0, 1, budget_seconds=10)
+
+        assert synced[0] == shard_domains[3]
+        assert second["deferred"] == 0
+        assert cache == {}
+
+    def test_remote_invocation_failures_are_aggregated(self, sync_env):
+        def invoke(shard, shard_count):
+            if shard == 1:
+                raise TimeoutError("read timeout")
+            return {"shard": shard, "status": "success", "synced": 1, "cached": 1, "deferred": 0}
+
+        result = lambda_sync.run_coordinator(2, invoke)
+
+        assert result["status"] == "partial"
+        assert result["synced"] == 1
+        assert result["errors"] == ["shard 1: read timeout"]
+
+    def test_handler_routes_shard_events_to_worker(self, sync_env):
+        synced, _ = sync_env
+
+        response = lambda_sync.handler({"shard": 0, "shard_count": 2}, Mock(request_id="r1"))
+
+        assert response["statusCode"] == 200
+        assert sorted(synced) == partition_domains(DOMAINS, 2)[0]
@@ -0,0 +1,187 @@
+"""
+Unit tests for per-calendar sync leases and attaching to in-flight syncs.
+"""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.core import sync_lock
+from app.core.sync_lock import (
+    LocalLeaseLock, RedisLeaseLock, advisory_lock_id, resolve_lock_backend, run_exclusive, run_unless_leased
+)
+
+
+@pytest.fixture
+def lock():
+    lock = LocalLeaseLock()
+    with patch.object(sync_lock, "_sync_lock", lock), \
+         patch.object(sync_lock.settings, "sync_lock_poll_seconds", 0.01):
+        yield lock
+
+
+def _slow_sync(result=(True, 3, ""), delay=0.05):
+    calls = []
+
+    async def sync():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return sync, calls
+
+
+@pytest.mark.unit
+class TestLeaseLocks:
+    """Test lease backends."""
+
+    def test_local_lease_expires_and_checks_token(self):
+        lock = LocalLeaseLock()
+
+        token = lock.acquire("calendar:1", 60)
+        assert lock.acquire("calendar:1", 60) is None
+        lock.release("calendar:1", "someone-else")
+        assert lock.is_held("calendar:1")
+        lock.release("calendar:1", token)
+        assert not lock.is_held("calendar:1")
+
+        lock.acquire("calendar:2", 0)
+        assert lock.acquire("calendar:2", 60) is not None  # Expired lease taken over
+
+    def test_redis_lease_uses_set_nx_and_token_checked_release(self):
+        client = Mock()
+        client.set.return_value = True
+        lock = RedisLeaseLock(client)
+
+        token = lock.acquire("calendar:1", 120)
+        lock.release("calendar:1", token)
+
+        client.set.assert_called_once_with("sync_lock:calendar:1", token, nx=True, px=120000)
+        assert client.eval.call_args.args[2:] == ("sync_lock:calendar:1", token)
+
+    def test_advisory_lock_id_is_stable_bigint(self):
+        lock_id = advisory_lock_id("calendar:1")
+
+        assert lock_id == advisory_lock_id("calendar:1") != advisory_lock_id("calendar:2")
+        assert -2**63 <= lock_id < 2**63
+
+    def test_advisory_leases_use_unpooled_engine(self):
+        from sqlalchemy.pool import NullPool
+        from app.core.database import engine
+
+        lock_engine = sync_lock.create_lock_engine("sqlite:///./test.db")
+
+        assert isinstance(lock_engine.pool, NullPool)
+        assert lock_engine is not engine
+        lock_engine.dispose()
+
+    def test_backend_resolution(self):
+        with patch.object(sync_lock, "get_database_url", return_value="postgresql://u:p@db/app"):
+            assert resolve_lock_backend("auto") == "advisory"
+        with patch.object(sync_lock, "get_database_url", return_value="sqlite:///./test.db"):
+            assert resolve_lock_backend("auto") == ("redis" if sync_lock.REDIS_AVAILABLE else "local")
+            assert resolve_lock_backend() == "local"  # SYNC_LOCK_BACKEND in tests
+        with pytest.raises(ValueError):
+            resolve_lock_backend("zookeeper")
+
+
+@pytest.mark.unit
+class TestRunExclusive:
+    """Test concurrent syncs of one key run once."""
+
+    async def test_concurrent_requests_attach_to_inflight_sync(self, lock):
+        sync, calls = _slow_sync()
+
+        results = await asyncio.gather(*(run_exclusive("calendar:1", sync, Mock()) for _ in range(3)))
+
+        assert calls == [1]
+        assert results == [(True, 3, "")] * 3
+        assert not lock.is_held("calendar:1")
+
+    async def test_attaches_across_threads(self, lock):
+        sync, calls = _slow_sync(delay=0.2)
+        owner_result = []
+        owner = threading.Thread(
+            target=lambda: owner_result.append(asyncio.run(run_exclusive("calendar:1", sync, Mock())))
+        )
+
+        owner.start()
+        while not calls:
+            await asyncio.sleep(0.01)
+        attached = await run_exclusive("calendar:1", AsyncMock(), Mock())
+        owner.join()
+
+        assert calls == [1]
+        assert attached == owner_result[0] == (True, 3, "")
+
+    async def test_waits_for_other_worker_and_reports_stored_state(self, lock):
+        other_worker = lock.acquire("calendar:1", 60)
+        asyncio.get_running_loop().call_later(0.05, lock.release, "calendar:1", other_worker)
+        sync = AsyncMock()
+
+        result = await run_exclusive("calendar:1", sync, lambda: (True, 7, ""))
+
+        assert result == (True, 7, "")
+        sync.assert_not_called()
+
+    async def test_gives_up_waiting(self, lock):
+        lock.acquire("calendar:1", 60)
+
+        with patch.object(sync_lock.settings, "sync_lock_wait_seconds", 0.05):
+            result = await run_exclusive("calendar:1", AsyncMock(), Mock())
+
+        assert result == (False, 0, "Sync already in progress")
+
+    async def test_syncs_unlocked_when_backend_fails(self, lock):
+        sync, calls = _slow_sync(delay=0)
+
+        with patch.object(lock, "acquire", side_effect=ConnectionError("redis down")):
+            result = await run_exclusive("calendar:1", sync, Mock())
+
+        assert (result, calls) == ((True, 3, ""), [1])
+
+    async def test_sync_calendar_events_fetches_once(self, lock):
+        from app.services import calendar_service
+
+        async def slow_fetch(url, **kwargs):
+            await asyncio.sleep(0.05)
+            return False, "", "Fetch error"
+
+        calendar = Mock(id=1, source_url="https://example.com/cal.ics", sync_state=None)
+        with patch.object(calendar_service, "fetch_ical_content", side_effect=slow_fetch) as fetch:
+            results = await asyncio.gather(
+                calendar_service.sync_calendar_events(Mock(), calendar),
+                calendar_service.sync_calendar_events(Mock(), calendar),
+            )
+
+        assert fetch.call_count == 1
+        assert results == [(False, 0, "Fetch error")] * 2
+
+
+@pytest.mark.unit
+class TestRunUnlessLeased:
+    """Test background jobs skip work held by another worker."""
+
+    async def test_skips_when_held_elsewhere(self, lock):
+        lock.acquire("domain:exter", 60)
+        job = AsyncMock()
+
+        assert await run_unless_leased("domain:exter", job) == (False, None)
+        job.assert_not_called()
+
+    async def test_lease_is_renewed_while_job_runs(self, lock):
+        async def job():
+            await asyncio.sleep(0.2)
+            return lock.is_held("domain:exter")
+
+        with patch.object(sync_lock.settings, "sync_lock_lease_seconds", 0.06):
+            result = await run_unless_leased("domain:exter", job)
+
+        # The job outlived several lease periods and still held the lease
+        assert result == (True, True)
+        assert not lock.is_held("domain:exter")
+
+    async def test_runs_unlocked_when_backend_fails(self, lock):
+        with patch.object(lock, "acquire", side_effect=ConnectionError("redis down")):
+            assert await run_unless_leased("domain:exter", AsyncMock(return_value=3)) == (True, 3)
@@ -0,0 +1,178 @@
+"""
+Unit tests for adaptive per-feed sync scheduling.
+
+Tests change detection, interval estimation, due-feed selection and the
+skip of unchanged feeds in calendar sync (state on the calendar row).
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.database import Base
+from app.data.sync_schedule import (
+    feed_content_hash, upstream_max_age, update_schedule, needs_rewrite, due_feeds, fallback_schedule
+)
+from app.models.calendar import Calendar, Filter
+from app.models.domain import Domain
+from app.services import calendar_service, export_service, sync_schedule_service
+
+HOUR = 3600
+MIN_SECONDS, MAX_SECONDS, DEFAULT_SECONDS = 600, 86400, 1800
+
+
+def _update(schedule, content_hash, now, max_age=None):
+    return update_schedule(schedule, content_hash, now, max_age, MIN_SECONDS, MAX_SECONDS, DEFAULT_SECONDS)
+
+
+@pytest.mark.unit
+class TestChangeDetection:
+    """Test content hashing and upstream cache headers."""
+
+    def test_hash_ignores_dtstamp(self):
+        first = "BEGIN:VEVENT\r\nDTSTAMP:20250101T000000Z\r\nSUMMARY:A\r\nEND:VEVENT"
+        refetched = "BEGIN:VEVENT\r\nDTSTAMP:20250102T120000Z\r\nSUMMARY:A\r\nEND:VEVENT"
+        edited = "BEGIN:VEVENT\r\nDTSTAMP:20250101T000000Z\r\nSUMMARY:B\r\nEND:VEVENT"
+
+        assert feed_content_hash(first) == feed_content_hash(refetched) != feed_content_hash(edited)
+
+    @pytest.mark.parametrize("headers, expected", [
+        ({"cache-control": "public, max-age=3600"}, 3600),
+        ({"Cache-Control": "max-age=60, s-maxage=7200"}, 7200),
+        ({"cache-control": "no-cache"}, 0),
+        ({"expires": "Wed, 01 Jan 2025 12:00:00 GMT", "date": "Wed, 01 Jan 2025 10:00:00 GMT"}, 7200),
+        ({"expires": "0", "date": "Wed, 01 Jan 2025 10:00:00 GMT"}, 0),
+        ({"content-type": "text/calendar"}, None),
+    ])
+    def test_upstream_max_age(self, headers, expected):
+        assert upstream_max_age(headers) == expected
+
+
+@pytest.mark.unit
+class TestIntervals:
+    """Test intervals adapt to the observed change rate within bounds."""
+
+    def test_first_fetch_uses_default_interval(self):
+        schedule, changed = _update(None, "a", now=0)
+
+        assert changed is True
+        assert schedule["change_times"] == []  # Nothing to compare with yet
+        assert (schedule["interval_seconds"], schedule["next_due"]) == (DEFAULT_SECONDS, DEFAULT_SECONDS)
+
+    def test_unchanged_feed_backs_off_to_max(self):
+        schedule, now = _update(None, "a", 0)[0], 0
+        intervals = []
+        for _ in range(20):
+            now = schedule["next_due"]
+            schedule, changed = _update(schedule, "a", now)
+            intervals.append(schedule["interval_seconds"])
+
+        assert not changed
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == MAX_SECONDS
+
+    def test_hourly_changes_converge_to_half_an_hour(self):
+        schedule = _update(None, "v0", 0)[0]
+        for version in range(1, 9):
+            schedule, changed = _update(schedule, f"v{version}", version * HOUR)
+            assert changed
+
+        # Right after a change: half the typical gap
+        assert schedule["interval_seconds"] == HOUR / 2
+        # Quiet since: polled less often
+        quiet = _update(schedule, "v8", 8 * HOUR + 6 * HOUR)[0]
+        assert quiet["interval_seconds"] == 3 * HOUR
+
+    def test_interval_bounds_and_upstream_max_age(self):
+        schedule = _update(None, "v0", 0)[0]
+        schedule = _update(schedule, "v1", 60)[0]
+
+        assert schedule["interval_seconds"] == MIN_SECONDS
+        assert _update(schedule, "v2", 120, max_age=7200)[0]["interval_seconds"] == 7200
+        assert _update(schedule, "v2", 120, max_age=10 ** 6)[0]["interval_seconds"] == MAX_SECONDS
+
+    def test_unchanged_content_rewritten_after_max_age(self):
+        schedule = _update(None, "a", 0)[0]
+
+        assert needs_rewrite(schedule, "b", 10, 100)
+        assert not needs_rewrite(schedule, "a", 10, 100)
+        assert needs_rewrite(schedule, "a", 100, 100)
+        assert needs_rewrite(None, "a", 10, 100)
+
+    def test_due_feeds_by_subscribers(self):
+        feeds = {
+            "quiet": {"next_due": 500},
+            "popular": {"next_due": 90},
+            "new": None,
+            "later": {"next_due": 200},
+        }
+
+        assert due_feeds(feeds, {"popular": 40, "quiet": 3}, now=100) == ["popular", "new"]
+
+    def test_fallback_schedule_from_last_fetched(self):
+        fetched = datetime(2030, 1, 1, 12, 0)
+
+        assert fallback_schedule(None, DEFAULT_SECONDS) is None
+        assert fallback_schedule(fetched, DEFAULT_SECONDS) == \
+            {"next_due": fetched.replace(tzinfo=timezone.utc).timestamp() + DEFAULT_SECONDS}
+
+
+@pytest.mark.unit
+class TestScheduledSync:
+    """Test sync skips unchanged feeds and selects due domains."""
+
+    async def test_unchanged_feed_is_not_parsed_or_rewritten(self):
+        db = Mock(spec=Session)
+        db.query.return_value.filter.return_value.count.return_value = 5
+        calendar = Calendar(id=7, name="Cal", type="domain", source_url="https://example.com/cal.ics")
+        feed = "BEGIN:VCALENDAR\r\nEND:VCALENDAR"
+
+        with patch.object(calendar_service, "fetch_ical_content", new_callable=AsyncMock) as fetch, \
+             patch.object(calendar_service, "parse_ical_feed", new_callable=AsyncMock) as parse, \
+             patch.object(export_service, "invalidate_calendar_filter_exports") as invalidate:
+            fetch.return_value = (True, feed, "")
+            parse.return_value = Mock(is_success=True, value=[])
+            first = await calendar_service.sync_calendar_events(db, calendar)
+            second = await calendar_service.sync_calendar_events(db, calendar)
+
+        assert first == (True, 0, "")
+        assert second == (True, 5, "")
+        assert parse.call_count == 1
+        invalidate.assert_called_once_with(db, 7)  # Only the rewrite drops cached exports
+        assert calendar.sync_state["schedule"]["changed"] is False
+        assert db.commit.called  # Schedule stored with last_fetched
+
+    def test_due_domains_most_subscribed_first(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'schedule.db'}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        now = time.time()
+        utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+        calendars = {
+            "small": {"sync_state": {"schedule": {"next_due": now - 50}}},
+            "big": {"sync_state": {"schedule": {"next_due": now - 50}}},
+            "fresh": {"sync_state": {"schedule": {"next_due": now + 500}}},
+            "recent": {"last_fetched": utc_now},  # No schedule yet: due after the default interval
+            "stale": {"last_fetched": utc_now - timedelta(days=2)},
+        }
+        for key, columns in calendars.items():
+            calendar = Calendar(name=key, type="domain", source_url="https://example.com", **columns)
+            db.add(calendar)
+            db.flush()
+            db.add(Domain(domain_key=key, name=key, calendar_url="https://example.com", calendar_id=calendar.id))
+        db.add(Domain(domain_key="new", name="new", calendar_url="https://example.com"))
+        db.add_all([Filter(name="f", domain_key="big") for _ in range(3)] + [Filter(name="f", domain_key="small")])
+        db.commit()
+
+        try:
+            due = sync_schedule_service.get_due_domains(db, [*calendars, "new"], now=now)
+        finally:
+            db.close()
+            engine.dispose()
+
+        assert due == ["big", "small", "new", "stale"]
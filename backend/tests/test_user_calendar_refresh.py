@@ -0,0 +1,163 @@
+"""
+Unit tests for background refresh of personal calendars.
+
+Tests the staleness/traffic priority queue, bounded concurrent refresh,
+skipping of backed-off feeds and the Lambda time budget (Redis replaced by a dict).
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import lambda_sync
+from app.core.database import Base
+from app.data.sync_schedule import user_refresh_queue
+from app.models.calendar import Calendar
+from app.services import feed_health_service, user_calendar_refresh_service as refresh_service
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+HOUR = 3600
+
+
+@pytest.mark.unit
+class TestRefreshQueue:
+    """Test calendars are picked by staleness weighted by export traffic."""
+
+    def test_priority_order(self):
+        calendars = [
+            (1, NOW - timedelta(hours=10)),  # Stale, no traffic
+            (2, NOW - timedelta(hours=2)),  # Less stale, heavily exported
+            (3, None),  # Never fetched
+            (4, (NOW - timedelta(minutes=10)).replace(tzinfo=None)),  # Fresh (naive UTC)
+        ]
+
+        queue = user_refresh_queue(calendars, {2: 9}, NOW, min_age_seconds=HOUR, limit=10)
+
+        assert queue == [3, 2, 1]
+
+    def test_limit(self):
+        calendars = [(i, NOW - timedelta(hours=i + 1)) for i in range(20)]
+
+        assert user_refresh_queue(calendars, {}, NOW, HOUR, limit=3) == [19, 18, 17]
+
+
+@pytest.fixture
+def refresh_env(tmp_path):
+    """User/domain calendars in a SQLite file, Redis as a dict."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'refresh.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    stale = (NOW - timedelta(hours=5)).replace(tzinfo=None)
+    db.add_all(
+        [Calendar(name=f"user {i}", source_url=f"https://example.com/{i}.ics", type="user", last_fetched=stale)
+         for i in range(6)]
+        + [Calendar(name="domain", source_url="https://example.com/d.ics", type="domain", last_fetched=stale),
+           Calendar(name="fresh", source_url="https://example.com/f.ics", type="user",
+                    last_fetched=datetime.now(timezone.utc).replace(tzinfo=None))]
+    )
+    db.commit()
+    db.close()
+
+    cache = {}
+    with patch.object(refresh_service, "get_session_sync", side_effect=Session), \
+         patch.object(refresh_service, "get_recent_export_counts", return_value={}), \
+         patch.object(feed_health_service, "get_cache", side_effect=cache.get), \
+         patch.object(feed_health_service, "set_cache", side_effect=lambda key, data, ttl: cache.__setitem__(key, data)), \
+         patch.object(feed_health_service, "_local_host_health", {}), \
+         patch.object(refresh_service.settings, "user_calendar_refresh_concurrency", 2), \
+         patch.object(refresh_service.settings, "user_calendar_refresh_batch_size", 10):
+        yield cache
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestRefreshUserCalendars:
+    """Test batches refresh with bounded concurrency through the sync engine."""
+
+    async def test_refreshes_stale_user_calendars_with_bounded_concurrency(self, refresh_env):
+        running, peak, synced = 0, 0, []
+
+        async def fake_sync(db, calendar):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            synced.append(calendar.name)
+            return True, 1, ""
+
+        with patch.object(refresh_service, "sync_calendar_events", side_effect=fake_sync):
+            result = await refresh_service.refresh_user_calendars()
+
+        assert sorted(synced) == [f"user {i}" for i in range(6)]  # No domain or fresh calendars
+        assert result == {"selected": 6, "refreshed": 6, "failed": 0, "deferred": 0}
+        assert peak == 2
+
+    async def test_failing_feed_backs_off(self, refresh_env):
+        async def fake_sync(db, calendar):
+            async def fetch():
+                return (False, "", "HTTP 404 error fetching calendar") if calendar.name == "user 0" else (True, "", "")
+
+            success, _, error = await feed_health_service.guarded_fetch(calendar, fetch)
+            db.commit()
+            return success, 1, error
+
+        with patch.object(refresh_service, "sync_calendar_events", side_effect=fake_sync):
+            first = await refresh_service.refresh_user_calendars()
+            second = await refresh_service.refresh_user_calendars()
+
+        assert first["failed"] == 1
+        # Still stale (sync is mocked), but the feed is backed off (stored on its calendar row)
+        assert second["selected"] == 5
+        assert refresh_env == {}
+
+    async def test_budget_defers_remaining(self, refresh_env):
+        async def slow_sync(db, calendar):
+            await asyncio.sleep(0.05)
+            return True, 1, ""
+
+        with patch.object(refresh_service, "sync_calendar_events", side_effect=slow_sync):
+            result = await refresh_service.refresh_user_calendars(budget_seconds=0.02)
+
+        assert (result["refreshed"], result["deferred"]) == (2, 4)
+
+
+@pytest.mark.unit
+class TestExportTraffic:
+    """Test export requests are counted per calendar and day."""
+
+    def test_record_and_read_counts(self):
+        client = Mock()
+        client.zrange.side_effect = [[("3", 4.0)], [("3", 1.0), ("5", 2.0)]]
+
+        with patch.object(refresh_service, "REDIS_AVAILABLE", True), \
+             patch.object(refresh_service, "get_redis_client", return_value=client):
+            refresh_service.record_calendar_export(3, NOW)
+            counts = refresh_service.get_recent_export_counts(NOW)
+
+        client.pipeline.return_value.zincrby.assert_called_once_with("user_calendar_exports:20250601", 1, 3)
+        assert counts == {3: 5, 5: 2}
+
+
+@pytest.mark.unit
+class TestLambdaUserRefresh:
+    """Test the coordinator keeps the refresh within the invocation's time."""
+
+    def test_skipped_without_time_left(self):
+        with patch.object(lambda_sync, "refresh_user_calendars") as refresh:
+            assert lambda_sync.run_user_calendar_refresh(remaining_seconds=10) == {"skipped": "no time left"}
+        refresh.assert_not_called()
+
+    def test_budget_limited_by_remaining_time(self):
+        async def fake_refresh(budget_seconds):
+            return {"budget": budget_seconds}
+
+        with patch.object(lambda_sync, "refresh_user_calendars", side_effect=fake_refresh):
+            result = lambda_sync.run_user_calendar_refresh(remaining_seconds=45)
+
+        assert result == {"budget": 45 - lambda_sync.USER_REFRESH_TIMEOUT_MARGIN_SECONDS}
@@ -47,10 +47,20 @@ export default $config({
         PK: "string",
         SK: "string",
         link_uuid: "string",
+        entity_type: "string",
+        entity_sort: "string",
+        filter_domain_key: "string",
+        reset_token: "string",
+        assign_group: "string",
       },
       primaryIndex: { hashKey: "PK", rangeKey: "SK" },
+      // Sparse indexes replace table scans (run app.db.backfill_indexes after adding them)
       globalIndexes: {
         LinkUuidIndex: { hashKey: "link_uuid" },
+        EntityIndex: { hashKey: "entity_type", rangeKey: "entity_sort" },
+        FilterDomainIndex: { hashKey: "filter_domain_key" },
+        ResetTokenIndex: { hashKey: "reset_token" },
+        AssignmentGroupIndex: { hashKey: "assign_group" },
       },
       billing: "on-demand",
     });
@@ -115,20 +125,37 @@ export default $config({
       handler: "backend/lambda_sync_main.handler",
       runtime: "python3.12",
       architecture: "x86_64",
-      timeout: "5 minutes",
+      // The coordinator waits for its shard workers (SYNC_SHARD_BUDGET_SECONDS 240 s plus the domain
+      // in flight: 30 s fetch + export precompute), then refreshes personal calendars (60 s)
+      timeout: "10 minutes",
       memory: "512 MB",
       link: [table],
-      environment: sharedEnv,
-      permissions: sharedPermissions,
+      environment: {
+        ...sharedEnv,
+        SYNC_SHARD_COUNT: "1",  // Raise to fan out: the schedule run invokes one worker per shard
+        // No REDIS_URL: feed schedules and feed health/backoff are kept on the calendar rows,
+        // host health per container; shard checkpoints are Redis-only and not kept (the handler
+        // logs a warning each run)
+      },
+      permissions: [
+        ...sharedPermissions,
+        {
+          // Coordinator invokes this same function (and only it) once per shard
+          actions: ["lambda:InvokeFunction"],
+          resources: [`arn:aws:lambda:*:*:function:${$app.name}-${$app.stage}-FilterIcalSyncTask*`]
+        }
+      ],
       copyFiles: [
         { from: "backend", to: "backend" },
       ],
       // Container mode disabled - use standard Python packaging
     });
 
-    // 5. EventBridge Schedule (runs every 30 minutes)
+    // 5. EventBridge Schedule: a tick every 10 minutes (FEED_SYNC_MIN_INTERVAL_MINUTES);
+    //    each run syncs only the feeds due by their adaptive schedule (calendar sync_state, or
+    //    last_fetched + 30 minutes before a feed has one), so quiet feeds are fetched less often
     new sst.aws.Cron("FilterIcalSyncSchedule", {
-      schedule: "rate(30 minutes)",
+      schedule: "rate(10 minutes)",
       job: syncFunction,
     });
 